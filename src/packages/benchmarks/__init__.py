@@ -0,0 +1,21 @@
+# Package modules.benchmarks
+from .cases import CASES, BenchmarkCase
+from .runner import (
+    BenchmarkResult,
+    BenchmarkRunner,
+    Comparison,
+    compare,
+    load_results,
+    save_results,
+)
+
+__all__ = [
+    "CASES",
+    "BenchmarkCase",
+    "BenchmarkResult",
+    "BenchmarkRunner",
+    "Comparison",
+    "compare",
+    "load_results",
+    "save_results",
+]
@@ -0,0 +1,209 @@
+import json
+import tempfile
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+DESCRIBE_DIR = PROJECT_ROOT / "data" / "describe"
+BASE_URL = "https://www.example.com/nba/"
+# Configuration files are small: each run loads them several times
+CONFIG_PASSES = 20
+
+
+@dataclass
+class BenchmarkCase:
+    """
+    A measured code path.
+
+    `setup` prepares the inputs from a synthetic dataset directory and
+    is not timed; `run` is the timed part and returns the number of rows
+    or items it processed. Either may raise ImportError when an optional
+    dependency is missing, and the case is then reported as skipped.
+
+    Attributes:
+        name: Case name.
+        description: What the case measures.
+        setup: Input preparation, from the dataset directory.
+        run: Timed code path, from the setup state.
+    """
+
+    name: str
+    description: str
+    setup: Callable[[str], Any]
+    run: Callable[[Any], int]
+
+
+def _csv_files(data_dir: str) -> list[Path]:
+    names = ("games.csv", "games_details.csv", "ranking.csv")
+    return [Path(data_dir) / name for name in names]
+
+
+def _load_csv(files: list[Path]) -> int:
+    return sum(len(pd.read_csv(path)) for path in files)
+
+
+def _pbp_file(data_dir: str) -> Path:
+    files = sorted(Path(data_dir).glob("*_pbp.csv"))
+    if not files:
+        raise FileNotFoundError(f"No pbp file in {data_dir}")
+    return files[-1]
+
+
+def _load_pbp(path: Path) -> int:
+    return len(pd.read_csv(path, low_memory=False))
+
+
+def _transform_setup(data_dir: str) -> tuple[Any, list[dict]]:
+    from packages.tools.api.transform import DataTransformer
+
+    details = pd.read_csv(Path(data_dir) / "games_details.csv")
+    columns = [str(c) for c in details.columns]
+    transformer = DataTransformer(
+        fields=columns,
+        mapping={"PLAYER": "PLAYER_NAME", "TEAM": "TEAM_ABBREVIATION"},
+    )
+    return transformer, details.to_dict(orient="records")
+
+
+def _transform_run(state: tuple[Any, list[dict]]) -> int:
+    transformer, records = state
+    return len(transformer.transform(records))
+
+
+def _analyse_setup(data_dir: str) -> Path:
+    # Imported here to skip the case when the tools package is unusable
+    from packages.tools.api.transform import DataTransformer  # noqa: F401
+
+    return Path(data_dir) / "games_details.csv"
+
+
+def _analyse_run(path: Path) -> int:
+    # Steps of DataAnalysisApp.run up to the profiling report, which the
+    # "report" case measures
+    from packages.tools.api.transform import DataTransformer
+
+    df = pd.read_csv(path)
+    transformer = DataTransformer(fields=list(df.columns))
+    records = [
+        {str(k): v for k, v in record.items()}
+        for record in df.to_dict(orient="records")
+    ]
+    enriched = pd.DataFrame(transformer.transform(records))
+    return len(enriched)
+
+
+def _report_setup(data_dir: str) -> tuple[Any, pd.DataFrame, dict, str]:
+    from packages.reporting.reporting_utils import generate_report
+
+    games = pd.read_csv(Path(data_dir) / "games.csv")
+    with open(DESCRIBE_DIR / "games_describe.json", encoding="utf-8") as f:
+        descriptions = json.load(f)["column_descriptions"]
+    output = tempfile.mkdtemp(prefix="nba_bench_")
+    return generate_report, games, descriptions, output
+
+
+def _report_run(state: tuple[Any, pd.DataFrame, dict, str]) -> int:
+    generate_report, games, descriptions, output = state
+    generate_report(games, descriptions, str(Path(output) / "report.html"))
+    return len(games)
+
+
+def _config_setup(data_dir: str) -> tuple[Any, list[str]]:
+    from packages.tools.file import FileTools
+
+    files = sorted(str(p) for p in (PROJECT_ROOT / "conf").glob("*.json"))
+    files += [str(PROJECT_ROOT / "project_structure.yaml")]
+    files += sorted(str(p) for p in DESCRIBE_DIR.glob("*.json"))
+    return FileTools, files
+
+
+def _config_run(state: tuple[Any, list[str]]) -> int:
+    file_tools, files = state
+    for _ in range(CONFIG_PASSES):
+        for path in files:
+            file_tools.load_from(path)
+    return CONFIG_PASSES * len(files)
+
+
+def _html_setup(data_dir: str) -> tuple[Any, Any, str]:
+    from packages.tools.web import Extractor, HtmlConverter
+
+    games = pd.read_csv(Path(data_dir) / "games.csv")
+    rows = "\n".join(
+        f'<tr><td><a href="{BASE_URL}games/{g.GAME_ID}">{g.GAME_ID}</a></td>'
+        f"<td>{g.GAME_DATE_EST}</td><td>{g.PTS_home}</td>"
+        f"<td>{g.PTS_away}</td></tr>"
+        for g in games.itertuples(index=False)
+    )
+    initial = json.dumps({"games": games.head(1000).to_dict(orient="records")})
+    html = (
+        "<html><head><title>Games</title>"
+        f"<script>window.__INITIAL_DATA__ = {initial};</script></head>"
+        f"<body><pre>  spaced   text  </pre><table>{rows}</table>"
+        '<a href="https://elsewhere.example.org/">out</a></body></html>'
+    )
+    return Extractor(), HtmlConverter(), html
+
+
+def _html_run(state: tuple[Any, Any, str]) -> int:
+    extractor, converter, html = state
+    links = extractor.extract_internal_links(html, BASE_URL)
+    objects = extractor.extract_json_objects_from_scripts(html)
+    extractor.extract_texts_from_json_objects(objects)
+    converter.html_to_text(
+        html, parser="html.parser", preserve_whitespace_tags=["pre"]
+    )
+    return len(links)
+
+
+CASES = {
+    case.name: case
+    for case in [
+        BenchmarkCase(
+            "csv_load",
+            "pandas.read_csv of games, games_details and ranking",
+            _csv_files,
+            _load_csv,
+        ),
+        BenchmarkCase(
+            "pbp_load",
+            "pandas.read_csv of the last pbp season",
+            _pbp_file,
+            _load_pbp,
+        ),
+        BenchmarkCase(
+            "transform",
+            "DataTransformer.transform of games_details records",
+            _transform_setup,
+            _transform_run,
+        ),
+        BenchmarkCase(
+            "data_analyse",
+            "data_analyse.py flow: load, records, transform, DataFrame",
+            _analyse_setup,
+            _analyse_run,
+        ),
+        BenchmarkCase(
+            "report",
+            "ydata-profiling HTML report of games",
+            _report_setup,
+            _report_run,
+        ),
+        BenchmarkCase(
+            "config_load",
+            "FileTools.load_from of the JSON and YAML configuration",
+            _config_setup,
+            _config_run,
+        ),
+        BenchmarkCase(
+            "html_extract",
+            "Extractor links and JSON, HtmlConverter text of a games page",
+            _html_setup,
+            _html_run,
+        ),
+    ]
+}
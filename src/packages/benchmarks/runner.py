@@ -0,0 +1,318 @@
+import gc
+import json
+import multiprocessing
+import os
+import platform
+import queue as queue_module
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import pandas as pd
+
+from packages.benchmarks.cases import CASES
+from packages.preprocessing.synthetic import SyntheticConfig, SyntheticDataset
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    Measures of one case at one scale.
+
+    Attributes:
+        case: Case name.
+        scale: Synthetic data scale.
+        status: "ok", "skipped" (missing dependency) or "error".
+        wall_s: Best wall time of the repeats, in seconds.
+        wall_median_s: Median wall time of the repeats.
+        cpu_s: Process CPU time of the best repeat.
+        peak_rss_mb: Peak resident memory of the case process.
+        rss_before_mb: Resident memory after setup, before the runs.
+        rows: Rows (or items) processed by one run.
+        reason: Why the case was skipped or failed.
+    """
+
+    case: str
+    scale: float
+    status: str = "ok"
+    wall_s: float | None = None
+    wall_median_s: float | None = None
+    cpu_s: float | None = None
+    peak_rss_mb: float | None = None
+    rss_before_mb: float | None = None
+    rows: int | None = None
+    reason: str | None = None
+
+    @property
+    def key(self) -> tuple[str, float]:
+        return self.case, self.scale
+
+
+def _current_rss_mb() -> float | None:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            pages = int(f.read().split()[1])
+    except OSError:
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def _peak_rss_mb() -> float | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, kilobytes elsewhere
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def run_case(name: str, data_dir: str, repeat: int) -> dict:
+    """
+    Measure one case in the current process.
+
+    Args:
+        name: Case name of `CASES`.
+        data_dir: Synthetic dataset directory.
+        repeat: Number of timed runs.
+
+    Returns:
+        Fields of a `BenchmarkResult`, without case and scale.
+    """
+    case = CASES[name]
+    try:
+        state = case.setup(data_dir)
+    except ImportError as err:
+        return {"status": "skipped", "reason": str(err)}
+    except Exception as err:
+        return {"status": "error", "reason": f"setup: {err!r}"}
+
+    gc.collect()
+    rss_before = _current_rss_mb()
+    walls, cpus, rows = [], [], None
+    try:
+        for _ in range(repeat):
+            wall, cpu = time.perf_counter(), time.process_time()
+            rows = case.run(state)
+            walls.append(time.perf_counter() - wall)
+            cpus.append(time.process_time() - cpu)
+    except ImportError as err:
+        return {"status": "skipped", "reason": str(err)}
+    except Exception as err:
+        return {"status": "error", "reason": repr(err)}
+    best = min(range(len(walls)), key=walls.__getitem__)
+    return {
+        "wall_s": walls[best],
+        "wall_median_s": statistics.median(walls),
+        "cpu_s": cpus[best],
+        "peak_rss_mb": _peak_rss_mb(),
+        "rss_before_mb": rss_before,
+        "rows": rows,
+    }
+
+
+def _child(name: str, data_dir: str, repeat: int, queue) -> None:
+    queue.put(run_case(name, data_dir, repeat))
+
+
+def _receive(process, queue, poll: float = 1.0) -> dict | None:
+    """
+    Result put by a child process, read before joining it.
+
+    A child only exits once its queue is flushed to the pipe, so joining
+    it first deadlocks on results larger than the pipe buffer.
+
+    Args:
+        process: Started child process.
+        queue: Queue the child puts its result in.
+        poll: Seconds between two liveness checks of the child.
+
+    Returns:
+        The result, None if the child exited without one.
+    """
+    while True:
+        alive = process.is_alive()
+        try:
+            return queue.get(timeout=poll)
+        except queue_module.Empty:
+            # Checked before the wait: a result put just before exiting
+            # is still read once
+            if not alive:
+                return None
+
+
+class BenchmarkRunner:
+    """
+    Time and memory benchmarks of the data paths on synthetic data.
+
+    Each scale gets a `SyntheticDataset` generated once under `workdir`
+    and reused by later runs. Every (case, scale) then runs in a fresh
+    process, so peak RSS belongs to that case alone and no cache or
+    import warmed by a previous case skews its timing.
+    """
+
+    def __init__(
+        self,
+        workdir: str,
+        scales: list[float],
+        cases: list[str] | None = None,
+        repeat: int = 3,
+        seed: int = 0,
+        pbp_seasons: int = 1,
+    ):
+        unknown = set(cases or []) - set(CASES)
+        if unknown:
+            raise ValueError(f"Unknown benchmark cases: {sorted(unknown)}")
+        self._workdir = Path(workdir)
+        self._scales = scales
+        self._cases = cases or list(CASES)
+        self._repeat = repeat
+        self._seed = seed
+        self._pbp_seasons = pbp_seasons
+
+    def data_dir(self, scale: float) -> Path:
+        """Synthetic dataset of a scale, generated on first use."""
+        data_dir = self._workdir / f"scale_{scale:g}_seed_{self._seed}"
+        marker = data_dir / "_rows.json"
+        if not marker.is_file():
+            config = SyntheticConfig(
+                scale=scale, seed=self._seed, pbp_seasons=self._pbp_seasons
+            )
+            rows = SyntheticDataset(config).generate(str(data_dir))
+            with open(marker, "w", encoding="utf-8") as f:
+                json.dump(rows, f, indent=2)
+        return data_dir
+
+    def run(self, isolate: bool = True) -> list[BenchmarkResult]:
+        """
+        Run every case at every scale.
+
+        Args:
+            isolate: Run each case in its own process; in-process runs
+                report the peak RSS of the whole session.
+
+        Returns:
+            One result per (case, scale).
+        """
+        results = []
+        context = multiprocessing.get_context("spawn")
+        for scale in self._scales:
+            data_dir = str(self.data_dir(scale))
+            for name in self._cases:
+                if isolate:
+                    queue = context.Queue()
+                    process = context.Process(
+                        target=_child,
+                        args=(name, data_dir, self._repeat, queue),
+                    )
+                    process.start()
+                    fields = _receive(process, queue)
+                    process.join()
+                    if fields is None:
+                        fields = {
+                            "status": "error",
+                            "reason": f"exit code {process.exitcode}",
+                        }
+                else:
+                    fields = run_case(name, data_dir, self._repeat)
+                results.append(BenchmarkResult(name, scale, **fields))
+        return results
+
+
+def save_results(results: list[BenchmarkResult], filepath: str) -> None:
+    """
+    Write results with the environment they were measured in.
+
+    Args:
+        results: Benchmark results.
+        filepath: JSON file, parent directories created.
+    """
+    payload = {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "pandas": pd.__version__,
+        },
+        "results": [asdict(result) for result in results],
+    }
+    Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+
+
+def load_results(filepath: str) -> list[BenchmarkResult]:
+    """Read results written by `save_results`."""
+    with open(filepath, encoding="utf-8") as f:
+        payload = json.load(f)
+    return [BenchmarkResult(**fields) for fields in payload["results"]]
+
+
+@dataclass
+class Comparison:
+    """
+    Result of a case against its baseline.
+
+    Attributes:
+        case: Case name.
+        scale: Synthetic data scale.
+        wall_ratio: Wall time over the baseline wall time.
+        rss_ratio: Peak RSS over the baseline peak RSS.
+        regressions: Measures beyond the threshold ("wall", "rss").
+    """
+
+    case: str
+    scale: float
+    wall_ratio: float | None
+    rss_ratio: float | None
+    regressions: list[str] = field(default_factory=list)
+
+
+def compare(
+    results: list[BenchmarkResult],
+    baseline: list[BenchmarkResult],
+    threshold: float = 0.2,
+) -> list[Comparison]:
+    """
+    Compare results to a baseline.
+
+    Args:
+        results: Current results.
+        baseline: Reference results, usually from the main branch.
+        threshold: Tolerated relative slowdown or memory growth.
+
+    Returns:
+        One comparison per case and scale measured in both.
+    """
+    reference = {r.key: r for r in baseline if r.status == "ok"}
+    comparisons = []
+    for result in results:
+        base = reference.get(result.key)
+        if result.status != "ok" or base is None:
+            continue
+        ratios = {}
+        for name, current, previous in (
+            ("wall", result.wall_s, base.wall_s),
+            ("rss", result.peak_rss_mb, base.peak_rss_mb),
+        ):
+            ratios[name] = current / previous if current and previous else None
+        comparisons.append(
+            Comparison(
+                result.case,
+                result.scale,
+                ratios["wall"],
+                ratios["rss"],
+                [
+                    name
+                    for name, ratio in ratios.items()
+                    if ratio is not None and ratio > 1 + threshold
+                ],
+            )
+        )
+    return comparisons
@@ -1 +1,24 @@
 # Package modules.features
+from .elo import EloConfig, EloRatingEngine
+from .feature_store import FeatureGroup, FeatureStore
+from .possessions import PossessionBuilder
+from .season_cube import SeasonCube
+from .shot_index import ShotIndex
+from .standings import StandingsIndex, parse_record
+from .stints import StintEngine
+from .win_probability import WinProbabilityConfig, WinProbabilityTable
+
+__all__ = [
+    "EloConfig",
+    "EloRatingEngine",
+    "FeatureGroup",
+    "FeatureStore",
+    "PossessionBuilder",
+    "SeasonCube",
+    "ShotIndex",
+    "StandingsIndex",
+    "parse_record",
+    "StintEngine",
+    "WinProbabilityConfig",
+    "WinProbabilityTable",
+]
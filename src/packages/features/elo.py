@@ -0,0 +1,332 @@
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class EloConfig:
+    """
+    Parameters of the team Elo model.
+
+    Attributes:
+        k_factor: Base update step applied after each game.
+        home_advantage: Elo points added to the home team expectation.
+        initial_rating: Rating given to a team seen for the first time,
+            also used as the regression target between seasons.
+        mov_multiplier: Scale updates by the margin of victory.
+        season_regression: Fraction of the gap to `initial_rating` removed
+            when a new season starts (0 disables the regression).
+    """
+
+    k_factor: float = 20.0
+    home_advantage: float = 100.0
+    initial_rating: float = 1500.0
+    mov_multiplier: bool = True
+    season_regression: float = 0.25
+
+
+class EloRatingEngine:
+    """
+    Incremental Elo ratings over games.csv.
+
+    Ratings are stored in a dense array indexed by team position in a
+    sorted TEAM_ID array. Games are processed in (GAME_DATE_EST, GAME_ID)
+    order, and the engine remembers the last processed game so that a
+    reloaded state only processes newer games.
+    """
+
+    GAME_COLUMNS = [
+        "GAME_DATE_EST",
+        "GAME_ID",
+        "SEASON",
+        "HOME_TEAM_ID",
+        "VISITOR_TEAM_ID",
+        "PTS_home",
+        "PTS_away",
+    ]
+
+    def __init__(self, config: EloConfig | None = None):
+        self.config = config or EloConfig()
+        self._team_ids = np.empty(0, dtype=np.int64)
+        self._ratings = np.empty(0, dtype=np.float64)
+        self._season: int | None = None
+        self._last_date: np.datetime64 | None = None
+        self._last_game_id: int | None = None
+
+    @property
+    def last_processed(self) -> tuple[pd.Timestamp, int] | None:
+        """(date, GAME_ID) of the last processed game, if any."""
+        if self._last_date is None or self._last_game_id is None:
+            return None
+        return pd.Timestamp(self._last_date), self._last_game_id
+
+    def ratings(self) -> pd.Series:
+        """
+        Current rating of every known team.
+
+        Returns:
+            Series of ratings indexed by TEAM_ID.
+        """
+        return pd.Series(
+            self._ratings.copy(),
+            index=pd.Index(self._team_ids, name="TEAM_ID"),
+            name="ELO",
+        )
+
+    def pregame(
+        self,
+        home_team_ids: np.ndarray,
+        away_team_ids: np.ndarray,
+        seasons: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Pre-game ratings and home win probability of upcoming games.
+
+        Ratings are read from the current state without updating it.
+        Unknown teams get `initial_rating`, and games of a season after
+        the last processed one get the between-season regression.
+
+        Args:
+            home_team_ids: Home TEAM_ID of every game.
+            away_team_ids: Away TEAM_ID of every game.
+            seasons: Season of every game.
+
+        Returns:
+            Home ratings, away ratings and home win probabilities.
+        """
+        cfg = self.config
+        ratings = []
+        for team_ids in (home_team_ids, away_team_ids):
+            team_ids = np.asarray(team_ids, dtype=np.int64)
+            positions = np.searchsorted(self._team_ids, team_ids)
+            positions = np.minimum(positions, max(len(self._team_ids) - 1, 0))
+            known = (
+                self._team_ids[positions] == team_ids
+                if len(self._team_ids)
+                else np.zeros(len(team_ids), dtype=bool)
+            )
+            values = np.full(len(team_ids), cfg.initial_rating)
+            if len(self._ratings):
+                values[known] = self._ratings[positions[known]]
+            if self._season is not None and cfg.season_regression > 0:
+                later = np.asarray(seasons, dtype=np.int64) > self._season
+                values[later] += cfg.season_regression * (
+                    cfg.initial_rating - values[later]
+                )
+            ratings.append(values)
+        diff = ratings[0] + cfg.home_advantage - ratings[1]
+        prob_home = 1.0 / (1.0 + 10.0 ** (-diff / 400.0))
+        return ratings[0], ratings[1], prob_home
+
+    def process(self, games: pd.DataFrame) -> pd.DataFrame:
+        """
+        Process games not seen yet and update ratings.
+
+        Duplicated GAME_IDs and games without a final score are ignored.
+        Games at or before the last processed (date, GAME_ID) are skipped,
+        which makes daily updates on the full games.csv incremental.
+
+        Args:
+            games: DataFrame with at least `GAME_COLUMNS`.
+
+        Returns:
+            One row per processed game with pre-game and post-game Elo of
+            both teams and the pre-game home win probability.
+        """
+        frame = self._prepare(games)
+        n_games = len(frame)
+        result = pd.DataFrame(
+            {
+                "GAME_ID": frame["GAME_ID"].to_numpy(),
+                "GAME_DATE_EST": frame["GAME_DATE_EST"].to_numpy(),
+                "SEASON": frame["SEASON"].to_numpy(),
+                "HOME_TEAM_ID": frame["HOME_TEAM_ID"].to_numpy(),
+                "VISITOR_TEAM_ID": frame["VISITOR_TEAM_ID"].to_numpy(),
+            }
+        )
+        if n_games == 0:
+            for col in self._output_columns():
+                result[col] = np.empty(0, dtype=np.float64)
+            return result
+
+        self._register_teams(
+            np.concatenate(
+                [
+                    frame["HOME_TEAM_ID"].to_numpy(),
+                    frame["VISITOR_TEAM_ID"].to_numpy(),
+                ]
+            )
+        )
+        home_idx = np.searchsorted(
+            self._team_ids, frame["HOME_TEAM_ID"].to_numpy()
+        ).tolist()
+        away_idx = np.searchsorted(
+            self._team_ids, frame["VISITOR_TEAM_ID"].to_numpy()
+        ).tolist()
+        margins = (
+            frame["PTS_home"].to_numpy(dtype=np.float64)
+            - frame["PTS_away"].to_numpy(dtype=np.float64)
+        ).tolist()
+        seasons = frame["SEASON"].to_numpy(dtype=np.int64).tolist()
+
+        pre_home = np.empty(n_games)
+        pre_away = np.empty(n_games)
+        post_home = np.empty(n_games)
+        post_away = np.empty(n_games)
+        prob_home = np.empty(n_games)
+
+        cfg = self.config
+        k_factor = cfg.k_factor
+        home_adv = cfg.home_advantage
+        use_mov = cfg.mov_multiplier
+        # Plain list for the sequential loop, written back to the array
+        ratings = self._ratings.tolist()
+        season = self._season
+
+        for i in range(n_games):
+            if season is None or seasons[i] > season:
+                if season is not None:
+                    ratings = self._regress(ratings)
+                season = seasons[i]
+
+            h, a = home_idx[i], away_idx[i]
+            r_home, r_away = ratings[h], ratings[a]
+            diff = r_home + home_adv - r_away
+            p_home = 1.0 / (1.0 + 10.0 ** (-diff / 400.0))
+            margin = margins[i]
+            outcome = 1.0 if margin > 0 else 0.0
+
+            mult = 1.0
+            if use_mov:
+                winner_diff = diff if margin > 0 else -diff
+                mult = (abs(margin) + 3.0) ** 0.8 / (7.5 + 0.006 * winner_diff)
+
+            shift = k_factor * mult * (outcome - p_home)
+            ratings[h] = r_home + shift
+            ratings[a] = r_away - shift
+
+            pre_home[i] = r_home
+            pre_away[i] = r_away
+            post_home[i] = r_home + shift
+            post_away[i] = r_away - shift
+            prob_home[i] = p_home
+
+        self._ratings = np.asarray(ratings, dtype=np.float64)
+        self._season = season
+        self._last_date = frame["GAME_DATE_EST"].to_numpy()[-1]
+        self._last_game_id = int(frame["GAME_ID"].to_numpy()[-1])
+
+        result["ELO_PRE_home"] = pre_home
+        result["ELO_PRE_away"] = pre_away
+        result["ELO_POST_home"] = post_home
+        result["ELO_POST_away"] = post_away
+        result["ELO_PROB_home"] = prob_home
+        return result
+
+    def save_state(self, filepath: str) -> None:
+        """
+        Persist ratings, config and last processed game to a .npz file.
+
+        Args:
+            filepath: Output file path.
+        """
+        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "config": asdict(self.config),
+            "season": self._season,
+            "last_date": (
+                str(pd.Timestamp(self._last_date).date())
+                if self._last_date is not None
+                else None
+            ),
+            "last_game_id": self._last_game_id,
+        }
+        with open(filepath, "wb") as f:
+            np.savez(
+                f,
+                team_ids=self._team_ids,
+                ratings=self._ratings,
+                meta=np.array(json.dumps(meta)),
+            )
+
+    @classmethod
+    def load_state(cls, filepath: str) -> "EloRatingEngine":
+        """
+        Rebuild an engine from a file written by `save_state`.
+
+        Args:
+            filepath: Path of the .npz state file.
+
+        Returns:
+            Engine ready to process games after the saved one.
+        """
+        with np.load(filepath) as state:
+            meta = json.loads(str(state["meta"]))
+            engine = cls(EloConfig(**meta["config"]))
+            engine._team_ids = state["team_ids"].astype(np.int64)
+            engine._ratings = state["ratings"].astype(np.float64)
+        engine._season = meta["season"]
+        if meta["last_date"] is not None:
+            engine._last_date = np.datetime64(meta["last_date"], "ns")
+        engine._last_game_id = meta["last_game_id"]
+        return engine
+
+    def _prepare(self, games: pd.DataFrame) -> pd.DataFrame:
+        missing = set(self.GAME_COLUMNS) - set(games.columns)
+        if missing:
+            raise KeyError(f"Missing game columns: {sorted(missing)}")
+
+        frame = games[self.GAME_COLUMNS].dropna(
+            subset=["PTS_home", "PTS_away"]
+        )
+        frame = frame.drop_duplicates(subset="GAME_ID", keep="last")
+        frame = frame.assign(
+            GAME_DATE_EST=pd.to_datetime(frame["GAME_DATE_EST"]).astype(
+                "datetime64[ns]"
+            )
+        )
+        frame = frame.sort_values(["GAME_DATE_EST", "GAME_ID"], kind="stable")
+
+        if self._last_date is not None and self._last_game_id is not None:
+            dates = frame["GAME_DATE_EST"].to_numpy()
+            newer = (dates > self._last_date) | (
+                (dates == self._last_date)
+                & (frame["GAME_ID"].to_numpy() > self._last_game_id)
+            )
+            frame = frame[newer]
+        return frame
+
+    def _register_teams(self, team_ids: np.ndarray) -> None:
+        new_ids = np.setdiff1d(team_ids, self._team_ids)
+        if new_ids.size == 0:
+            return
+        all_ids = np.concatenate([self._team_ids, new_ids])
+        all_ratings = np.concatenate(
+            [
+                self._ratings,
+                np.full(new_ids.size, self.config.initial_rating),
+            ]
+        )
+        order = np.argsort(all_ids, kind="stable")
+        self._team_ids = all_ids[order].astype(np.int64)
+        self._ratings = all_ratings[order]
+
+    def _regress(self, ratings: list[float]) -> list[float]:
+        weight = self.config.season_regression
+        if weight <= 0:
+            return ratings
+        target = self.config.initial_rating
+        return [r + weight * (target - r) for r in ratings]
+
+    @staticmethod
+    def _output_columns() -> list[str]:
+        return [
+            "ELO_PRE_home",
+            "ELO_PRE_away",
+            "ELO_POST_home",
+            "ELO_POST_away",
+            "ELO_PROB_home",
+        ]
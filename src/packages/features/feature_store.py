@@ -0,0 +1,356 @@
+import hashlib
+import inspect
+import json
+import shutil
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from packages.preprocessing.fingerprint import data_fingerprint
+from packages.preprocessing.memory import parse_minutes
+
+ENTITY_KEYS = {
+    "team": ["GAME_ID", "TEAM_ID"],
+    "player": ["GAME_ID", "PLAYER_ID"],
+}
+EVENT_TIME = "EVENT_TIME"
+
+
+@dataclass
+class FeatureGroup:
+    """
+    Named set of features computed together.
+
+    Attributes:
+        name: Group name, also its directory in the store.
+        entity: "team" for (GAME_ID, TEAM_ID) rows, "player" for
+            (GAME_ID, PLAYER_ID) rows.
+        compute: Function of (season input rows, **config) returning the
+            entity keys, `EVENT_TIME` (when the values become known) and
+            the feature columns.
+        config: Keyword arguments passed to `compute`.
+        depends_on: Helper functions called by `compute`, whose source is
+            part of the version as well.
+    """
+
+    name: str
+    entity: str
+    compute: Callable[..., pd.DataFrame]
+    config: dict = field(default_factory=dict)
+    depends_on: list[Callable] = field(default_factory=list)
+
+    @property
+    def keys(self) -> list[str]:
+        """Entity key columns of the group."""
+        return ENTITY_KEYS[self.entity]
+
+    @property
+    def version(self) -> str:
+        """Hash of the compute and helper source code and config."""
+        sources = [
+            inspect.getsource(f) for f in [self.compute, *self.depends_on]
+        ]
+        payload = "".join(sources) + json.dumps(
+            self.config, sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()[:12]
+
+
+class FeatureStore:
+    """
+    Local store of versioned feature groups, partitioned by season.
+
+    Layout: `<root>/<group>/v=<version>/season=<season>.parquet`, plus a
+    manifest holding the fingerprint of the input rows of each partition.
+    Changing the compute code, its listed helpers or the config gives a
+    new version; new or modified input rows only recompute the seasons
+    they belong to.
+    """
+
+    MANIFEST_FILE = "manifest.json"
+
+    def __init__(self, root: str):
+        self._root = Path(root)
+        self._groups: dict[str, FeatureGroup] = {}
+
+    def register(self, group: FeatureGroup) -> None:
+        """Make a group available to `materialize` and readers."""
+        if group.entity not in ENTITY_KEYS:
+            raise ValueError(f"Unknown entity: {group.entity}")
+        self._groups[group.name] = group
+
+    def versions(self, name: str) -> list[str]:
+        """Versions of a group present on disk."""
+        group_dir = self._root / name
+        if not group_dir.is_dir():
+            return []
+        return sorted(p.name[2:] for p in group_dir.glob("v=*"))
+
+    def materialize(
+        self, name: str, inputs: pd.DataFrame, season_column: str = "SEASON"
+    ) -> list[int]:
+        """
+        Compute the partitions whose input rows changed.
+
+        Args:
+            name: Registered group name.
+            inputs: Input rows of every season (games, box lines...).
+            season_column: Column used to partition `inputs`.
+
+        Returns:
+            Seasons that were (re)computed.
+        """
+        group = self._groups[name]
+        version_dir = self._version_dir(group)
+        version_dir.mkdir(parents=True, exist_ok=True)
+        manifest = self._manifest(version_dir)
+
+        computed = []
+        for _, rows in inputs.groupby(season_column, sort=True):
+            season = int(rows[season_column].to_numpy()[0])
+            fingerprint = data_fingerprint(rows)
+            if manifest.get(str(season), {}).get("input") == fingerprint:
+                continue
+            features = group.compute(rows, **group.config)
+            self._check(group, features)
+            features = features.sort_values(group.keys, kind="stable")
+            features.to_parquet(
+                version_dir / f"season={season}.parquet", index=False
+            )
+            manifest[str(season)] = {
+                "input": fingerprint,
+                "rows": len(features),
+            }
+            computed.append(season)
+
+        with open(
+            version_dir / self.MANIFEST_FILE, "w", encoding="utf-8"
+        ) as f:
+            json.dump(manifest, f, indent=2)
+        return computed
+
+    def read(
+        self,
+        name: str,
+        seasons: list[int] | None = None,
+        columns: list[str] | None = None,
+        version: str | None = None,
+    ) -> pd.DataFrame:
+        """
+        Load feature rows of a group.
+
+        Args:
+            name: Group name.
+            seasons: Seasons to load, every materialized season if None.
+            columns: Feature columns to load, all if None.
+            version: Version to read, the registered one if None.
+
+        Returns:
+            Keys, `EVENT_TIME`, SEASON and the feature columns.
+        """
+        version_dir = self._version_dir(self._groups[name], version)
+        manifest = self._manifest(version_dir)
+        wanted = sorted(int(s) for s in manifest)
+        if seasons is not None:
+            wanted = [s for s in wanted if s in set(seasons)]
+        if columns is not None:
+            columns = [*self._groups[name].keys, EVENT_TIME, *columns]
+
+        frames = []
+        for season in wanted:
+            frame = pd.read_parquet(
+                version_dir / f"season={season}.parquet", columns=columns
+            )
+            frames.append(frame.assign(SEASON=season))
+        if not frames:
+            raise KeyError(f"No materialized partition for {name}")
+        return pd.concat(frames, ignore_index=True)
+
+    def point_in_time(
+        self,
+        name: str,
+        spine: pd.DataFrame,
+        entity_column: str,
+        time_column: str,
+        columns: list[str] | None = None,
+        strict: bool = True,
+    ) -> pd.DataFrame:
+        """
+        Latest feature values known at each spine time.
+
+        For every spine row, takes the feature row of the same entity with
+        the greatest `EVENT_TIME` before `time_column` (or equal to it if
+        `strict` is False), so training sets never see future values.
+
+        Args:
+            name: Group name.
+            spine: Rows to enrich, e.g. one row per (game, team).
+            entity_column: Entity column of the spine, matched against
+                the group entity key (TEAM_ID or PLAYER_ID).
+            time_column: Time of each spine row.
+            columns: Feature columns to attach, all if None.
+            strict: Exclude features known exactly at the spine time.
+
+        Returns:
+            Copy of `spine` with the feature columns, same row order.
+        """
+        group = self._groups[name]
+        entity_key = group.keys[1]
+        features = self.read(name, columns=columns)
+        value_columns = [
+            c
+            for c in features.columns
+            if c not in (*group.keys, EVENT_TIME, "SEASON")
+        ]
+
+        times = pd.to_datetime(spine[time_column]).astype("datetime64[ns]")
+        left = pd.DataFrame(
+            {
+                "_ENTITY": spine[entity_column].to_numpy(dtype=np.int64),
+                "_TIME": times.to_numpy(),
+                "_ROW": np.arange(len(spine)),
+            }
+        ).sort_values("_TIME", kind="stable")
+        right = pd.DataFrame(
+            {
+                "_ENTITY": features[entity_key].to_numpy(dtype=np.int64),
+                "_TIME": pd.to_datetime(features[EVENT_TIME])
+                .astype("datetime64[ns]")
+                .to_numpy(),
+            }
+        )
+        for col in value_columns:
+            right[col] = features[col].to_numpy()
+        right = right.sort_values("_TIME", kind="stable")
+
+        matched = pd.merge_asof(
+            left,
+            right,
+            on="_TIME",
+            by="_ENTITY",
+            allow_exact_matches=not strict,
+        ).sort_values("_ROW")
+        out = spine.copy()
+        for col in value_columns:
+            out[col] = matched[col].to_numpy()
+        return out
+
+    def prune(self, name: str) -> list[str]:
+        """
+        Delete the versions of a group other than the registered one.
+
+        Returns:
+            Removed versions.
+        """
+        current = self._groups[name].version
+        removed = [v for v in self.versions(name) if v != current]
+        for version in removed:
+            shutil.rmtree(self._root / name / f"v={version}")
+        return removed
+
+    def _version_dir(
+        self, group: FeatureGroup, version: str | None = None
+    ) -> Path:
+        return self._root / group.name / f"v={version or group.version}"
+
+    def _manifest(self, version_dir: Path) -> dict:
+        manifest_file = version_dir / self.MANIFEST_FILE
+        if not manifest_file.is_file():
+            return {}
+        with open(manifest_file, encoding="utf-8") as f:
+            return json.load(f)
+
+    @staticmethod
+    def _check(group: FeatureGroup, features: pd.DataFrame) -> None:
+        missing = {*group.keys, EVENT_TIME} - set(features.columns)
+        if missing:
+            raise KeyError(
+                f"{group.name} output lacks columns: {sorted(missing)}"
+            )
+        if features.duplicated(subset=group.keys).any():
+            raise ValueError(f"{group.name} output has duplicated keys")
+
+
+def team_form_features(games: pd.DataFrame, window: int = 10) -> pd.DataFrame:
+    """
+    Post-game rolling form of each team over the season, per game.
+
+    Values include the game itself: the event time is the game date, so
+    strict point-in-time reads only pick them up from the next day on.
+
+    Args:
+        games: Games of one season with scores and HOME_TEAM_WINS.
+        window: Number of games averaged.
+
+    Returns:
+        (GAME_ID, TEAM_ID) rows with FORM_WIN, FORM_NET and GAMES_PLAYED.
+    """
+    games = games.dropna(subset=["PTS_home", "PTS_away", "HOME_TEAM_WINS"])
+    home_win = games["HOME_TEAM_WINS"].to_numpy(dtype=np.float64)
+    margin = (games["PTS_home"] - games["PTS_away"]).to_numpy(dtype=np.float64)
+    long = pd.DataFrame(
+        {
+            "GAME_ID": np.tile(games["GAME_ID"].to_numpy(), 2),
+            "TEAM_ID": np.concatenate(
+                [games["HOME_TEAM_ID"], games["VISITOR_TEAM_ID"]]
+            ),
+            EVENT_TIME: np.tile(
+                pd.to_datetime(games["GAME_DATE_EST"]).to_numpy(), 2
+            ),
+            "WIN": np.concatenate([home_win, 1.0 - home_win]),
+            "NET": np.concatenate([margin, -margin]),
+        }
+    ).sort_values(["TEAM_ID", EVENT_TIME, "GAME_ID"], kind="stable")
+    grouped = long.groupby("TEAM_ID", sort=False)
+    long["FORM_WIN"] = grouped["WIN"].transform(
+        lambda s: s.rolling(window, min_periods=1).mean()
+    )
+    long["FORM_NET"] = grouped["NET"].transform(
+        lambda s: s.rolling(window, min_periods=1).mean()
+    )
+    long["GAMES_PLAYED"] = grouped.cumcount() + 1
+    return long.drop(columns=["WIN", "NET"]).reset_index(drop=True)
+
+
+def player_form_features(lines: pd.DataFrame, window: int = 5) -> pd.DataFrame:
+    """
+    Post-game rolling box score averages of each player over the season.
+
+    Args:
+        lines: games_details rows of one season with GAME_DATE_EST.
+        window: Number of games averaged.
+
+    Returns:
+        (GAME_ID, PLAYER_ID) rows with TEAM_ID and rolling MIN, PTS, REB,
+        AST averages over the games actually played.
+    """
+    lines = lines.drop_duplicates(subset=["GAME_ID", "PLAYER_ID"])
+    minutes = parse_minutes(lines["MIN"]) / 60.0
+    frame = pd.DataFrame(
+        {
+            "GAME_ID": lines["GAME_ID"].to_numpy(),
+            "PLAYER_ID": lines["PLAYER_ID"].to_numpy(),
+            "TEAM_ID": lines["TEAM_ID"].to_numpy(),
+            EVENT_TIME: pd.to_datetime(lines["GAME_DATE_EST"]).to_numpy(),
+            "MIN": minutes.to_numpy(),
+            "PTS": lines["PTS"].to_numpy(dtype=np.float64),
+            "REB": (lines["OREB"] + lines["DREB"]).to_numpy(dtype=np.float64),
+            "AST": lines["AST"].to_numpy(dtype=np.float64),
+        }
+    ).sort_values(["PLAYER_ID", EVENT_TIME, "GAME_ID"], kind="stable")
+    # DNP lines carry no box score and do not count in the window
+    played = frame["MIN"].notna()
+    stats = ["MIN", "PTS", "REB", "AST"]
+    rolled = (
+        frame[played]
+        .groupby("PLAYER_ID", sort=False)[stats]
+        .transform(lambda s: s.rolling(window, min_periods=1).mean())
+    )
+    frame[stats] = rolled.reindex(frame.index)
+    frame[stats] = frame.groupby("PLAYER_ID", sort=False)[stats].ffill()
+    return frame.rename(columns={c: f"FORM_{c}" for c in stats}).reset_index(
+        drop=True
+    )
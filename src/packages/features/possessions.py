@@ -0,0 +1,198 @@
+import numpy as np
+import pandas as pd
+
+REGULATION_PERIOD = 720
+OVERTIME_PERIOD = 300
+
+
+def period_length(quarter: np.ndarray) -> np.ndarray:
+    """Length in seconds of each period (12 min, 5 min in overtime)."""
+    return np.where(quarter <= 4, REGULATION_PERIOD, OVERTIME_PERIOD)
+
+
+def elapsed_seconds(quarter: np.ndarray, sec_left: np.ndarray) -> np.ndarray:
+    """
+    Seconds elapsed since tip-off for (Quarter, SecLeft) pairs.
+
+    Args:
+        quarter: Period numbers, 5 and above for overtimes.
+        sec_left: Seconds left in the period.
+
+    Returns:
+        Float array of elapsed game seconds.
+    """
+    quarter = np.asarray(quarter, dtype=np.int64)
+    regulation = np.minimum(quarter - 1, 4) * REGULATION_PERIOD
+    overtime = np.maximum(quarter - 5, 0) * OVERTIME_PERIOD
+    return (
+        regulation
+        + overtime
+        + period_length(quarter)
+        - np.asarray(sec_left, dtype=np.float64)
+    )
+
+
+class PossessionBuilder:
+    """
+    Derive possessions from play-by-play events with column operations.
+
+    Events are sorted by game, period and clock. The offense of an event
+    is known for shots, free throws of a trip, turnovers and rebounds (the
+    rebounding team holds the ball afterwards); it is forward filled to
+    fouls, substitutions and other neutral events. A possession starts
+    whenever the offense or the period changes, so and-ones and offensive
+    rebounds stay inside the possession that produced them.
+    """
+
+    def __init__(self, game_column: str = "URL"):
+        self._game_column = game_column
+
+    def build(self, pbp: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Annotate events and summarise possessions in one call.
+
+        Args:
+            pbp: Play-by-play events of one or many games.
+
+        Returns:
+            Annotated events and one row per possession.
+        """
+        events = self.annotate(pbp)
+        return events, self.possessions(events)
+
+    def annotate(self, pbp: pd.DataFrame) -> pd.DataFrame:
+        """
+        Add possession columns to every event.
+
+        Added columns: POSS_ID (unique over the frame), OFF_HOME (offense
+        is the home team), OFF_TEAM, DEF_TEAM, ELAPSED (seconds since
+        tip-off), PTS_HOME and PTS_AWAY (points scored on the event) and
+        PTS_OFF (points scored by the offense on the event).
+
+        Args:
+            pbp: Play-by-play events.
+
+        Returns:
+            Events sorted chronologically within each game.
+        """
+        game_codes, _ = pd.factorize(pbp[self._game_column])
+        quarter = pbp["Quarter"].to_numpy(dtype=np.int64)
+        sec_left = pbp["SecLeft"].to_numpy(dtype=np.float64)
+        order = np.lexsort(
+            (np.arange(len(pbp)), -sec_left, quarter, game_codes)
+        )
+        events = pbp.iloc[order].reset_index(drop=True)
+        game_codes = game_codes[order]
+        quarter = quarter[order]
+        sec_left = sec_left[order]
+
+        is_home = events["HomePlay"].notna().to_numpy()
+        is_away = events["AwayPlay"].notna().to_numpy() & ~is_home
+        defines_offense = (
+            events["Shooter"].notna()
+            | (
+                events["FreeThrowShooter"].notna()
+                & events["FreeThrowNum"].notna()
+            )
+            | events["TurnoverType"].notna()
+            | events["Rebounder"].notna()
+        ).to_numpy() & (is_home | is_away)
+
+        offense = pd.Series(
+            np.where(defines_offense, is_home.astype(np.float64), np.nan)
+        )
+        period_key = pd.Series(game_codes * 100 + quarter)
+        offense = offense.groupby(period_key).ffill()
+        offense = offense.groupby(period_key).bfill()
+        # Periods without any offensive event fall back to the event side
+        filled = offense.fillna(pd.Series(is_home.astype(np.float64)))
+        off_home = filled.to_numpy() == 1.0
+
+        period_codes = period_key.to_numpy()
+        new_possession = np.ones(len(events), dtype=bool)
+        new_possession[1:] = (off_home[1:] != off_home[:-1]) | (
+            period_codes[1:] != period_codes[:-1]
+        )
+
+        home_pts = self._event_points(events["HomeScore"], game_codes)
+        away_pts = self._event_points(events["AwayScore"], game_codes)
+
+        home_team = events["HomeTeam"].to_numpy()
+        away_team = events["AwayTeam"].to_numpy()
+        events["POSS_ID"] = np.cumsum(new_possession) - 1
+        events["OFF_HOME"] = off_home
+        events["OFF_TEAM"] = np.where(off_home, home_team, away_team)
+        events["DEF_TEAM"] = np.where(off_home, away_team, home_team)
+        events["ELAPSED"] = elapsed_seconds(quarter, sec_left)
+        events["PTS_HOME"] = home_pts
+        events["PTS_AWAY"] = away_pts
+        events["PTS_OFF"] = np.where(off_home, home_pts, away_pts)
+        return events
+
+    def possessions(self, events: pd.DataFrame) -> pd.DataFrame:
+        """
+        One row per possession of annotated events.
+
+        A possession starts when the previous one of the same period ends,
+        or at the start of the period; it ends on its last event.
+
+        Args:
+            events: Output of `annotate`.
+
+        Returns:
+            Possessions with teams, clock bounds, duration, points and
+            number of events.
+        """
+        grouped = events.groupby("POSS_ID", sort=True)
+        poss = grouped.agg(
+            GAME=(self._game_column, "first"),
+            Quarter=("Quarter", "first"),
+            OFF_TEAM=("OFF_TEAM", "first"),
+            DEF_TEAM=("DEF_TEAM", "first"),
+            OFF_HOME=("OFF_HOME", "first"),
+            END_SECLEFT=("SecLeft", "min"),
+            END_TIME=("ELAPSED", "max"),
+            PTS=("PTS_OFF", "sum"),
+            N_EVENTS=("POSS_ID", "size"),
+        )
+        poss = poss.rename(columns={"GAME": self._game_column})
+
+        quarter = poss["Quarter"].to_numpy(dtype=np.int64)
+        games = poss[self._game_column].to_numpy()
+        period_start = np.ones(len(poss), dtype=bool)
+        period_start[1:] = (games[1:] != games[:-1]) | (
+            quarter[1:] != quarter[:-1]
+        )
+        period_end = np.ones(len(poss), dtype=bool)
+        period_end[:-1] = period_start[1:]
+
+        # The last possession of a period runs until the buzzer
+        end_sec_left = np.where(
+            period_end, 0.0, poss["END_SECLEFT"].to_numpy(dtype=np.float64)
+        )
+        start_sec_left = np.empty_like(end_sec_left)
+        start_sec_left[1:] = end_sec_left[:-1]
+        start_sec_left = np.where(
+            period_start, period_length(quarter), start_sec_left
+        )
+
+        poss["END_SECLEFT"] = end_sec_left
+        poss["END_TIME"] = elapsed_seconds(quarter, end_sec_left)
+        poss.insert(5, "START_SECLEFT", start_sec_left)
+        poss.insert(7, "START_TIME", elapsed_seconds(quarter, start_sec_left))
+        poss["DURATION"] = poss["END_TIME"] - poss["START_TIME"]
+        return poss.reset_index()
+
+    @staticmethod
+    def _event_points(score: pd.Series, game_codes: np.ndarray) -> np.ndarray:
+        values = (
+            score.groupby(game_codes)
+            .ffill()
+            .fillna(0.0)
+            .to_numpy(dtype=np.float64)
+        )
+        points = np.diff(values, prepend=0.0)
+        first = np.ones(len(values), dtype=bool)
+        first[1:] = game_codes[1:] != game_codes[:-1]
+        points[first] = values[first]
+        return np.maximum(points, 0.0)
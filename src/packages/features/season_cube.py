@@ -0,0 +1,250 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from packages.preprocessing.memory import parse_minutes
+
+STAT_COLUMNS = [
+    "FGM",
+    "FGA",
+    "FG3M",
+    "FG3A",
+    "FTM",
+    "FTA",
+    "OREB",
+    "DREB",
+    "AST",
+    "STL",
+    "BLK",
+    "TO",
+    "PF",
+    "PTS",
+    "PLUS_MINUS",
+]
+
+PLAYER_KEYS = ["PLAYER_ID", "TEAM_ID", "SEASON"]
+TEAM_KEYS = ["TEAM_ID", "SEASON"]
+
+
+class SeasonCube:
+    """
+    Precomputed season aggregates over games_details.
+
+    Two grains are stored as Parquet files in `cube_dir`:
+    (PLAYER_ID, TEAM_ID, SEASON) and (TEAM_ID, SEASON). Each holds the sum
+    of `STAT_COLUMNS`, seconds played and games played. Rates and per-game
+    values are derived on read, so the cube stays additive and can be
+    updated with new games only.
+    """
+
+    PLAYER_FILE = "player_season.parquet"
+    TEAM_FILE = "team_season.parquet"
+    GAMES_FILE = "games.parquet"
+
+    def __init__(self, cube_dir: str):
+        self._cube_dir = Path(cube_dir)
+        self._players = self._empty(PLAYER_KEYS)
+        self._teams = self._empty(TEAM_KEYS)
+        self._game_ids = np.empty(0, dtype=np.int64)
+
+    @property
+    def game_ids(self) -> np.ndarray:
+        """Sorted GAME_IDs already aggregated in the cube."""
+        return self._game_ids
+
+    def load(self) -> "SeasonCube":
+        """
+        Load the cube from `cube_dir` if it has been saved before.
+
+        Returns:
+            The cube itself, for chaining.
+        """
+        player_file = self._cube_dir / self.PLAYER_FILE
+        if not player_file.is_file():
+            return self
+        self._players = self._indexed(pd.read_parquet(player_file))
+        self._teams = self._indexed(
+            pd.read_parquet(self._cube_dir / self.TEAM_FILE)
+        )
+        games = pd.read_parquet(self._cube_dir / self.GAMES_FILE)
+        self._game_ids = games["GAME_ID"].to_numpy(dtype=np.int64)
+        return self
+
+    def save(self) -> None:
+        """Write both grains and the processed GAME_IDs as Parquet."""
+        self._cube_dir.mkdir(parents=True, exist_ok=True)
+        self._players.reset_index().to_parquet(
+            self._cube_dir / self.PLAYER_FILE, index=False
+        )
+        self._teams.reset_index().to_parquet(
+            self._cube_dir / self.TEAM_FILE, index=False
+        )
+        pd.DataFrame({"GAME_ID": self._game_ids}).to_parquet(
+            self._cube_dir / self.GAMES_FILE, index=False
+        )
+
+    def update(self, details: pd.DataFrame, games: pd.DataFrame) -> int:
+        """
+        Add box score lines of games not aggregated yet.
+
+        Args:
+            details: games_details rows (new or full file).
+            games: games rows used to map GAME_ID to SEASON.
+
+        Returns:
+            Number of new games added to the cube.
+        """
+        new_ids = np.setdiff1d(
+            details["GAME_ID"].to_numpy(dtype=np.int64), self._game_ids
+        )
+        if new_ids.size == 0:
+            return 0
+
+        rows = details[details["GAME_ID"].isin(new_ids)]
+        seasons = games.drop_duplicates(subset="GAME_ID").set_index("GAME_ID")[
+            "SEASON"
+        ]
+        rows = rows.assign(SEASON=rows["GAME_ID"].map(seasons))
+        rows = rows.dropna(subset=["SEASON"])
+
+        stats = rows[STAT_COLUMNS].apply(pd.to_numeric, errors="coerce")
+        seconds = parse_minutes(rows["MIN"])
+        lines = pd.DataFrame(
+            {
+                "PLAYER_ID": rows["PLAYER_ID"].to_numpy(dtype=np.int64),
+                "TEAM_ID": rows["TEAM_ID"].to_numpy(dtype=np.int64),
+                "SEASON": rows["SEASON"].to_numpy(dtype=np.int64),
+                "GAME_ID": rows["GAME_ID"].to_numpy(dtype=np.int64),
+                "GP": seconds.notna().to_numpy(dtype=np.int64),
+                "SECONDS": seconds.fillna(0.0).to_numpy(),
+            }
+        )
+        for col in STAT_COLUMNS:
+            lines[col] = stats[col].fillna(0.0).to_numpy()
+
+        value_cols = ["GP", "SECONDS", *STAT_COLUMNS]
+        players = lines.groupby(PLAYER_KEYS, sort=False)[value_cols].sum()
+        teams = lines.groupby(TEAM_KEYS, sort=False)[value_cols[1:]].sum()
+        teams.insert(
+            0,
+            "GP",
+            lines.groupby(TEAM_KEYS, sort=False)["GAME_ID"].nunique(),
+        )
+
+        self._players = self._merge(self._players, players)
+        self._teams = self._merge(self._teams, teams)
+        self._game_ids = np.union1d(
+            self._game_ids, lines["GAME_ID"].to_numpy()
+        )
+        return int(lines["GAME_ID"].nunique())
+
+    def player_season(
+        self, player_id: int, season: int | None = None
+    ) -> pd.DataFrame:
+        """
+        Totals, shooting splits and per-game averages of a player.
+
+        Args:
+            player_id: PLAYER_ID to look up.
+            season: Restrict to one season, all seasons if None.
+
+        Returns:
+            One row per (TEAM_ID, SEASON) stint of the player.
+        """
+        try:
+            rows = self._players.loc[[player_id]]
+        except KeyError:
+            rows = self._players.iloc[:0]
+        if season is not None:
+            rows = rows[rows.index.get_level_values("SEASON") == season]
+        return self.with_rates(rows.reset_index())
+
+    def team_season(
+        self, team_id: int, season: int | None = None
+    ) -> pd.DataFrame:
+        """
+        Totals, shooting splits and per-game averages of a team.
+
+        Args:
+            team_id: TEAM_ID to look up.
+            season: Restrict to one season, all seasons if None.
+
+        Returns:
+            One row per season of the team.
+        """
+        try:
+            rows = self._teams.loc[[team_id]]
+        except KeyError:
+            rows = self._teams.iloc[:0]
+        if season is not None:
+            rows = rows[rows.index.get_level_values("SEASON") == season]
+        return self.with_rates(rows.reset_index())
+
+    def season_players(self, season: int) -> pd.DataFrame:
+        """
+        Every player line of a season, with derived rates.
+
+        Args:
+            season: Season to extract.
+
+        Returns:
+            One row per (PLAYER_ID, TEAM_ID) for the season.
+        """
+        rows = self._players[
+            self._players.index.get_level_values("SEASON") == season
+        ]
+        return self.with_rates(rows.reset_index())
+
+    @staticmethod
+    def with_rates(frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        Add shooting splits and per-game averages to cube rows.
+
+        Args:
+            frame: Cube rows holding summed columns.
+
+        Returns:
+            Copy of `frame` with derived columns.
+        """
+        out = frame.copy()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fga = out["FGA"].to_numpy(dtype=np.float64)
+            fta = out["FTA"].to_numpy(dtype=np.float64)
+            fg3a = out["FG3A"].to_numpy(dtype=np.float64)
+            gp = out["GP"].to_numpy(dtype=np.float64)
+            out["MIN"] = out["SECONDS"] / 60.0
+            out["REB"] = out["OREB"] + out["DREB"]
+            out["FG_PCT"] = out["FGM"] / fga
+            out["FG3_PCT"] = out["FG3M"] / fg3a
+            out["FT_PCT"] = out["FTM"] / fta
+            out["EFG_PCT"] = (out["FGM"] + 0.5 * out["FG3M"]) / fga
+            out["TS_PCT"] = out["PTS"] / (2.0 * (fga + 0.44 * fta))
+            for col in ["MIN", "PTS", "REB", "AST", "STL", "BLK", "TO"]:
+                out[f"{col}_PG"] = out[col] / gp
+        return out.replace([np.inf, -np.inf], np.nan)
+
+    @staticmethod
+    def _empty(keys: list[str]) -> pd.DataFrame:
+        columns = ["GP", "SECONDS", *STAT_COLUMNS]
+        index = pd.MultiIndex.from_arrays(
+            [np.empty(0, dtype=np.int64) for _ in keys], names=keys
+        )
+        return pd.DataFrame(
+            {col: np.empty(0, dtype=np.float64) for col in columns},
+            index=index,
+        )
+
+    @staticmethod
+    def _indexed(frame: pd.DataFrame) -> pd.DataFrame:
+        keys = PLAYER_KEYS if "PLAYER_ID" in frame.columns else TEAM_KEYS
+        return frame.set_index(keys).sort_index()
+
+    @staticmethod
+    def _merge(current: pd.DataFrame, new: pd.DataFrame) -> pd.DataFrame:
+        if current.empty:
+            return new.sort_index()
+        combined = pd.concat([current, new])
+        return combined.groupby(level=list(range(combined.index.nlevels)))[
+            list(current.columns)
+        ].sum()
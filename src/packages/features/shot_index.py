@@ -0,0 +1,326 @@
+import json
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from packages.preprocessing.seasons import season_from_dates
+
+SHOT_VALUES = ("2-pt", "3-pt")
+SHOT_FAMILIES = ("jump shot", "layup", "dunk", "hook shot", "tip-in", "other")
+DISTANCE_EDGES = (0, 3, 10, 16, 24, 30)
+DISTANCE_LABELS = ("0-3", "3-10", "10-16", "16-24", "24-30", "30+", "n/a")
+OUTCOMES = ("miss", "make")
+
+ENTITY_KINDS = ("player", "team")
+
+
+class ShotIndex:
+    """
+    Shot-distribution histograms over play-by-play shots.
+
+    Every shot is binned by value (2-pt / 3-pt), shot family, distance
+    bucket and outcome. Counts are kept as dense int32 arrays shaped
+    (entity, season, value, family, distance, outcome) for players
+    (`Shooter`) and teams (shooting side), so profiles over any season
+    range are sums of array slices instead of row scans.
+    """
+
+    def __init__(self):
+        self._seasons: list[int] = []
+        self._names: dict[str, pd.Index] = {
+            kind: pd.Index([], dtype=object) for kind in ENTITY_KINDS
+        }
+        self._counts: dict[str, np.ndarray] = {
+            kind: np.zeros((0, 0, *self._cell_shape()), dtype=np.int32)
+            for kind in ENTITY_KINDS
+        }
+        # League totals per season, rebuilt lazily after each `add`
+        self._league: dict[str, np.ndarray] = {}
+
+    @property
+    def seasons(self) -> list[int]:
+        """Seasons present in the index."""
+        return list(self._seasons)
+
+    def entities(self, kind: str) -> list[str]:
+        """Player or team names known by the index."""
+        return self._names[kind].tolist()
+
+    def add(self, pbp: pd.DataFrame, season: int | None = None) -> int:
+        """
+        Bin the shots of play-by-play events into the index.
+
+        A season already present is replaced, so reloading a season file
+        never double counts.
+
+        Args:
+            pbp: Play-by-play events, typically one season file.
+            season: Season start year; derived from `Date` if None.
+
+        Returns:
+            Number of shots added.
+        """
+        shots = pbp[pbp["Shooter"].notna() & pbp["ShotOutcome"].notna()]
+        if season is not None:
+            season_values = np.full(len(shots), season, dtype=np.int64)
+        else:
+            season_values = season_from_dates(shots["Date"])
+        self._league.clear()
+        for value in np.unique(season_values).tolist():
+            self._clear_season(value)
+
+        shot_type = shots["ShotType"].astype("string").str.lower()
+        value_idx = shot_type.str.startswith("3-pt").fillna(False)
+        family_idx = np.full(len(shots), len(SHOT_FAMILIES) - 1)
+        for i, family in reversed(list(enumerate(SHOT_FAMILIES[:-1]))):
+            match = shot_type.str.contains(family, regex=False)
+            family_idx[match.fillna(False).to_numpy()] = i
+        distance = pd.to_numeric(shots["ShotDist"], errors="coerce").to_numpy(
+            dtype=np.float64
+        )
+        bucket_idx = np.digitize(distance, DISTANCE_EDGES[1:])
+        bucket_idx[np.isnan(distance)] = len(DISTANCE_LABELS) - 1
+        outcome_idx = (
+            shots["ShotOutcome"].astype("string").str.lower() == "make"
+        )
+
+        season_idx = np.array(
+            [self._season_position(s) for s in season_values.tolist()],
+            dtype=np.int64,
+        )
+        cells = (
+            value_idx.to_numpy(dtype=np.int64),
+            family_idx,
+            bucket_idx,
+            outcome_idx.fillna(False).to_numpy(dtype=np.int64),
+        )
+        teams = np.where(
+            shots["HomePlay"].notna(), shots["HomeTeam"], shots["AwayTeam"]
+        )
+        for kind, names in (
+            ("player", shots["Shooter"].to_numpy(dtype=object)),
+            ("team", teams.astype(object)),
+        ):
+            entity_idx = self._entity_positions(kind, names)
+            self._accumulate(kind, (entity_idx, season_idx, *cells))
+        return len(shots)
+
+    def profile(
+        self,
+        kind: str,
+        name: str | None = None,
+        seasons: Iterable[int] | tuple[int, int] | None = None,
+        by: tuple[str, ...] = ("value", "distance"),
+    ) -> pd.DataFrame:
+        """
+        Attempts, makes and efficiency of an entity, or the league.
+
+        Args:
+            kind: "player" or "team".
+            name: Entity name, the whole league if None.
+            seasons: (first, last) inclusive range, explicit seasons, or
+                every season if None.
+            by: Axes kept in the result among "value", "family" and
+                "distance"; the other axes are summed.
+
+        Returns:
+            One row per kept cell with FGA, FGM, FG_PCT and EFG_PCT.
+        """
+        selected = self._select(kind, name, seasons)
+        threes_only = np.zeros_like(selected)
+        threes_only[SHOT_VALUES.index("3-pt")] = selected[
+            SHOT_VALUES.index("3-pt")
+        ]
+        axes = {"value": 0, "family": 1, "distance": 2}
+        summed = tuple(axes[a] for a in axes if a not in by)
+        counts = selected.sum(axis=summed) if summed else selected
+        threes = threes_only.sum(axis=summed) if summed else threes_only
+
+        labels = {
+            "value": SHOT_VALUES,
+            "family": SHOT_FAMILIES,
+            "distance": DISTANCE_LABELS,
+        }
+        kept = [a for a in axes if a in by]
+        if len(kept) == 1:
+            index = pd.Index(labels[kept[0]], name=kept[0])
+        elif kept:
+            index = pd.MultiIndex.from_product(
+                [labels[a] for a in kept], names=kept
+            )
+        else:
+            index = pd.Index(["all"], name="cell")
+        flat = counts.reshape(-1, len(OUTCOMES))
+        fgm = flat[:, 1].astype(np.int64)
+        fga = flat.sum(axis=1).astype(np.int64)
+        fg3m = threes.reshape(-1, len(OUTCOMES))[:, 1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            frame = pd.DataFrame(
+                {
+                    "FGA": fga,
+                    "FGM": fgm,
+                    "FG_PCT": fgm / fga,
+                    "EFG_PCT": (fgm + 0.5 * fg3m) / fga,
+                },
+                index=index,
+            )
+        return frame
+
+    def attempts(
+        self, kind: str, name: str | None = None, **kwargs
+    ) -> pd.Series:
+        """Attempts per cell, see `profile`."""
+        return self.profile(kind, name, **kwargs)["FGA"]
+
+    def makes(self, kind: str, name: str | None = None, **kwargs) -> pd.Series:
+        """Makes per cell, see `profile`."""
+        return self.profile(kind, name, **kwargs)["FGM"]
+
+    def compare_to_league(
+        self,
+        kind: str,
+        name: str,
+        seasons: Iterable[int] | tuple[int, int] | None = None,
+        by: tuple[str, ...] = ("distance",),
+    ) -> pd.DataFrame:
+        """
+        Entity profile next to the league profile over the same seasons.
+
+        Args:
+            kind: "player" or "team".
+            name: Entity name.
+            seasons: Season selection, see `profile`.
+            by: Kept axes, see `profile`.
+
+        Returns:
+            Entity columns, LEAGUE_* columns, share of attempts per cell
+            and eFG% difference with the league.
+        """
+        entity = self.profile(kind, name, seasons, by)
+        league = self.profile(kind, None, seasons, by).add_prefix("LEAGUE_")
+        frame = entity.join(league)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            frame["FGA_SHARE"] = frame["FGA"] / frame["FGA"].sum()
+            frame["LEAGUE_FGA_SHARE"] = (
+                frame["LEAGUE_FGA"] / frame["LEAGUE_FGA"].sum()
+            )
+        frame["EFG_DIFF"] = frame["EFG_PCT"] - frame["LEAGUE_EFG_PCT"]
+        return frame
+
+    def save(self, filepath: str) -> None:
+        """
+        Write counts and dimension labels to a .npz file.
+
+        Args:
+            filepath: Output file path.
+        """
+        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "seasons": self._seasons,
+            "names": {k: v.tolist() for k, v in self._names.items()},
+        }
+        arrays: dict[str, Any] = {
+            f"counts_{k}": v for k, v in self._counts.items()
+        }
+        with open(filepath, "wb") as f:
+            np.savez_compressed(f, meta=np.array(json.dumps(meta)), **arrays)
+
+    @classmethod
+    def load(cls, filepath: str) -> "ShotIndex":
+        """
+        Rebuild an index written by `save`.
+
+        Args:
+            filepath: Path of the .npz file.
+
+        Returns:
+            Loaded ShotIndex.
+        """
+        index = cls()
+        with np.load(filepath) as data:
+            meta = json.loads(str(data["meta"]))
+            for kind in ENTITY_KINDS:
+                index._counts[kind] = data[f"counts_{kind}"]
+        index._seasons = meta["seasons"]
+        index._names = {
+            k: pd.Index(v, dtype=object) for k, v in meta["names"].items()
+        }
+        return index
+
+    @staticmethod
+    def _cell_shape() -> tuple[int, ...]:
+        return (
+            len(SHOT_VALUES),
+            len(SHOT_FAMILIES),
+            len(DISTANCE_LABELS),
+            len(OUTCOMES),
+        )
+
+    def _select(
+        self,
+        kind: str,
+        name: str | None,
+        seasons: Iterable[int] | tuple[int, int] | None,
+    ) -> np.ndarray:
+        counts = self._counts[kind]
+        if seasons is None:
+            season_idx = np.arange(len(self._seasons))
+        else:
+            if isinstance(seasons, tuple) and len(seasons) == 2:
+                first, last = seasons
+                wanted = [s for s in self._seasons if first <= s <= last]
+            else:
+                wanted = [s for s in seasons if s in self._seasons]
+            season_idx = np.array(
+                [self._seasons.index(s) for s in wanted], dtype=np.int64
+            )
+        if name is None:
+            if kind not in self._league:
+                self._league[kind] = counts.sum(axis=0)
+            return self._league[kind][season_idx].sum(axis=0)
+        position = self._names[kind].get_indexer(pd.Index([name]))[0]
+        if position < 0:
+            return np.zeros(self._cell_shape(), dtype=np.int64)
+        return counts[position, season_idx].sum(axis=0)
+
+    def _season_position(self, season: int) -> int:
+        if season not in self._seasons:
+            self._seasons.append(season)
+            for kind, counts in self._counts.items():
+                extra = np.zeros(
+                    (counts.shape[0], 1, *self._cell_shape()), dtype=np.int32
+                )
+                self._counts[kind] = np.concatenate([counts, extra], axis=1)
+        return self._seasons.index(season)
+
+    def _clear_season(self, season: int) -> None:
+        if season in self._seasons:
+            position = self._seasons.index(season)
+            for counts in self._counts.values():
+                counts[:, position] = 0
+
+    def _entity_positions(self, kind: str, names: np.ndarray) -> np.ndarray:
+        known = self._names[kind]
+        new_names = pd.Index(pd.unique(names)).difference(known)
+        if len(new_names):
+            self._names[kind] = known.append(new_names)
+            counts = self._counts[kind]
+            extra = np.zeros(
+                (len(new_names), *counts.shape[1:]), dtype=np.int32
+            )
+            self._counts[kind] = np.concatenate([counts, extra], axis=0)
+        return self._names[kind].get_indexer(pd.Index(names))
+
+    def _accumulate(
+        self, kind: str, positions: tuple[np.ndarray, ...]
+    ) -> None:
+        counts = self._counts[kind]
+        flat = np.ravel_multi_index(positions, counts.shape)
+        counts += (
+            np.bincount(flat, minlength=counts.size)
+            .reshape(counts.shape)
+            .astype(np.int32)
+        )
@@ -0,0 +1,181 @@
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+
+COUNT_COLUMNS = ["G", "W", "L", "HOME_W", "HOME_L", "ROAD_W", "ROAD_L"]
+STANDING_COLUMNS = [*COUNT_COLUMNS, "W_PCT"]
+
+
+def parse_record(values: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Split "W-L" record strings (`HOME_RECORD`, `ROAD_RECORD`) into ints.
+
+    Args:
+        values: Record strings, e.g. "12-3".
+
+    Returns:
+        Wins and losses arrays, -1 where the record is missing or invalid.
+    """
+    # A season only holds a few hundred distinct records: parse those
+    codes, uniques = pd.factorize(values)
+    parts = (
+        pd.Series(uniques, dtype="string")
+        .str.extract(r"^\s*(\d+)-(\d+)\s*$")
+        .apply(pd.to_numeric, errors="coerce")
+        .fillna(-1)
+        .to_numpy(dtype=np.int32)
+    )
+    parts = np.vstack([parts, [[-1, -1]]])
+    rows = parts[np.where(codes < 0, len(uniques), codes)]
+    return rows[:, 0], rows[:, 1]
+
+
+def _day_numbers(dates) -> np.ndarray:
+    # Missing dates map before any snapshot, so they never match
+    codes, uniques = pd.factorize(pd.Series(dates))
+    days = pd.to_datetime(pd.Series(uniques)).to_numpy(dtype="datetime64[D]")
+    days = np.append(days.astype(np.int64), np.iinfo(np.int32).min)
+    return days[np.where(codes < 0, len(uniques), codes)]
+
+
+class StandingsIndex:
+    """
+    As-of lookup of team standings over ranking.csv snapshots.
+
+    Snapshots are sorted by (team, date) into flat arrays: one int64 key
+    per snapshot (team code and day number packed together), an int32
+    matrix of `COUNT_COLUMNS` and a float W_PCT array. Home and road
+    records are parsed once at build time. A batch of (team, date)
+    queries is answered with a single `np.searchsorted` on the keys.
+    """
+
+    # Room for every day number in a team block of the packed keys
+    _TEAM_STRIDE = 1 << 32
+
+    def __init__(self, ranking: pd.DataFrame):
+        frame = ranking.dropna(subset=["TEAM_ID", "STANDINGSDATE"])
+        team_ids = frame["TEAM_ID"].to_numpy(dtype=np.int64)
+        days = _day_numbers(frame["STANDINGSDATE"])
+        self._teams = np.unique(team_ids)
+        keys = self._pack(np.searchsorted(self._teams, team_ids), days)
+        order = np.argsort(keys, kind="stable")
+        # The last snapshot of a duplicated (team, date) wins
+        keys = keys[order]
+        last = np.ones(len(keys), dtype=bool)
+        last[:-1] = keys[1:] != keys[:-1]
+        order = order[last]
+        self._keys = keys[last]
+        self._days = days[order]
+
+        home_w, home_l = parse_record(frame["HOME_RECORD"])
+        road_w, road_l = parse_record(frame["ROAD_RECORD"])
+        counts = np.column_stack(
+            [
+                *(
+                    frame[col].fillna(-1).to_numpy(dtype=np.int32)
+                    for col in ("G", "W", "L")
+                ),
+                home_w,
+                home_l,
+                road_w,
+                road_l,
+            ]
+        )
+        self._counts = counts[order]
+        self._w_pct = frame["W_PCT"].to_numpy(dtype=np.float64)[order]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def teams(self) -> np.ndarray:
+        """Sorted TEAM_IDs present in the index."""
+        return self._teams
+
+    def lookup(self, team_ids, dates, strict: bool = True) -> pd.DataFrame:
+        """
+        Standings of each team as of each date.
+
+        Args:
+            team_ids: TEAM_ID of every query.
+            dates: Date of every query.
+            strict: Use the last snapshot strictly before the date (the
+                standings known before a game); on or before if False.
+
+        Returns:
+            One row per query with `STANDING_COLUMNS` and STANDINGSDATE,
+            NaN where the team has no snapshot early enough.
+        """
+        team_ids = np.asarray(team_ids, dtype=np.int64)
+        days = _day_numbers(dates)
+        codes = np.searchsorted(self._teams, team_ids)
+        codes = np.minimum(codes, max(len(self._teams) - 1, 0))
+        known = (
+            self._teams[codes] == team_ids
+            if len(self._teams)
+            else np.zeros(len(team_ids), dtype=bool)
+        )
+
+        side: Literal["left", "right"] = "left" if strict else "right"
+        positions = (
+            np.searchsorted(self._keys, self._pack(codes, days), side=side) - 1
+        )
+        # A hit must belong to the same team block
+        found = known & (positions >= 0)
+        found[found] = (
+            self._keys[positions[found]] // self._TEAM_STRIDE == codes[found]
+        )
+
+        safe = np.where(found, positions, 0)
+        result = {}
+        if len(self._keys):
+            counts = self._counts[safe].astype(np.float64)
+            w_pct = self._w_pct[safe]
+            snapshot_days = self._days[safe]
+        else:
+            counts = np.zeros((len(safe), len(COUNT_COLUMNS)))
+            w_pct = np.zeros(len(safe))
+            snapshot_days = np.zeros(len(safe), dtype=np.int64)
+        counts[~found] = np.nan
+        # Records that could not be parsed stay unknown
+        counts[counts < 0] = np.nan
+        for i, col in enumerate(COUNT_COLUMNS):
+            result[col] = counts[:, i]
+        result["W_PCT"] = np.where(found, w_pct, np.nan)
+        result["STANDINGSDATE"] = np.where(
+            found,
+            snapshot_days.astype("datetime64[D]"),
+            np.datetime64("NaT"),
+        ).astype("datetime64[s]")
+        return pd.DataFrame(result)
+
+    def annotate_games(
+        self,
+        games: pd.DataFrame,
+        date_column: str = "GAME_DATE_EST",
+        team_columns: tuple[str, str] = ("HOME_TEAM_ID", "VISITOR_TEAM_ID"),
+    ) -> pd.DataFrame:
+        """
+        Add pre-game standings of both teams to games.
+
+        Args:
+            games: Games holding a date and the two team id columns.
+            date_column: Game date column.
+            team_columns: Home and away TEAM_ID columns.
+
+        Returns:
+            Copy of `games` with HOME_STD_* and AWAY_STD_* columns.
+        """
+        out = games.copy()
+        dates = games[date_column].to_numpy()
+        for side, column in zip(("HOME", "AWAY"), team_columns, strict=True):
+            standings = self.lookup(games[column].to_numpy(), dates)
+            for col in STANDING_COLUMNS:
+                out[f"{side}_STD_{col}"] = standings[col].to_numpy()
+        return out
+
+    def _pack(self, codes: np.ndarray, days: np.ndarray) -> np.ndarray:
+        return codes.astype(np.int64) * self._TEAM_STRIDE + (
+            days.astype(np.int64) + (self._TEAM_STRIDE >> 1)
+        )
@@ -0,0 +1,394 @@
+import numpy as np
+import pandas as pd
+
+from .possessions import PossessionBuilder, elapsed_seconds, period_length
+
+KIND_ACT = 0
+KIND_ENTER = 1
+KIND_LEAVE = 2
+
+HOME = 1
+AWAY = 0
+
+
+def popcount(masks: np.ndarray) -> np.ndarray:
+    """Number of set bits of each uint64 lineup mask."""
+    masks = np.ascontiguousarray(masks, dtype=np.uint64)
+    bits = np.unpackbits(masks.view(np.uint8).reshape(-1, 8), axis=1)
+    return bits.sum(axis=1)
+
+
+class StintEngine:
+    """
+    Rebuild on-court lineups and stints from play-by-play events.
+
+    Players are coded per (game, team) and a lineup is a uint64 bitset of
+    those codes. A player is a period starter when their first appearance
+    in the period is not an `EnterGame`; periods with fewer than five
+    detected starters are completed with players on court at the end of
+    the previous period who did not check in again. Substitutions toggle
+    two bits, so lineups of every event are a cumulative XOR of the
+    substitutions applied to the period starters.
+    """
+
+    # Player columns attributed to the team of the play column
+    SAME_SIDE_COLUMNS = [
+        "Shooter",
+        "Assister",
+        "Fouler",
+        "Rebounder",
+        "ViolationPlayer",
+        "FreeThrowShooter",
+        "TurnoverPlayer",
+    ]
+    # Player columns attributed to the opposing team
+    OTHER_SIDE_COLUMNS = ["Blocker", "Fouled", "TurnoverCauser"]
+    NON_PLAYERS = ["Team"]
+    LINEUP_SIZE = 5
+
+    def __init__(
+        self,
+        possession_builder: PossessionBuilder | None = None,
+        game_column: str = "URL",
+    ):
+        self._game_column = game_column
+        self._builder = possession_builder or PossessionBuilder(game_column)
+
+    def build(self, pbp: pd.DataFrame) -> pd.DataFrame:
+        """
+        Stint table of raw play-by-play events.
+
+        Args:
+            pbp: Play-by-play events of one or many games.
+
+        Returns:
+            One row per stint, see `stints`.
+        """
+        return self.stints(self._builder.annotate(pbp))
+
+    def stints(self, events: pd.DataFrame) -> pd.DataFrame:
+        """
+        Split annotated events into stints of constant lineups.
+
+        Args:
+            events: Output of `PossessionBuilder.annotate`.
+
+        Returns:
+            One row per stint with both lineups (sorted tuples of player
+            names), start/end game time, duration, points and possessions
+            of each team.
+        """
+        game_codes, _ = pd.factorize(events[self._game_column])
+        quarter = events["Quarter"].to_numpy(dtype=np.int64)
+        home_mask, away_mask, players = self._lineup_masks(
+            events, game_codes, quarter
+        )
+
+        n_events = len(events)
+        period_change = np.ones(n_events, dtype=bool)
+        period_change[1:] = (game_codes[1:] != game_codes[:-1]) | (
+            quarter[1:] != quarter[:-1]
+        )
+        new_stint = period_change.copy()
+        new_stint[1:] |= (home_mask[1:] != home_mask[:-1]) | (
+            away_mask[1:] != away_mask[:-1]
+        )
+        stint_id = np.cumsum(new_stint) - 1
+
+        poss_id = events["POSS_ID"].to_numpy()
+        poss_start = np.ones(n_events, dtype=bool)
+        poss_start[1:] = poss_id[1:] != poss_id[:-1]
+        off_home = events["OFF_HOME"].to_numpy(dtype=bool)
+
+        frame = pd.DataFrame(
+            {
+                "STINT_ID": stint_id,
+                "GAME_CODE": game_codes,
+                self._game_column: events[self._game_column].to_numpy(),
+                "Quarter": quarter,
+                "HomeTeam": events["HomeTeam"].to_numpy(),
+                "AwayTeam": events["AwayTeam"].to_numpy(),
+                "HOME_MASK": home_mask,
+                "AWAY_MASK": away_mask,
+                "START_TIME": events["ELAPSED"].to_numpy(dtype=np.float64),
+                "PTS_HOME": events["PTS_HOME"].to_numpy(dtype=np.float64),
+                "PTS_AWAY": events["PTS_AWAY"].to_numpy(dtype=np.float64),
+                "POSS_HOME": (poss_start & off_home).astype(np.int64),
+                "POSS_AWAY": (poss_start & ~off_home).astype(np.int64),
+            }
+        )
+        stints = frame.groupby("STINT_ID", sort=True).agg(
+            GAME_CODE=("GAME_CODE", "first"),
+            GAME=(self._game_column, "first"),
+            Quarter=("Quarter", "first"),
+            HomeTeam=("HomeTeam", "first"),
+            AwayTeam=("AwayTeam", "first"),
+            HOME_MASK=("HOME_MASK", "first"),
+            AWAY_MASK=("AWAY_MASK", "first"),
+            START_TIME=("START_TIME", "first"),
+            PTS_HOME=("PTS_HOME", "sum"),
+            PTS_AWAY=("PTS_AWAY", "sum"),
+            POSS_HOME=("POSS_HOME", "sum"),
+            POSS_AWAY=("POSS_AWAY", "sum"),
+        )
+        stints = stints.rename(columns={"GAME": self._game_column})
+
+        st_quarter = stints["Quarter"].to_numpy(dtype=np.int64)
+        st_game = stints["GAME_CODE"].to_numpy()
+        first_in_period = period_change[new_stint]
+        last_in_period = np.ones(len(stints), dtype=bool)
+        last_in_period[:-1] = first_in_period[1:]
+        period_start = elapsed_seconds(st_quarter, period_length(st_quarter))
+        period_end = elapsed_seconds(st_quarter, np.zeros(len(stints)))
+
+        start = np.where(
+            first_in_period, period_start, stints["START_TIME"].to_numpy()
+        )
+        end = np.empty_like(start)
+        end[:-1] = start[1:]
+        end = np.where(last_in_period, period_end, end)
+        stints["START_TIME"] = start
+        stints["END_TIME"] = end
+        stints["DURATION"] = end - start
+
+        stints["HOME_LINEUP"] = self._decode(
+            st_game, HOME, stints["HOME_MASK"].to_numpy(), players
+        )
+        stints["AWAY_LINEUP"] = self._decode(
+            st_game, AWAY, stints["AWAY_MASK"].to_numpy(), players
+        )
+        return stints.drop(columns=["GAME_CODE"]).reset_index()
+
+    @staticmethod
+    def lineup_plus_minus(stints: pd.DataFrame) -> pd.DataFrame:
+        """
+        Aggregate stints into per-lineup totals.
+
+        Args:
+            stints: Output of `stints`, for one game or a whole season.
+
+        Returns:
+            One row per (TEAM, LINEUP) with seconds played, points and
+            possessions for and against, plus-minus and net rating per
+            100 possessions.
+        """
+        sides = []
+        for team, lineup, pts, opp_pts, poss, opp_poss in (
+            (
+                "HomeTeam",
+                "HOME_LINEUP",
+                "PTS_HOME",
+                "PTS_AWAY",
+                "POSS_HOME",
+                "POSS_AWAY",
+            ),
+            (
+                "AwayTeam",
+                "AWAY_LINEUP",
+                "PTS_AWAY",
+                "PTS_HOME",
+                "POSS_AWAY",
+                "POSS_HOME",
+            ),
+        ):
+            sides.append(
+                pd.DataFrame(
+                    {
+                        "TEAM": stints[team].to_numpy(),
+                        "LINEUP": stints[lineup].to_numpy(),
+                        "SECONDS": stints["DURATION"].to_numpy(),
+                        "PTS_FOR": stints[pts].to_numpy(),
+                        "PTS_AGAINST": stints[opp_pts].to_numpy(),
+                        "POSS_FOR": stints[poss].to_numpy(),
+                        "POSS_AGAINST": stints[opp_poss].to_numpy(),
+                    }
+                )
+            )
+        totals = (
+            pd.concat(sides, ignore_index=True)
+            .groupby(["TEAM", "LINEUP"], sort=False)
+            .sum()
+        )
+        totals["PLUS_MINUS"] = totals["PTS_FOR"] - totals["PTS_AGAINST"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            totals["NET_RTG"] = 100.0 * (
+                totals["PTS_FOR"] / totals["POSS_FOR"]
+                - totals["PTS_AGAINST"] / totals["POSS_AGAINST"]
+            )
+        return totals.replace([np.inf, -np.inf], np.nan).reset_index()
+
+    def _appearances(self, events: pd.DataFrame) -> pd.DataFrame:
+        is_home = events["HomePlay"].notna().to_numpy()
+        is_away = events["AwayPlay"].notna().to_numpy() & ~is_home
+        has_side = is_home | is_away
+        event_side = is_home.astype(np.int64)
+        index = np.arange(len(events))
+
+        columns = [
+            (col, event_side, KIND_ACT) for col in self.SAME_SIDE_COLUMNS
+        ]
+        columns += [
+            (col, 1 - event_side, KIND_ACT) for col in self.OTHER_SIDE_COLUMNS
+        ]
+        columns += [
+            ("EnterGame", event_side, KIND_ENTER),
+            ("LeaveGame", event_side, KIND_LEAVE),
+        ]
+        jumpball = [
+            ("JumpballHomePlayer", HOME),
+            ("JumpballAwayPlayer", AWAY),
+        ]
+
+        parts = []
+        for col, side, kind in columns:
+            if col not in events.columns:
+                continue
+            values = events[col]
+            valid = (
+                values.notna() & ~values.isin(self.NON_PLAYERS)
+            ).to_numpy() & has_side
+            parts.append((index[valid], side[valid], values[valid], kind))
+        for col, side_value in jumpball:
+            if col not in events.columns:
+                continue
+            values = events[col]
+            valid = (
+                values.notna() & ~values.isin(self.NON_PLAYERS)
+            ).to_numpy()
+            side = np.full(int(valid.sum()), side_value)
+            parts.append((index[valid], side, values[valid], KIND_ACT))
+
+        appearances = pd.DataFrame(
+            {
+                "EVENT": np.concatenate([p[0] for p in parts]),
+                "SIDE": np.concatenate([p[1] for p in parts]),
+                "PLAYER": np.concatenate(
+                    [p[2].to_numpy(dtype=object) for p in parts]
+                ),
+                "KIND": np.concatenate(
+                    [np.full(len(p[0]), p[3]) for p in parts]
+                ),
+            }
+        )
+        return appearances.sort_values("EVENT", kind="stable")
+
+    def _lineup_masks(
+        self,
+        events: pd.DataFrame,
+        game_codes: np.ndarray,
+        quarter: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, dict[tuple[int, int], np.ndarray]]:
+        n_events = len(events)
+        app = self._appearances(events)
+        app_event = app["EVENT"].to_numpy()
+        app["GAME"] = game_codes[app_event]
+        app["QUARTER"] = quarter[app_event]
+
+        # Player code per (game, team), in order of first appearance
+        combos = app.drop_duplicates(["GAME", "SIDE", "PLAYER"])[
+            ["GAME", "SIDE", "PLAYER"]
+        ]
+        combos = combos.assign(
+            CODE=combos.groupby(["GAME", "SIDE"]).cumcount()
+        )
+        if len(combos) and combos["CODE"].max() >= 64:
+            raise ValueError("More than 64 players for a team in one game")
+        players: dict[tuple[int, int], np.ndarray] = {}
+        for _, group in combos.groupby(["GAME", "SIDE"], sort=False):
+            game, side = group[["GAME", "SIDE"]].to_numpy()[0]
+            players[int(game), int(side)] = group["PLAYER"].to_numpy()
+        app = app.merge(combos, on=["GAME", "SIDE", "PLAYER"], how="left")
+        app["BIT"] = np.left_shift(
+            np.uint64(1), app["CODE"].to_numpy(dtype=np.uint64)
+        )
+
+        period_change = np.ones(n_events, dtype=bool)
+        period_change[1:] = (game_codes[1:] != game_codes[:-1]) | (
+            quarter[1:] != quarter[:-1]
+        )
+        period_id = np.cumsum(period_change) - 1
+        period_first = np.flatnonzero(period_change)
+        period_last = np.append(period_first[1:] - 1, n_events - 1)
+        n_periods = len(period_first)
+        app["PERIOD"] = period_id[app["EVENT"].to_numpy()]
+
+        first = app.drop_duplicates(["PERIOD", "SIDE", "PLAYER"])
+        starters = np.zeros((2, n_periods), dtype=np.uint64)
+        entered = np.zeros((2, n_periods), dtype=np.uint64)
+        for target, selected in (
+            (starters, first[first["KIND"] != KIND_ENTER]),
+            (entered, first[first["KIND"] == KIND_ENTER]),
+        ):
+            np.bitwise_or.at(
+                target,
+                (
+                    selected["SIDE"].to_numpy(),
+                    selected["PERIOD"].to_numpy(),
+                ),
+                selected["BIT"].to_numpy(),
+            )
+
+        subs = app[app["KIND"] != KIND_ACT]
+        toggles = np.zeros((2, n_events), dtype=np.uint64)
+        np.bitwise_xor.at(
+            toggles,
+            (subs["SIDE"].to_numpy(), subs["EVENT"].to_numpy()),
+            subs["BIT"].to_numpy(),
+        )
+
+        masks = []
+        for side in (AWAY, HOME):
+            cumulative = np.bitwise_xor.accumulate(toggles[side])
+            base = np.zeros(n_periods, dtype=np.uint64)
+            base[1:] = cumulative[period_first[1:] - 1]
+            period_xor = cumulative[period_last] ^ base
+            self._complete_starters(
+                starters[side],
+                entered[side],
+                period_xor,
+                game_codes[period_first],
+            )
+            masks.append(
+                starters[side][period_id] ^ cumulative ^ base[period_id]
+            )
+        return masks[HOME], masks[AWAY], players
+
+    def _complete_starters(
+        self,
+        starters: np.ndarray,
+        entered: np.ndarray,
+        period_xor: np.ndarray,
+        period_game: np.ndarray,
+    ) -> None:
+        incomplete = np.flatnonzero(popcount(starters) < self.LINEUP_SIZE)
+        for period in incomplete.tolist():
+            if period == 0 or period_game[period] != period_game[period - 1]:
+                continue
+            previous_end = starters[period - 1] ^ period_xor[period - 1]
+            candidates = int(
+                previous_end & ~entered[period] & ~starters[period]
+            )
+            missing = self.LINEUP_SIZE - bin(int(starters[period])).count("1")
+            while candidates and missing > 0:
+                lowest = candidates & -candidates
+                starters[period] |= np.uint64(lowest)
+                candidates ^= lowest
+                missing -= 1
+
+    @staticmethod
+    def _decode(
+        games: np.ndarray,
+        side: int,
+        masks: np.ndarray,
+        players: dict[tuple[int, int], np.ndarray],
+    ) -> list[tuple[str, ...]]:
+        cache: dict[tuple[int, int], tuple[str, ...]] = {}
+        lineups = []
+        for game, mask in zip(games.tolist(), masks.tolist(), strict=True):
+            key = (game, mask)
+            if key not in cache:
+                names = players.get((game, side), np.empty(0, dtype=object))
+                codes = [i for i in range(len(names)) if mask >> i & 1]
+                cache[key] = tuple(sorted(names[codes].tolist()))
+            lineups.append(cache[key])
+        return lineups
@@ -0,0 +1,307 @@
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from packages.features.possessions import (
+    OVERTIME_PERIOD,
+    REGULATION_PERIOD,
+    PossessionBuilder,
+)
+
+GAME_SECONDS = 4 * REGULATION_PERIOD
+
+
+@dataclass
+class WinProbabilityConfig:
+    """
+    Grid and smoothing of the win-probability table.
+
+    Attributes:
+        max_margin: Home margins are clipped to [-max_margin, max_margin].
+        time_step: Width in seconds of the time-remaining bins.
+        strength_bins: Number of bins of the pre-game home win
+            probability (1 when the table is fitted without strength).
+        margin_sigma: Gaussian smoothing width along margin at tip-off,
+            in bins, shrinking to 0 at the end of the game.
+        time_sigma: Gaussian smoothing width along time, in bins.
+        prior_weight: Pseudo-count of the analytical prior in each cell.
+        game_sigma: Standard deviation of a full-game final margin, in
+            points, used by the prior.
+    """
+
+    max_margin: int = 30
+    time_step: int = 10
+    strength_bins: int = 10
+    margin_sigma: float = 2.0
+    time_sigma: float = 2.0
+    prior_weight: float = 10.0
+    game_sigma: float = 13.0
+
+
+def seconds_remaining(quarter, sec_left) -> np.ndarray:
+    """
+    Seconds left in regulation, or in the overtime being played.
+
+    Args:
+        quarter: Period numbers, 5 and above for overtimes.
+        sec_left: Seconds left in the period.
+
+    Returns:
+        Float array between 0 and 2880.
+    """
+    quarter = np.asarray(quarter, dtype=np.int64)
+    sec_left = np.asarray(sec_left, dtype=np.float64)
+    regulation = np.maximum(4 - quarter, 0) * REGULATION_PERIOD + sec_left
+    overtime = np.minimum(sec_left, OVERTIME_PERIOD)
+    return np.where(quarter <= 4, regulation, overtime)
+
+
+def _smooth(values: np.ndarray, axis: int, sigma) -> np.ndarray:
+    # Gaussian filter along one axis; `sigma` may vary along the other
+    # axes (array broadcastable to `values`, size 1 along `axis`)
+    sigma = np.asarray(sigma, dtype=np.float64)
+    radius = int(np.ceil(3 * sigma.max()))
+    if radius == 0:
+        return values
+    offsets = np.arange(-radius, radius + 1)
+    safe = np.where(sigma > 0, sigma, 1.0)
+    weights = [
+        np.where(sigma > 0, np.exp(-0.5 * (offset / safe) ** 2), offset == 0)
+        for offset in offsets
+    ]
+    total = sum(weights)
+    pad = [(0, 0)] * values.ndim
+    pad[axis] = (radius, radius)
+    padded = np.pad(values, pad, mode="edge")
+    size = values.shape[axis]
+    out = np.zeros_like(values)
+    for offset, weight in zip(offsets, weights, strict=True):
+        window = np.take(
+            padded, np.arange(radius + offset, radius + offset + size), axis
+        )
+        out += weight / total * window
+    return out
+
+
+class WinProbabilityTable:
+    """
+    Home win probability by game state, precomputed on a dense grid.
+
+    Cells are indexed by (pre-game strength bin, home offense, seconds
+    remaining bin, home margin) and hold P(home win). Fitting counts wins
+    and events of historical pbp per cell, smooths both counts along
+    margin and time, and shrinks sparse cells to a normal-approximation
+    prior. Queries are pure index arithmetic, so the curve of every event
+    of a season is one array lookup.
+    """
+
+    def __init__(self, table: np.ndarray, config: WinProbabilityConfig):
+        self.table = table
+        self.config = config
+
+    @property
+    def n_strength(self) -> int:
+        """Number of strength bins of the table."""
+        return self.table.shape[0]
+
+    @classmethod
+    def fit(
+        cls,
+        pbp: pd.DataFrame,
+        strength: np.ndarray | None = None,
+        config: WinProbabilityConfig | None = None,
+    ) -> "WinProbabilityTable":
+        """
+        Build the table from historical play-by-play events.
+
+        Args:
+            pbp: Events with Quarter, SecLeft, HomeScore, AwayScore,
+                HomeTeam and WinningTeam, plus the columns used by
+                `PossessionBuilder`.
+            strength: Pre-game home win probability of each event's game,
+                aligned on `pbp`; the table has a single strength bin
+                if None.
+            config: Grid and smoothing parameters.
+
+        Returns:
+            Fitted table.
+        """
+        config = config or WinProbabilityConfig()
+        n_strength = config.strength_bins if strength is not None else 1
+        frame = pbp.assign(
+            _STRENGTH=(
+                np.asarray(strength, dtype=np.float64)
+                if strength is not None
+                else 0.5
+            ),
+            _HOME_WIN=(pbp["WinningTeam"] == pbp["HomeTeam"]).astype(
+                np.float64
+            ),
+        ).dropna(subset=["WinningTeam"])
+        table = cls(np.zeros((n_strength, 2, 1, 1)), config)
+        margin, remaining, off_home, events = table._state(frame)
+        cells = table._cells(margin, remaining, off_home, events["_STRENGTH"])
+        shape = table._shape(n_strength)
+        size = int(np.prod(shape))
+        wins = np.bincount(
+            cells, weights=events["_HOME_WIN"].to_numpy(), minlength=size
+        ).reshape(shape)
+        counts = np.bincount(cells, minlength=size).astype(np.float64)
+        counts = counts.reshape(shape)
+
+        # Margin smoothing fades out with the time left: one point decides
+        # the game at the buzzer
+        remaining = np.arange(shape[2]) * config.time_step / GAME_SECONDS
+        margin_sigma = config.margin_sigma * np.sqrt(remaining)
+        for axis, sigma in (
+            (2, config.time_sigma),
+            (3, margin_sigma[None, None, :, None]),
+        ):
+            wins = _smooth(wins, axis, sigma)
+            counts = _smooth(counts, axis, sigma)
+        prior = table._prior(shape)
+        weight = config.prior_weight
+        table.table = ((wins + weight * prior) / (counts + weight)).astype(
+            np.float32
+        )
+        return table
+
+    def lookup(
+        self,
+        margin,
+        remaining,
+        off_home,
+        strength=None,
+    ) -> np.ndarray:
+        """
+        Home win probability of game states.
+
+        Args:
+            margin: Home score minus away score.
+            remaining: Seconds remaining, see `seconds_remaining`.
+            off_home: Whether the home team has the ball.
+            strength: Pre-game home win probability, ignored by tables
+                fitted without strength.
+
+        Returns:
+            float32 probabilities.
+        """
+        margin = np.asarray(margin, dtype=np.float64)
+        if strength is None:
+            strength = np.full(margin.shape, 0.5)
+        cells = self._cells(margin, remaining, off_home, strength)
+        return self.table.reshape(-1)[cells]
+
+    def game_series(
+        self, pbp: pd.DataFrame, strength: np.ndarray | None = None
+    ) -> pd.DataFrame:
+        """
+        Win-probability curve of every game of a pbp frame.
+
+        Args:
+            pbp: Events of one or many games.
+            strength: Pre-game home win probability, aligned on `pbp`.
+
+        Returns:
+            Events in chronological order per game (URL, Quarter, SecLeft,
+            scores) with ELAPSED, MARGIN and WP_HOME.
+        """
+        frame = pbp.assign(
+            _STRENGTH=(
+                np.asarray(strength, dtype=np.float64)
+                if strength is not None
+                else 0.5
+            )
+        )
+        margin, remaining, off_home, events = self._state(frame)
+        wp = self.lookup(margin, remaining, off_home, events["_STRENGTH"])
+        out = events[
+            ["URL", "Quarter", "SecLeft", "HomeScore", "AwayScore", "ELAPSED"]
+        ].copy()
+        out["MARGIN"] = margin
+        out["WP_HOME"] = wp
+        return out
+
+    def save(self, filepath: str) -> None:
+        """Write the table and its config to a .npz file."""
+        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        with open(filepath, "wb") as f:
+            np.savez(
+                f,
+                table=self.table,
+                config=np.array(json.dumps(asdict(self.config))),
+            )
+
+    @classmethod
+    def load(cls, filepath: str) -> "WinProbabilityTable":
+        """Rebuild a table written by `save`."""
+        with np.load(filepath) as state:
+            config = WinProbabilityConfig(**json.loads(str(state["config"])))
+            return cls(state["table"].astype(np.float32), config)
+
+    def _state(
+        self, frame: pd.DataFrame
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, pd.DataFrame]:
+        events = PossessionBuilder().annotate(frame)
+        games = events["URL"]
+        scores = (
+            events[["HomeScore", "AwayScore"]]
+            .groupby(games)
+            .ffill()
+            .fillna(0.0)
+            .to_numpy(dtype=np.float64)
+        )
+        margin = scores[:, 0] - scores[:, 1]
+        remaining = seconds_remaining(events["Quarter"], events["SecLeft"])
+        return margin, remaining, events["OFF_HOME"].to_numpy(), events
+
+    def _shape(self, n_strength: int) -> tuple[int, int, int, int]:
+        cfg = self.config
+        n_time = GAME_SECONDS // cfg.time_step + 1
+        return n_strength, 2, n_time, 2 * cfg.max_margin + 1
+
+    def _cells(self, margin, remaining, off_home, strength) -> np.ndarray:
+        cfg = self.config
+        shape = self._shape(self.n_strength)
+        margin_bin = (
+            np.clip(np.rint(margin), -cfg.max_margin, cfg.max_margin)
+            + cfg.max_margin
+        ).astype(np.int64)
+        time_bin = np.clip(
+            np.rint(np.asarray(remaining, dtype=np.float64) / cfg.time_step),
+            0,
+            shape[2] - 1,
+        ).astype(np.int64)
+        strength = np.nan_to_num(
+            np.asarray(strength, dtype=np.float64), nan=0.5
+        )
+        strength_bin = np.clip(
+            (strength * shape[0]).astype(np.int64), 0, shape[0] - 1
+        )
+        poss_bin = np.asarray(off_home, dtype=bool).astype(np.int64)
+        return np.ravel_multi_index(
+            (strength_bin, poss_bin, time_bin, margin_bin), shape
+        )
+
+    def _prior(self, shape: tuple[int, int, int, int]) -> np.ndarray:
+        # Final margin ~ Normal(current margin + strength edge, sd growing
+        # with the square root of the time left), logistic approximation
+        cfg = self.config
+        strength = (np.arange(shape[0]) + 0.5) / shape[0]
+        if shape[0] == 1:
+            strength = np.array([0.55])
+        p = np.clip(strength, 0.01, 0.99)
+        edge = cfg.game_sigma * 0.6 * np.log(p / (1 - p))
+        remaining = np.arange(shape[2]) * cfg.time_step / GAME_SECONDS
+        margin = np.arange(shape[3]) - cfg.max_margin
+        possession = np.array([-0.5, 0.5])
+        mean = (
+            margin[None, None, None, :]
+            + possession[None, :, None, None]
+            + (edge[:, None, None, None] * remaining[None, None, :, None])
+        )
+        sd = cfg.game_sigma * np.sqrt(remaining)[None, None, :, None] + 0.5
+        return 1.0 / (1.0 + np.exp(-1.7 * mean / sd))
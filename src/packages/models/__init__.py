@@ -1 +1,26 @@
 # Package modules.models
+from .scoring import FeatureState, ScoringService, request_scores
+from .search import HalvingSearch
+from .train_model import (
+    FeatureCache,
+    FeatureConfig,
+    FeatureMatrix,
+    ModelTrainer,
+    build_features,
+    make_estimator,
+    season_folds,
+)
+
+__all__ = [
+    "FeatureCache",
+    "FeatureConfig",
+    "FeatureMatrix",
+    "FeatureState",
+    "HalvingSearch",
+    "ModelTrainer",
+    "ScoringService",
+    "build_features",
+    "make_estimator",
+    "request_scores",
+    "season_folds",
+]
@@ -0,0 +1,291 @@
+import json
+import pickle
+import socket
+import socketserver
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from packages.features.elo import EloRatingEngine
+from packages.features.standings import STANDING_COLUMNS, StandingsIndex
+from packages.models.train_model import (
+    TARGET_COLUMN,
+    FeatureConfig,
+    standing_features,
+    replay_elo,
+    team_games,
+)
+
+REQUEST_COLUMNS = [
+    "GAME_ID",
+    "GAME_DATE_EST",
+    "SEASON",
+    "HOME_TEAM_ID",
+    "VISITOR_TEAM_ID",
+]
+
+
+class FeatureState:
+    """
+    Latest pre-game feature state of every team.
+
+    Holds what the training features need to score a game that has not
+    been played yet: the as-of standings index, each team's last
+    `form_window` results and last game day per season, and the Elo
+    ratings after the last finished game. Features of a whole batch are
+    then array lookups, with no pass over the history.
+    """
+
+    def __init__(
+        self,
+        history: pd.DataFrame,
+        config: FeatureConfig,
+        standings: StandingsIndex | None = None,
+    ):
+        self.config = config
+        self._standings = standings
+        finished = history.dropna(
+            subset=["PTS_home", "PTS_away", TARGET_COLUMN]
+        )
+        finished = finished.sort_values(
+            ["GAME_DATE_EST", "GAME_ID"], kind="stable"
+        ).reset_index(drop=True)
+
+        long = team_games(finished)
+        keys = ["TEAM_ID", "SEASON"]
+        recent = long.groupby(keys, sort=False).tail(config.form_window)
+        self._form = recent.groupby(keys).agg(
+            FORM_WIN=("WIN", "mean"), FORM_NET=("NET", "mean")
+        )
+        self._form["LAST_DAY"] = long.groupby(keys)["DAY"].max()
+
+        self._elo: EloRatingEngine | None = None
+        if config.include_elo:
+            self._elo = replay_elo(finished)[0]
+
+    def features(self, games: pd.DataFrame) -> pd.DataFrame:
+        """
+        Training features of upcoming games.
+
+        Args:
+            games: Games holding `REQUEST_COLUMNS`.
+
+        Returns:
+            Feature columns named as in `build_features`, aligned on
+            `games`.
+        """
+        games = games.reset_index(drop=True)
+        if self._standings is not None:
+            annotated = self._standings.annotate_games(games)
+        else:
+            annotated = games.copy()
+            for side in ("HOME", "AWAY"):
+                for col in STANDING_COLUMNS:
+                    annotated[f"{side}_STD_{col}"] = np.nan
+        out = standing_features(annotated)
+
+        days = (
+            pd.to_datetime(games["GAME_DATE_EST"])
+            .to_numpy(dtype="datetime64[D]")
+            .astype(np.int64)
+        )
+        seasons = games["SEASON"].to_numpy(dtype=np.int64)
+        for side, column in (
+            ("HOME", "HOME_TEAM_ID"),
+            ("AWAY", "VISITOR_TEAM_ID"),
+        ):
+            keys = pd.MultiIndex.from_arrays(
+                [games[column].to_numpy(dtype=np.int64), seasons]
+            )
+            positions = self._form.index.get_indexer(keys)
+            form = self._form.to_numpy(dtype=np.float64)[positions]
+            form[positions < 0] = np.nan
+            out[f"{side}_FORM_WIN"] = form[:, 0]
+            out[f"{side}_FORM_NET"] = form[:, 1]
+            out[f"{side}_REST"] = np.minimum(
+                days - form[:, 2], self.config.rest_cap_days
+            )
+        out["FORM_NET_DIFF"] = out["HOME_FORM_NET"] - out["AWAY_FORM_NET"]
+
+        if self._elo is not None:
+            home, away, prob = self._elo.pregame(
+                games["HOME_TEAM_ID"].to_numpy(),
+                games["VISITOR_TEAM_ID"].to_numpy(),
+                seasons,
+            )
+            out["ELO_DIFF"] = home - away
+            out["ELO_PROB_HOME"] = prob
+        return out
+
+
+class ScoringService:
+    """
+    Warm scorer of upcoming games.
+
+    The model of a training run and the `FeatureState` are loaded once;
+    each batch of games is then scored with one vectorized
+    `predict_proba` call. Requests can come from Python (`score`), as
+    JSON (`handle`) or over a local TCP socket (`serve`, one JSON request
+    per line).
+    """
+
+    def __init__(self, run_dir: str, state: FeatureState):
+        with open(Path(run_dir) / "model.pkl", "rb") as f:
+            artifact = pickle.load(f)
+        self._model = artifact["model"]
+        self._columns: list[str] = artifact["columns"]
+        self._state = state
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_run(
+        cls,
+        run_dir: str,
+        history: pd.DataFrame,
+        standings: StandingsIndex | None = None,
+    ) -> "ScoringService":
+        """
+        Build the service with the feature config saved by the run.
+
+        Args:
+            run_dir: Directory written by `ModelTrainer.train`.
+            history: Game view used to build the feature state.
+            standings: As-of standings of upcoming game dates.
+
+        Returns:
+            Warm scoring service.
+        """
+        with open(Path(run_dir) / "metrics.json", encoding="utf-8") as f:
+            config = FeatureConfig(**json.load(f)["feature_config"])
+        return cls(run_dir, FeatureState(history, config, standings))
+
+    @property
+    def columns(self) -> list[str]:
+        """Feature columns expected by the model."""
+        return list(self._columns)
+
+    def refresh(self, state: FeatureState) -> None:
+        """Swap in a feature state built after new games were played."""
+        with self._lock:
+            self._state = state
+
+    def score(self, games: pd.DataFrame) -> pd.DataFrame:
+        """
+        Home win probability of a batch of games.
+
+        Args:
+            games: Games holding `REQUEST_COLUMNS`.
+
+        Returns:
+            `REQUEST_COLUMNS`, PROB_HOME_WIN and the feature snapshot used
+            for each game.
+        """
+        with self._lock:
+            state = self._state
+        features = state.features(games)[self._columns]
+        matrix = features.to_numpy(dtype=np.float32)
+        proba = self._model.predict_proba(matrix)[:, 1]
+        result = games[REQUEST_COLUMNS].reset_index(drop=True)
+        result["PROB_HOME_WIN"] = proba
+        return pd.concat([result, features], axis=1)
+
+    def handle(self, request: dict) -> dict:
+        """
+        Score a JSON request {"games": [{<REQUEST_COLUMNS>}, ...]}.
+
+        Args:
+            request: Decoded request.
+
+        Returns:
+            {"predictions": [...], "elapsed_ms": float}, or {"error": str}.
+        """
+        started = time.perf_counter()
+        try:
+            games = pd.DataFrame(request["games"])
+            missing = set(REQUEST_COLUMNS) - set(games.columns)
+            if missing:
+                raise KeyError(f"Missing game fields: {sorted(missing)}")
+            scored = self.score(games)
+        except (KeyError, TypeError, ValueError) as err:
+            return {"error": str(err)}
+        scored["GAME_DATE_EST"] = scored["GAME_DATE_EST"].astype(str)
+        records = json.loads(scored.to_json(orient="records"))
+        return {
+            "predictions": records,
+            "elapsed_ms": (time.perf_counter() - started) * 1000.0,
+        }
+
+    def serve(self, host: str = "127.0.0.1", port: int = 8765) -> None:
+        """
+        Answer JSON-lines requests on a local TCP socket until interrupted.
+
+        Args:
+            host: Interface to bind, local only by default.
+            port: TCP port.
+        """
+        with self.make_server(host, port) as server:
+            server.serve_forever()
+
+    def make_server(
+        self, host: str = "127.0.0.1", port: int = 8765
+    ) -> socketserver.ThreadingTCPServer:
+        """
+        Bound JSON-lines TCP server of the service, not started yet.
+
+        Args:
+            host: Interface to bind.
+            port: TCP port, 0 for any free port.
+
+        Returns:
+            Threading TCP server, one request per line on each connection.
+        """
+        service = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    if not line.strip():
+                        continue
+                    try:
+                        request = json.loads(line)
+                    except json.JSONDecodeError as err:
+                        response = {"error": f"Invalid JSON: {err}"}
+                    else:
+                        response = service.handle(request)
+                    self.wfile.write(json.dumps(response).encode() + b"\n")
+                    self.wfile.flush()
+
+        class Server(socketserver.ThreadingTCPServer):
+            allow_reuse_address = True
+            daemon_threads = True
+
+        return Server((host, port), Handler)
+
+
+def request_scores(
+    games: pd.DataFrame,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    timeout: float = 10.0,
+) -> dict:
+    """
+    Send a batch of games to a running `ScoringService.serve`.
+
+    Args:
+        games: Games holding `REQUEST_COLUMNS`.
+        host: Server host.
+        port: Server port.
+        timeout: Socket timeout in seconds.
+
+    Returns:
+        Decoded response of the service.
+    """
+    payload = games[REQUEST_COLUMNS].astype({"GAME_DATE_EST": str})
+    request = {"games": payload.to_dict(orient="records")}
+    with socket.create_connection((host, port), timeout=timeout) as conn:
+        conn.sendall(json.dumps(request).encode() + b"\n")
+        with conn.makefile("rb") as reader:
+            return json.loads(reader.readline())
@@ -0,0 +1,321 @@
+import json
+import math
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from packages.models.train_model import (
+    FeatureMatrix,
+    evaluate_fold,
+    make_estimator,
+    season_folds,
+)
+
+RESOURCES = ("max_iter", "seasons")
+# Metrics of `fold_metrics`, mapped to whether greater values are better
+METRICS = {
+    "log_loss": False,
+    "brier": False,
+    "accuracy": True,
+    "roc_auc": True,
+}
+
+
+class HalvingSearch:
+    """
+    Successive halving and Hyperband over a cached feature matrix.
+
+    Candidates are sampled from `space` and evaluated on expanding-window
+    season folds with a growing budget: boosting rounds (`max_iter`) or
+    number of training seasons before each validation season
+    (`seasons`). After each rung only the best 1/`eta` candidates are
+    promoted to an `eta` times larger budget, ranked on `metric` in the
+    direction given by `METRICS`. Fold fits run in a process
+    pool whose workers memory-map the cached matrix read-only.
+
+    Every finished (candidate, budget) evaluation is appended to a JSON
+    lines journal; a search restarted with the same settings replays the
+    journal and only runs the missing evaluations.
+    """
+
+    def __init__(
+        self,
+        features: FeatureMatrix,
+        estimator: str,
+        space: dict[str, list],
+        resource: str = "max_iter",
+        min_resource: int = 10,
+        max_resource: int = 270,
+        eta: int = 3,
+        n_folds: int = 3,
+        metric: str = "log_loss",
+        n_jobs: int = 1,
+        seed: int = 0,
+        journal: str | None = None,
+    ):
+        if resource not in RESOURCES:
+            raise ValueError(f"Unknown resource: {resource}")
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric: {metric}")
+        if features.path is None:
+            raise ValueError("The search needs a cached FeatureMatrix")
+        self._features = features
+        self._path: Path = features.path
+        self._estimator = estimator
+        self._space = space
+        self._resource = resource
+        self._min_resource = min_resource
+        self._max_resource = max_resource
+        self._eta = eta
+        self._metric = metric
+        self._greater_is_better = METRICS[metric]
+        self._n_jobs = n_jobs
+        self._seed = seed
+        self._folds = season_folds(
+            features.seasons,
+            n_folds,
+            min_train_seasons=min_resource if resource == "seasons" else 2,
+        )
+        self._journal = Path(journal) if journal else None
+        self._trials: dict[str, dict] = {}
+        self._load_journal()
+
+    def sample(self, n: int, bracket: int = 0) -> list[dict]:
+        """
+        Draw candidates uniformly from the search space.
+
+        Draws only depend on `seed` and `bracket`, so a restarted search
+        gets the same candidates.
+
+        Args:
+            n: Number of candidates.
+            bracket: Bracket number, to draw different candidates per
+                Hyperband bracket.
+
+        Returns:
+            Parameter dicts.
+        """
+        rng = np.random.default_rng([self._seed, bracket])
+        names = sorted(self._space)
+        candidates = []
+        for _ in range(n):
+            params = {}
+            for name in names:
+                values = self._space[name]
+                params[name] = values[int(rng.integers(len(values)))]
+            candidates.append(params)
+        return candidates
+
+    def successive_halving(
+        self,
+        n_candidates: int,
+        min_resource: int | None = None,
+        bracket: int = 0,
+    ) -> pd.DataFrame:
+        """
+        Run one successive halving bracket.
+
+        Args:
+            n_candidates: Number of sampled candidates of the first rung.
+            min_resource: Budget of the first rung, `min_resource` of the
+                search if None.
+            bracket: Bracket number, see `sample`.
+
+        Returns:
+            Trials of the bracket, see `results`.
+        """
+        budget = min_resource or self._min_resource
+        candidates = {
+            f"{bracket}-{i}": params
+            for i, params in enumerate(self.sample(n_candidates, bracket))
+        }
+        alive = list(candidates)
+        while True:
+            budget = min(budget, self._max_resource)
+            scores = self._run_rung(
+                {cid: candidates[cid] for cid in alive}, budget
+            )
+            if budget >= self._max_resource or len(alive) == 1:
+                break
+            n_keep = max(1, len(alive) // self._eta)
+            alive = sorted(
+                alive,
+                key=lambda cid: scores[cid],
+                reverse=self._greater_is_better,
+            )[:n_keep]
+            budget = budget * self._eta
+        results = self.results()
+        return results[results["bracket"] == bracket]
+
+    def hyperband(self) -> pd.DataFrame:
+        """
+        Run every Hyperband bracket, most aggressive first.
+
+        Returns:
+            All trials, see `results`.
+        """
+        ratio = self._max_resource / self._min_resource
+        s_max = int(math.floor(math.log(ratio, self._eta) + 1e-9))
+        for s in range(s_max, -1, -1):
+            n = int(math.ceil((s_max + 1) / (s + 1) * self._eta**s))
+            budget = int(round(self._max_resource * self._eta ** (-s)))
+            self.successive_halving(n, budget, bracket=s_max - s)
+        return self.results()
+
+    def results(self) -> pd.DataFrame:
+        """
+        Every evaluated (candidate, budget) pair, best first.
+
+        Returns:
+            candidate, bracket, budget, params, mean metrics over folds.
+        """
+        if not self._trials:
+            return pd.DataFrame(
+                columns=["candidate", "bracket", "budget", "params"]
+            )
+        rows = []
+        for trial in self._trials.values():
+            row = {
+                "candidate": trial["candidate"],
+                "bracket": int(trial["candidate"].split("-")[0]),
+                "budget": trial["budget"],
+                "params": trial["params"],
+            }
+            row.update(trial["metrics"])
+            rows.append(row)
+        frame = pd.DataFrame(rows)
+        return frame.sort_values(
+            ["budget", self._metric],
+            ascending=[False, not self._greater_is_better],
+        ).reset_index(drop=True)
+
+    def best(self) -> dict:
+        """Parameters of the best candidate at the largest budget reached."""
+        results = self.results()
+        if results.empty:
+            raise ValueError("No trial has been run yet")
+        best = results.iloc[0]
+        params = dict(best["params"])
+        if self._resource == "max_iter":
+            params["max_iter"] = int(best["budget"])
+        return params
+
+    def _run_rung(
+        self, candidates: dict[str, dict], budget: int
+    ) -> dict[str, float]:
+        todo = [
+            cid
+            for cid in candidates
+            if self._key(cid, budget) not in self._trials
+        ]
+        jobs = []
+        for cid in todo:
+            estimator = self._make(candidates[cid], budget)
+            for train, valid in self._budget_folds(budget):
+                jobs.append(
+                    (
+                        str(self._path),
+                        None,
+                        None,
+                        estimator,
+                        train,
+                        valid,
+                    )
+                )
+
+        if self._n_jobs > 1 and len(jobs) > 1:
+            workers = min(self._n_jobs, len(jobs))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = pool.map(evaluate_fold, *zip(*jobs, strict=True))
+                self._record_rung(todo, candidates, budget, results)
+        else:
+            results = (evaluate_fold(*job) for job in jobs)
+            self._record_rung(todo, candidates, budget, results)
+        return {
+            cid: self._trials[self._key(cid, budget)]["metrics"][self._metric]
+            for cid in candidates
+        }
+
+    def _record_rung(
+        self,
+        todo: list[str],
+        candidates: dict[str, dict],
+        budget: int,
+        results: Iterator[dict[str, float]],
+    ) -> None:
+        # Candidates are journaled as soon as their folds are done, so an
+        # interrupted rung only loses the candidates still running
+        n_folds = len(self._folds)
+        for cid in todo:
+            folds = pd.DataFrame([next(results) for _ in range(n_folds)])
+            self._record(
+                {
+                    "candidate": cid,
+                    "budget": budget,
+                    "params": candidates[cid],
+                    "metrics": folds.mean(numeric_only=True).to_dict(),
+                }
+            )
+
+    def _make(self, params: dict, budget: int):
+        if self._resource == "max_iter":
+            params = {**params, "max_iter": int(budget)}
+        return make_estimator(self._estimator, params)
+
+    def _budget_folds(
+        self, budget: int
+    ) -> list[tuple[np.ndarray, np.ndarray]]:
+        if self._resource != "seasons":
+            return self._folds
+        seasons = self._features.seasons
+        folds = []
+        for train, valid in self._folds:
+            first = seasons[valid[0]] - budget
+            folds.append((train[seasons[train] >= first], valid))
+        return folds
+
+    @staticmethod
+    def _key(candidate: str, budget: int) -> str:
+        return f"{candidate}@{budget}"
+
+    def _signature(self) -> dict:
+        return {
+            "features": self._path.name,
+            "estimator": self._estimator,
+            "space": self._space,
+            "resource": self._resource,
+            "min_resource": self._min_resource,
+            "max_resource": self._max_resource,
+            "eta": self._eta,
+            "folds": len(self._folds),
+            "seed": self._seed,
+        }
+
+    def _load_journal(self) -> None:
+        if self._journal is None:
+            return
+        signature = json.loads(json.dumps(self._signature()))
+        if not self._journal.is_file():
+            self._journal.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._journal, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"signature": signature}) + "\n")
+            return
+        with open(self._journal, encoding="utf-8") as f:
+            lines = [json.loads(line) for line in f if line.strip()]
+        if not lines or lines[0].get("signature") != signature:
+            raise ValueError(
+                f"Journal {self._journal} belongs to another search"
+            )
+        for trial in lines[1:]:
+            self._trials[self._key(trial["candidate"], trial["budget"])] = (
+                trial
+            )
+
+    def _record(self, trial: dict) -> None:
+        self._trials[self._key(trial["candidate"], trial["budget"])] = trial
+        if self._journal is not None:
+            with open(self._journal, "a", encoding="utf-8") as f:
+                f.write(json.dumps(trial, default=float) + "\n")
@@ -0,0 +1,543 @@
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.ensemble import HistGradientBoostingClassifier
+from sklearn.impute import SimpleImputer
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import (
+    accuracy_score,
+    brier_score_loss,
+    log_loss,
+    roc_auc_score,
+)
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+
+from packages.features.elo import EloConfig, EloRatingEngine
+from packages.preprocessing.fingerprint import data_fingerprint
+
+TARGET_COLUMN = "HOME_TEAM_WINS"
+INDEX_COLUMNS = ["GAME_ID", "GAME_DATE_EST", "SEASON"]
+
+
+@dataclass(frozen=True)
+class FeatureConfig:
+    """Parameters of the pre-game feature matrix."""
+
+    form_window: int = 10
+    rest_cap_days: int = 10
+    include_elo: bool = True
+    min_season: int | None = None
+
+
+@dataclass
+class FeatureMatrix:
+    """
+    Feature matrix of finished games, usually memory-mapped from cache.
+
+    Attributes:
+        X: float32 matrix, one row per game.
+        y: Home win target (0/1).
+        seasons: Season of every row, used to build time-aware folds.
+        game_ids: GAME_ID of every row.
+        columns: Feature names of the columns of `X`.
+        path: Directory of the cached arrays, None if built in memory.
+    """
+
+    X: np.ndarray
+    y: np.ndarray
+    seasons: np.ndarray
+    game_ids: np.ndarray
+    columns: list[str]
+    path: Path | None = None
+
+
+def _rolling_previous(
+    values: np.ndarray, starts: np.ndarray, window: int
+) -> np.ndarray:
+    """
+    Mean of the `window` previous values inside consecutive groups.
+
+    Args:
+        values: Values sorted by group, then time.
+        starts: Position of the first row of each row's group.
+        window: Number of previous rows averaged.
+
+    Returns:
+        Float array, NaN on the first row of each group.
+    """
+    valid = ~np.isnan(values)
+    sums = np.concatenate([[0.0], np.cumsum(np.where(valid, values, 0.0))])
+    counts = np.concatenate([[0], np.cumsum(valid)])
+    end = np.arange(len(values))
+    begin = np.maximum(end - window, starts)
+    total = sums[end] - sums[begin]
+    n = counts[end] - counts[begin]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(n > 0, total / n, np.nan)
+
+
+def build_features(view: pd.DataFrame, config: FeatureConfig) -> pd.DataFrame:
+    """
+    Pre-game features of finished games from the preprocessing game view.
+
+    Every feature only uses information available before tip-off:
+    standings of the day before, rolling form over the previous games of
+    the season, rest days and, optionally, pre-game Elo ratings.
+
+    Args:
+        view: Output of `DataPreprocessor.game_view`.
+        config: Feature parameters.
+
+    Returns:
+        `INDEX_COLUMNS`, feature columns and `TARGET_COLUMN`, sorted by
+        date then GAME_ID.
+    """
+    games = view.dropna(subset=["PTS_home", "PTS_away", TARGET_COLUMN])
+    games = games.sort_values(["GAME_DATE_EST", "GAME_ID"], kind="stable")
+    # Elo runs over the whole history, so that ratings of the first kept
+    # season carry what happened before `min_season`
+    elo = replay_elo(games)[1] if config.include_elo else None
+    if config.min_season is not None:
+        games = games[games["SEASON"] >= config.min_season]
+    games = games.reset_index(drop=True)
+    out = games[INDEX_COLUMNS].join(standing_features(games))
+    out = out.join(_team_form(games, config))
+    out["FORM_NET_DIFF"] = out["HOME_FORM_NET"] - out["AWAY_FORM_NET"]
+
+    if elo is not None:
+        elo = elo.set_index("GAME_ID")
+        diff = elo["ELO_PRE_home"] - elo["ELO_PRE_away"]
+        out["ELO_DIFF"] = out["GAME_ID"].map(diff)
+        out["ELO_PROB_HOME"] = out["GAME_ID"].map(elo["ELO_PROB_home"])
+
+    out[TARGET_COLUMN] = games[TARGET_COLUMN].astype(np.int8)
+    return out
+
+
+def standing_features(games: pd.DataFrame) -> pd.DataFrame:
+    """
+    Standings features of games holding HOME_STD_* and AWAY_STD_* columns.
+
+    Args:
+        games: Game view rows, or games annotated by
+            `StandingsIndex.annotate_games`.
+
+    Returns:
+        Win percentages, games played and venue records (home record of
+        the home team, road record of the away team), aligned on `games`.
+    """
+    out = pd.DataFrame(index=games.index)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for side, venue in (("HOME", "HOME"), ("AWAY", "ROAD")):
+            wins = games[f"{side}_STD_{venue}_W"].to_numpy(dtype=np.float64)
+            losses = games[f"{side}_STD_{venue}_L"].to_numpy(dtype=np.float64)
+            out[f"{side}_W_PCT"] = games[f"{side}_STD_W_PCT"]
+            out[f"{side}_G"] = games[f"{side}_STD_G"]
+            out[f"{side}_VENUE_PCT"] = wins / (wins + losses)
+    out["W_PCT_DIFF"] = out["HOME_W_PCT"] - out["AWAY_W_PCT"]
+    return out
+
+
+def team_games(games: pd.DataFrame) -> pd.DataFrame:
+    """
+    One row per (game, team) with the result seen by that team.
+
+    Args:
+        games: Games with scores and `TARGET_COLUMN`.
+
+    Returns:
+        ROW (position in `games`), IS_HOME, TEAM_ID, SEASON, DAY (day
+        number), WIN and NET (point margin), sorted by team, season, day.
+    """
+    n = len(games)
+    home_pts = games["PTS_home"].to_numpy(dtype=np.float64)
+    away_pts = games["PTS_away"].to_numpy(dtype=np.float64)
+    home_win = games[TARGET_COLUMN].to_numpy(dtype=np.float64)
+    days = (
+        pd.to_datetime(games["GAME_DATE_EST"])
+        .to_numpy(dtype="datetime64[D]")
+        .astype(np.int64)
+    )
+    # One row per (game, team): home rows then away rows
+    long = pd.DataFrame(
+        {
+            "ROW": np.tile(np.arange(n), 2),
+            "IS_HOME": np.repeat([True, False], n),
+            "TEAM_ID": np.concatenate(
+                [games["HOME_TEAM_ID"], games["VISITOR_TEAM_ID"]]
+            ),
+            "SEASON": np.tile(games["SEASON"].to_numpy(), 2),
+            "DAY": np.tile(days, 2),
+            "WIN": np.concatenate([home_win, 1.0 - home_win]),
+            "NET": np.concatenate([home_pts - away_pts, away_pts - home_pts]),
+        }
+    )
+    return long.sort_values(["TEAM_ID", "SEASON", "DAY", "ROW"])
+
+
+def replay_elo(
+    games: pd.DataFrame,
+) -> tuple[EloRatingEngine, pd.DataFrame]:
+    """
+    Elo ratings replayed over finished games.
+
+    Training and serving both call it on the full history so that their
+    ratings agree whatever the `min_season` of the feature config.
+
+    Args:
+        games: Finished games sorted by date then GAME_ID.
+
+    Returns:
+        The engine holding the ratings after the last game, and its
+        per-game output (see `EloRatingEngine.process`).
+    """
+    engine = EloRatingEngine(EloConfig())
+    return engine, engine.process(games[EloRatingEngine.GAME_COLUMNS])
+
+
+def _team_form(games: pd.DataFrame, config: FeatureConfig) -> pd.DataFrame:
+    long = team_games(games)
+    group = long[["TEAM_ID", "SEASON"]].to_numpy()
+    first = np.ones(len(long), dtype=bool)
+    first[1:] = (group[1:] != group[:-1]).any(axis=1)
+    starts = np.maximum.accumulate(np.where(first, np.arange(len(long)), 0))
+
+    long["FORM_WIN"] = _rolling_previous(
+        long["WIN"].to_numpy(), starts, config.form_window
+    )
+    long["FORM_NET"] = _rolling_previous(
+        long["NET"].to_numpy(), starts, config.form_window
+    )
+    rest = np.diff(long["DAY"].to_numpy(), prepend=0).astype(np.float64)
+    rest[first] = np.nan
+    long["REST"] = np.minimum(rest, config.rest_cap_days)
+
+    form = pd.DataFrame(index=np.arange(len(games)))
+    for side, is_home in (("HOME", True), ("AWAY", False)):
+        rows = long[long["IS_HOME"] == is_home].set_index("ROW").sort_index()
+        for col in ("FORM_WIN", "FORM_NET", "REST"):
+            form[f"{side}_{col}"] = rows[col].to_numpy()
+    return form
+
+
+class FeatureCache:
+    """
+    On-disk cache of feature matrices as float32 .npy memmaps.
+
+    Entries are keyed by the feature config and the fingerprint of the
+    input data, so a new config or new games produce a new entry while
+    repeated runs reopen the cached arrays without building anything.
+    """
+
+    def __init__(self, cache_dir: str):
+        self._cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def key(config: FeatureConfig, fingerprint: str) -> str:
+        """Cache key of a (config, data) pair."""
+        payload = json.dumps(
+            {"config": asdict(config), "data": fingerprint}, sort_keys=True
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+    def load(self, key: str) -> FeatureMatrix | None:
+        """
+        Open a cached matrix in read-only memory-mapped mode.
+
+        Args:
+            key: Cache key, see `key`.
+
+        Returns:
+            The cached matrix, None if absent.
+        """
+        path = self._cache_dir / key
+        if not (path / "meta.json").is_file():
+            return None
+        return self._open(path)
+
+    def store(self, key: str, features: pd.DataFrame) -> FeatureMatrix:
+        """
+        Write the output of `build_features` and reopen it memory-mapped.
+
+        Args:
+            key: Cache key, see `key`.
+            features: Output of `build_features`.
+
+        Returns:
+            The cached matrix.
+        """
+        columns = [
+            c
+            for c in features.columns
+            if c not in (*INDEX_COLUMNS, TARGET_COLUMN)
+        ]
+        path = self._cache_dir / key
+        tmp_path = self._cache_dir / f".{key}.{os.getpid()}"
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        tmp_path.mkdir(parents=True)
+
+        matrix = np.lib.format.open_memmap(
+            tmp_path / "X.npy",
+            mode="w+",
+            dtype=np.float32,
+            shape=(len(features), len(columns)),
+        )
+        for i, col in enumerate(columns):
+            matrix[:, i] = features[col].to_numpy(dtype=np.float32)
+        matrix.flush()
+        del matrix
+        np.save(tmp_path / "y.npy", features[TARGET_COLUMN].to_numpy())
+        np.save(tmp_path / "seasons.npy", features["SEASON"].to_numpy())
+        np.save(tmp_path / "game_ids.npy", features["GAME_ID"].to_numpy())
+        with open(tmp_path / "meta.json", "w", encoding="utf-8") as f:
+            json.dump({"columns": columns, "rows": len(features)}, f)
+
+        # Entries are immutable: a concurrent writer may have won the race
+        if path.exists():
+            shutil.rmtree(tmp_path)
+        else:
+            tmp_path.rename(path)
+        return self._open(path)
+
+    @staticmethod
+    def _open(path: Path) -> FeatureMatrix:
+        with open(path / "meta.json", encoding="utf-8") as f:
+            meta = json.load(f)
+        return FeatureMatrix(
+            X=np.load(path / "X.npy", mmap_mode="r"),
+            y=np.load(path / "y.npy", mmap_mode="r"),
+            seasons=np.load(path / "seasons.npy"),
+            game_ids=np.load(path / "game_ids.npy"),
+            columns=meta["columns"],
+            path=path,
+        )
+
+
+def season_folds(
+    seasons: np.ndarray, n_folds: int = 5, min_train_seasons: int = 2
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    """
+    Expanding-window folds over seasons.
+
+    Each fold validates on one season and trains on every earlier season,
+    so the model never sees games played after the validation games.
+
+    Args:
+        seasons: Season of every row.
+        n_folds: Number of validation seasons (the most recent ones).
+        min_train_seasons: Minimum number of training seasons.
+
+    Returns:
+        (train positions, validation positions) pairs, oldest first.
+    """
+    unique = np.unique(seasons)
+    candidates = unique[min_train_seasons:]
+    folds = []
+    for season in candidates[-n_folds:] if n_folds else []:
+        train = np.flatnonzero(seasons < season)
+        valid = np.flatnonzero(seasons == season)
+        folds.append((train, valid))
+    return folds
+
+
+def fold_metrics(y_true: np.ndarray, proba: np.ndarray) -> dict[str, float]:
+    """Probabilistic and classification metrics of home-win predictions."""
+    proba = np.clip(proba, 1e-6, 1.0 - 1e-6)
+    metrics = {
+        "log_loss": float(log_loss(y_true, proba, labels=[0, 1])),
+        "brier": float(brier_score_loss(y_true, proba)),
+        "accuracy": float(accuracy_score(y_true, proba >= 0.5)),
+    }
+    if len(np.unique(y_true)) == 2:
+        metrics["roc_auc"] = float(roc_auc_score(y_true, proba))
+    return metrics
+
+
+def make_estimator(name: str = "logistic", params: dict | None = None):
+    """
+    Build one of the supported classifiers.
+
+    Args:
+        name: "logistic" (imputed, scaled logistic regression) or
+            "gradient_boosting" (HistGradientBoostingClassifier).
+        params: Keyword arguments of the classifier.
+
+    Returns:
+        Unfitted scikit-learn estimator.
+    """
+    params = params or {}
+    if name == "logistic":
+        return make_pipeline(
+            SimpleImputer(strategy="median", keep_empty_features=True),
+            StandardScaler(),
+            LogisticRegression(max_iter=1000, **params),
+        )
+    if name == "gradient_boosting":
+        return HistGradientBoostingClassifier(**params)
+    raise ValueError(f"Unknown estimator: {name}")
+
+
+def evaluate_fold(
+    path: str | None,
+    X: np.ndarray | None,
+    y: np.ndarray | None,
+    estimator,
+    train: np.ndarray,
+    valid: np.ndarray,
+) -> dict[str, float]:
+    """
+    Fit a clone of an estimator on one fold and score its validation rows.
+
+    Runs in pool workers: with `path` set, the cached arrays are reopened
+    memory-mapped so their pages are shared, never pickled.
+
+    Args:
+        path: Directory of a cached `FeatureMatrix`, or None.
+        X: In-memory matrix, used when `path` is None.
+        y: In-memory target, used when `path` is None.
+        estimator: Unfitted scikit-learn classifier.
+        train: Training row positions.
+        valid: Validation row positions.
+
+    Returns:
+        `fold_metrics` plus fit time and fold sizes.
+    """
+    if path is not None:
+        X = np.load(Path(path) / "X.npy", mmap_mode="r")
+        y = np.load(Path(path) / "y.npy", mmap_mode="r")
+    if X is None or y is None:
+        raise ValueError("evaluate_fold needs either path or X and y")
+    started = time.perf_counter()
+    model = clone(estimator).fit(X[train], y[train])
+    proba = model.predict_proba(X[valid])[:, 1]
+    metrics = fold_metrics(np.asarray(y[valid]), proba)
+    metrics["fit_seconds"] = time.perf_counter() - started
+    metrics["n_train"] = len(train)
+    metrics["n_valid"] = len(valid)
+    return metrics
+
+
+class ModelTrainer:
+    """
+    Game-outcome training pipeline over cached feature matrices.
+
+    Features are built once per (feature config, data) pair and cached by
+    `FeatureCache`; cross-validation folds run in a process pool whose
+    workers memory-map the cached matrix, and each run writes its model,
+    metrics and configuration to `artifacts_dir/<run_name>`.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        artifacts_dir: str,
+        feature_config: FeatureConfig | None = None,
+        n_jobs: int = 1,
+    ):
+        self.feature_config = feature_config or FeatureConfig()
+        self._cache = FeatureCache(cache_dir)
+        self._artifacts_dir = Path(artifacts_dir)
+        self._n_jobs = n_jobs
+
+    def prepare(self, view: pd.DataFrame) -> FeatureMatrix:
+        """
+        Cached feature matrix of a game view, built on first use.
+
+        Args:
+            view: Output of `DataPreprocessor.game_view`.
+
+        Returns:
+            Memory-mapped feature matrix.
+        """
+        key = self._cache.key(self.feature_config, data_fingerprint(view))
+        cached = self._cache.load(key)
+        if cached is not None:
+            return cached
+        features = build_features(view, self.feature_config)
+        return self._cache.store(key, features)
+
+    def cross_validate(
+        self, features: FeatureMatrix, estimator, n_folds: int = 5
+    ) -> pd.DataFrame:
+        """
+        Evaluate an estimator on expanding-window season folds.
+
+        Args:
+            features: Output of `prepare`.
+            estimator: Unfitted scikit-learn classifier.
+            n_folds: Number of validation seasons.
+
+        Returns:
+            One row of metrics per validation season.
+        """
+        folds = season_folds(features.seasons, n_folds)
+        data: tuple[str | None, np.ndarray | None, np.ndarray | None]
+        if features.path is not None:
+            data = (str(features.path), None, None)
+        else:
+            data = (None, features.X, features.y)
+        jobs = [(*data, estimator, train, valid) for train, valid in folds]
+
+        if self._n_jobs > 1 and len(jobs) > 1:
+            workers = min(self._n_jobs, len(jobs))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(
+                    pool.map(evaluate_fold, *zip(*jobs, strict=True))
+                )
+        else:
+            results = [evaluate_fold(*job) for job in jobs]
+
+        seasons = [int(features.seasons[valid[0]]) for _, valid in folds]
+        return pd.DataFrame(results, index=pd.Index(seasons, name="SEASON"))
+
+    def train(
+        self,
+        view: pd.DataFrame,
+        estimator,
+        run_name: str,
+        n_folds: int = 5,
+    ) -> Path:
+        """
+        Cross-validate, fit on every game and persist the run.
+
+        Args:
+            view: Output of `DataPreprocessor.game_view`.
+            estimator: Unfitted scikit-learn classifier.
+            run_name: Name of the run directory.
+            n_folds: Number of validation seasons.
+
+        Returns:
+            Directory holding model.pkl, metrics.json and folds.csv.
+        """
+        features = self.prepare(view)
+        folds = self.cross_validate(features, estimator, n_folds)
+        model = clone(estimator).fit(features.X, features.y)
+
+        run_dir = self._artifacts_dir / run_name
+        run_dir.mkdir(parents=True, exist_ok=True)
+        with open(run_dir / "model.pkl", "wb") as f:
+            pickle.dump({"model": model, "columns": features.columns}, f)
+        folds.to_csv(run_dir / "folds.csv")
+        summary = {
+            "run_name": run_name,
+            "feature_config": asdict(self.feature_config),
+            "feature_cache": features.path.name if features.path else None,
+            "columns": features.columns,
+            "estimator": repr(estimator),
+            "n_games": len(features.y),
+            "cv_mean": folds.mean(numeric_only=True).to_dict(),
+        }
+        with open(run_dir / "metrics.json", "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+        return run_dir
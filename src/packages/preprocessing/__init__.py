@@ -1 +1,30 @@
 # Package modules.preprocessing
+from .data_preprocessing import DataPreprocessor
+from .dimensions import Dimension, DimensionTables
+from .fingerprint import data_fingerprint
+from .memory import MemoryOptimizer, load_csv, parse_minutes
+from .name_resolution import PlayerNameIndex, normalize_name
+from .pbp_storage import PbpStore
+from .play_parser import PlayTextParser
+from .query_engine import QueryEngine
+from .seasons import season_from_dates, season_from_filename
+from .synthetic import SyntheticConfig, SyntheticDataset
+
+__all__ = [
+    "DataPreprocessor",
+    "Dimension",
+    "DimensionTables",
+    "MemoryOptimizer",
+    "PbpStore",
+    "PlayTextParser",
+    "PlayerNameIndex",
+    "QueryEngine",
+    "SyntheticConfig",
+    "SyntheticDataset",
+    "data_fingerprint",
+    "load_csv",
+    "normalize_name",
+    "parse_minutes",
+    "season_from_dates",
+    "season_from_filename",
+]
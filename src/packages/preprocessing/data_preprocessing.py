@@ -0,0 +1,329 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from packages.features.standings import STANDING_COLUMNS, StandingsIndex
+from packages.preprocessing.dimensions import DimensionTables
+from packages.preprocessing.memory import MemoryOptimizer
+
+BOX_COLUMNS = [
+    "FGM",
+    "FGA",
+    "FG3M",
+    "FG3A",
+    "FTM",
+    "FTA",
+    "OREB",
+    "DREB",
+    "AST",
+    "STL",
+    "BLK",
+    "TO",
+    "PF",
+    "PTS",
+]
+
+# Compact dtypes of the join keys. NBA TEAM_IDs (161061xxxx) and
+# PLAYER_IDs fit in int32.
+KEY_DTYPES = {
+    "GAME_ID": np.int32,
+    "TEAM_ID": np.int32,
+    "HOME_TEAM_ID": np.int32,
+    "VISITOR_TEAM_ID": np.int32,
+    "PLAYER_ID": np.int32,
+    "SEASON": np.int16,
+    "SEASON_ID": np.int32,
+}
+
+RAW_FILES = {
+    "games": "games.csv",
+    "details": "games_details.csv",
+    "teams": "teams.csv",
+    "ranking": "ranking.csv",
+}
+
+
+class DataPreprocessor:
+    """
+    Cleaned raw tables and ready-joined views of the Kaggle NBA dataset.
+
+    Each raw table is loaded once, deduplicated on its natural key, cast to
+    compact integer keys and sorted on that key, so joins are index
+    lookups (`get_indexer`) and as-of searches (`StandingsIndex`) instead
+    of ad-hoc `merge` calls. The game view (one row per game with both
+    teams' box totals and pre-game standings) is cached in memory and as
+    Parquet in `processed_dir`; the cached file is reused as long as the
+    raw files have not changed. Loaded tables go through `MemoryOptimizer`
+    unless `optimize` is False: MIN is then in seconds.
+
+    Dimension codes are opt-in: the loaders and the game view keep the
+    natural ids, which the feature and model code join on, and `encoded`
+    returns a raw table with its keys replaced by codes.
+    """
+
+    GAME_VIEW_FILE = "game_view.parquet"
+    SIGNATURE_FILE = "game_view.json"
+    DIMENSIONS_DIR = "dimensions"
+    # Optional raw file, only used to name players in the dimensions
+    PLAYERS_FILE = "players.csv"
+
+    def __init__(
+        self,
+        raw_dir: str,
+        processed_dir: str | None = None,
+        filenames: dict[str, str] | None = None,
+        optimize: bool = True,
+    ):
+        self._raw_dir = Path(raw_dir)
+        self._processed_dir = Path(processed_dir) if processed_dir else None
+        self._filenames = {**RAW_FILES, **(filenames or {})}
+        self._tables: dict[str, pd.DataFrame] = {}
+        self._standings: StandingsIndex | None = None
+        self._game_view: pd.DataFrame | None = None
+        self._dimensions: DimensionTables | None = None
+        self._optimizer = MemoryOptimizer() if optimize else None
+
+    def games(self) -> pd.DataFrame:
+        """
+        Games deduplicated on GAME_ID, indexed and sorted by GAME_ID.
+
+        Returns:
+            Games with GAME_DATE_EST parsed as datetime.
+        """
+        if "games" not in self._tables:
+            games = self._read("games")
+            games["GAME_DATE_EST"] = pd.to_datetime(games["GAME_DATE_EST"])
+            # Duplicated GAME_IDs are repeated rows of the same game; keep
+            # the most complete one.
+            games = (
+                games.assign(_NA=games.isna().sum(axis=1))
+                .sort_values(["GAME_ID", "_NA"], kind="stable")
+                .drop_duplicates(subset="GAME_ID")
+                .drop(columns="_NA")
+            )
+            self._tables["games"] = self._compact(games).set_index("GAME_ID")
+        return self._tables["games"]
+
+    def details(self) -> pd.DataFrame:
+        """
+        Box score lines deduplicated on (GAME_ID, PLAYER_ID).
+
+        Returns:
+            Lines indexed and sorted by (GAME_ID, TEAM_ID, PLAYER_ID), MIN
+            in seconds played unless `optimize` is False.
+        """
+        if "details" not in self._tables:
+            details = self._read("details").drop_duplicates(
+                subset=["GAME_ID", "PLAYER_ID"]
+            )
+            details = self._compact(details).set_index(
+                ["GAME_ID", "TEAM_ID", "PLAYER_ID"]
+            )
+            self._tables["details"] = details.sort_index()
+        return self._tables["details"]
+
+    def teams(self) -> pd.DataFrame:
+        """Teams indexed by TEAM_ID."""
+        if "teams" not in self._tables:
+            teams = self._read("teams").drop_duplicates(subset="TEAM_ID")
+            teams = self._compact(teams).set_index("TEAM_ID")
+            self._tables["teams"] = teams.sort_index()
+        return self._tables["teams"]
+
+    def ranking(self) -> pd.DataFrame:
+        """
+        Standings snapshots deduplicated on (TEAM_ID, STANDINGSDATE).
+
+        Returns:
+            Snapshots sorted by (TEAM_ID, STANDINGSDATE), default index.
+        """
+        if "ranking" not in self._tables:
+            ranking = self._read("ranking")
+            ranking["STANDINGSDATE"] = pd.to_datetime(ranking["STANDINGSDATE"])
+            ranking = ranking.drop_duplicates(
+                subset=["TEAM_ID", "STANDINGSDATE"], keep="last"
+            )
+            ranking = self._compact(ranking).sort_values(
+                ["TEAM_ID", "STANDINGSDATE"], kind="stable"
+            )
+            self._tables["ranking"] = ranking.reset_index(drop=True)
+        return self._tables["ranking"]
+
+    def players(self) -> pd.DataFrame | None:
+        """Player rosters per season of players.csv, None if absent."""
+        if "players" not in self._tables:
+            players_file = self._raw_dir / self.PLAYERS_FILE
+            if not players_file.is_file():
+                return None
+            players = self._read_csv(players_file).drop_duplicates(
+                subset=["PLAYER_ID", "TEAM_ID", "SEASON"]
+            )
+            self._tables["players"] = self._compact(players)
+        return self._tables["players"]
+
+    def standings(self) -> StandingsIndex:
+        """As-of standings index built over `ranking`."""
+        if self._standings is None:
+            self._standings = StandingsIndex(self.ranking())
+        return self._standings
+
+    def dimensions(self) -> DimensionTables:
+        """
+        Team, player and season codes covering every raw table.
+
+        Saved dimensions of `processed_dir` are loaded first and only
+        extended with new keys, so codes stay stable between runs.
+        """
+        if self._dimensions is None:
+            if self._processed_dir is not None:
+                dims_dir = self._processed_dir / self.DIMENSIONS_DIR
+                dimensions = DimensionTables.load(str(dims_dir))
+            else:
+                dimensions = DimensionTables()
+            added = dimensions.update(
+                games=self.games().reset_index(),
+                details=self.details().reset_index(),
+                teams=self.teams().reset_index(),
+                players=self.players(),
+            )
+            if self._processed_dir is not None and any(added.values()):
+                dimensions.save(str(dims_dir))
+            self._dimensions = dimensions
+        return self._dimensions
+
+    def encoded(self, name: str) -> pd.DataFrame:
+        """
+        Raw table with ids, abbreviations and seasons as dimension codes.
+
+        Args:
+            name: "games", "details", "teams" or "ranking".
+
+        Returns:
+            Table with a default index, see `DimensionTables.encode`.
+        """
+        if name not in RAW_FILES:
+            raise KeyError(f"Unknown table: {name}")
+        table = getattr(self, name)().reset_index()
+        return self.dimensions().encode(table)
+
+    def team_box(self) -> pd.DataFrame:
+        """
+        Team totals of `BOX_COLUMNS` per game.
+
+        Returns:
+            Totals indexed and sorted by (GAME_ID, TEAM_ID).
+        """
+        if "team_box" not in self._tables:
+            details = self.details()
+            stats = details[BOX_COLUMNS].apply(pd.to_numeric, errors="coerce")
+            self._tables["team_box"] = stats.groupby(
+                level=["GAME_ID", "TEAM_ID"], sort=True
+            ).sum()
+        return self._tables["team_box"]
+
+    def game_view(self, refresh: bool = False) -> pd.DataFrame:
+        """
+        One row per game with both teams' box totals and standings.
+
+        Box totals are prefixed HOME_/AWAY_ and standings (last snapshot
+        strictly before the game date) HOME_STD_/AWAY_STD_, next to the
+        team abbreviations.
+
+        Args:
+            refresh: Rebuild the view even if a cached one is valid.
+
+        Returns:
+            Game view sorted by GAME_ID.
+        """
+        if self._game_view is not None and not refresh:
+            return self._game_view
+        if not refresh:
+            cached = self._load_cached_view()
+            if cached is not None:
+                self._game_view = cached
+                return cached
+
+        games = self.games().reset_index()
+        view = games
+        for side, team_col in (
+            ("HOME", "HOME_TEAM_ID"),
+            ("AWAY", "VISITOR_TEAM_ID"),
+        ):
+            view = view.join(
+                self._team_columns(games, team_col).add_prefix(f"{side}_")
+            )
+        self._game_view = view
+        self._save_view(view)
+        return view
+
+    def _team_columns(
+        self, games: pd.DataFrame, team_col: str
+    ) -> pd.DataFrame:
+        game_ids = games["GAME_ID"].to_numpy()
+        team_ids = games[team_col].to_numpy()
+
+        teams = self.teams()
+        abbreviation = teams["ABBREVIATION"].reindex(team_ids).to_numpy()
+
+        box = self.team_box()
+        keys = pd.MultiIndex.from_arrays([game_ids, team_ids])
+        positions = box.index.get_indexer(keys)
+        box_values = box.to_numpy(dtype=np.float64)[positions]
+        box_values[positions < 0] = np.nan
+
+        standings = self.standings().lookup(
+            team_ids, games["GAME_DATE_EST"].to_numpy()
+        )
+        frame = pd.DataFrame(box_values, columns=BOX_COLUMNS)
+        frame.insert(0, "ABBREVIATION", abbreviation)
+        standings = standings[STANDING_COLUMNS].add_prefix("STD_")
+        return pd.concat([frame, standings], axis=1)
+
+    def _read(self, name: str) -> pd.DataFrame:
+        return self._read_csv(self._raw_dir / self._filenames[name])
+
+    def _read_csv(self, filepath: Path) -> pd.DataFrame:
+        frame = pd.read_csv(filepath)
+        if self._optimizer is not None:
+            frame = self._optimizer.optimize(frame)
+        return frame
+
+    @staticmethod
+    def _compact(frame: pd.DataFrame) -> pd.DataFrame:
+        frame = frame.dropna(
+            subset=[c for c in KEY_DTYPES if c in frame.columns]
+        )
+        return frame.astype(
+            {c: t for c, t in KEY_DTYPES.items() if c in frame.columns}
+        )
+
+    def _signature(self) -> dict:
+        signature = {}
+        for name, filename in sorted(self._filenames.items()):
+            stat = (self._raw_dir / filename).stat()
+            signature[name] = [stat.st_size, stat.st_mtime_ns]
+        return signature
+
+    def _load_cached_view(self) -> pd.DataFrame | None:
+        if self._processed_dir is None:
+            return None
+        view_file = self._processed_dir / self.GAME_VIEW_FILE
+        signature_file = self._processed_dir / self.SIGNATURE_FILE
+        if not (view_file.is_file() and signature_file.is_file()):
+            return None
+        with open(signature_file, encoding="utf-8") as f:
+            if json.load(f) != self._signature():
+                return None
+        return pd.read_parquet(view_file)
+
+    def _save_view(self, view: pd.DataFrame) -> None:
+        if self._processed_dir is None:
+            return
+        self._processed_dir.mkdir(parents=True, exist_ok=True)
+        view.to_parquet(self._processed_dir / self.GAME_VIEW_FILE, index=False)
+        with open(
+            self._processed_dir / self.SIGNATURE_FILE, "w", encoding="utf-8"
+        ) as f:
+            json.dump(self._signature(), f)
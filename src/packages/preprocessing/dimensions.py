@@ -0,0 +1,296 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Columns holding a natural key of each dimension, per dataset
+TEAM_ID_COLUMNS = [
+    "TEAM_ID",
+    "HOME_TEAM_ID",
+    "VISITOR_TEAM_ID",
+    "TEAM_ID_home",
+    "TEAM_ID_away",
+]
+TEAM_ALIAS_COLUMNS = ["TEAM_ABBREVIATION", "HomeTeam", "AwayTeam"]
+PLAYER_ID_COLUMNS = ["PLAYER_ID"]
+SEASON_COLUMNS = ["SEASON"]
+
+
+class Dimension:
+    """
+    Dense integer codes of the natural keys of one entity.
+
+    Codes are positions in the key array: new keys are appended, so codes
+    already handed out never change. Text aliases (abbreviations, names)
+    can point to the same codes. Codes are int16 while the dimension fits
+    in it, int32 beyond, and -1 marks unknown keys.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._keys: pd.Index = pd.Index([], dtype=np.int64)
+        self._labels = np.empty(0, dtype=object)
+        self._aliases = pd.Index([], dtype=object)
+        self._alias_codes = np.empty(0, dtype=np.int32)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def dtype(self) -> type:
+        """Smallest signed integer type holding every code and -1."""
+        return np.int16 if len(self) < np.iinfo(np.int16).max else np.int32
+
+    @property
+    def keys(self) -> pd.Index:
+        """Natural keys, in code order."""
+        return self._keys
+
+    @property
+    def labels(self) -> np.ndarray:
+        """Display label of every code (None if unknown)."""
+        return self._labels
+
+    def extend(self, keys, labels=None) -> int:
+        """
+        Give codes to keys not seen yet.
+
+        Args:
+            keys: Natural keys, duplicates and missing values allowed.
+            labels: Display label of each key, optional.
+
+        Returns:
+            Number of new codes.
+        """
+        frame = pd.DataFrame(
+            {"key": keys, "label": labels if labels is not None else None}
+        ).dropna(subset=["key"])
+        frame = frame.astype({"key": np.int64}).drop_duplicates(subset="key")
+        known = self._keys.get_indexer(pd.Index(frame["key"]))
+        # Labels of known keys are refreshed when given
+        if labels is not None:
+            update = (known >= 0) & frame["label"].notna().to_numpy()
+            self._labels[known[update]] = frame["label"].to_numpy()[update]
+        new = frame[known < 0]
+        self._keys = self._keys.append(pd.Index(new["key"], dtype=np.int64))
+        self._labels = np.concatenate(
+            [self._labels, new["label"].to_numpy(dtype=object)]
+        )
+        return len(new)
+
+    def add_aliases(self, aliases, keys) -> None:
+        """
+        Map text aliases to the codes of existing keys.
+
+        Args:
+            aliases: Alias strings, e.g. abbreviations.
+            keys: Natural key of each alias.
+        """
+        codes = self.encode(keys)
+        frame = pd.DataFrame({"alias": aliases, "code": codes})
+        frame = frame[(frame["code"] >= 0) & frame["alias"].notna()]
+        frame = frame.drop_duplicates(subset="alias", keep="last")
+        merged = pd.Series(self._alias_codes, index=self._aliases)
+        merged = pd.concat(
+            [merged, frame.set_index("alias")["code"].astype(np.int32)]
+        )
+        merged = merged[~merged.index.duplicated(keep="last")]
+        self._aliases = pd.Index(merged.index, dtype=object)
+        self._alias_codes = merged.to_numpy(dtype=np.int32)
+
+    def encode(self, keys) -> np.ndarray:
+        """
+        Codes of natural keys.
+
+        Args:
+            keys: Natural keys.
+
+        Returns:
+            Code array of `dtype`, -1 for unknown or missing keys.
+        """
+        values = pd.to_numeric(pd.Series(keys), errors="coerce")
+        codes = np.full(len(values), -1, dtype=np.int64)
+        present = values.notna().to_numpy()
+        codes[present] = self._keys.get_indexer(
+            pd.Index(values[present], dtype=np.int64)
+        )
+        return codes.astype(self.dtype)
+
+    def encode_aliases(self, aliases) -> np.ndarray:
+        """Codes of text aliases, -1 for unknown ones."""
+        positions = self._aliases.get_indexer(pd.Index(aliases, dtype=object))
+        codes = np.where(
+            positions >= 0, self._alias_codes[np.maximum(positions, 0)], -1
+        )
+        return codes.astype(self.dtype)
+
+    def decode(self, codes) -> np.ndarray:
+        """Natural keys of codes, -1 for code -1."""
+        codes = np.asarray(codes, dtype=np.int64)
+        keys = self._keys.to_numpy()[np.maximum(codes, 0)]
+        return np.where(codes >= 0, keys, -1)
+
+    def categorical(self, keys) -> pd.Categorical:
+        """
+        Keys as a categorical sharing the dimension dictionary.
+
+        Args:
+            keys: Natural keys.
+
+        Returns:
+            Categorical whose codes are the dimension codes.
+        """
+        return pd.Categorical.from_codes(self.encode(keys), self._keys)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Code, key and label of every entry, then aliases."""
+        entries = pd.DataFrame(
+            {
+                "CODE": np.arange(len(self), dtype=np.int32),
+                "KEY": self._keys.to_numpy(),
+                "LABEL": self._labels,
+                "ALIAS": None,
+            }
+        )
+        aliases = pd.DataFrame(
+            {
+                "CODE": self._alias_codes,
+                "KEY": self.decode(self._alias_codes),
+                "LABEL": None,
+                "ALIAS": self._aliases.to_numpy(),
+            }
+        )
+        return pd.concat([entries, aliases], ignore_index=True)
+
+    @classmethod
+    def from_frame(cls, name: str, frame: pd.DataFrame) -> "Dimension":
+        """Rebuild a dimension written by `to_frame`."""
+        dim = cls(name)
+        entries = frame[frame["ALIAS"].isna()].sort_values("CODE")
+        dim._keys = pd.Index(entries["KEY"].to_numpy(dtype=np.int64))
+        dim._labels = np.array(entries["LABEL"], dtype=object)
+        aliases = frame[frame["ALIAS"].notna()]
+        dim._aliases = pd.Index(aliases["ALIAS"].to_numpy(), dtype=object)
+        dim._alias_codes = aliases["CODE"].to_numpy(dtype=np.int32)
+        return dim
+
+
+class DimensionTables:
+    """
+    Team, player and season dimensions shared by every dataset.
+
+    `encode` replaces the id, abbreviation and season columns of a frame
+    by their codes, so joins become array lookups and team or player
+    features can be stored in dense arrays indexed by code. The tables
+    are saved as Parquet and only ever extended, keeping codes stable
+    across runs. Loaders do not encode on their own: callers opt in with
+    `encode` (or `DataPreprocessor.encoded`).
+    """
+
+    NAMES = ("team", "player", "season")
+
+    def __init__(self):
+        self.team = Dimension("team")
+        self.player = Dimension("player")
+        self.season = Dimension("season")
+
+    def update(
+        self,
+        games: pd.DataFrame | None = None,
+        details: pd.DataFrame | None = None,
+        teams: pd.DataFrame | None = None,
+        players: pd.DataFrame | None = None,
+    ) -> dict[str, int]:
+        """
+        Add the keys found in raw tables.
+
+        Args:
+            games: games rows (team ids, SEASON).
+            details: games_details rows (ids, TEAM_ABBREVIATION, names).
+            teams: teams rows (TEAM_ID, ABBREVIATION, NICKNAME).
+            players: players rows (PLAYER_ID, PLAYER_NAME, SEASON).
+
+        Returns:
+            Number of new codes per dimension.
+        """
+        added = dict.fromkeys(self.NAMES, 0)
+        if teams is not None:
+            added["team"] += self.team.extend(
+                teams["TEAM_ID"], teams.get("ABBREVIATION")
+            )
+            self.team.add_aliases(teams["ABBREVIATION"], teams["TEAM_ID"])
+        for frame in (games, details, players):
+            if frame is None:
+                continue
+            for col in TEAM_ID_COLUMNS:
+                if col in frame.columns:
+                    added["team"] += self.team.extend(frame[col])
+            if "SEASON" in frame.columns:
+                seasons = np.sort(frame["SEASON"].dropna().unique())
+                added["season"] += self.season.extend(seasons, seasons)
+            if "PLAYER_ID" in frame.columns:
+                added["player"] += self.player.extend(
+                    frame["PLAYER_ID"], frame.get("PLAYER_NAME")
+                )
+        if details is not None and "TEAM_ABBREVIATION" in details.columns:
+            # Historical abbreviations (NJN, SEA...) point to current ids
+            self.team.add_aliases(
+                details["TEAM_ABBREVIATION"], details["TEAM_ID"]
+            )
+        return added
+
+    def encode(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        Replace identity columns of a frame by dimension codes.
+
+        Args:
+            frame: Any raw or processed table.
+
+        Returns:
+            Copy of `frame` where team/player ids and seasons hold codes,
+            and team abbreviations are replaced by TEAM codes.
+        """
+        out = frame.copy()
+        for columns, dim in (
+            (TEAM_ID_COLUMNS, self.team),
+            (PLAYER_ID_COLUMNS, self.player),
+            (SEASON_COLUMNS, self.season),
+        ):
+            for col in columns:
+                if col in out.columns:
+                    out[col] = dim.encode(out[col])
+        for col in TEAM_ALIAS_COLUMNS:
+            if col in out.columns:
+                out[col] = self.team.encode_aliases(out[col])
+        return out
+
+    def save(self, directory: str) -> None:
+        """Write each dimension to `<directory>/<name>.parquet`."""
+        path = Path(directory)
+        path.mkdir(parents=True, exist_ok=True)
+        for name in self.NAMES:
+            frame = getattr(self, name).to_frame()
+            frame = frame.astype({"LABEL": "string", "ALIAS": "string"})
+            frame.to_parquet(path / f"{name}.parquet", index=False)
+
+    @classmethod
+    def load(cls, directory: str) -> "DimensionTables":
+        """
+        Load saved dimensions, empty ones if nothing was saved yet.
+
+        Args:
+            directory: Directory written by `save`.
+
+        Returns:
+            Dimension tables.
+        """
+        tables = cls()
+        path = Path(directory)
+        for name in cls.NAMES:
+            file = path / f"{name}.parquet"
+            if file.is_file():
+                frame = pd.read_parquet(file)
+                frame = frame.astype({"LABEL": object, "ALIAS": object})
+                frame = frame.replace({pd.NA: None})
+                setattr(tables, name, Dimension.from_frame(name, frame))
+        return tables
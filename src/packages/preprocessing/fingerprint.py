@@ -0,0 +1,21 @@
+import hashlib
+import json
+
+import pandas as pd
+
+
+def data_fingerprint(frame: pd.DataFrame) -> str:
+    """
+    Content hash of a DataFrame, stable across runs.
+
+    Args:
+        frame: Data to fingerprint.
+
+    Returns:
+        Hex SHA-256 digest of the row hashes and column names.
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps(list(map(str, frame.columns))).encode())
+    row_hashes = pd.util.hash_pandas_object(frame, index=False)
+    digest.update(row_hashes.to_numpy().tobytes())
+    return digest.hexdigest()
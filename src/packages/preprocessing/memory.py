@@ -0,0 +1,254 @@
+"""
+Compact dtypes of loaded tables.
+
+`DataPreprocessor` loads every raw table through `MemoryOptimizer`
+unless built with `optimize=False`. This changes one value for callers:
+games_details `MIN` is then float seconds played instead of "mm:ss"
+text. Readers of MIN should go through `parse_minutes`, which accepts
+both forms.
+"""
+
+import numpy as np
+import pandas as pd
+
+# "mm:ss" columns converted to seconds played
+MINUTES_COLUMNS = ["MIN"]
+# Free text that is filled from and compared with other columns: never
+# turned into categoricals
+TEXT_COLUMNS = ["HomePlay", "AwayPlay"]
+CATEGORY_RATIO = 0.5
+MAX_CATEGORIES = 10_000
+
+_INT_DTYPES: list[type[np.signedinteger]] = [
+    np.int8,
+    np.int16,
+    np.int32,
+    np.int64,
+]
+
+
+def _smallest_int(values: np.ndarray) -> np.dtype | None:
+    if values.size == 0:
+        return np.dtype(np.int8)
+    low, high = values.min(), values.max()
+    for dtype in _INT_DTYPES:
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return np.dtype(dtype)
+    return None
+
+
+def parse_minutes(values: pd.Series) -> pd.Series:
+    """
+    Convert games_details `MIN` values to seconds played.
+
+    Handles "mm:ss", plain minutes ("34") and the float-minute variant
+    found in older seasons ("34.000000:12"). Missing values (DNP) give NaN.
+    Numeric values, already converted by the loaders, are kept.
+
+    Args:
+        values: Raw `MIN` column.
+
+    Returns:
+        Float Series of seconds played.
+    """
+    if pd.api.types.is_numeric_dtype(values.dtype):
+        return values.astype("float64")
+    parts = values.astype("string").str.split(":", n=1, expand=True)
+    minutes = pd.to_numeric(parts[0], errors="coerce")
+    seconds: pd.Series | float = 0.0
+    if parts.shape[1] > 1:
+        seconds = pd.to_numeric(parts[1], errors="coerce").fillna(0.0)
+    return (minutes * 60.0 + seconds).astype("float64")
+
+
+class MemoryOptimizer:
+    """
+    Shrink the dtypes of loaded DataFrames without changing their values.
+
+    Integers are downcast to the smallest integer type holding their
+    range. Float columns holding only whole numbers become integers when
+    they have no NaN, and float32 when every value round-trips exactly.
+    String columns with few distinct values become categoricals, and
+    `MIN`-like "mm:ss" columns become seconds played. Integer keys
+    (GAME_ID, TEAM_ID, PLAYER_ID...) are downcast like any integer column,
+    int32 for the NBA ids. Dates, booleans, nullable and categorical
+    columns are kept as they are.
+
+    Args:
+        category_ratio: Maximum distinct values over non-null values of a
+            string column turned into a categorical.
+        max_categories: Maximum distinct values of a categorical.
+        minutes_columns: "mm:ss" columns parsed to seconds, MIN by default.
+        exclude: Columns left untouched, the pbp play texts by default.
+    """
+
+    def __init__(
+        self,
+        category_ratio: float = CATEGORY_RATIO,
+        max_categories: int = MAX_CATEGORIES,
+        minutes_columns: list[str] | None = None,
+        exclude: list[str] | None = None,
+    ):
+        self._category_ratio = category_ratio
+        self._max_categories = max_categories
+        self._minutes_columns = set(
+            MINUTES_COLUMNS if minutes_columns is None else minutes_columns
+        )
+        self._exclude = set(TEXT_COLUMNS if exclude is None else exclude)
+
+    def optimize(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        Copy of a frame with compact dtypes.
+
+        Args:
+            frame: Loaded frame.
+
+        Returns:
+            Frame with the same columns, index and values.
+        """
+        out = frame.copy(deep=False)
+        for position, column in enumerate(frame.columns):
+            converted = self._convert(column, frame.iloc[:, position])
+            if converted is not None:
+                out.isetitem(position, converted.array)
+        return out
+
+    def profile(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        Column statistics and the dtype `optimize` would choose.
+
+        Args:
+            frame: Loaded frame.
+
+        Returns:
+            One row per column: dtype, nulls, distinct values, min, max
+            and target dtype.
+        """
+        rows = []
+        for position, column in enumerate(frame.columns):
+            values = frame.iloc[:, position]
+            numeric = pd.api.types.is_numeric_dtype(values.dtype)
+            converted = self._convert(column, values)
+            rows.append(
+                {
+                    "column": column,
+                    "dtype": str(values.dtype),
+                    "nulls": int(values.isna().sum()),
+                    "unique": int(values.nunique()),
+                    "min": values.min() if numeric else None,
+                    "max": values.max() if numeric else None,
+                    "target": str(
+                        values.dtype if converted is None else converted.dtype
+                    ),
+                }
+            )
+        return pd.DataFrame(rows)
+
+    @staticmethod
+    def report(before: pd.DataFrame, after: pd.DataFrame) -> pd.DataFrame:
+        """
+        Memory per column before and after optimization.
+
+        Args:
+            before: Original frame.
+            after: Optimized frame, same columns.
+
+        Returns:
+            One row per column plus a TOTAL row: dtypes, bytes before and
+            after and the reduction factor.
+        """
+        bytes_before = before.memory_usage(deep=True, index=False)
+        bytes_after = after.memory_usage(deep=True, index=False)
+        report = pd.DataFrame(
+            {
+                "dtype_before": before.dtypes.astype(str),
+                "dtype_after": after.dtypes.astype(str),
+                "bytes_before": bytes_before,
+                "bytes_after": bytes_after,
+            }
+        )
+        total = pd.DataFrame(
+            {
+                "dtype_before": "",
+                "dtype_after": "",
+                "bytes_before": int(bytes_before.sum()),
+                "bytes_after": int(bytes_after.sum()),
+            },
+            index=["TOTAL"],
+        )
+        report = pd.concat([report, total])
+        report["bytes_before"] = report["bytes_before"].astype(np.int64)
+        report["bytes_after"] = report["bytes_after"].astype(np.int64)
+        report["factor"] = report["bytes_before"] / report["bytes_after"].clip(
+            lower=1
+        )
+        return report.rename_axis("column").reset_index()
+
+    def _convert(self, column, values: pd.Series) -> pd.Series | None:
+        # Converted column, or None to keep it
+        if column in self._exclude:
+            return None
+        dtype = values.dtype
+        if column in self._minutes_columns and not (
+            pd.api.types.is_numeric_dtype(dtype)
+        ):
+            return self._downcast_float(parse_minutes(values))
+        if isinstance(dtype, np.dtype) and dtype.kind == "f":
+            converted = self._downcast_float(values)
+            return None if converted is values else converted
+        if isinstance(dtype, np.dtype) and dtype.kind in "iu":
+            target = _smallest_int(values.to_numpy())
+            if target is None or target == dtype:
+                return None
+            return values.astype(target)
+        if pd.api.types.is_string_dtype(dtype) and not isinstance(
+            dtype, pd.CategoricalDtype
+        ):
+            return self._categorical(values)
+        return None
+
+    @staticmethod
+    def _downcast_float(values: pd.Series) -> pd.Series:
+        array = values.to_numpy(dtype=np.float64)
+        present = array[~np.isnan(array)]
+        if present.size == len(array) and np.all(np.mod(present, 1) == 0):
+            target = _smallest_int(present)
+            if target is not None:
+                return values.astype(target)
+        as32 = array.astype(np.float32)
+        if np.array_equal(as32.astype(np.float64), array, equal_nan=True):
+            return pd.Series(as32, index=values.index, name=values.name)
+        return values
+
+    def _categorical(self, values: pd.Series) -> pd.Series | None:
+        if (
+            values.dtype == object
+            and not values.dropna().map(lambda v: isinstance(v, str)).all()
+        ):
+            return None
+        count = int(values.count())
+        if count == 0:
+            return None
+        unique = int(values.nunique())
+        if unique > self._max_categories or unique > (
+            self._category_ratio * count
+        ):
+            return None
+        return values.astype("category")
+
+
+def load_csv(filepath, optimize: bool = True, **kwargs) -> pd.DataFrame:
+    """
+    Read a CSV file with compact dtypes.
+
+    Args:
+        filepath: CSV file.
+        optimize: Apply `MemoryOptimizer` with its defaults.
+        **kwargs: `pandas.read_csv` arguments.
+
+    Returns:
+        Loaded frame.
+    """
+    frame = pd.read_csv(filepath, **kwargs)
+    return MemoryOptimizer().optimize(frame) if optimize else frame
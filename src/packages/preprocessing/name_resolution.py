@@ -0,0 +1,338 @@
+import difflib
+import re
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+from packages.preprocessing.dimensions import DimensionTables
+from packages.preprocessing.seasons import season_from_dates
+
+# Player columns of the pbp data and the side whose team they play for:
+# "same" is the side of the play column, "home"/"away" is fixed and None
+# means unknown (resolved against the whole season).
+PLAYER_COLUMNS = {
+    "Shooter": "same",
+    "Assister": "same",
+    "Fouler": "same",
+    "Rebounder": "same",
+    "ViolationPlayer": "same",
+    "FreeThrowShooter": "same",
+    "TurnoverPlayer": "same",
+    "EnterGame": "same",
+    "LeaveGame": "same",
+    "Blocker": "other",
+    "Fouled": "other",
+    "TurnoverCauser": "other",
+    "JumpballHomePlayer": "home",
+    "JumpballAwayPlayer": "away",
+    "JumpballPoss": None,
+}
+# Basketball-Reference abbreviations of the pbp data differing from the
+# NBA ones of teams.csv
+PBP_TEAM_ALIASES = {"BRK": "BKN", "CHO": "CHA", "PHO": "PHX"}
+NON_PLAYERS = ["Team", "team"]
+NAME_SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "v"}
+FUZZY_CUTOFF = 0.85
+
+_REFERENCE_ID = re.compile(r"\s+-\s+[a-z']+\d{2}$")
+_PUNCTUATION = re.compile(r"[.'`’,]")
+_SEPARATORS = re.compile(r"[-\s]+")
+
+
+def normalize_name(name: str) -> tuple[str, str]:
+    """
+    Comparable forms of a player name.
+
+    Accents, punctuation, Basketball-Reference ids ("L. James -
+    jamesle01") and suffixes (Jr., III...) are removed.
+
+    Args:
+        name: Raw player name.
+
+    Returns:
+        Full normalized name and its initial form ("lebron james" and
+        "l james"); both empty for blank names.
+    """
+    name = _REFERENCE_ID.sub("", str(name).strip())
+    name = unicodedata.normalize("NFKD", name)
+    name = "".join(c for c in name if not unicodedata.combining(c))
+    name = _PUNCTUATION.sub("", name.lower())
+    tokens = [t for t in _SEPARATORS.split(name) if t]
+    while len(tokens) > 1 and tokens[-1] in NAME_SUFFIXES:
+        tokens.pop()
+    if not tokens:
+        return "", ""
+    full = " ".join(tokens)
+    if len(tokens) == 1:
+        return full, full
+    return full, " ".join([tokens[0][0], *tokens[1:]])
+
+
+class PlayerNameIndex:
+    """
+    Resolve player names of the pbp data to PLAYER_ID.
+
+    The roster (who played for which team in which season) is indexed by
+    normalized full name and initial form, per (TEAM_ID, SEASON) and per
+    season. A name is looked up in that order, exact forms before fuzzy
+    matching on the team-season candidates, and only unique matches are
+    accepted. Every (name, team, season) is resolved once and cached, so
+    linking a season only resolves its few thousand distinct names.
+    """
+
+    def __init__(self, roster: pd.DataFrame):
+        roster = roster.dropna(
+            subset=["PLAYER_ID", "PLAYER_NAME", "SEASON"]
+        ).drop_duplicates(subset=["PLAYER_ID", "TEAM_ID", "SEASON"])
+        forms = [normalize_name(name) for name in roster["PLAYER_NAME"]]
+        frame = pd.DataFrame(
+            {
+                "PLAYER_ID": roster["PLAYER_ID"].to_numpy(dtype=np.int64),
+                "TEAM_ID": roster["TEAM_ID"]
+                .fillna(-1)
+                .to_numpy(dtype=np.int64),
+                "SEASON": roster["SEASON"].to_numpy(dtype=np.int64),
+                "full": [f for f, _ in forms],
+                "short": [s for _, s in forms],
+            }
+        )
+        self._team_index = self._candidates(frame, ["TEAM_ID", "SEASON"])
+        self._season_index = self._candidates(frame, ["SEASON"])
+        self._cache: dict[tuple[str, int, int], tuple[int, str | None]] = {}
+
+    @classmethod
+    def from_tables(
+        cls,
+        details: pd.DataFrame,
+        games: pd.DataFrame,
+        players: pd.DataFrame | None = None,
+    ) -> "PlayerNameIndex":
+        """
+        Index built from box score lines and players.csv.
+
+        Args:
+            details: games_details rows (GAME_ID, TEAM_ID, PLAYER_ID,
+                PLAYER_NAME).
+            games: games rows giving the SEASON of each GAME_ID.
+            players: players.csv rows, optional.
+
+        Returns:
+            Name index.
+        """
+        games = games.drop_duplicates(subset="GAME_ID")
+        seasons = games.set_index("GAME_ID")["SEASON"]
+        lines = details.assign(
+            SEASON=seasons.reindex(details["GAME_ID"]).to_numpy()
+        )
+        columns = ["PLAYER_ID", "PLAYER_NAME", "TEAM_ID", "SEASON"]
+        frames = [lines[columns]]
+        if players is not None:
+            frames.append(players[columns])
+        return cls(pd.concat(frames, ignore_index=True))
+
+    def resolve(
+        self, name: str, team_id: int = -1, season: int = -1
+    ) -> tuple[int, str | None]:
+        """
+        PLAYER_ID of one name.
+
+        Args:
+            name: Raw name.
+            team_id: TEAM_ID the player played for, -1 if unknown.
+            season: Season of the game.
+
+        Returns:
+            PLAYER_ID (-1 if unresolved) and the method that matched:
+            "team", "season", "fuzzy" or None.
+        """
+        key = (name, int(team_id), int(season))
+        if key not in self._cache:
+            self._cache[key] = self._resolve(*key)
+        return self._cache[key]
+
+    def resolve_many(
+        self, names, team_ids=None, seasons=None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        PLAYER_IDs of name arrays, each distinct triple resolved once.
+
+        Args:
+            names: Raw names, missing values allowed.
+            team_ids: TEAM_ID of each name, -1 if unknown.
+            seasons: Season of each name.
+
+        Returns:
+            int32 PLAYER_IDs (-1 if unresolved) and matching methods.
+        """
+        name_codes, name_uniques = pd.factorize(pd.Series(names))
+        n = len(name_codes)
+        teams = np.full(n, -1) if team_ids is None else team_ids
+        seasons = np.full(n, -1) if seasons is None else seasons
+        ids = np.full(n, -1, dtype=np.int32)
+        methods = np.full(n, None, dtype=object)
+        if len(name_uniques) == 0:
+            return ids, methods
+        players = ~np.isin(np.asarray(name_uniques, dtype=object), NON_PLAYERS)
+        valid = (name_codes >= 0) & players[name_codes]
+        if not valid.any():
+            return ids, methods
+
+        # One int64 key per (name, team, season) to resolve each once
+        parts = [(name_codes[valid], np.asarray(name_uniques, dtype=object))]
+        for values in (teams, seasons):
+            parts.append(
+                pd.factorize(np.asarray(values, dtype=np.int64)[valid])
+            )
+        key = np.zeros(int(valid.sum()), dtype=np.int64)
+        for codes, uniques in parts:
+            key = key * len(uniques) + codes
+        _, first, inverse = np.unique(
+            key, return_index=True, return_inverse=True
+        )
+        resolved = [
+            self.resolve(*(uniques[codes[i]] for codes, uniques in parts))
+            for i in first
+        ]
+        ids[valid] = np.array([r[0] for r in resolved], dtype=np.int32)[
+            inverse
+        ]
+        methods[valid] = np.array([r[1] for r in resolved], dtype=object)[
+            inverse
+        ]
+        return ids, methods
+
+    def link(
+        self,
+        pbp: pd.DataFrame,
+        dimensions: DimensionTables,
+        season: int | None = None,
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Add the PLAYER_ID of every player column of pbp events.
+
+        Teams come from HomeTeam/AwayTeam through the team aliases of
+        `dimensions`, seasons from `season` or else the game Date.
+
+        Args:
+            pbp: Play-by-play events.
+            dimensions: Dimension tables holding team abbreviations.
+            season: SEASON of every event, e.g. from
+                `season_from_filename` for a season file.
+
+        Returns:
+            Copy of `pbp` with a `<column>_ID` int32 column per player
+            column (-1 if unresolved), and the report of unresolved names
+            (name, TEAM_ID, SEASON, column, events), most frequent first.
+        """
+        out = pbp.copy()
+        if season is not None:
+            seasons = np.full(len(pbp), season, dtype=np.int64)
+        else:
+            seasons = season_from_dates(pbp["Date"])
+        team_ids = {}
+        for side in ("Home", "Away"):
+            abbreviations = (
+                pbp[f"{side}Team"].astype("string").replace(PBP_TEAM_ALIASES)
+            )
+            codes = dimensions.team.encode_aliases(abbreviations)
+            team_ids[side.lower()] = dimensions.team.decode(codes)
+        home_play = pbp["HomePlay"].notna().to_numpy()
+        same = np.where(home_play, team_ids["home"], team_ids["away"])
+        other = np.where(home_play, team_ids["away"], team_ids["home"])
+        sides = {
+            "same": same,
+            "other": other,
+            "home": team_ids["home"],
+            "away": team_ids["away"],
+            None: np.full(len(pbp), -1),
+        }
+
+        unresolved = []
+        for column, scope in PLAYER_COLUMNS.items():
+            if column not in pbp.columns:
+                continue
+            ids, _ = self.resolve_many(pbp[column], sides[scope], seasons)
+            out[f"{column}_ID"] = ids
+            missing = (
+                (ids < 0)
+                & pbp[column].notna().to_numpy()
+                & ~pbp[column].isin(NON_PLAYERS).to_numpy()
+            )
+            if missing.any():
+                unresolved.append(
+                    pd.DataFrame(
+                        {
+                            "name": pbp[column].to_numpy()[missing],
+                            "TEAM_ID": sides[scope][missing],
+                            "SEASON": seasons[missing],
+                            "column": column,
+                        }
+                    )
+                )
+
+        columns = ["name", "TEAM_ID", "SEASON", "column"]
+        if not unresolved:
+            return out, pd.DataFrame(columns=[*columns, "events"])
+        report = (
+            pd.concat(unresolved, ignore_index=True)
+            .groupby(columns)
+            .size()
+            .rename("events")
+            .sort_values(ascending=False)
+            .reset_index()
+        )
+        return out, report
+
+    @staticmethod
+    def _candidates(
+        frame: pd.DataFrame, keys: list[str]
+    ) -> dict[tuple, dict[str, dict[str, np.ndarray]]]:
+        index = {}
+        for _, group in frame.groupby(keys, sort=False):
+            key = tuple(int(k) for k in group[keys].to_numpy()[0])
+            index[key] = {
+                form: {
+                    str(value): ids
+                    for value, ids in group.groupby(form)["PLAYER_ID"]
+                    .unique()
+                    .items()
+                }
+                for form in ("full", "short")
+            }
+        return index
+
+    def _resolve(
+        self, name: str, team_id: int, season: int
+    ) -> tuple[int, str | None]:
+        full, short = normalize_name(name)
+        if not full:
+            return -1, None
+        scopes = [
+            ("team", self._team_index.get((team_id, season))),
+            ("season", self._season_index.get((season,))),
+        ]
+        for method, candidates in scopes:
+            if candidates is None:
+                continue
+            for form, value in (("full", full), ("short", short)):
+                ids = candidates[form].get(value)
+                if ids is not None and len(ids) == 1:
+                    return int(ids[0]), method
+
+        # Fuzzy matching on the team roster first, then the season one
+        for _, candidates in scopes:
+            if candidates is None:
+                continue
+            for form, value in (("full", full), ("short", short)):
+                matches = difflib.get_close_matches(
+                    value, candidates[form], n=2, cutoff=FUZZY_CUTOFF
+                )
+                matched = {
+                    int(i)
+                    for match in matches
+                    for i in candidates[form][match]
+                }
+                if len(matched) == 1:
+                    return matched.pop(), "fuzzy"
+        return -1, None
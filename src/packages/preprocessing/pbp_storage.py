@@ -0,0 +1,287 @@
+import json
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from packages.preprocessing.play_parser import PlayTextParser
+from packages.preprocessing.seasons import (
+    season_from_dates,
+    season_from_filename,
+)
+
+PARTITION_COLUMNS = ["SEASON", "Team"]
+# In-file order: the team's home games first, each sorted by game time,
+# so Side, URL and Quarter statistics prune row groups
+SORT_COLUMNS = ["Side", "URL", "Quarter", "SecLeft"]
+EVENT_TYPE = "EventType"
+
+
+class PbpStore:
+    """
+    Play-by-play events stored as Parquet partitioned by season and team.
+
+    Layout: `<root>/SEASON=<season>/Team=<team>/part-<source>.parquet`,
+    one file per source (pbp CSV), so converting a file again only
+    replaces its own events, even in seasons other files also cover.
+    Each event is stored in the partition of both teams of its game, with
+    `Side` telling whether the partition team played at home, so a team
+    query only opens that team's files. Files are sorted by side, game
+    and game time and cut in small row groups with min/max statistics.
+    Readers filter on season, team, game, quarter, seconds left and
+    event type (the play category of `PlayTextParser`): non-matching
+    partitions are never opened, non-matching row groups never read, and
+    each event is returned once. SQL readers of the files (`QueryEngine`)
+    get each event once by filtering `Side = 'home'` or on `Team`.
+    """
+
+    MANIFEST_FILE = "_manifest.json"
+
+    def __init__(self, root: str, row_group_size: int = 8192):
+        self._root = Path(root)
+        self._row_group_size = row_group_size
+
+    def write(
+        self,
+        pbp: pd.DataFrame,
+        source: str = "0",
+        season: int | None = None,
+    ) -> list[int]:
+        """
+        Store events, replacing those written before from the same source.
+
+        Args:
+            pbp: Raw or parsed play-by-play events.
+            source: Name of the data source, e.g. the CSV file stem.
+            season: SEASON of every event, derived from Date if None.
+
+        Returns:
+            Seasons written.
+        """
+        frame = pbp.copy()
+        if season is not None:
+            frame["SEASON"] = season
+        else:
+            frame["SEASON"] = season_from_dates(frame["Date"])
+        if EVENT_TYPE not in frame.columns:
+            plays = frame["HomePlay"].fillna(frame["AwayPlay"])
+            frame[EVENT_TYPE] = PlayTextParser().parse(plays)["PlayCategory"]
+        sides = []
+        for side, team_column in (("home", "HomeTeam"), ("away", "AwayTeam")):
+            sides.append(frame.assign(Team=frame[team_column], Side=side))
+        frame = pd.concat(sides, ignore_index=True)
+
+        filename = f"part-{source}.parquet"
+        self._remove(filename)
+        seasons = []
+        for _, rows in frame.groupby("SEASON", sort=True):
+            season = int(rows["SEASON"].to_numpy()[0])
+            season_dir = self._root / f"SEASON={season}"
+            for team, team_rows in rows.groupby("Team", sort=True):
+                team_dir = season_dir / f"Team={team}"
+                team_dir.mkdir(parents=True, exist_ok=True)
+                team_rows = team_rows.sort_values(
+                    SORT_COLUMNS,
+                    ascending=[False, True, True, False],
+                    kind="stable",
+                )
+                table = pa.Table.from_pandas(
+                    team_rows.drop(columns=PARTITION_COLUMNS),
+                    preserve_index=False,
+                )
+                pq.write_table(
+                    table,
+                    team_dir / filename,
+                    row_group_size=self._row_group_size,
+                    compression="zstd",
+                )
+            seasons.append(season)
+        return seasons
+
+    def convert_csv(self, csv_file: str, refresh: bool = False) -> bool:
+        """
+        Store a pbp CSV unless it was already converted unchanged.
+
+        Args:
+            csv_file: Season CSV file, e.g. 2019-20_pbp.csv: its events
+                are stored in the season of its name, or of their Date if
+                the name holds none.
+            refresh: Convert even if the manifest says it is up to date.
+
+        Returns:
+            True if the file was (re)converted.
+        """
+        path = Path(csv_file)
+        stat = path.stat()
+        signature = [stat.st_size, stat.st_mtime_ns]
+        manifest = self._manifest()
+        if not refresh and manifest.get(path.name, {}).get("source") == (
+            signature
+        ):
+            return False
+        seasons = self.write(
+            pd.read_csv(path, low_memory=False),
+            source=path.stem,
+            season=season_from_filename(path),
+        )
+        manifest[path.name] = {"source": signature, "seasons": seasons}
+        self._root.mkdir(parents=True, exist_ok=True)
+        with open(self._root / self.MANIFEST_FILE, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        return True
+
+    def read(
+        self,
+        columns: list[str] | None = None,
+        **filters,
+    ) -> pd.DataFrame:
+        """
+        Load the events matching filters.
+
+        Args:
+            columns: Columns to load, all if None.
+            **filters: See `expression`.
+
+        Returns:
+            Matching events with SEASON, sorted by team and game.
+        """
+        expression = self.expression(**filters)
+        table = self._dataset().to_table(columns=columns, filter=expression)
+        return table.to_pandas().drop(
+            columns=["Team", "Side"], errors="ignore"
+        )
+
+    def scan_stats(self, **filters) -> dict[str, float]:
+        """
+        Share of the store a filtered read touches.
+
+        Args:
+            **filters: See `expression`.
+
+        Returns:
+            Files, row groups and compressed bytes read, with totals.
+        """
+        expression = self.expression(**filters)
+        dataset = self._dataset()
+        stats: dict[str, float] = dict.fromkeys(
+            ["files", "row_groups", "bytes", "files_read"], 0
+        )
+        stats.update(row_groups_read=0, bytes_read=0)
+        selected = {
+            fragment.path: fragment
+            for fragment in dataset.get_fragments(filter=expression)
+        }
+        for fragment in dataset.get_fragments():
+            metadata = fragment.metadata
+            sizes = [
+                metadata.row_group(i).total_byte_size
+                for i in range(metadata.num_row_groups)
+            ]
+            stats["files"] += 1
+            stats["row_groups"] += len(sizes)
+            stats["bytes"] += sum(sizes)
+            if fragment.path not in selected:
+                continue
+            stats["files_read"] += 1
+            pieces = fragment.split_by_row_group(
+                expression, schema=dataset.schema
+            )
+            for piece in pieces:
+                for row_group in piece.row_groups:
+                    stats["row_groups_read"] += 1
+                    stats["bytes_read"] += sizes[row_group.id]
+        stats["fraction_read"] = stats["bytes_read"] / max(stats["bytes"], 1)
+        return stats
+
+    @staticmethod
+    def expression(
+        seasons: list[int] | None = None,
+        teams: list[str] | None = None,
+        games: list[str] | None = None,
+        quarters: list[int] | None = None,
+        sec_left: tuple[float, float] | None = None,
+        event_types: list[str] | None = None,
+    ) -> ds.Expression:
+        """
+        Dataset filter of the reader arguments.
+
+        Args:
+            seasons: Seasons (starting year).
+            teams: Team abbreviations, home or away.
+            games: Game URLs.
+            quarters: Quarters (5 and more for overtimes).
+            sec_left: Inclusive (min, max) seconds left in the quarter.
+            event_types: Play categories ("shot", "foul"...).
+
+        Returns:
+            Conjunction of the given filters, reading each event once.
+        """
+        terms = []
+        if seasons is not None:
+            terms.append(ds.field("SEASON").isin(list(map(int, seasons))))
+        if teams is not None:
+            teams = list(teams)
+            # Games between two requested teams are kept from the home
+            # team partition only
+            terms.append(
+                ds.field("Team").isin(teams)
+                & (
+                    (ds.field("Side") == "home")
+                    | ~ds.field("HomeTeam").isin(teams)
+                )
+            )
+        else:
+            terms.append(ds.field("Side") == "home")
+        if games is not None:
+            terms.append(ds.field("URL").isin(list(games)))
+        if quarters is not None:
+            terms.append(ds.field("Quarter").isin(list(map(int, quarters))))
+        if sec_left is not None:
+            low, high = sec_left
+            terms.append(
+                (ds.field("SecLeft") >= low) & (ds.field("SecLeft") <= high)
+            )
+        if event_types is not None:
+            terms.append(ds.field(EVENT_TYPE).isin(list(event_types)))
+        expression = terms[0]
+        for term in terms[1:]:
+            expression = expression & term
+        return expression
+
+    def seasons(self) -> list[int]:
+        """Seasons present in the store."""
+        if not self._root.is_dir():
+            return []
+        return sorted(
+            int(p.name.split("=")[1]) for p in self._root.glob("SEASON=*")
+        )
+
+    def _dataset(self) -> ds.Dataset:
+        if not self.seasons():
+            raise FileNotFoundError(f"No pbp partition in {self._root}")
+        partitioning = ds.partitioning(
+            pa.schema([("SEASON", pa.int32()), ("Team", pa.string())]),
+            flavor="hive",
+        )
+        return ds.dataset(
+            self._root,
+            format="parquet",
+            partitioning=partitioning,
+        )
+
+    def _remove(self, filename: str) -> None:
+        """Delete the partition files of a source and emptied folders."""
+        for part in self._root.glob(f"SEASON=*/Team=*/{filename}"):
+            part.unlink()
+            for folder in (part.parent, part.parent.parent):
+                if not any(folder.iterdir()):
+                    folder.rmdir()
+
+    def _manifest(self) -> dict:
+        manifest_file = self._root / self.MANIFEST_FILE
+        if not manifest_file.is_file():
+            return {}
+        with open(manifest_file, encoding="utf-8") as f:
+            return json.load(f)
@@ -0,0 +1,263 @@
+import re
+from collections.abc import Iterator
+
+import numpy as np
+import pandas as pd
+
+# Leading keyword of each play category. Free throws are tested before
+# field goals since both start with "<player> makes|misses".
+CATEGORY_PATTERN = (
+    r"^(?:"
+    r"(?P<rebound>(?:Offensive|Defensive) rebound by )"
+    r"|(?P<turnover>Turnover by )"
+    r"|(?P<jumpball>Jump ball: )"
+    r"|(?P<violation>Violation by )"
+    r"|(?P<freethrow>.+? (?:makes|misses) (?:[a-z]+ )*free throw)"
+    r"|(?P<shot>.+? (?:makes|misses) [23]-pt )"
+    r"|(?P<foul>.+? foul by )"
+    r"|(?P<substitution>.+? enters the game for )"
+    r"|(?P<timeout>.+? timeout$)"
+    r")"
+)
+
+FIELD_PATTERNS = {
+    "shot": (
+        r"^(?P<Shooter>.+?) (?P<ShotOutcome>makes|misses) "
+        r"(?P<ShotType>[23]-pt [a-z\- ]+?)"
+        r"(?: from (?P<ShotDist>\d+) ft| (?P<AtRim>at rim))?"
+        r"(?: \((?:assist by (?P<Assister>.+?)"
+        r"|block by (?P<Blocker>.+?))\))?$"
+    ),
+    "freethrow": (
+        r"^(?P<FreeThrowShooter>.+?) (?P<FreeThrowOutcome>makes|misses) "
+        r"(?:[a-z ]+ )?free throw(?: (?P<FreeThrowNum>\d+ of \d+))?$"
+    ),
+    "rebound": (
+        r"^(?P<ReboundType>Offensive|Defensive) rebound by "
+        r"(?P<Rebounder>.+)$"
+    ),
+    "turnover": (
+        r"^Turnover by (?P<TurnoverPlayer>.+?) "
+        r"\((?P<TurnoverType>[^;)]+)"
+        r"(?:; (?P<TurnoverCause>steal|block) by "
+        r"(?P<TurnoverCauser>.+?))?\)$"
+    ),
+    "foul": (
+        r"^(?P<FoulType>.+?) foul by (?P<Fouler>.+?)"
+        r"(?: \(drawn by (?P<Fouled>.+?)\))?$"
+    ),
+    "violation": (
+        r"^Violation by (?P<ViolationPlayer>.+?) "
+        r"\((?P<ViolationType>.+)\)$"
+    ),
+    "substitution": (
+        r"^(?P<EnterGame>.+?) enters the game for (?P<LeaveGame>.+)$"
+    ),
+    "jumpball": (
+        r"^Jump ball: (?P<JumpballAwayPlayer>.+?) vs\. "
+        r"(?P<JumpballHomePlayer>.+?)"
+        r"(?: \((?P<JumpballPoss>.+?) gains possession\))?$"
+    ),
+    "timeout": (
+        r"^(?P<TimeoutTeam>.+?) "
+        r"(?:full |20 second |short )?timeout$"
+    ),
+}
+
+NAME_COLUMNS = [
+    "Shooter",
+    "Assister",
+    "Blocker",
+    "Fouler",
+    "Fouled",
+    "Rebounder",
+    "ViolationPlayer",
+    "TimeoutTeam",
+    "FreeThrowShooter",
+    "EnterGame",
+    "LeaveGame",
+    "TurnoverPlayer",
+    "TurnoverCauser",
+    "JumpballAwayPlayer",
+    "JumpballHomePlayer",
+    "JumpballPoss",
+]
+CATEGORY_COLUMNS = [
+    "ShotType",
+    "ShotOutcome",
+    "FoulType",
+    "ReboundType",
+    "ViolationType",
+    "FreeThrowOutcome",
+    "FreeThrowNum",
+    "TurnoverType",
+    "TurnoverCause",
+]
+OUTPUT_COLUMNS = [
+    "Shooter",
+    "ShotType",
+    "ShotOutcome",
+    "ShotDist",
+    "Assister",
+    "Blocker",
+    "FoulType",
+    "Fouler",
+    "Fouled",
+    "Rebounder",
+    "ReboundType",
+    "ViolationPlayer",
+    "ViolationType",
+    "TimeoutTeam",
+    "FreeThrowShooter",
+    "FreeThrowOutcome",
+    "FreeThrowNum",
+    "EnterGame",
+    "LeaveGame",
+    "TurnoverPlayer",
+    "TurnoverType",
+    "TurnoverCause",
+    "TurnoverCauser",
+    "JumpballAwayPlayer",
+    "JumpballHomePlayer",
+    "JumpballPoss",
+]
+
+OUTCOME_VALUES = {"makes": "make", "misses": "miss"}
+
+
+class PlayTextParser:
+    """
+    Parse `HomePlay`/`AwayPlay` descriptions into pbp columns.
+
+    Each distinct text is classified once by its leading keyword, then
+    every category is extracted column-wise with one precompiled anchored
+    pattern. Parsed texts are memoized in a cache capped at
+    `max_cache_size` entries, so repeated plays ("Defensive rebound by
+    Team", timeouts...) are parsed a single time per run.
+    """
+
+    def __init__(self, max_cache_size: int = 500_000):
+        self._category_re = re.compile(CATEGORY_PATTERN)
+        self._field_res = {
+            name: re.compile(pattern)
+            for name, pattern in FIELD_PATTERNS.items()
+        }
+        self._max_cache_size = max_cache_size
+        self._cache = self._empty_result(pd.Index([], dtype=object))
+
+    @property
+    def cache_size(self) -> int:
+        """Number of distinct texts currently memoized."""
+        return len(self._cache)
+
+    def parse(self, plays: pd.Series) -> pd.DataFrame:
+        """
+        Parse play descriptions.
+
+        Args:
+            plays: Play description texts, NaN for empty plays.
+
+        Returns:
+            Typed `OUTPUT_COLUMNS` plus `PlayCategory`, aligned on `plays`.
+        """
+        codes, uniques = pd.factorize(plays)
+        uniques = pd.Index(uniques, dtype=object)
+        missing = uniques.difference(self._cache.index)
+        table = self._cache
+        if len(missing):
+            table = pd.concat([table, self._parse_unique(missing)])
+            # Evict after the lookup table is built, not before
+            self._remember(table)
+
+        table = table.reindex(uniques)
+        positions = np.where(codes < 0, len(table), codes)
+        table = pd.concat(
+            [table, self._empty_result(pd.Index([None], dtype=object))]
+        )
+        result = table.iloc[positions].reset_index(drop=True)
+        result.index = plays.index
+        return self._typed(result)
+
+    def parse_events(self, pbp: pd.DataFrame) -> pd.DataFrame:
+        """
+        Rebuild the derived columns of play-by-play events.
+
+        Args:
+            pbp: Events holding `HomePlay` and `AwayPlay`.
+
+        Returns:
+            Copy of `pbp` with `OUTPUT_COLUMNS` (re)computed.
+        """
+        plays = pbp["HomePlay"].fillna(pbp["AwayPlay"])
+        parsed = self.parse(plays)
+        out = pbp.copy()
+        for col in OUTPUT_COLUMNS:
+            out[col] = parsed[col]
+        return out
+
+    def parse_csv(
+        self, filepath: str, chunksize: int = 100_000
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Parse a season pbp CSV chunk by chunk.
+
+        Args:
+            filepath: Path of the pbp CSV file.
+            chunksize: Number of rows read at once.
+
+        Yields:
+            Parsed chunks, see `parse_events`.
+        """
+        for chunk in pd.read_csv(filepath, chunksize=chunksize):
+            yield self.parse_events(chunk)
+
+    def _parse_unique(self, texts: pd.Index) -> pd.DataFrame:
+        series = pd.Series(texts.to_numpy(), index=texts, dtype=object)
+        result = self._empty_result(texts)
+        flags = series.str.extract(self._category_re).notna()
+        category = pd.Series(pd.NA, index=texts, dtype=object)
+        # First matching alternative wins, as in the regex itself
+        for name in reversed(flags.columns.tolist()):
+            category[flags[name].to_numpy()] = name
+        result["PlayCategory"] = category
+
+        for name, pattern in self._field_res.items():
+            mask = (category == name).to_numpy()
+            if not mask.any():
+                continue
+            extracted = series[mask].str.extract(pattern)
+            if name == "shot":
+                at_rim = extracted.pop("AtRim").notna()
+                extracted.loc[at_rim, "ShotDist"] = "0"
+            for col in extracted.columns:
+                result.loc[mask, col] = extracted[col].to_numpy()
+        return result
+
+    def _remember(self, cache: pd.DataFrame) -> None:
+        if len(cache) > self._max_cache_size:
+            cache = cache.iloc[-self._max_cache_size :]
+        self._cache = cache
+
+    @staticmethod
+    def _empty_result(index: pd.Index) -> pd.DataFrame:
+        columns = [*OUTPUT_COLUMNS, "PlayCategory"]
+        return pd.DataFrame(
+            {
+                col: pd.Series(pd.NA, index=index, dtype=object)
+                for col in columns
+            }
+        )
+
+    @staticmethod
+    def _typed(frame: pd.DataFrame) -> pd.DataFrame:
+        out = frame.copy()
+        for col in ("ShotOutcome", "FreeThrowOutcome"):
+            out[col] = out[col].replace(OUTCOME_VALUES)
+        for col in ("ReboundType", "FoulType"):
+            out[col] = out[col].str.lower()
+        out["ShotDist"] = pd.to_numeric(out["ShotDist"], errors="coerce")
+        for col in NAME_COLUMNS:
+            out[col] = out[col].astype("string")
+        for col in [*CATEGORY_COLUMNS, "PlayCategory"]:
+            out[col] = out[col].astype("category")
+        return out
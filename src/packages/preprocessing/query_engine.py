@@ -0,0 +1,139 @@
+import re
+from pathlib import Path
+
+import duckdb
+import pandas as pd
+
+# Tables spanning several files, registered as one scan over a glob
+DEFAULT_GROUPS = {"pbp": "*_pbp.csv"}
+
+_INVALID_CHARS = re.compile(r"[^0-9a-zA-Z_]+")
+
+
+def table_name(stem: str) -> str:
+    """SQL-friendly table name of a file or directory name."""
+    name = _INVALID_CHARS.sub("_", stem).strip("_").lower()
+    return f"t_{name}" if name[:1].isdigit() else name
+
+
+class QueryEngine:
+    """
+    SQL over the raw and processed datasets with an embedded DuckDB.
+
+    Every CSV and Parquet file of the data directories is registered as a
+    view: nothing is loaded until a query runs, and DuckDB only reads the
+    columns and, for Parquet, the row groups the query needs, on all
+    cores. A Parquet file shadows the CSV of the same name; directories
+    of Parquet files (feature store, partitioned exports) become one
+    table with their `key=value` partitions as columns, and `groups`
+    gather multi-file datasets such as the pbp seasons.
+    """
+
+    def __init__(
+        self,
+        data_dirs: list[str],
+        groups: dict[str, str] | None = None,
+        threads: int | None = None,
+        memory_limit: str | None = None,
+    ):
+        config: dict[str, str | bool | int | float | list[str]] = {}
+        if threads:
+            config["threads"] = threads
+        if memory_limit:
+            config["memory_limit"] = memory_limit
+        self._con = duckdb.connect(":memory:", config=config)
+        self._sources: dict[str, tuple[str, str]] = {}
+        self._groups = DEFAULT_GROUPS if groups is None else groups
+        for data_dir in data_dirs:
+            self._register_dir(Path(data_dir))
+
+    def close(self) -> None:
+        """Close the DuckDB connection."""
+        self._con.close()
+
+    def __enter__(self) -> "QueryEngine":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def tables(self) -> pd.DataFrame:
+        """Registered tables with their format and source path."""
+        return pd.DataFrame(
+            [
+                {"table": name, "format": fmt, "source": source}
+                for name, (fmt, source) in sorted(self._sources.items())
+            ],
+            columns=["table", "format", "source"],
+        )
+
+    def register(self, name: str, source: str, fmt: str) -> None:
+        """
+        Expose a file, glob or directory as a table.
+
+        Args:
+            name: Table name.
+            source: Path or glob of the data files.
+            fmt: "csv" or "parquet".
+        """
+        if fmt == "csv":
+            scan = f"read_csv({self._quote(source)}, union_by_name = true)"
+        elif fmt == "parquet":
+            scan = (
+                f"read_parquet({self._quote(source)}, "
+                "hive_partitioning = true, union_by_name = true)"
+            )
+        else:
+            raise ValueError(f"Unknown format: {fmt}")
+        self._con.execute(
+            f'CREATE OR REPLACE VIEW "{name}" AS SELECT * FROM {scan}'
+        )
+        self._sources[name] = (fmt, source)
+
+    def query(
+        self, sql: str, params: dict | list | None = None
+    ) -> pd.DataFrame:
+        """
+        Run a query and return its result.
+
+        Args:
+            sql: SQL statement, with `$name` or `?` placeholders.
+            params: Placeholder values.
+
+        Returns:
+            Result rows.
+        """
+        return self._con.execute(sql, params).df()
+
+    def explain(self, sql: str) -> str:
+        """Physical plan of a query, to check pushed-down projections."""
+        rows = self._con.execute(f"EXPLAIN {sql}").fetchall()
+        return "\n".join(row[1] for row in rows)
+
+    def _register_dir(self, data_dir: Path) -> None:
+        if not data_dir.is_dir():
+            return
+        grouped = set()
+        for name, pattern in self._groups.items():
+            files = sorted(data_dir.glob(pattern))
+            if files:
+                fmt = "parquet" if pattern.endswith(".parquet") else "csv"
+                self.register(name, str(data_dir / pattern), fmt)
+                grouped.update(files)
+
+        for path in sorted(data_dir.iterdir()):
+            if path in grouped:
+                continue
+            name = table_name(path.stem)
+            if path.suffix == ".parquet":
+                self.register(name, str(path), "parquet")
+            elif path.suffix == ".csv":
+                # The Parquet export of a CSV is faster to scan
+                if not path.with_suffix(".parquet").is_file():
+                    self.register(name, str(path), "csv")
+            elif path.is_dir() and any(path.rglob("*.parquet")):
+                self.register(name, str(path / "**" / "*.parquet"), "parquet")
+
+    @staticmethod
+    def _quote(value: str) -> str:
+        return "'" + value.replace("'", "''") + "'"
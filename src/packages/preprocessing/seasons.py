@@ -0,0 +1,53 @@
+import re
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# First month of a season: games before it belong to the previous one
+SEASON_START_MONTH = 8
+# Seasons played past the usual cut-off, with the last day of their
+# games: the 2019-20 season resumed in the Orlando bubble in July 2020
+# and its finals ended on 2020-10-11
+LATE_SEASON_ENDS = {2019: "2020-11-30"}
+# Season files of the pbp data, e.g. 2019-20_pbp.csv
+_SEASON_FILE = re.compile(r"(\d{4})-\d{2}_pbp")
+
+
+def season_from_dates(dates) -> np.ndarray:
+    """
+    SEASON (starting year) of game dates, as in games.csv.
+
+    Games from August on start a new season, except those of the seasons
+    of `LATE_SEASON_ENDS`: the Jul-Oct 2020 bubble games stay in 2019.
+
+    Args:
+        dates: Game dates, as strings ("2020-03-03", "January 5 2020")
+            or datetimes.
+
+    Returns:
+        int64 array, e.g. 2019 for a game played in March or August 2020.
+    """
+    parsed = pd.to_datetime(pd.Series(dates), format="mixed")
+    years = parsed.dt.year.to_numpy(dtype=np.int64)
+    seasons = years - (parsed.dt.month.to_numpy() < SEASON_START_MONTH)
+    for season, last_day in LATE_SEASON_ENDS.items():
+        late = (seasons == season + 1) & (
+            parsed <= pd.Timestamp(last_day)
+        ).to_numpy()
+        seasons[late] = season
+    return seasons
+
+
+def season_from_filename(path: str | Path) -> int | None:
+    """
+    SEASON (starting year) of a pbp season file.
+
+    Args:
+        path: File named after its season, e.g. "2019-20_pbp.csv".
+
+    Returns:
+        Starting year (2019), None if the name holds no season.
+    """
+    match = _SEASON_FILE.search(Path(path).name)
+    return int(match.group(1)) if match else None
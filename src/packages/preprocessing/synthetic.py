@@ -0,0 +1,966 @@
+import math
+import unicodedata
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# (TEAM_ID offset, ABBREVIATION, Basketball-Reference abbreviation,
+# NICKNAME, CITY, CONFERENCE) of the 30 NBA franchises
+TEAMS = [
+    (0, "ATL", "ATL", "Hawks", "Atlanta", "East"),
+    (1, "BOS", "BOS", "Celtics", "Boston", "East"),
+    (2, "CLE", "CLE", "Cavaliers", "Cleveland", "East"),
+    (3, "NOP", "NOP", "Pelicans", "New Orleans", "West"),
+    (4, "CHI", "CHI", "Bulls", "Chicago", "East"),
+    (5, "DAL", "DAL", "Mavericks", "Dallas", "West"),
+    (6, "DEN", "DEN", "Nuggets", "Denver", "West"),
+    (7, "GSW", "GSW", "Warriors", "Golden State", "West"),
+    (8, "HOU", "HOU", "Rockets", "Houston", "West"),
+    (9, "LAC", "LAC", "Clippers", "LA", "West"),
+    (10, "LAL", "LAL", "Lakers", "Los Angeles", "West"),
+    (11, "MIA", "MIA", "Heat", "Miami", "East"),
+    (12, "MIL", "MIL", "Bucks", "Milwaukee", "East"),
+    (13, "MIN", "MIN", "Timberwolves", "Minnesota", "West"),
+    (14, "BKN", "BRK", "Nets", "Brooklyn", "East"),
+    (15, "NYK", "NYK", "Knicks", "New York", "East"),
+    (16, "ORL", "ORL", "Magic", "Orlando", "East"),
+    (17, "IND", "IND", "Pacers", "Indiana", "East"),
+    (18, "PHI", "PHI", "76ers", "Philadelphia", "East"),
+    (19, "PHX", "PHO", "Suns", "Phoenix", "West"),
+    (20, "POR", "POR", "Trail Blazers", "Portland", "West"),
+    (21, "SAC", "SAC", "Kings", "Sacramento", "West"),
+    (22, "SAS", "SAS", "Spurs", "San Antonio", "West"),
+    (23, "OKC", "OKC", "Thunder", "Oklahoma City", "West"),
+    (24, "TOR", "TOR", "Raptors", "Toronto", "East"),
+    (25, "UTA", "UTA", "Jazz", "Utah", "West"),
+    (26, "MEM", "MEM", "Grizzlies", "Memphis", "West"),
+    (27, "WAS", "WAS", "Wizards", "Washington", "East"),
+    (28, "DET", "DET", "Pistons", "Detroit", "East"),
+    (29, "CHA", "CHO", "Hornets", "Charlotte", "East"),
+]
+FIRST_TEAM_ID = 1610612737
+
+FIRST_NAMES = [
+    "Aaron", "Al", "Andre", "Anthony", "Ben", "Bobby", "Bruce", "Chris",
+    "D'Angelo", "Damian", "De'Aaron", "Derrick", "Devin", "Donovan",
+    "Eric", "Gary", "Giannis", "Goran", "Jaylen", "Jamal", "James",
+    "Jrue", "Julius", "Karl-Anthony", "Kawhi", "Kevin", "Kyle", "Kyrie",
+    "LaMarcus", "LeBron", "Luka", "Marcus", "Mike", "Nikola", "Paul",
+    "Rudy", "Russell", "Stephen", "Tim", "Tobias", "Trae", "Zach",
+]  # fmt: skip
+LAST_NAMES = [
+    "Adams", "Aldridge", "Antetokounmpo", "Beal", "Brown", "Butler",
+    "Curry", "Davis", "DeRozan", "Dončić", "Dragić", "Durant", "Embiid",
+    "George", "Gobert", "Green", "Harden", "Harris", "Holiday", "Irving",
+    "James", "Johnson", "Jokić", "Jones", "LaVine", "Leonard", "Lillard",
+    "Lowry", "Middleton", "Mitchell", "Morris", "O'Neale", "Paul",
+    "Randle", "Russell", "Smart", "Smith", "Thompson", "Towns", "Trent",
+    "Vučević", "Walker", "Westbrook", "Williams", "Young",
+]  # fmt: skip
+
+GAMES_COLUMNS = [
+    "GAME_DATE_EST",
+    "GAME_ID",
+    "GAME_STATUS_TEXT",
+    "HOME_TEAM_ID",
+    "VISITOR_TEAM_ID",
+    "SEASON",
+    "TEAM_ID_home",
+    "PTS_home",
+    "FG_PCT_home",
+    "FT_PCT_home",
+    "FG3_PCT_home",
+    "AST_home",
+    "REB_home",
+    "TEAM_ID_away",
+    "PTS_away",
+    "FG_PCT_away",
+    "FT_PCT_away",
+    "FG3_PCT_away",
+    "AST_away",
+    "REB_away",
+    "HOME_TEAM_WINS",
+]
+DETAILS_COLUMNS = [
+    "GAME_ID",
+    "TEAM_ID",
+    "TEAM_ABBREVIATION",
+    "TEAM_CITY",
+    "PLAYER_ID",
+    "PLAYER_NAME",
+    "NICKNAME",
+    "START_POSITION",
+    "COMMENT",
+    "MIN",
+    "FGM",
+    "FGA",
+    "FG_PCT",
+    "FG3M",
+    "FG3A",
+    "FG3_PCT",
+    "FTM",
+    "FTA",
+    "FT_PCT",
+    "OREB",
+    "DREB",
+    "REB",
+    "AST",
+    "STL",
+    "BLK",
+    "TO",
+    "PF",
+    "PTS",
+    "PLUS_MINUS",
+]
+PLAYERS_COLUMNS = ["PLAYER_NAME", "TEAM_ID", "PLAYER_ID", "SEASON"]
+TEAMS_COLUMNS = [
+    "LEAGUE_ID",
+    "TEAM_ID",
+    "MIN_YEAR",
+    "MAX_YEAR",
+    "ABBREVIATION",
+    "NICKNAME",
+    "YEARFOUNDED",
+    "CITY",
+    "ARENA",
+    "ARENACAPACITY",
+    "OWNER",
+    "GENERALMANAGER",
+    "HEADCOACH",
+    "DLEAGUEAFFILIATION",
+]
+RANKING_COLUMNS = [
+    "TEAM_ID",
+    "LEAGUE_ID",
+    "SEASON_ID",
+    "STANDINGSDATE",
+    "CONFERENCE",
+    "TEAM",
+    "G",
+    "W",
+    "L",
+    "W_PCT",
+    "HOME_RECORD",
+    "ROAD_RECORD",
+    "RETURNTOPLAY",
+]
+PBP_COLUMNS = [
+    "URL",
+    "GameType",
+    "Location",
+    "Date",
+    "Time",
+    "WinningTeam",
+    "Quarter",
+    "SecLeft",
+    "AwayTeam",
+    "AwayPlay",
+    "AwayScore",
+    "HomeTeam",
+    "HomePlay",
+    "HomeScore",
+    "Shooter",
+    "ShotType",
+    "ShotOutcome",
+    "ShotDist",
+    "Assister",
+    "Blocker",
+    "FoulType",
+    "Fouler",
+    "Fouled",
+    "Rebounder",
+    "ReboundType",
+    "ViolationPlayer",
+    "ViolationType",
+    "TimeoutTeam",
+    "FreeThrowShooter",
+    "FreeThrowOutcome",
+    "FreeThrowNum",
+    "EnterGame",
+    "LeaveGame",
+    "TurnoverPlayer",
+    "TurnoverType",
+    "TurnoverCause",
+    "TurnoverCauser",
+    "JumpballAwayPlayer",
+    "JumpballHomePlayer",
+    "JumpballPoss",
+]
+
+ROSTER_SIZE = 15
+ACTIVE_PLAYERS = 13
+# Minutes weights of the 13 active players, starters first
+MINUTES_WEIGHTS = np.array(
+    [34, 33, 32, 31, 30, 24, 20, 17, 14, 10, 6, 4, 2], dtype=np.float64
+)
+PCT_COLUMNS = [
+    ("FG_PCT", "FGM", "FGA"),
+    ("FT_PCT", "FTM", "FTA"),
+    ("FG3_PCT", "FG3M", "FG3A"),
+]
+SHOT_TYPES_2PT = ["layup", "jump shot", "dunk", "hook shot"]
+
+
+@dataclass
+class SyntheticConfig:
+    """
+    Size and seed of a synthetic dataset.
+
+    At scale 1 the dataset has the size of the Kaggle one: 30 teams over
+    `n_seasons` seasons, with pbp for the last `pbp_seasons`. Scales below
+    1 keep fewer seasons; above 1, `ceil(scale)` independent leagues of
+    30 teams share the seasons, so cardinalities grow like the data.
+
+    Attributes:
+        scale: Size factor.
+        seed: Seed of every random draw.
+        first_season: First SEASON generated.
+        n_seasons: Number of seasons at scale 1.
+        pbp_seasons: Number of last seasons with play-by-play at scale 1.
+        games_per_team: Regular season games of each team.
+        pbp_chunk_games: Games simulated between two pbp writes.
+    """
+
+    scale: float = 1.0
+    seed: int = 0
+    first_season: int = 2003
+    n_seasons: int = 20
+    pbp_seasons: int = 6
+    games_per_team: int = 82
+    pbp_chunk_games: int = 100
+
+    @property
+    def n_leagues(self) -> int:
+        """Number of 30-team leagues."""
+        return max(1, int(np.ceil(self.scale)))
+
+    @property
+    def seasons(self) -> list[int]:
+        """Generated seasons."""
+        per_league = self.n_seasons * self.scale / self.n_leagues
+        count = min(self.n_seasons, max(1, int(round(per_league))))
+        return list(range(self.first_season, self.first_season + count))
+
+    @property
+    def seasons_with_pbp(self) -> list[int]:
+        """Seasons with a pbp file."""
+        seasons = self.seasons
+        count = min(len(seasons), self.pbp_seasons)
+        return seasons[len(seasons) - count :] if count else []
+
+
+class _CsvSink:
+    # Appends chunks to a CSV file, header written with the first chunk
+    def __init__(self, path: Path, columns: list[str]):
+        self.path = path
+        self.columns = columns
+        self.rows = 0
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pd.DataFrame(columns=columns).to_csv(path, index=False)
+
+    def write(self, frame: pd.DataFrame) -> None:
+        frame[self.columns].to_csv(
+            self.path,
+            mode="a",
+            header=False,
+            index=False,
+        )
+        self.rows += len(frame)
+
+
+class _Draws:
+    # Scalar draws of a generator served from a pre-drawn buffer: the pbp
+    # simulation makes millions of them
+    def __init__(self, rng: np.random.Generator, size: int = 65536):
+        self._rng = rng
+        self._size = size
+        self._buffer: list[float] = []
+
+    def random(self) -> float:
+        if not self._buffer:
+            self._buffer = self._rng.random(self._size).tolist()
+        return self._buffer.pop()
+
+    def integers(self, low: int, high: int | None = None) -> int:
+        if high is None:
+            low, high = 0, low
+        return low + int(self.random() * (high - low))
+
+    def exponential(self, scale: float) -> float:
+        return -scale * math.log(1.0 - self.random())
+
+
+def _ascii(text: str) -> str:
+    text = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in text if c.isascii() and c.isalpha()).lower()
+
+
+class SyntheticDataset:
+    """
+    Generator of NBA-shaped raw files for scale and performance tests.
+
+    Writes games.csv, games_details.csv, players.csv, teams.csv,
+    ranking.csv and one `<season>_pbp.csv` per pbp season with the
+    columns of `data/describe`. Keys are consistent across files: box
+    score lines add up to the game scores, rosters follow players.csv,
+    standings are the cumulative records of the games, and pbp events
+    use the same games, teams and player names (pbp scores come from
+    their own possession simulation). Every (league, season) draws from
+    its own seeded generator and is written before the next one, so the
+    output is deterministic and memory stays flat whatever the scale.
+    """
+
+    def __init__(self, config: SyntheticConfig | None = None):
+        self.config = config or SyntheticConfig()
+
+    def generate(self, output_dir: str) -> dict[str, int]:
+        """
+        Write every file to a directory.
+
+        Args:
+            output_dir: Destination, created if needed.
+
+        Returns:
+            Number of rows written per file name.
+        """
+        cfg = self.config
+        root = Path(output_dir)
+        sinks = {
+            "games": _CsvSink(root / "games.csv", GAMES_COLUMNS),
+            "details": _CsvSink(root / "games_details.csv", DETAILS_COLUMNS),
+            "players": _CsvSink(root / "players.csv", PLAYERS_COLUMNS),
+            "teams": _CsvSink(root / "teams.csv", TEAMS_COLUMNS),
+            "ranking": _CsvSink(root / "ranking.csv", RANKING_COLUMNS),
+        }
+        for league in range(cfg.n_leagues):
+            sinks["teams"].write(self.teams(league))
+
+        rosters = {
+            league: self._first_roster(league)
+            for league in range(cfg.n_leagues)
+        }
+        for season in cfg.seasons:
+            pbp_sink = None
+            if season in cfg.seasons_with_pbp:
+                name = f"{season}-{(season + 1) % 100:02d}_pbp.csv"
+                pbp_sink = _CsvSink(root / name, PBP_COLUMNS)
+                sinks[name] = pbp_sink
+            for league in range(cfg.n_leagues):
+                rng = np.random.default_rng([cfg.seed, league, season])
+                roster = self._next_roster(rosters[league], rng)
+                rosters[league] = roster
+                sinks["players"].write(self._players(roster, season))
+
+                schedule = self._schedule(league, season, rng)
+                games, details = self._box_scores(
+                    schedule, roster, season, rng
+                )
+                sinks["games"].write(games)
+                sinks["details"].write(details)
+                sinks["ranking"].write(self._ranking(games, league, season))
+                if pbp_sink is not None:
+                    for chunk in self._pbp(schedule, roster, rng):
+                        pbp_sink.write(chunk)
+        return {sink.path.name: sink.rows for sink in sinks.values()}
+
+    def teams(self, league: int) -> pd.DataFrame:
+        """teams.csv rows of one league."""
+        rows = []
+        for offset, abbr, _, nickname, city, _ in TEAMS:
+            rows.append(
+                {
+                    "LEAGUE_ID": 0,
+                    "TEAM_ID": self._team_id(league, offset),
+                    "MIN_YEAR": 1949 + offset,
+                    "MAX_YEAR": 2019,
+                    "ABBREVIATION": self._abbreviation(abbr, league),
+                    "NICKNAME": nickname,
+                    "YEARFOUNDED": 1949 + offset,
+                    "CITY": city,
+                    "ARENA": f"{city} Arena",
+                    "ARENACAPACITY": 18000 + 100 * offset,
+                    "OWNER": f"{nickname} Group",
+                    "GENERALMANAGER": f"{FIRST_NAMES[offset]} Manager",
+                    "HEADCOACH": f"{FIRST_NAMES[-offset - 1]} Coach",
+                    "DLEAGUEAFFILIATION": f"{city} G-League",
+                }
+            )
+        return pd.DataFrame(rows)
+
+    @staticmethod
+    def _team_id(league: int, offset) -> int:
+        return FIRST_TEAM_ID + 100 * league + offset
+
+    @staticmethod
+    def _abbreviation(abbr: str, league: int) -> str:
+        return abbr if league == 0 else f"{abbr}{league}"
+
+    def _first_roster(self, league: int) -> dict:
+        return {
+            "league": league,
+            "next_id": 0,
+            "ids": np.empty((len(TEAMS), 0), dtype=np.int64),
+            "names": {},
+            "usage": {},
+        }
+
+    def _new_player(self, roster: dict, rng: np.random.Generator) -> int:
+        player_id = 1_000_000 * roster["league"] + 200_000 + roster["next_id"]
+        roster["next_id"] += 1
+        name = (
+            f"{FIRST_NAMES[rng.integers(len(FIRST_NAMES))]} "
+            f"{LAST_NAMES[rng.integers(len(LAST_NAMES))]}"
+        )
+        if rng.random() < 0.04:
+            name += " Jr."
+        roster["names"][player_id] = name
+        roster["usage"][player_id] = float(rng.lognormal(0.0, 0.35))
+        return player_id
+
+    def _next_roster(self, roster: dict, rng: np.random.Generator) -> dict:
+        # About 20% of the players leave each season and 5% are traded
+        ids = roster["ids"]
+        if ids.shape[1] == 0:
+            ids = np.zeros((len(TEAMS), ROSTER_SIZE), dtype=np.int64)
+            replace = np.ones(ids.shape, dtype=bool)
+        else:
+            ids = ids.copy()
+            replace = rng.random(ids.shape) < 0.2
+            traded = np.flatnonzero(
+                ~replace.ravel() & (rng.random(ids.size) < 0.05)
+            )
+            flat = ids.ravel()
+            flat[traded] = flat[rng.permutation(traded)]
+            ids = flat.reshape(ids.shape)
+        for team, slot in zip(*np.nonzero(replace), strict=True):
+            ids[team, slot] = self._new_player(roster, rng)
+        # Best players first: the first five start
+        usage = np.vectorize(roster["usage"].get)(ids)
+        order = np.argsort(-usage, axis=1, kind="stable")
+        roster["ids"] = np.take_along_axis(ids, order, axis=1)
+        return roster
+
+    def _players(self, roster: dict, season: int) -> pd.DataFrame:
+        ids = roster["ids"]
+        team_ids = np.repeat(
+            [self._team_id(roster["league"], t[0]) for t in TEAMS],
+            ids.shape[1],
+        )
+        return pd.DataFrame(
+            {
+                "PLAYER_NAME": [roster["names"][i] for i in ids.ravel()],
+                "TEAM_ID": team_ids,
+                "PLAYER_ID": ids.ravel(),
+                "SEASON": season,
+            }
+        )
+
+    def _schedule(
+        self, league: int, season: int, rng: np.random.Generator
+    ) -> pd.DataFrame:
+        # Each round pairs every team once; rounds are two days apart
+        n_teams = len(TEAMS)
+        rounds = self.config.games_per_team
+        pairs = np.stack([rng.permutation(n_teams) for _ in range(rounds)])
+        pairs = pairs.reshape(rounds, n_teams // 2, 2)
+        home, away = pairs[..., 0].ravel(), pairs[..., 1].ravel()
+        day = np.repeat(np.arange(rounds) * 2, n_teams // 2)
+        day += np.tile(np.arange(n_teams // 2) >= n_teams // 4, rounds)
+        start = np.datetime64(f"{season}-10-20")
+        order = np.lexsort((home, day))
+        strength = rng.normal(0.0, 4.0, n_teams)
+        schedule = pd.DataFrame(
+            {
+                "GAME_DATE_EST": (start + day[order]).astype("datetime64[ns]"),
+                "GAME_ID": (
+                    10_000_000 * league
+                    + 20_000_000
+                    + (season % 100) * 100_000
+                    + np.arange(1, len(order) + 1)
+                ),
+                "HOME": home[order],
+                "AWAY": away[order],
+            }
+        )
+        schedule["HOME_STRENGTH"] = strength[schedule["HOME"]]
+        schedule["AWAY_STRENGTH"] = strength[schedule["AWAY"]]
+        schedule["LEAGUE"] = league
+        return schedule
+
+    def _box_scores(
+        self,
+        schedule: pd.DataFrame,
+        roster: dict,
+        season: int,
+        rng: np.random.Generator,
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        n_games = len(schedule)
+        # Team-games: home rows then away rows
+        team = np.concatenate([schedule["HOME"], schedule["AWAY"]])
+        edge = np.concatenate(
+            [
+                schedule["HOME_STRENGTH"] - schedule["AWAY_STRENGTH"] + 1.5,
+                schedule["AWAY_STRENGTH"] - schedule["HOME_STRENGTH"] - 1.5,
+            ]
+        )
+        n = len(team)
+        # Two inactive players per game, drawn among the bench
+        lineup = np.tile(np.arange(ROSTER_SIZE), (n, 1))
+        bench = rng.permuted(
+            np.tile(np.arange(5, ROSTER_SIZE), (n, 1)), axis=1
+        )
+        lineup[:, 5:] = bench
+        lineup[:, 5:ACTIVE_PLAYERS] = np.sort(bench[:, : ACTIVE_PLAYERS - 5])
+        player_ids = roster["ids"][team[:, None], lineup]
+        usage = np.vectorize(roster["usage"].get)(
+            player_ids[:, :ACTIVE_PLAYERS]
+        )
+
+        minutes = MINUTES_WEIGHTS * rng.lognormal(
+            0.0, 0.15, (n, ACTIVE_PLAYERS)
+        )
+        seconds = np.rint(minutes / minutes.sum(axis=1, keepdims=True) * 14400)
+        shares = seconds * usage
+        shares /= shares.sum(axis=1, keepdims=True)
+
+        def spread(mean: float, sd: float, cap=None) -> np.ndarray:
+            totals = np.maximum(rng.normal(mean, sd, n), 0).round()
+            if cap is not None:
+                totals = np.minimum(totals, cap)
+            return rng.multinomial(totals.astype(np.int64), shares)
+
+        fg3a = spread(32.0, 6.0)
+        fg2a = spread(54.0, 6.0)
+        fta = spread(22.0, 5.0)
+        pct = np.clip(0.52 + 0.004 * edge, 0.3, 0.7)[:, None]
+        fg2m = rng.binomial(fg2a, pct)
+        fg3m = rng.binomial(fg3a, np.clip(pct - 0.165, 0.2, 0.5))
+        ftm = rng.binomial(fta, 0.77)
+        pts = 2 * fg2m + 3 * fg3m + ftm
+
+        # No draw: the best scorer of the game's home side gets one more
+        # made free throw
+        team_pts = pts.sum(axis=1)
+        tie = np.flatnonzero(team_pts[:n_games] == team_pts[n_games:])
+        ftm[tie, 0] += 1
+        fta[tie, 0] += 1
+        pts[tie, 0] += 1
+        team_pts = pts.sum(axis=1)
+
+        fgm, fga = fg2m + fg3m, fg2a + fg3a
+        stats = {
+            "FGM": fgm,
+            "FGA": fga,
+            "FG3M": fg3m,
+            "FG3A": fg3a,
+            "FTM": ftm,
+            "FTA": fta,
+            "OREB": spread(10.0, 3.0),
+            "DREB": spread(34.0, 4.0),
+            "AST": rng.binomial(fgm, 0.6),
+            "STL": spread(7.5, 2.5),
+            "BLK": spread(5.0, 2.0),
+            "TO": spread(14.0, 3.5),
+            "PF": spread(20.0, 4.0, cap=6 * ACTIVE_PLAYERS),
+            "PTS": pts,
+        }
+        margin = np.concatenate(
+            [
+                team_pts[:n_games] - team_pts[n_games:],
+                team_pts[n_games:] - team_pts[:n_games],
+            ]
+        )
+        plus_minus = np.rint(
+            margin[:, None] * seconds / 2880.0
+            + rng.normal(0.0, 4.0, seconds.shape)
+        )
+
+        games = self._games_rows(schedule, season, stats, n_games)
+        details = self._detail_rows(
+            schedule, roster, team, player_ids, seconds, stats, plus_minus
+        )
+        return games, details
+
+    def _games_rows(
+        self,
+        schedule: pd.DataFrame,
+        season: int,
+        stats: dict[str, np.ndarray],
+        n_games: int,
+    ) -> pd.DataFrame:
+        league = int(schedule["LEAGUE"].iloc[0])
+        totals = {k: v.sum(axis=1) for k, v in stats.items()}
+        games = pd.DataFrame(
+            {
+                "GAME_DATE_EST": schedule["GAME_DATE_EST"].dt.strftime(
+                    "%Y-%m-%d"
+                ),
+                "GAME_ID": schedule["GAME_ID"],
+                "GAME_STATUS_TEXT": "Final",
+                "HOME_TEAM_ID": self._team_id(league, schedule["HOME"]),
+                "VISITOR_TEAM_ID": self._team_id(league, schedule["AWAY"]),
+                "SEASON": season,
+            }
+        )
+        sides = (("home", slice(0, n_games)), ("away", slice(n_games, None)))
+        for side, rows in sides:
+            column = "HOME_TEAM_ID" if side == "home" else "VISITOR_TEAM_ID"
+            games[f"TEAM_ID_{side}"] = games[column]
+            games[f"PTS_{side}"] = totals["PTS"][rows]
+            for pct, made, att in PCT_COLUMNS:
+                games[f"{pct}_{side}"] = np.round(
+                    totals[made][rows] / np.maximum(totals[att][rows], 1), 3
+                )
+            games[f"AST_{side}"] = totals["AST"][rows]
+            games[f"REB_{side}"] = totals["OREB"][rows] + totals["DREB"][rows]
+        games["HOME_TEAM_WINS"] = (
+            games["PTS_home"] > games["PTS_away"]
+        ).astype(int)
+        return games
+
+    def _detail_rows(
+        self,
+        schedule: pd.DataFrame,
+        roster: dict,
+        team: np.ndarray,
+        player_ids: np.ndarray,
+        seconds: np.ndarray,
+        stats: dict[str, np.ndarray],
+        plus_minus: np.ndarray,
+    ) -> pd.DataFrame:
+        league = roster["league"]
+        n, n_lines = player_ids.shape
+        game_ids = np.concatenate([schedule["GAME_ID"]] * 2)
+        active = np.arange(n_lines) < ACTIVE_PLAYERS
+        names = np.array(
+            [roster["names"][i] for i in player_ids.ravel()], dtype=object
+        )
+        abbr = np.array(
+            [self._abbreviation(t[1], league) for t in TEAMS], dtype=object
+        )
+        city = np.array([t[4] for t in TEAMS], dtype=object)
+        details = pd.DataFrame(
+            {
+                "GAME_ID": np.repeat(game_ids, n_lines),
+                "TEAM_ID": np.repeat(self._team_id(league, team), n_lines),
+                "TEAM_ABBREVIATION": np.repeat(abbr[team], n_lines),
+                "TEAM_CITY": np.repeat(city[team], n_lines),
+                "PLAYER_ID": player_ids.ravel(),
+                "PLAYER_NAME": names,
+                "NICKNAME": None,
+                "START_POSITION": np.tile(
+                    np.array(
+                        ["F", "F", "C", "G", "G"] + [None] * (n_lines - 5),
+                        dtype=object,
+                    ),
+                    n,
+                ),
+                "COMMENT": np.tile(
+                    np.array(
+                        [None] * ACTIVE_PLAYERS
+                        + ["DNP - Coach's Decision"]
+                        * (n_lines - ACTIVE_PLAYERS),
+                        dtype=object,
+                    ),
+                    n,
+                ),
+            }
+        )
+        played = np.tile(active, n)
+        grid = np.zeros((n, n_lines))
+        grid[:, :ACTIVE_PLAYERS] = seconds
+        secs = grid.ravel().astype(np.int64)
+        details["MIN"] = [
+            f"{s // 60}:{s % 60:02d}" if on_court else None
+            for s, on_court in zip(secs, played, strict=True)
+        ]
+
+        def full(values: np.ndarray) -> np.ndarray:
+            out = np.full((n, n_lines), np.nan)
+            out[:, :ACTIVE_PLAYERS] = values
+            return out.ravel()
+
+        for col in DETAILS_COLUMNS[10:]:
+            if col in stats:
+                details[col] = full(stats[col])
+        for pct, made, att in PCT_COLUMNS:
+            details[pct] = np.round(
+                details[made] / np.maximum(details[att], 1), 3
+            )
+        details["REB"] = details["OREB"] + details["DREB"]
+        details["PLUS_MINUS"] = full(plus_minus)
+        return details
+
+    def _ranking(
+        self, games: pd.DataFrame, league: int, season: int
+    ) -> pd.DataFrame:
+        dates = pd.to_datetime(games["GAME_DATE_EST"]).to_numpy()
+        home_win = games["HOME_TEAM_WINS"].to_numpy().astype(bool)
+        days = np.arange(
+            dates.min(),
+            dates.max() + np.timedelta64(1, "D"),
+            np.timedelta64(1, "D"),
+        )
+        frames = []
+        for offset, _, _, _, city, conference in TEAMS:
+            team_id = self._team_id(league, offset)
+            home = games["HOME_TEAM_ID"].to_numpy() == team_id
+            away = games["VISITOR_TEAM_ID"].to_numpy() == team_id
+            played = home | away
+            team_dates = dates[played]
+            won = np.where(home, home_win, ~home_win)[played]
+            at_home = home[played]
+            # Standings of a day include the games played that day
+            idx = np.searchsorted(team_dates, days, side="right")
+
+            def cum(mask: np.ndarray, idx=idx) -> np.ndarray:
+                return np.concatenate([[0], np.cumsum(mask)])[idx]
+
+            g = idx
+            w = cum(won)
+            home_w, home_g = cum(won & at_home), cum(at_home)
+            road_w, road_g = cum(won & ~at_home), cum(~at_home)
+            frames.append(
+                pd.DataFrame(
+                    {
+                        "TEAM_ID": team_id,
+                        "LEAGUE_ID": 0,
+                        "SEASON_ID": 20000 + season,
+                        "STANDINGSDATE": pd.DatetimeIndex(days).strftime(
+                            "%Y-%m-%d"
+                        ),
+                        "CONFERENCE": conference,
+                        "TEAM": city,
+                        "G": g,
+                        "W": w,
+                        "L": g - w,
+                        "W_PCT": np.round(w / np.maximum(g, 1), 3),
+                        "HOME_RECORD": [
+                            f"{a}-{b - a}"
+                            for a, b in zip(home_w, home_g, strict=True)
+                        ],
+                        "ROAD_RECORD": [
+                            f"{a}-{b - a}"
+                            for a, b in zip(road_w, road_g, strict=True)
+                        ],
+                        "RETURNTOPLAY": np.nan,
+                    }
+                )
+            )
+        return pd.concat(frames, ignore_index=True)
+
+    def _pbp(
+        self,
+        schedule: pd.DataFrame,
+        roster: dict,
+        rng: np.random.Generator,
+    ):
+        league = roster["league"]
+        draws = _Draws(rng)
+        chunk = []
+        for game in schedule.itertuples(index=False):
+            chunk.extend(self._simulate_game(game, roster, league, draws))
+            if len(chunk) >= self.config.pbp_chunk_games * 450:
+                yield pd.DataFrame.from_records(chunk, columns=PBP_COLUMNS)
+                chunk = []
+        if chunk:
+            yield pd.DataFrame.from_records(chunk, columns=PBP_COLUMNS)
+
+    @staticmethod
+    def _pbp_name(name: str, player_id: int) -> tuple[str, str]:
+        # Play text form ("L. James") and column form with a
+        # Basketball-Reference style id ("L. James - jamesle01")
+        first, _, last = name.partition(" ")
+        short = f"{first[0]}. {last}"
+        ref = f"{_ascii(last.replace(' Jr.', ''))[:5]}{_ascii(first)[:2]}"
+        return short, f"{short} - {ref}{player_id % 100:02d}"
+
+    def _simulate_game(self, game, roster, league, rng) -> list[dict]:
+        home_t, away_t = TEAMS[game.HOME], TEAMS[game.AWAY]
+        date = pd.Timestamp(game.GAME_DATE_EST)
+        home_abbr = self._abbreviation(home_t[2], league)
+        away_abbr = self._abbreviation(away_t[2], league)
+        header = {
+            "URL": f"/boxscores/{date:%Y%m%d}0{home_abbr}.html",
+            "GameType": "regular",
+            "Location": f"{home_t[4]} Arena",
+            "Date": f"{date:%B} {date.day} {date.year}",
+            "HomeTeam": home_abbr,
+            "AwayTeam": away_abbr,
+        }
+        players = []
+        for team in (game.HOME, game.AWAY):
+            ids = roster["ids"][team]
+            players.append(
+                [self._pbp_name(roster["names"][i], i) for i in ids]
+            )
+        on_court = [list(range(5)), list(range(5))]
+        cities = (home_t[4], away_t[4])
+        score = [0, 0]
+        events = []
+
+        def emit(side, quarter, sec_left, text, **fields):
+            row = dict(header)
+            row.update(
+                Quarter=quarter,
+                SecLeft=int(sec_left),
+                Time=f"{int(sec_left) // 60}:{int(sec_left) % 60:02d}.0",
+                HomeScore=score[0],
+                AwayScore=score[1],
+            )
+            row["HomePlay" if side == 0 else "AwayPlay"] = text
+            row.update(fields)
+            events.append(row)
+
+        def pick(side, exclude=None):
+            choices = [p for p in on_court[side] if p != exclude]
+            return players[side][choices[rng.integers(len(choices))]]
+
+        quarter, offense = 1, int(rng.integers(2))
+        jumpers = (players[1][on_court[1][4]], players[0][on_court[0][4]])
+        winner = pick(offense)
+        emit(
+            0,
+            1,
+            720,
+            f"Jump ball: {jumpers[0][0]} vs. {jumpers[1][0]} "
+            f"({winner[0]} gains possession)",
+            JumpballAwayPlayer=jumpers[0][1],
+            JumpballHomePlayer=jumpers[1][1],
+            JumpballPoss=winner[1],
+        )
+        while True:
+            clock = 720.0 if quarter <= 4 else 300.0
+            while True:
+                clock -= min(max(rng.exponential(14.0), 3.0), 24.0)
+                if clock <= 0:
+                    break
+                offense = self._possession(
+                    offense, quarter, clock, players, on_court, cities,
+                    score, emit, pick, rng,
+                )  # fmt: skip
+            if quarter >= 4 and score[0] != score[1]:
+                break
+            quarter += 1
+        winner_abbr = home_abbr if score[0] > score[1] else away_abbr
+        for row in events:
+            row["WinningTeam"] = winner_abbr
+        return events
+
+    def _possession(
+        self, offense, quarter, clock, players, on_court, cities, score,
+        emit, pick, rng,
+    ) -> int:  # fmt: skip
+        defense = 1 - offense
+        draw = rng.random()
+        if draw < 0.03:
+            # Substitution of a random player of either side
+            side = int(rng.integers(2))
+            bench = [i for i in range(ROSTER_SIZE) if i not in on_court[side]]
+            slot = int(rng.integers(5))
+            entering = bench[rng.integers(len(bench))]
+            leaving = on_court[side][slot]
+            on_court[side][slot] = entering
+            new, old = players[side][entering], players[side][leaving]
+            emit(
+                side, quarter, clock,
+                f"{new[0]} enters the game for {old[0]}",
+                EnterGame=new[1], LeaveGame=old[1],
+            )  # fmt: skip
+            return offense
+        if draw < 0.045:
+            emit(
+                offense, quarter, clock, f"{cities[offense]} full timeout",
+                TimeoutTeam=cities[offense],
+            )  # fmt: skip
+            return offense
+        if draw < 0.17:
+            player, thief = pick(offense), pick(defense)
+            if rng.random() < 0.5:
+                emit(
+                    offense, quarter, clock,
+                    f"Turnover by {player[0]} (bad pass; steal by "
+                    f"{thief[0]})",
+                    TurnoverPlayer=player[1], TurnoverType="bad pass",
+                    TurnoverCause="steal", TurnoverCauser=thief[1],
+                )  # fmt: skip
+            else:
+                emit(
+                    offense, quarter, clock,
+                    f"Turnover by {player[0]} (traveling)",
+                    TurnoverPlayer=player[1], TurnoverType="traveling",
+                )  # fmt: skip
+            return defense
+        if draw < 0.25:
+            fouler, fouled = pick(defense), pick(offense)
+            emit(
+                defense, quarter, clock,
+                f"Shooting foul by {fouler[0]} (drawn by {fouled[0]})",
+                FoulType="shooting", Fouler=fouler[1], Fouled=fouled[1],
+            )  # fmt: skip
+            made = False
+            for number in (1, 2):
+                made = rng.random() < 0.77
+                score[offense] += int(made)
+                outcome = "makes" if made else "misses"
+                emit(
+                    offense, quarter, clock,
+                    f"{fouled[0]} {outcome} free throw {number} of 2",
+                    FreeThrowShooter=fouled[1],
+                    FreeThrowOutcome="make" if made else "miss",
+                    FreeThrowNum=f"{number} of 2",
+                )  # fmt: skip
+            return (
+                defense
+                if made
+                else self._rebound(offense, quarter, clock, emit, pick, rng)
+            )
+
+        shooter = pick(offense)
+        three = rng.random() < 0.38
+        if three:
+            shot_type, dist = "3-pt jump shot", int(rng.integers(23, 30))
+        else:
+            kind = SHOT_TYPES_2PT[rng.integers(len(SHOT_TYPES_2PT))]
+            shot_type = f"2-pt {kind}"
+            dist = 0 if kind == "dunk" else int(rng.integers(1, 22))
+        made = rng.random() < (0.36 if three else 0.52)
+        where = "at rim" if dist == 0 else f"from {dist} ft"
+        text = (
+            f"{shooter[0]} {'makes' if made else 'misses'} {shot_type} {where}"
+        )
+        fields = {
+            "Shooter": shooter[1],
+            "ShotType": shot_type,
+            "ShotOutcome": "make" if made else "miss",
+            "ShotDist": dist,
+        }
+        if made:
+            score[offense] += 3 if three else 2
+            if rng.random() < 0.6:
+                assister = pick(offense, exclude=None)
+                if assister != shooter:
+                    text += f" (assist by {assister[0]})"
+                    fields["Assister"] = assister[1]
+        elif rng.random() < 0.06:
+            blocker = pick(defense)
+            text += f" (block by {blocker[0]})"
+            fields["Blocker"] = blocker[1]
+        emit(offense, quarter, clock, text, **fields)
+        if made:
+            return defense
+        return self._rebound(offense, quarter, clock, emit, pick, rng)
+
+    @staticmethod
+    def _rebound(offense, quarter, clock, emit, pick, rng) -> int:
+        side = offense if rng.random() < 0.25 else 1 - offense
+        kind = "Offensive" if side == offense else "Defensive"
+        rebounder = pick(side)
+        emit(
+            side, quarter, clock,
+            f"{kind} rebound by {rebounder[0]}",
+            Rebounder=rebounder[1], ReboundType=kind.lower(),
+        )  # fmt: skip
+        return side
@@ -8,7 +8,6 @@ from .api import (
     LoadDataFromApi,
     TransformerInterface,
 )
-from .data import DataValidator
 from .file import FileTools, FileValidator, PathUtils
 from .logger import (
     ConsoleHandler,
@@ -16,7 +15,21 @@ from .logger import (
     LoggerManager,
     log_function_call,
 )
-from .web import Crawler, Extractor, HtmlConverter, ResourceManager, WebUtils
+from .web import (
+    AssetDownloader,
+    Crawler,
+    CrawlFrontier,
+    Extractor,
+    FetchResult,
+    FrontierItem,
+    HtmlConverter,
+    HybridFetcher,
+    PagePool,
+    ResourceManager,
+    RouteFilter,
+    RouteStats,
+    WebUtils,
+)
 
 __all__ = [
     # API subpackage
@@ -31,7 +44,6 @@ __all__ = [
     # DATA subpackage
     "DataTransformer",
     "TransformerInterface",
-    "DataValidator",
     # FILE subpackage
     "FileTools",
     "PathUtils",
@@ -42,9 +54,17 @@ __all__ = [
     "FileHandler",
     "ConsoleHandler",
     # WEB subpackage
+    "AssetDownloader",
     "Crawler",
+    "CrawlFrontier",
+    "FrontierItem",
+    "PagePool",
     "Extractor",
+    "FetchResult",
+    "HybridFetcher",
     "ResourceManager",
+    "RouteFilter",
+    "RouteStats",
     "WebUtils",
     "HtmlConverter",
 ]
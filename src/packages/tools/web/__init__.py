@@ -1,13 +1,26 @@
+from .assets import AssetDownloader
 from .converter import HtmlConverter
 from .crawler import Crawler
 from .extractor import Extractor
+from .fetcher import FetchResult, HybridFetcher
+from .frontier import CrawlFrontier, FrontierItem
+from .page_pool import PagePool
 from .resources import ResourceManager
+from .route_filter import RouteFilter, RouteStats
 from .utils import WebUtils
 
 __all__ = [
+    "AssetDownloader",
     "Crawler",
+    "CrawlFrontier",
+    "FrontierItem",
+    "PagePool",
     "Extractor",
+    "FetchResult",
+    "HybridFetcher",
     "ResourceManager",
+    "RouteFilter",
+    "RouteStats",
     "WebUtils",
     "HtmlConverter",
 ]
@@ -0,0 +1,221 @@
+import hashlib
+import json
+import os
+import posixpath
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .resources import ResourceManager
+
+INDEX_FILENAME = "assets_index.jsonl"
+CHUNK_SIZE = 64 * 1024
+
+
+class AssetDownloader:
+    """
+    Download the static resources of a whole crawl, each one once.
+
+    URLs are deduplicated when submitted, against the crawl and the
+    on-disk index of previous runs. Downloads run on a bounded thread
+    pool sharing one pooled `requests.Session` and are streamed to disk
+    in chunks while hashed, so no body is held in memory. Bytes already
+    stored under another URL are not written again: the index maps the
+    URL to the existing file. Each stored asset is appended to the
+    JSON lines index of `output_dir`.
+
+    Args:
+        output_dir: Directory of the assets, laid out like the URL paths.
+        max_workers: Concurrent downloads.
+        same_host_only: Only fetch assets of the page host, as
+            `ResourceManager` does.
+        timeout: HTTP timeout in seconds.
+        chunk_size: Bytes read and written at a time.
+        user_agent: User agent of the HTTP requests.
+        session: Session to use instead of a new one.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        max_workers: int = 8,
+        same_host_only: bool = True,
+        timeout: float = 30,
+        chunk_size: int = CHUNK_SIZE,
+        user_agent: str | None = None,
+        session: requests.Session | None = None,
+    ):
+        self.output_dir = output_dir
+        self.same_host_only = same_host_only
+        self.timeout = timeout
+        self.chunk_size = chunk_size
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=max_workers, pool_maxsize=max_workers
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        if user_agent:
+            session.headers["User-Agent"] = user_agent
+        self._session = session
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="assets"
+        )
+        # Reentrant: done callbacks of finished futures run in `submit`
+        self._lock = threading.RLock()
+        self._futures: set[Future] = set()
+        self._seen: set[str] = set()
+        # URL -> stored path, content hash -> stored path
+        self._paths: dict[str, str] = {}
+        self._hashes: dict[str, str] = {}
+        self._stored: set[str] = set()
+        self.stats = {
+            "fetched": 0,
+            "duplicates": 0,
+            "skipped": 0,
+            "failed": 0,
+            "bytes": 0,
+        }
+        self._tmp_dir = os.path.join(output_dir, ".tmp")
+        os.makedirs(self._tmp_dir, exist_ok=True)
+        self._index_path = os.path.join(output_dir, INDEX_FILENAME)
+        self._load_index()
+
+    def __enter__(self) -> "AssetDownloader":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def submit_page(self, html: str, page_url: str) -> int:
+        """
+        Queue the resources referenced by a page.
+
+        Args:
+            html: Page HTML.
+            page_url: Page URL, base of relative links.
+
+        Returns:
+            Number of URLs queued, i.e. not seen before.
+        """
+        urls = ResourceManager.extract_resource_urls(html, page_url)
+        if self.same_host_only:
+            host = urlparse(page_url).netloc
+            urls = {url for url in urls if urlparse(url).netloc == host}
+        return self.submit(urls)
+
+    def submit(self, urls) -> int:
+        """Queue asset URLs not seen before; returns how many."""
+        queued = 0
+        with self._lock:
+            for url in urls:
+                url = url.split("#")[0]
+                if url in self._seen or url in self._paths:
+                    self.stats["skipped"] += 1
+                    continue
+                self._seen.add(url)
+                future = self._executor.submit(self._download, url)
+                self._futures.add(future)
+                future.add_done_callback(self._discard)
+                queued += 1
+        return queued
+
+    def path_of(self, url: str) -> str | None:
+        """Stored path of an asset, relative to `output_dir`."""
+        with self._lock:
+            return self._paths.get(url)
+
+    def wait(self) -> None:
+        """Block until every queued download is finished."""
+        while True:
+            with self._lock:
+                futures = set(self._futures)
+            if not futures:
+                return
+            wait(futures)
+
+    def close(self) -> None:
+        """Finish the downloads, then release the pool."""
+        self.wait()
+        self._executor.shutdown()
+        self._session.close()
+
+    def _discard(self, future: Future) -> None:
+        with self._lock:
+            self._futures.discard(future)
+
+    def _load_index(self) -> None:
+        if not os.path.isfile(self._index_path):
+            return
+        with open(self._index_path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                self._paths[record["url"]] = record["path"]
+                self._hashes.setdefault(record["sha256"], record["path"])
+                self._stored.add(record["path"])
+
+    def _download(self, url: str) -> None:
+        tmp_path = os.path.join(self._tmp_dir, f"{uuid.uuid4().hex}.part")
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with self._session.get(
+                url, stream=True, timeout=self.timeout
+            ) as response:
+                response.raise_for_status()
+                with open(tmp_path, "wb") as f:
+                    for chunk in response.iter_content(self.chunk_size):
+                        f.write(chunk)
+                        digest.update(chunk)
+                        size += len(chunk)
+        except (requests.RequestException, OSError):
+            with self._lock:
+                self.stats["failed"] += 1
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+
+        sha256 = digest.hexdigest()
+        with self._lock:
+            path = self._hashes.get(sha256)
+            if path is not None:
+                os.remove(tmp_path)
+                self.stats["duplicates"] += 1
+            else:
+                path = self._target_path(url, sha256)
+                full_path = os.path.join(self.output_dir, path)
+                try:
+                    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+                    os.replace(tmp_path, full_path)
+                except OSError:
+                    # e.g. a file stored where this path needs a folder
+                    os.remove(tmp_path)
+                    self.stats["failed"] += 1
+                    return
+                self._hashes[sha256] = path
+                self._stored.add(path)
+                self.stats["fetched"] += 1
+                self.stats["bytes"] += size
+            self._paths[url] = path
+            record = {"url": url, "path": path, "sha256": sha256, "size": size}
+            with open(self._index_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+
+    def _target_path(self, url: str, sha256: str) -> str:
+        # Path of the URL inside output_dir ("/.." cannot escape the
+        # root), made unique when other bytes are already stored there
+        url_path = urlparse(url).path
+        path = posixpath.normpath("/" + url_path).lstrip("/")
+        if not path or url_path.endswith("/"):
+            path = posixpath.join(path, "index")
+        if path in self._stored:
+            root, ext = posixpath.splitext(path)
+            path = f"{root}.{sha256[:12]}{ext}"
+        return path
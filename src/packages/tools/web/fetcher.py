@@ -0,0 +1,206 @@
+import re
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .utils import WaitUntil, WebUtils
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
+
+# Markup of pages built in the browser: empty mount points of the usual
+# frameworks and visible "enable JavaScript" notices
+SPA_MARKERS = [
+    re.compile(
+        r"<div[^>]*\bid=[\"'](?:root|app|__next|__nuxt|svelte)[\"'][^>]*>"
+        r"\s*</div>",
+        re.IGNORECASE,
+    ),
+    re.compile(r"<app-root[^>]*>\s*</app-root>", re.IGNORECASE),
+    re.compile(r"\bng-app\b", re.IGNORECASE),
+    re.compile(r"(?:enable|activer)\s+(?:the\s+)?javascript", re.IGNORECASE),
+]
+HTML_TYPES = ("text/html", "application/xhtml+xml")
+_HIDDEN_TEXT = re.compile(
+    r"<(script|style|noscript|template)\b.*?</\1\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+_NOSCRIPT = re.compile(
+    r"<noscript\b.*?</noscript\s*>", re.IGNORECASE | re.DOTALL
+)
+_TAG = re.compile(r"<[^>]+>")
+
+
+@dataclass
+class FetchResult:
+    """
+    Page fetched by `HybridFetcher`.
+
+    Attributes:
+        url: Requested URL.
+        html: Page HTML, empty if it could not be fetched.
+        rendered: Whether the HTML comes from the browser.
+        reason: Why the browser was needed ("http", "type", "host" or
+            a `needs_rendering` reason), None for plain HTTP pages.
+    """
+
+    url: str
+    html: str
+    rendered: bool
+    reason: str | None = None
+
+
+class HybridFetcher:
+    """
+    Fetch pages with a plain HTTP GET, rendering them only when needed.
+
+    The GET goes through a pooled `requests.Session`. The URL is sent
+    to a Playwright page when the GET did not return usable HTML (error,
+    non HTML answer) or the HTML looks built by JavaScript: empty body,
+    SPA markers, too little visible text or an expected CSS selector
+    missing. Hosts whose first `learn_after` pages all needed the
+    browser are then rendered directly. The fetcher can be shared by
+    the workers of a `PagePool`.
+
+    Args:
+        expected_selectors: CSS selectors every static page must match.
+        min_text_length: Visible characters below which a page is
+            rendered.
+        learn_after: Pages of a host needing the browser, with none
+            served by HTTP, before the host is always rendered.
+        timeout: HTTP timeout in seconds.
+        user_agent: User agent of the HTTP requests.
+        pool_size: Connections kept per host.
+        session: Session to use instead of a new one.
+    """
+
+    def __init__(
+        self,
+        expected_selectors: list[str] | None = None,
+        min_text_length: int = 50,
+        learn_after: int = 3,
+        timeout: float = 10,
+        user_agent: str | None = None,
+        pool_size: int = 10,
+        session: requests.Session | None = None,
+    ):
+        self.expected_selectors = expected_selectors or []
+        self.min_text_length = min_text_length
+        self.learn_after = learn_after
+        self.timeout = timeout
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=pool_size, pool_maxsize=pool_size
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        if user_agent:
+            session.headers["User-Agent"] = user_agent
+        self._session = session
+        self._lock = threading.Lock()
+        # Per host: [pages served by HTTP, pages needing the browser]
+        self._hosts: dict[str, list[int]] = {}
+        self.stats = {"http": 0, "rendered": 0, "learned": 0}
+
+    def fetch(
+        self,
+        url: str,
+        page: "Page | None" = None,
+        wait_until: WaitUntil = "load",
+    ) -> FetchResult:
+        """
+        HTML of a URL, from HTTP or from the browser.
+
+        Args:
+            url: Page URL.
+            page: Playwright page rendering the URL when needed; without
+                it the HTTP result is returned as is.
+            wait_until: Load state awaited by the browser rendering.
+
+        Returns:
+            Fetched page.
+        """
+        host = urlparse(url).netloc.lower()
+        reason: str | None
+        if self.renders_host(host):
+            reason = "host"
+            html = ""
+        else:
+            html, reason = self._get(url)
+            self._learn(host, reason is not None)
+        if reason is None or page is None:
+            self._count("http")
+            return FetchResult(url, html, False, reason)
+        self._count("rendered")
+        html = WebUtils.fetch_page_with_playwright(page, url, wait_until)
+        return FetchResult(url, html, True, reason)
+
+    def renders_host(self, host: str) -> bool:
+        """Whether pages of a host go straight to the browser."""
+        with self._lock:
+            served, rendered = self._hosts.get(host, (0, 0))
+        return served == 0 and rendered >= self.learn_after
+
+    def needs_rendering(self, html: str) -> str | None:
+        """
+        Why an HTML page must be rendered by the browser.
+
+        Args:
+            html: HTML received over HTTP.
+
+        Returns:
+            "empty", "spa", "text" or "selector", None for static pages.
+        """
+        if not html.strip():
+            return "empty"
+        # <noscript> notices are boilerplate of static pages too
+        shown = _NOSCRIPT.sub(" ", html)
+        if any(marker.search(shown) for marker in SPA_MARKERS):
+            return "spa"
+        text = _TAG.sub(" ", _HIDDEN_TEXT.sub(" ", html))
+        if len("".join(text.split())) < self.min_text_length:
+            return "text"
+        if self.expected_selectors:
+            from bs4 import BeautifulSoup
+
+            soup = BeautifulSoup(html, "html.parser")
+            for selector in self.expected_selectors:
+                if soup.select_one(selector) is None:
+                    return "selector"
+        return None
+
+    def close(self) -> None:
+        """Close the HTTP connections."""
+        self._session.close()
+
+    def _get(self, url: str) -> tuple[str, str | None]:
+        try:
+            response = self._session.get(url, timeout=self.timeout)
+        except requests.RequestException:
+            return "", "http"
+        content_type = response.headers.get("Content-Type", "")
+        if not content_type.startswith(HTML_TYPES):
+            return "", "type"
+        if "charset" not in content_type.lower():
+            # requests falls back to ISO-8859-1 for text/* without charset
+            response.encoding = response.apparent_encoding
+        if not response.ok:
+            return response.text, "http"
+        html = response.text
+        return html, self.needs_rendering(html)
+
+    def _learn(self, host: str, rendered: bool) -> None:
+        with self._lock:
+            counts = self._hosts.setdefault(host, [0, 0])
+            counts[1 if rendered else 0] += 1
+            if rendered and counts == [0, self.learn_after]:
+                self.stats["learned"] += 1
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
@@ -0,0 +1,219 @@
+import json
+import os
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from urllib.parse import urldefrag, urlparse
+
+
+@dataclass
+class FrontierItem:
+    """
+    URL waiting to be crawled.
+
+    Attributes:
+        url: Absolute URL, without fragment.
+        depth: Link distance from the start URL.
+        priority: Lower values are crawled first.
+        host: Network location of the URL.
+    """
+
+    url: str
+    depth: int
+    priority: int
+    host: str
+
+
+class CrawlFrontier:
+    """
+    Queue of URLs to crawl, deduplicated when they are enqueued.
+
+    Every URL is queued at most once: the seen-set is checked on `push`,
+    so popular links cost one set lookup instead of one queue entry per
+    page linking to them. Each host has its own sub-queue made of one
+    deque per (priority, depth) bucket, served lowest priority then
+    shallowest depth first, and hosts are served round-robin with an
+    optional politeness delay. Push and pop are O(1) (bucket counts are
+    bounded by priorities times depths). The state can be saved to JSON
+    and reloaded to resume a crawl.
+
+    Args:
+        max_depth: Deeper URLs are rejected, no limit if None.
+        max_queued: URLs waiting at most; further pushes are dropped.
+        host_delay: Minimum seconds between two pops of the same host.
+    """
+
+    def __init__(
+        self,
+        max_depth: int | None = None,
+        max_queued: int | None = None,
+        host_delay: float = 0.0,
+    ):
+        self.max_depth = max_depth
+        self.max_queued = max_queued
+        self.host_delay = host_delay
+        self._seen: set[str] = set()
+        self._hosts: dict[str, dict[tuple[int, int], deque]] = {}
+        self._ready: deque[str] = deque()
+        self._next_time: dict[str, float] = {}
+        self._size = 0
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, url: str) -> bool:
+        return self.normalize(url) in self._seen
+
+    @staticmethod
+    def normalize(url: str) -> str:
+        """URL without its fragment, the deduplication key."""
+        return urldefrag(url)[0]
+
+    @property
+    def seen_count(self) -> int:
+        """Number of distinct URLs ever accepted."""
+        return len(self._seen)
+
+    def push(self, url: str, depth: int = 0, priority: int = 0) -> bool:
+        """
+        Enqueue a URL unless it was already seen.
+
+        Args:
+            url: Absolute URL.
+            depth: Link distance from the start URL.
+            priority: Lower values are crawled first.
+
+        Returns:
+            True if the URL was queued.
+        """
+        url = self.normalize(url)
+        if url in self._seen:
+            return False
+        if self.max_depth is not None and depth > self.max_depth:
+            return False
+        if self.max_queued is not None and self._size >= self.max_queued:
+            self.dropped += 1
+            return False
+        self._seen.add(url)
+        self._enqueue(FrontierItem(url, depth, priority, self._host(url)))
+        return True
+
+    def push_many(self, urls, depth: int = 0, priority: int = 0) -> int:
+        """Enqueue URLs, see `push`; returns how many were queued."""
+        return sum(self.push(url, depth, priority) for url in urls)
+
+    def pop(self, exclude=None) -> FrontierItem | None:
+        """
+        Next URL of the next host allowed to be crawled.
+
+        Args:
+            exclude: Hosts to skip, e.g. those at their concurrency limit.
+
+        Returns:
+            Item, or None if the frontier is empty or every host with
+            queued URLs is still within its politeness delay.
+        """
+        now = time.monotonic()
+        for _ in range(len(self._ready)):
+            host = self._ready[0]
+            self._ready.rotate(-1)
+            if exclude and host in exclude:
+                continue
+            if self._next_time.get(host, 0.0) > now:
+                continue
+            item = self._dequeue(host)
+            if self.host_delay:
+                self._next_time[host] = now + self.host_delay
+            return item
+        return None
+
+    def wait_time(self) -> float:
+        """Seconds until a host with queued URLs may be popped."""
+        if not self._ready:
+            return 0.0
+        now = time.monotonic()
+        return max(
+            0.0,
+            min(self._next_time.get(host, 0.0) for host in self._ready) - now,
+        )
+
+    def mark_seen(self, url: str) -> None:
+        """Record a URL as crawled without queueing it."""
+        self._seen.add(self.normalize(url))
+
+    def save(self, filepath: str) -> None:
+        """
+        Write the seen-set and queued URLs to a JSON file.
+
+        The file is replaced atomically, so an interrupted save keeps the
+        previous state.
+
+        Args:
+            filepath: Destination file.
+        """
+        queued = [
+            asdict(item)
+            for host in self._hosts.values()
+            for bucket in host.values()
+            for item in bucket
+        ]
+        state = {
+            "max_depth": self.max_depth,
+            "max_queued": self.max_queued,
+            "host_delay": self.host_delay,
+            "dropped": self.dropped,
+            "seen": sorted(self._seen),
+            "queued": queued,
+        }
+        directory = os.path.dirname(os.path.abspath(filepath))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{filepath}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, filepath)
+
+    @classmethod
+    def load(cls, filepath: str) -> "CrawlFrontier":
+        """Rebuild a frontier written by `save`."""
+        with open(filepath, encoding="utf-8") as f:
+            state = json.load(f)
+        frontier = cls(
+            max_depth=state["max_depth"],
+            max_queued=state["max_queued"],
+            host_delay=state["host_delay"],
+        )
+        frontier.dropped = state["dropped"]
+        frontier._seen = set(state["seen"])
+        for fields in state["queued"]:
+            frontier._enqueue(FrontierItem(**fields))
+        return frontier
+
+    @staticmethod
+    def _host(url: str) -> str:
+        return urlparse(url).netloc.lower()
+
+    def _enqueue(self, item: FrontierItem) -> None:
+        buckets = self._hosts.get(item.host)
+        if buckets is None:
+            buckets = self._hosts[item.host] = {}
+            self._ready.append(item.host)
+        key = (item.priority, item.depth)
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = buckets[key] = deque()
+        bucket.append(item)
+        self._size += 1
+
+    def _dequeue(self, host: str) -> FrontierItem:
+        buckets = self._hosts[host]
+        key = min(buckets)
+        bucket = buckets[key]
+        item = bucket.popleft()
+        if not bucket:
+            del buckets[key]
+        if not buckets:
+            del self._hosts[host]
+            self._ready.remove(host)
+        self._size -= 1
+        return item
@@ -0,0 +1,258 @@
+import threading
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING
+
+from .frontier import CrawlFrontier, FrontierItem
+from .route_filter import RouteFilter
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Browser, BrowserContext, Page
+
+# Handler of a crawled page: new links to enqueue, or None when the page
+# does not count as crawled (e.g. blocked by robots.txt)
+PageHandler = Callable[["Page", FrontierItem], Iterable[str] | None]
+
+
+class _Slot:
+    """Browser, context and page owned by one worker thread."""
+
+    def __init__(
+        self,
+        browser: "Browser",
+        user_agent: str | None,
+        pages_per_context: int,
+        route_filter: RouteFilter | None = None,
+    ):
+        self._browser = browser
+        self._route_filter = route_filter
+        self._user_agent = user_agent
+        self._pages_per_context = pages_per_context
+        self._context: BrowserContext | None = None
+        self._page: Page | None = None
+        self._crashed = False
+        self._served = 0
+        self.recycled = 0
+
+    def next_page(self) -> "Page":
+        """Page for the next URL, renewed if needed."""
+        context = self._context
+        if context is None or self._served >= self._pages_per_context:
+            context = self._new_context()
+        page = self._page
+        if page is None or self._crashed or page.is_closed():
+            page = self._new_page(context)
+        self._served += 1
+        return page
+
+    def recycle(self) -> None:
+        """Drop the page, the next one is opened in the same context."""
+        self._crashed = True
+
+    def close(self) -> None:
+        if self._context is not None:
+            self._context.close()
+
+    def _new_context(self) -> "BrowserContext":
+        self.close()
+        self._context = self._browser.new_context(user_agent=self._user_agent)
+        self._served = 0
+        self._page = None
+        return self._context
+
+    def _new_page(self, context: "BrowserContext") -> "Page":
+        if self._page is not None:
+            self.recycled += 1
+            if not self._page.is_closed():
+                self._page.close()
+        self._crashed = False
+        page = self._page = context.new_page()
+        page.on("crash", lambda _: self.recycle())
+        if self._route_filter is not None:
+            self._route_filter.attach(page)
+        return page
+
+
+class PagePool:
+    """
+    Render pages of a crawl concurrently with Playwright.
+
+    Playwright's sync API is bound to the thread that started it, so
+    each of the `size` workers owns a browser with one context reused
+    across pages. A page that crashed or whose handler raised is closed
+    and replaced in the same context; contexts are renewed every
+    `pages_per_context` pages to bound their memory. URLs come from a
+    `CrawlFrontier` shared by the workers, with at most `max_per_host`
+    pages of one host rendered at once. A `RouteFilter` is attached to
+    every page.
+
+    Args:
+        size: Number of concurrent pages.
+        max_per_host: Concurrent pages per host, `size` if None.
+        headless: Run the browsers without window.
+        user_agent: User agent of the contexts, Playwright's if None.
+        pages_per_context: Pages rendered before a context is renewed.
+        route_filter: Request filter of the pages.
+    """
+
+    def __init__(
+        self,
+        size: int = 4,
+        max_per_host: int | None = None,
+        headless: bool = True,
+        user_agent: str | None = None,
+        pages_per_context: int = 200,
+        route_filter: RouteFilter | None = None,
+    ):
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        self.size = size
+        self.max_per_host = max_per_host or size
+        self.headless = headless
+        self.user_agent = user_agent
+        self.pages_per_context = pages_per_context
+        self.route_filter = route_filter
+        self.recycled = 0
+
+    def crawl(
+        self,
+        frontier: CrawlFrontier,
+        handler: PageHandler,
+        max_pages: int | None = None,
+        on_error: Callable[[FrontierItem, Exception], None] | None = None,
+        frontier_file: str | None = None,
+        checkpoint_every: int = 50,
+    ) -> int:
+        """
+        Crawl the frontier until it is empty or `max_pages` are crawled.
+
+        The handler is called from the worker threads with the page of
+        the worker and the frontier item; the links it returns are
+        enqueued one level deeper. The crawl stops once no URL is queued
+        and no page is being rendered.
+
+        Args:
+            frontier: URLs to crawl.
+            handler: Loads and processes one URL, see `PageHandler`.
+            max_pages: Pages counted as crawled at most.
+            on_error: Called with the item and the exception when the
+                handler raises; the URL is then dropped.
+            frontier_file: File the frontier is saved to every
+                `checkpoint_every` crawled pages.
+            checkpoint_every: Pages between two saves.
+
+        Returns:
+            Number of pages crawled.
+        """
+        condition = threading.Condition()
+        hosts: dict[str, int] = {}
+        state = {"crawled": 0, "in_flight": 0}
+        stop = threading.Event()
+        failures: list[BaseException] = []
+
+        def next_item() -> FrontierItem | None:
+            with condition:
+                while not stop.is_set():
+                    crawled, in_flight = state["crawled"], state["in_flight"]
+                    if max_pages is not None and crawled >= max_pages:
+                        return None
+                    if (
+                        max_pages is not None
+                        and crawled + in_flight >= max_pages
+                    ):
+                        condition.wait()
+                        continue
+                    busy = {
+                        host
+                        for host, count in hosts.items()
+                        if count >= self.max_per_host
+                    }
+                    item = frontier.pop(exclude=busy) if frontier else None
+                    if item is not None:
+                        state["in_flight"] += 1
+                        hosts[item.host] = hosts.get(item.host, 0) + 1
+                        return item
+                    if not frontier and not in_flight:
+                        return None
+                    # Queued hosts are busy or within their delay
+                    condition.wait(frontier.wait_time() or None)
+                return None
+
+        def done(item: FrontierItem, links: Iterable[str] | None) -> None:
+            with condition:
+                state["in_flight"] -= 1
+                hosts[item.host] -= 1
+                if links is not None:
+                    state["crawled"] += 1
+                    frontier.push_many(links, depth=item.depth + 1)
+                    if (
+                        frontier_file
+                        and state["crawled"] % checkpoint_every == 0
+                    ):
+                        frontier.save(frontier_file)
+                condition.notify_all()
+
+        def worker() -> None:
+            try:
+                render()
+            except BaseException as err:
+                with condition:
+                    failures.append(err)
+
+        def render() -> None:
+            from playwright.sync_api import sync_playwright
+
+            with sync_playwright() as p:
+                browser = p.chromium.launch(headless=self.headless)
+                slot = self._slot(browser)
+                try:
+                    while (item := next_item()) is not None:
+                        links = None
+                        try:
+                            links = handler(slot.next_page(), item)
+                        except Exception as err:
+                            slot.recycle()
+                            if on_error is not None:
+                                on_error(item, err)
+                        finally:
+                            done(item, links)
+                        if not browser.is_connected():
+                            # The browser process died, start a new one
+                            with condition:
+                                self.recycled += slot.recycled
+                            browser = p.chromium.launch(headless=self.headless)
+                            slot = self._slot(browser)
+                finally:
+                    with condition:
+                        self.recycled += slot.recycled
+                    if browser.is_connected():
+                        slot.close()
+                        browser.close()
+
+        threads = [
+            threading.Thread(target=worker, name=f"page-pool-{i}")
+            for i in range(self.size)
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                thread.join()
+        except KeyboardInterrupt:
+            # Let the pages being rendered finish, then stop
+            with condition:
+                stop.set()
+                condition.notify_all()
+            for thread in threads:
+                thread.join()
+            raise
+        if failures:
+            raise failures[0]
+        return state["crawled"]
+
+    def _slot(self, browser: "Browser") -> _Slot:
+        return _Slot(
+            browser,
+            self.user_agent,
+            self.pages_per_context,
+            self.route_filter,
+        )
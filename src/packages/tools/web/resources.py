@@ -38,24 +38,21 @@ class ResourceManager:
             pass
         return None
 
-    def extract_and_download_resources(
-        self, page: Page, base_url: str, output_dir: str
-    ) -> list[str]:
+    @staticmethod
+    def extract_resource_urls(html: str, base_url: str) -> set[str]:
         """
-        Extract resources URLs and download only those belonging
-        to base domain.
+        Absolute URLs of the CSS, fonts, scripts and images of a page.
 
         Args:
-            page: Playwright Page loaded with content.
-            base_url: Base URL for filtering resources.
-            output_dir: Directory to save resources.
+            html: Page HTML.
+            base_url: URL the relative links are resolved against.
 
         Returns:
-            List of relative paths of successfully downloaded resources.
+            Resource URLs, from any domain.
         """
         from bs4 import BeautifulSoup, Tag
 
-        soup = BeautifulSoup(page.content(), "html.parser")
+        soup = BeautifulSoup(html, "html.parser")
         resource_urls = set()
 
         # Gather CSS, fonts
@@ -85,6 +82,33 @@ class ResourceManager:
             if not isinstance(src, str):
                 continue
             resource_urls.add(urljoin(base_url, src))
+        return resource_urls
+
+    def extract_and_download_resources(
+        self,
+        page: Page,
+        base_url: str,
+        output_dir: str,
+        html: str | None = None,
+    ) -> list[str]:
+        """
+        Extract resources URLs and download only those belonging
+        to base domain.
+
+        Args:
+            page: Playwright Page loaded with content, or any page of the
+                browser context when `html` is given.
+            base_url: Base URL for filtering resources.
+            output_dir: Directory to save resources.
+            html: HTML of the page, e.g. fetched without the browser;
+                the page content if None.
+
+        Returns:
+            List of relative paths of successfully downloaded resources.
+        """
+        if html is None:
+            html = page.content()
+        resource_urls = self.extract_resource_urls(html, base_url)
 
         downloaded: list[str] = []
         base_netloc = urlparse(base_url).netloc
@@ -0,0 +1,213 @@
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Page, Route
+
+# Playwright resource types not needed to extract links, JSON and text
+BLOCK_TYPES = ["image", "media", "font"]
+# Answered with an empty body rather than aborted, so that pages waiting
+# for them do not stall or fail
+STUB_TYPES = ["stylesheet"]
+# Analytics and advertising hosts
+TRACKER_PATTERNS = [
+    r"google-analytics\.com",
+    r"googletagmanager\.com",
+    r"googlesyndication\.com",
+    r"doubleclick\.net",
+    r"adservice\.google\.",
+    r"connect\.facebook\.net",
+    r"amazon-adsystem\.com",
+    r"scorecardresearch\.com",
+    r"hotjar\.com",
+    r"criteo\.(?:com|net)",
+    r"taboola\.com",
+    r"outbrain\.com",
+]
+# Typical transfer sizes in bytes, used to estimate what blocking saved
+# (aborted requests never tell their size)
+TYPICAL_BYTES = {
+    "image": 40_000,
+    "media": 500_000,
+    "font": 30_000,
+    "stylesheet": 20_000,
+    "script": 30_000,
+}
+STUB_CONTENT_TYPES = {
+    "stylesheet": "text/css",
+    "script": "application/javascript",
+}
+
+
+@dataclass
+class RouteStats:
+    """
+    Requests of a page seen by a `RouteFilter`.
+
+    Attributes:
+        allowed: Requests let through.
+        blocked: Requests aborted.
+        stubbed: Requests answered with an empty body.
+        bytes_saved: Estimated bytes not downloaded, from TYPICAL_BYTES.
+        by_type: Blocked and stubbed requests per resource type.
+    """
+
+    allowed: int = 0
+    blocked: int = 0
+    stubbed: int = 0
+    bytes_saved: int = 0
+    by_type: dict[str, int] = field(default_factory=dict)
+
+    def add(self, other: "RouteStats") -> None:
+        """Add the counters of another page."""
+        self.allowed += other.allowed
+        self.blocked += other.blocked
+        self.stubbed += other.stubbed
+        self.bytes_saved += other.bytes_saved
+        for resource_type, count in other.by_type.items():
+            self.by_type[resource_type] = (
+                self.by_type.get(resource_type, 0) + count
+            )
+
+
+class RouteFilter:
+    """
+    Playwright request filter keeping only what page extraction needs.
+
+    Requests are blocked by resource type, URL pattern (regular
+    expressions, trackers by default) or, optionally, when they go to
+    another host than the page. Documents are always let through.
+    Assets fetched explicitly, through `page.request` by
+    `ResourceManager` or over HTTP by `AssetDownloader`, do not go
+    through the filter.
+
+    Args:
+        block_types: Resource types aborted.
+        stub_types: Resource types answered with an empty body.
+        block_patterns: URL regular expressions aborted.
+        block_third_party: Abort requests to other hosts than the page.
+        allowed_hosts: Hosts never considered third-party (CDN, API).
+    """
+
+    def __init__(
+        self,
+        block_types: list[str] | None = None,
+        stub_types: list[str] | None = None,
+        block_patterns: list[str] | None = None,
+        block_third_party: bool = False,
+        allowed_hosts: list[str] | None = None,
+    ):
+        self.block_types = set(
+            BLOCK_TYPES if block_types is None else block_types
+        )
+        self.stub_types = set(STUB_TYPES if stub_types is None else stub_types)
+        patterns = (
+            TRACKER_PATTERNS if block_patterns is None else block_patterns
+        )
+        self._pattern = re.compile("|".join(patterns)) if patterns else None
+        self.block_third_party = block_third_party
+        self.allowed_hosts = set(allowed_hosts or [])
+        self.totals = RouteStats()
+        self._lock = threading.Lock()
+        self._pages: dict[Page, RouteStats] = {}
+        self._first_party: dict[Page, str] = {}
+
+    def decide(
+        self, url: str, resource_type: str, page_host: str | None = None
+    ) -> str | None:
+        """
+        Fate of a request.
+
+        Args:
+            url: Requested URL.
+            resource_type: Playwright resource type.
+            page_host: Host of the page document, if known.
+
+        Returns:
+            "block", "stub" or None to let the request through.
+        """
+        if resource_type == "document":
+            return None
+        if self._pattern is not None and self._pattern.search(url):
+            return "block"
+        if resource_type in self.block_types:
+            return "block"
+        if self.block_third_party and page_host:
+            host = urlparse(url).netloc.lower()
+            if host != page_host and host not in self.allowed_hosts:
+                return "block"
+        if resource_type in self.stub_types:
+            return "stub"
+        return None
+
+    def attach(self, page: "Page") -> None:
+        """Route every request of a page through the filter."""
+        with self._lock:
+            self._pages[page] = RouteStats()
+        page.route("**/*", lambda route: self._handle(page, route))
+        page.on("close", self._forget)
+
+    def take(self, page: "Page") -> RouteStats:
+        """
+        Counters of a page since the previous call, then reset them.
+
+        Args:
+            page: Page given to `attach`.
+
+        Returns:
+            Requests of the page, also added to `totals`.
+        """
+        with self._lock:
+            stats = self._pages.get(page, RouteStats())
+            self._pages[page] = RouteStats()
+            self.totals.add(stats)
+        return stats
+
+    def _handle(self, page: "Page", route: "Route") -> None:
+        request = route.request
+        resource_type = request.resource_type
+        if (
+            resource_type == "document"
+            and request.is_navigation_request()
+            and request.frame == page.main_frame
+        ):
+            # Third-party requests are relative to the main document host
+            self._first_party[page] = urlparse(request.url).netloc.lower()
+        action = self.decide(
+            request.url, resource_type, self._first_party.get(page)
+        )
+        with self._lock:
+            stats = self._pages.setdefault(page, RouteStats())
+            if action is None:
+                stats.allowed += 1
+            else:
+                if action == "stub":
+                    stats.stubbed += 1
+                else:
+                    stats.blocked += 1
+                stats.bytes_saved += TYPICAL_BYTES.get(resource_type, 0)
+                stats.by_type[resource_type] = (
+                    stats.by_type.get(resource_type, 0) + 1
+                )
+        if action is None:
+            route.continue_()
+        elif action == "stub":
+            route.fulfill(
+                status=200,
+                body="",
+                content_type=STUB_CONTENT_TYPES.get(
+                    resource_type, "text/plain"
+                ),
+            )
+        else:
+            route.abort("blockedbyclient")
+
+    def _forget(self, page: "Page") -> None:
+        with self._lock:
+            stats = self._pages.pop(page, None)
+            if stats is not None:
+                self.totals.add(stats)
+        self._first_party.pop(page, None)
@@ -2,11 +2,14 @@ import os
 import random
 import re
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
 if TYPE_CHECKING:
     from playwright.sync_api import Page
 
+# Load states Playwright navigations can wait for
+WaitUntil = Literal["commit", "domcontentloaded", "load", "networkidle"]
+
 
 class WebUtils:
     """
@@ -48,11 +51,16 @@ class WebUtils:
         return re.sub(r"[:/?#]+", "_", url)
 
     @staticmethod
-    def fetch_page_with_playwright(page: "Page", url: str) -> str:
+    def fetch_page_with_playwright(
+        page: "Page", url: str, wait_until: WaitUntil = "load"
+    ) -> str:
         """
         Use Playwright to load a URL and return the HTML content.
+
+        `wait_until` is the Playwright load state ("domcontentloaded",
+        "load", "networkidle") the navigation waits for.
         """
-        page.goto(url)
+        page.goto(url, wait_until=wait_until)
         return page.content()
 
     @staticmethod
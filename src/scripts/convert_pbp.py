@@ -0,0 +1,75 @@
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+from packages.init_app import init_app
+from packages.preprocessing.pbp_storage import PbpStore
+from packages.tools.file import PathUtils
+
+(
+    PROJECT_STRUCTURE,
+    DICT_APP,
+    DICT_SCRIPT_CONFIG,
+    LOGGER,
+    CONST,
+) = init_app(__file__)
+
+
+def convert(config: dict, refresh: bool = False) -> list[str]:
+    """
+    Rewrite the pbp CSV files of data/raw as a partitioned Parquet store.
+
+    Args:
+        config (dict): Script configuration.
+        refresh (bool): Convert files even if they are unchanged.
+
+    Returns:
+        list[str]: Names of the converted files.
+    """
+    raw_path = PathUtils.get_node_path(PROJECT_STRUCTURE, "data", "raw")
+    processed_path = PathUtils.get_node_path(
+        PROJECT_STRUCTURE, "data", "processed"
+    )
+    store = PbpStore(
+        os.path.join(processed_path, config.get("store_dirname", "pbp_store")),
+        row_group_size=config.get("row_group_size", 8192),
+    )
+    converted = []
+    for pbp_file in sorted(Path(raw_path).glob(config["pbp_pattern"])):
+        started = time.perf_counter()
+        if store.convert_csv(str(pbp_file), refresh=refresh):
+            converted.append(pbp_file.name)
+            LOGGER.info(
+                f"{pbp_file.name} converti en "
+                f"{time.perf_counter() - started:.1f} s"
+            )
+        else:
+            LOGGER.info(f"{pbp_file.name} déjà à jour")
+    LOGGER.info(f"Saisons disponibles : {store.seasons()}")
+    return converted
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Conversion du play-by-play en Parquet partitionné"
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Reconvertit les fichiers même s'ils n'ont pas changé",
+    )
+    args = parser.parse_args()
+
+    try:
+        convert(DICT_SCRIPT_CONFIG, refresh=args.refresh)
+    except Exception as err:
+        LOGGER.error(f"Erreur durant la conversion pbp : {err}")
+        sys.exit(1)
+
+    LOGGER.info("Fin du script.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+import argparse
+import os
+import sys
+
+from packages.features.elo import EloConfig, EloRatingEngine
+from packages.init_app import init_app
+from packages.preprocessing.memory import load_csv
+from packages.tools.file import PathUtils
+
+(
+    PROJECT_STRUCTURE,
+    DICT_APP,
+    DICT_SCRIPT_CONFIG,
+    LOGGER,
+    CONST,
+) = init_app(__file__)
+
+
+def build_config(config: dict) -> EloConfig:
+    """
+    Build the Elo parameters from the script configuration.
+
+    Args:
+        config (dict): Script configuration.
+
+    Returns:
+        EloConfig: Elo model parameters.
+    """
+    defaults = EloConfig()
+    return EloConfig(
+        k_factor=config.get("k_factor", defaults.k_factor),
+        home_advantage=config.get("home_advantage", defaults.home_advantage),
+        initial_rating=config.get("initial_rating", defaults.initial_rating),
+        mov_multiplier=config.get("mov_multiplier", defaults.mov_multiplier),
+        season_regression=config.get(
+            "season_regression", defaults.season_regression
+        ),
+    )
+
+
+def update_ratings(config: dict, full_rebuild: bool = False) -> int:
+    """
+    Update Elo ratings with the games not processed yet.
+
+    Args:
+        config (dict): Script configuration.
+        full_rebuild (bool): Ignore the saved state and recompute history.
+
+    Returns:
+        int: Number of processed games.
+    """
+    raw_path = PathUtils.get_node_path(PROJECT_STRUCTURE, "data", "raw")
+    processed_path = PathUtils.get_node_path(
+        PROJECT_STRUCTURE, "data", "processed"
+    )
+    games_file = os.path.join(
+        raw_path, config.get("games_filename", "games.csv")
+    )
+    state_file = os.path.join(
+        processed_path, config.get("state_filename", "elo_state.npz")
+    )
+    history_file = os.path.join(
+        processed_path, config.get("history_filename", "elo_history.csv")
+    )
+
+    if not full_rebuild and os.path.isfile(state_file):
+        engine = EloRatingEngine.load_state(state_file)
+        LOGGER.info(
+            f"État Elo chargé : {state_file} "
+            f"(dernier match {engine.last_processed})"
+        )
+    else:
+        engine = EloRatingEngine(build_config(config))
+        if os.path.isfile(history_file):
+            os.remove(history_file)
+
+    games = load_csv(games_file, usecols=EloRatingEngine.GAME_COLUMNS)
+    history = engine.process(games)
+    LOGGER.info(f"{len(history)} nouveaux matchs traités")
+
+    if not history.empty:
+        history.to_csv(
+            history_file,
+            mode="a",
+            header=not os.path.isfile(history_file),
+            index=False,
+        )
+        engine.save_state(state_file)
+        LOGGER.info(f"Historique Elo mis à jour : {history_file}")
+    return len(history)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Mise à jour incrémentale des classements Elo"
+    )
+    parser.add_argument(
+        "--full-rebuild",
+        action="store_true",
+        help="Recalcule tout l'historique sans reprendre l'état sauvegardé",
+    )
+    args = parser.parse_args()
+
+    try:
+        update_ratings(DICT_SCRIPT_CONFIG, full_rebuild=args.full_rebuild)
+    except Exception as err:
+        LOGGER.error(f"Erreur durant la mise à jour Elo : {err}")
+        sys.exit(1)
+
+    LOGGER.info("Fin du script.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import argparse
+import os
+import sys
+import time
+
+from packages.init_app import init_app
+from packages.preprocessing.synthetic import SyntheticConfig, SyntheticDataset
+from packages.tools.file import PathUtils
+
+(
+    PROJECT_STRUCTURE,
+    DICT_APP,
+    DICT_SCRIPT_CONFIG,
+    LOGGER,
+    CONST,
+) = init_app(__file__)
+
+
+def generate(config: dict, scale: float, seed: int) -> dict[str, int]:
+    """
+    Write a synthetic NBA-shaped dataset next to data/raw.
+
+    Args:
+        config (dict): Script configuration.
+        scale (float): Size factor, 1 being the size of the real dataset.
+        seed (int): Seed of the random draws.
+
+    Returns:
+        dict[str, int]: Rows written per file.
+    """
+    raw_path = PathUtils.get_node_path(PROJECT_STRUCTURE, "data", "raw")
+    output_dir = os.path.join(
+        os.path.dirname(os.path.normpath(raw_path)),
+        config.get("output_dirname", "synthetic"),
+    )
+    dataset = SyntheticDataset(
+        SyntheticConfig(
+            scale=scale,
+            seed=seed,
+            first_season=config.get("first_season", 2003),
+            n_seasons=config.get("n_seasons", 20),
+            pbp_seasons=config.get("pbp_seasons", 6),
+        )
+    )
+    started = time.perf_counter()
+    rows = dataset.generate(output_dir)
+    for name, count in rows.items():
+        LOGGER.info(f"{name} : {count} lignes")
+    LOGGER.info(
+        f"Jeu synthétique écrit dans {output_dir} en "
+        f"{time.perf_counter() - started:.1f} s"
+    )
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Génération d'un jeu de données NBA synthétique"
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=DICT_SCRIPT_CONFIG.get("scale", 1.0),
+        help="Facteur de taille (1 = taille du jeu réel)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=DICT_SCRIPT_CONFIG.get("seed", 0),
+        help="Graine des tirages aléatoires",
+    )
+    args = parser.parse_args()
+
+    try:
+        generate(DICT_SCRIPT_CONFIG, args.scale, args.seed)
+    except Exception as err:
+        LOGGER.error(f"Erreur durant la génération : {err}")
+        sys.exit(1)
+
+    LOGGER.info("Fin du script.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+from packages.init_app import init_app
+from packages.preprocessing.data_preprocessing import DataPreprocessor
+from packages.preprocessing.memory import load_csv
+from packages.preprocessing.name_resolution import PlayerNameIndex
+from packages.preprocessing.seasons import season_from_filename
+from packages.tools.file import PathUtils
+
+(
+    PROJECT_STRUCTURE,
+    DICT_APP,
+    DICT_SCRIPT_CONFIG,
+    LOGGER,
+    CONST,
+) = init_app(__file__)
+
+
+def link_files(config: dict, pattern: str | None = None) -> int:
+    """
+    Add PLAYER_IDs to the pbp files of data/raw.
+
+    Each file is written as Parquet next to a CSV report of its
+    unresolved names, in data/processed.
+
+    Args:
+        config (dict): Script configuration.
+        pattern (str | None): Glob of the pbp files, config one if None.
+
+    Returns:
+        int: Number of unresolved names over all files.
+    """
+    raw_path = PathUtils.get_node_path(PROJECT_STRUCTURE, "data", "raw")
+    processed_path = PathUtils.get_node_path(
+        PROJECT_STRUCTURE, "data", "processed"
+    )
+    output_dir = Path(
+        os.path.join(
+            processed_path, config.get("output_dirname", "pbp_linked")
+        )
+    )
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    preprocessor = DataPreprocessor(raw_path, processed_path)
+    index = PlayerNameIndex.from_tables(
+        preprocessor.details().reset_index(),
+        preprocessor.games().reset_index(),
+        preprocessor.players(),
+    )
+    dimensions = preprocessor.dimensions()
+
+    files = sorted(Path(raw_path).glob(pattern or config["pbp_pattern"]))
+    if not files:
+        LOGGER.warning(f"Aucun fichier pbp trouvé dans {raw_path}")
+    n_unresolved = 0
+    for pbp_file in files:
+        started = time.perf_counter()
+        pbp = load_csv(pbp_file, low_memory=False)
+        linked, report = index.link(
+            pbp, dimensions, season_from_filename(pbp_file)
+        )
+        linked.to_parquet(output_dir / f"{pbp_file.stem}.parquet")
+        report.to_csv(
+            output_dir / f"{pbp_file.stem}_unresolved.csv", index=False
+        )
+        n_unresolved += len(report)
+        LOGGER.info(
+            f"{pbp_file.name} : {len(pbp)} actions, {len(report)} noms "
+            f"non résolus ({time.perf_counter() - started:.1f} s)"
+        )
+    return n_unresolved
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rattachement des noms du play-by-play aux PLAYER_ID"
+    )
+    parser.add_argument(
+        "--pattern",
+        help="Motif des fichiers pbp dans data/raw (config par défaut)",
+    )
+    args = parser.parse_args()
+
+    try:
+        link_files(DICT_SCRIPT_CONFIG, args.pattern)
+    except Exception as err:
+        LOGGER.error(f"Erreur durant le rattachement des joueurs : {err}")
+        sys.exit(1)
+
+    LOGGER.info("Fin du script.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+import argparse
+import os
+import sys
+
+from packages.features.feature_store import (
+    FeatureGroup,
+    FeatureStore,
+    player_form_features,
+    team_form_features,
+)
+from packages.init_app import init_app
+from packages.preprocessing.data_preprocessing import DataPreprocessor
+from packages.preprocessing.memory import parse_minutes
+from packages.tools.file import PathUtils
+
+(
+    PROJECT_STRUCTURE,
+    DICT_APP,
+    DICT_SCRIPT_CONFIG,
+    LOGGER,
+    CONST,
+) = init_app(__file__)
+
+
+def build_store(config: dict) -> FeatureStore:
+    """
+    Feature store of the project with the standard groups registered.
+
+    Args:
+        config (dict): Script configuration.
+
+    Returns:
+        FeatureStore: Store rooted in data/processed.
+    """
+    processed_path = PathUtils.get_node_path(
+        PROJECT_STRUCTURE, "data", "processed"
+    )
+    store = FeatureStore(
+        os.path.join(
+            processed_path, config.get("store_dirname", "feature_store")
+        )
+    )
+    store.register(
+        FeatureGroup(
+            "team_form",
+            "team",
+            team_form_features,
+            {"window": config.get("team_window", 10)},
+        )
+    )
+    store.register(
+        FeatureGroup(
+            "player_form",
+            "player",
+            player_form_features,
+            {"window": config.get("player_window", 5)},
+            depends_on=[parse_minutes],
+        )
+    )
+    return store
+
+
+def materialize(config: dict, groups: list[str] | None = None) -> None:
+    """
+    Recompute the partitions of the feature groups touched by new data.
+
+    Args:
+        config (dict): Script configuration.
+        groups (list[str] | None): Groups to materialize, all if None.
+    """
+    raw_path = PathUtils.get_node_path(PROJECT_STRUCTURE, "data", "raw")
+    processed_path = PathUtils.get_node_path(
+        PROJECT_STRUCTURE, "data", "processed"
+    )
+    preprocessor = DataPreprocessor(raw_path, processed_path)
+    store = build_store(config)
+    games = preprocessor.games().reset_index()
+
+    groups = groups or ["team_form", "player_form"]
+    if "team_form" in groups:
+        seasons = store.materialize("team_form", games)
+        LOGGER.info(f"team_form : saisons recalculées {seasons}")
+    if "player_form" in groups:
+        lines = preprocessor.details().reset_index()
+        lines = lines.join(
+            games.set_index("GAME_ID")[["GAME_DATE_EST", "SEASON"]],
+            on="GAME_ID",
+        ).dropna(subset=["SEASON"])
+        seasons = store.materialize("player_form", lines)
+        LOGGER.info(f"player_form : saisons recalculées {seasons}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Matérialisation des groupes de features partagés"
+    )
+    parser.add_argument(
+        "--group",
+        action="append",
+        choices=["team_form", "player_form"],
+        help="Groupe à matérialiser (tous par défaut, option répétable)",
+    )
+    args = parser.parse_args()
+
+    try:
+        materialize(DICT_SCRIPT_CONFIG, args.group)
+    except Exception as err:
+        LOGGER.error(f"Erreur durant la matérialisation : {err}")
+        sys.exit(1)
+
+    LOGGER.info("Fin du script.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+import argparse
+import sys
+
+from packages.init_app import init_app
+from packages.preprocessing.data_preprocessing import DataPreprocessor
+from packages.tools.file import PathUtils
+
+(
+    PROJECT_STRUCTURE,
+    DICT_APP,
+    DICT_SCRIPT_CONFIG,
+    LOGGER,
+    CONST,
+) = init_app(__file__)
+
+
+def build_views(config: dict, refresh: bool = False) -> int:
+    """
+    Build the joined game view and the dimension tables in data/processed.
+
+    Args:
+        config (dict): Script configuration.
+        refresh (bool): Rebuild the view even if the cached one is valid.
+
+    Returns:
+        int: Number of games in the view.
+    """
+    raw_path = PathUtils.get_node_path(PROJECT_STRUCTURE, "data", "raw")
+    processed_path = PathUtils.get_node_path(
+        PROJECT_STRUCTURE, "data", "processed"
+    )
+    preprocessor = DataPreprocessor(
+        raw_path, processed_path, filenames=config.get("filenames")
+    )
+    view = preprocessor.game_view(refresh=refresh)
+    LOGGER.info(
+        f"Vue matchs prête : {len(view)} matchs, {view.shape[1]} colonnes "
+        f"({processed_path})"
+    )
+    dimensions = preprocessor.dimensions()
+    LOGGER.info(
+        f"Dimensions : {len(dimensions.team)} équipes, "
+        f"{len(dimensions.player)} joueurs, "
+        f"{len(dimensions.season)} saisons"
+    )
+    return len(view)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Prétraitement et jointure des tables brutes"
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Reconstruit la vue même si le cache est à jour",
+    )
+    args = parser.parse_args()
+
+    try:
+        build_views(DICT_SCRIPT_CONFIG, refresh=args.refresh)
+    except Exception as err:
+        LOGGER.error(f"Erreur durant le prétraitement : {err}")
+        sys.exit(1)
+
+    LOGGER.info("Fin du script.")
+
+
+if __name__ == "__main__":
+    main()
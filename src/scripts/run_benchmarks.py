@@ -0,0 +1,141 @@
+import argparse
+import os
+import sys
+import time
+
+from packages.benchmarks import (
+    BenchmarkRunner,
+    compare,
+    load_results,
+    save_results,
+)
+from packages.init_app import init_app
+from packages.tools.file import PathUtils
+
+(
+    PROJECT_STRUCTURE,
+    DICT_APP,
+    DICT_SCRIPT_CONFIG,
+    LOGGER,
+    CONST,
+) = init_app(__file__)
+
+
+def run(
+    config: dict,
+    scales: list[float],
+    cases: list[str] | None,
+    save_baseline: bool = False,
+) -> bool:
+    """
+    Run the benchmarks, save the results and compare to the baseline.
+
+    Args:
+        config (dict): Script configuration.
+        scales (list[float]): Synthetic data scales.
+        cases (list[str] | None): Cases to run, all if None.
+        save_baseline (bool): Also store the results as the new baseline.
+
+    Returns:
+        bool: True if no case regressed beyond the threshold.
+    """
+    processed_path = PathUtils.get_node_path(
+        PROJECT_STRUCTURE, "data", "processed"
+    )
+    bench_dir = os.path.join(
+        processed_path, config.get("results_dirname", "benchmarks")
+    )
+    runner = BenchmarkRunner(
+        os.path.join(bench_dir, "data"),
+        scales=scales,
+        cases=cases,
+        repeat=config.get("repeat", 3),
+        seed=config.get("seed", 0),
+        pbp_seasons=config.get("pbp_seasons", 1),
+    )
+    results = runner.run()
+    for result in results:
+        if result.status == "ok":
+            LOGGER.info(
+                f"{result.case} x{result.scale:g} : {result.wall_s:.3f} s, "
+                f"CPU {result.cpu_s:.3f} s, pic RSS "
+                f"{result.peak_rss_mb or 0:.0f} Mo, {result.rows} lignes"
+            )
+        else:
+            LOGGER.warning(
+                f"{result.case} x{result.scale:g} : {result.status} "
+                f"({result.reason})"
+            )
+
+    results_file = os.path.join(
+        bench_dir, f"{time.strftime('%Y%m%d%H%M%S')}_results.json"
+    )
+    save_results(results, results_file)
+    LOGGER.info(f"Résultats enregistrés dans {results_file}")
+
+    baseline_file = os.path.join(
+        bench_dir, config.get("baseline_file", "baseline.json")
+    )
+    if save_baseline:
+        save_results(results, baseline_file)
+        LOGGER.info(f"Référence enregistrée dans {baseline_file}")
+        return True
+    if not os.path.isfile(baseline_file):
+        LOGGER.info("Pas de référence : comparaison ignorée")
+        return True
+
+    threshold = config.get("threshold", 0.2)
+    comparisons = compare(results, load_results(baseline_file), threshold)
+    for comparison in comparisons:
+        ratios = (
+            f"temps x{comparison.wall_ratio or 0:.2f}, "
+            f"RSS x{comparison.rss_ratio or 0:.2f}"
+        )
+        label = f"{comparison.case} x{comparison.scale:g}"
+        if comparison.regressions:
+            LOGGER.warning(f"Régression {label} : {ratios}")
+        else:
+            LOGGER.info(f"{label} : {ratios}")
+    return not any(c.regressions for c in comparisons)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmarks de chargement, transformation et rapports"
+    )
+    parser.add_argument(
+        "--scales",
+        type=float,
+        nargs="+",
+        default=DICT_SCRIPT_CONFIG.get("scales", [0.05, 0.25, 1.0]),
+        help="Échelles du jeu synthétique",
+    )
+    parser.add_argument(
+        "--cases",
+        nargs="+",
+        default=None,
+        help="Cas à mesurer (tous par défaut)",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Enregistre les résultats comme nouvelle référence",
+    )
+    args = parser.parse_args()
+
+    try:
+        passed = run(
+            DICT_SCRIPT_CONFIG, args.scales, args.cases, args.save_baseline
+        )
+    except Exception as err:
+        LOGGER.error(f"Erreur durant les benchmarks : {err}")
+        sys.exit(1)
+
+    if not passed:
+        LOGGER.error("Régression de performance au-delà du seuil")
+        sys.exit(1)
+    LOGGER.info("Fin du script.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+import argparse
+import os
+import sys
+
+import pandas as pd
+
+from packages.init_app import init_app
+from packages.models.scoring import ScoringService, request_scores
+from packages.preprocessing.data_preprocessing import DataPreprocessor
+from packages.tools.file import PathUtils
+
+(
+    PROJECT_STRUCTURE,
+    DICT_APP,
+    DICT_SCRIPT_CONFIG,
+    LOGGER,
+    CONST,
+) = init_app(__file__)
+
+
+def load_service(config: dict) -> ScoringService:
+    """
+    Load the model of the configured run and the latest feature state.
+
+    Args:
+        config (dict): Script configuration.
+
+    Returns:
+        ScoringService: Warm scoring service.
+    """
+    raw_path = PathUtils.get_node_path(PROJECT_STRUCTURE, "data", "raw")
+    processed_path = PathUtils.get_node_path(
+        PROJECT_STRUCTURE, "data", "processed"
+    )
+    run_dir = os.path.join(
+        processed_path,
+        config.get("models_dirname", "models"),
+        config["run_name"],
+    )
+    preprocessor = DataPreprocessor(raw_path, processed_path)
+    service = ScoringService.from_run(
+        run_dir, preprocessor.game_view(), preprocessor.standings()
+    )
+    LOGGER.info(f"Modèle chargé : {run_dir}")
+    return service
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Service de prédiction des matchs du jour"
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Démarre le service socket local avec le modèle chargé",
+    )
+    parser.add_argument(
+        "--games",
+        help="CSV des matchs à prédire (GAME_ID, GAME_DATE_EST, SEASON, "
+        "HOME_TEAM_ID, VISITOR_TEAM_ID)",
+    )
+    parser.add_argument(
+        "--local",
+        action="store_true",
+        help="Prédit sans passer par le service (démarrage à froid)",
+    )
+    args = parser.parse_args()
+    host = DICT_SCRIPT_CONFIG.get("host", "127.0.0.1")
+    port = DICT_SCRIPT_CONFIG.get("port", 8765)
+
+    try:
+        if args.serve:
+            service = load_service(DICT_SCRIPT_CONFIG)
+            LOGGER.info(f"Service en écoute sur {host}:{port}")
+            service.serve(host, port)
+        elif args.games:
+            games = pd.read_csv(args.games)
+            if args.local:
+                scored = load_service(DICT_SCRIPT_CONFIG).score(games)
+            else:
+                response = request_scores(games, host, port)
+                if "error" in response:
+                    raise ValueError(response["error"])
+                scored = pd.DataFrame(response["predictions"])
+                LOGGER.info(
+                    f"Réponse du service en {response['elapsed_ms']:.1f} ms"
+                )
+            print(scored.to_string(index=False))
+        else:
+            parser.error("--serve ou --games est requis")
+    except KeyboardInterrupt:
+        LOGGER.info("Service arrêté.")
+    except Exception as err:
+        LOGGER.error(f"Erreur durant la prédiction : {err}")
+        sys.exit(1)
+
+    LOGGER.info("Fin du script.")
+
+
+if __name__ == "__main__":
+    main()
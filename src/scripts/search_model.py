@@ -0,0 +1,95 @@
+import argparse
+import os
+import sys
+
+from packages.init_app import init_app
+from packages.models.search import HalvingSearch
+from packages.models.train_model import FeatureConfig, ModelTrainer
+from packages.preprocessing.data_preprocessing import DataPreprocessor
+from packages.tools.file import PathUtils
+
+(
+    PROJECT_STRUCTURE,
+    DICT_APP,
+    DICT_SCRIPT_CONFIG,
+    LOGGER,
+    CONST,
+) = init_app(__file__)
+
+
+def run_search(config: dict, method: str = "hyperband") -> dict:
+    """
+    Search the hyperparameters of the game-outcome model.
+
+    Args:
+        config (dict): Script configuration.
+        method (str): "hyperband" or "halving".
+
+    Returns:
+        dict: Best parameters found.
+    """
+    raw_path = PathUtils.get_node_path(PROJECT_STRUCTURE, "data", "raw")
+    processed_path = PathUtils.get_node_path(
+        PROJECT_STRUCTURE, "data", "processed"
+    )
+    view = DataPreprocessor(raw_path, processed_path).game_view()
+    trainer = ModelTrainer(
+        cache_dir=os.path.join(
+            processed_path, config.get("cache_dirname", "feature_cache")
+        ),
+        artifacts_dir=os.path.join(
+            processed_path, config.get("models_dirname", "models")
+        ),
+        feature_config=FeatureConfig(**config.get("features", {})),
+    )
+    features = trainer.prepare(view)
+    LOGGER.info(f"Matrice de features prête : {features.X.shape}")
+
+    search = HalvingSearch(
+        features,
+        config.get("estimator", "gradient_boosting"),
+        config["space"],
+        resource=config.get("resource", "max_iter"),
+        min_resource=config.get("min_resource", 10),
+        max_resource=config.get("max_resource", 270),
+        eta=config.get("eta", 3),
+        n_folds=config.get("n_folds", 3),
+        n_jobs=config.get("n_jobs", os.cpu_count() or 1),
+        seed=config.get("seed", 0),
+        journal=os.path.join(
+            processed_path, config.get("journal_filename", "search.jsonl")
+        ),
+    )
+    if method == "halving":
+        results = search.successive_halving(config.get("n_candidates", 27))
+    else:
+        results = search.hyperband()
+    LOGGER.info(f"{len(results)} évaluations, meilleur essai :")
+    LOGGER.info(results.head(1).to_string(index=False))
+    return search.best()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Recherche d'hyperparamètres par successive halving"
+    )
+    parser.add_argument(
+        "--method",
+        choices=["hyperband", "halving"],
+        default="hyperband",
+        help="Hyperband (défaut) ou un seul bracket de successive halving",
+    )
+    args = parser.parse_args()
+
+    try:
+        best = run_search(DICT_SCRIPT_CONFIG, method=args.method)
+        LOGGER.info(f"Meilleurs paramètres : {best}")
+    except Exception as err:
+        LOGGER.error(f"Erreur durant la recherche : {err}")
+        sys.exit(1)
+
+    LOGGER.info("Fin du script.")
+
+
+if __name__ == "__main__":
+    main()
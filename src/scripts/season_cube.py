@@ -0,0 +1,84 @@
+import argparse
+import os
+import shutil
+import sys
+
+from packages.features.season_cube import STAT_COLUMNS, SeasonCube
+from packages.init_app import init_app
+from packages.preprocessing.memory import load_csv
+from packages.tools.file import PathUtils
+
+(
+    PROJECT_STRUCTURE,
+    DICT_APP,
+    DICT_SCRIPT_CONFIG,
+    LOGGER,
+    CONST,
+) = init_app(__file__)
+
+DETAIL_COLUMNS = ["GAME_ID", "TEAM_ID", "PLAYER_ID", "MIN", *STAT_COLUMNS]
+
+
+def update_cube(config: dict, full_rebuild: bool = False) -> int:
+    """
+    Add new games of games_details.csv to the season cube.
+
+    Args:
+        config (dict): Script configuration.
+        full_rebuild (bool): Drop the existing cube before aggregating.
+
+    Returns:
+        int: Number of games added to the cube.
+    """
+    raw_path = PathUtils.get_node_path(PROJECT_STRUCTURE, "data", "raw")
+    processed_path = PathUtils.get_node_path(
+        PROJECT_STRUCTURE, "data", "processed"
+    )
+    cube_dir = os.path.join(
+        processed_path, config.get("cube_dirname", "season_cube")
+    )
+    if full_rebuild and os.path.isdir(cube_dir):
+        shutil.rmtree(cube_dir)
+
+    cube = SeasonCube(cube_dir).load()
+    LOGGER.info(f"Cube chargé : {len(cube.game_ids)} matchs déjà agrégés")
+
+    games = load_csv(
+        os.path.join(raw_path, config.get("games_filename", "games.csv")),
+        usecols=["GAME_ID", "SEASON"],
+    )
+    details = load_csv(
+        os.path.join(
+            raw_path, config.get("details_filename", "games_details.csv")
+        ),
+        usecols=DETAIL_COLUMNS,
+    )
+    added = cube.update(details, games)
+    if added:
+        cube.save()
+    LOGGER.info(f"{added} nouveaux matchs agrégés dans {cube_dir}")
+    return added
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Mise à jour du cube d'agrégats joueur/équipe par saison"
+    )
+    parser.add_argument(
+        "--full-rebuild",
+        action="store_true",
+        help="Reconstruit le cube à partir de zéro",
+    )
+    args = parser.parse_args()
+
+    try:
+        update_cube(DICT_SCRIPT_CONFIG, full_rebuild=args.full_rebuild)
+    except Exception as err:
+        LOGGER.error(f"Erreur durant la mise à jour du cube : {err}")
+        sys.exit(1)
+
+    LOGGER.info("Fin du script.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+import argparse
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+from packages.init_app import init_app
+from packages.preprocessing.query_engine import QueryEngine
+from packages.tools.file import PathUtils
+
+(
+    PROJECT_STRUCTURE,
+    DICT_APP,
+    DICT_SCRIPT_CONFIG,
+    LOGGER,
+    CONST,
+) = init_app(__file__)
+
+
+def build_engine(config: dict) -> QueryEngine:
+    """
+    Query engine over data/raw and data/processed.
+
+    Args:
+        config (dict): Script configuration.
+
+    Returns:
+        QueryEngine: Engine with every dataset registered.
+    """
+    raw_path = PathUtils.get_node_path(PROJECT_STRUCTURE, "data", "raw")
+    processed_path = PathUtils.get_node_path(
+        PROJECT_STRUCTURE, "data", "processed"
+    )
+    return QueryEngine(
+        [raw_path, processed_path],
+        groups=config.get("groups"),
+        threads=config.get("threads"),
+        memory_limit=config.get("memory_limit"),
+    )
+
+
+def parse_params(values: list[str] | None) -> dict:
+    """
+    Query parameters given as name=value.
+
+    Args:
+        values (list[str] | None): Raw --param values.
+
+    Returns:
+        dict: Parameters, numbers converted when possible.
+    """
+    params: dict[str, int | float | str] = {}
+    for value in values or []:
+        name, sep, raw = value.partition("=")
+        if not sep:
+            raise ValueError(f"Paramètre invalide (nom=valeur) : {value}")
+        try:
+            params[name] = int(raw)
+        except ValueError:
+            try:
+                params[name] = float(raw)
+            except ValueError:
+                params[name] = raw
+    return params
+
+
+def write_result(result: pd.DataFrame, output: str | None) -> None:
+    """
+    Print a result or write it as CSV/Parquet depending on the suffix.
+
+    Args:
+        result (pd.DataFrame): Query result.
+        output (str | None): Output file, printed to stdout if None.
+    """
+    if output is None:
+        with pd.option_context("display.width", 200):
+            print(result.to_string(index=False))
+        return
+    Path(output).parent.mkdir(parents=True, exist_ok=True)
+    if output.endswith(".parquet"):
+        result.to_parquet(output, index=False)
+    else:
+        result.to_csv(output, index=False)
+    LOGGER.info(f"{len(result)} lignes écrites dans {output}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Requêtes SQL sur les jeux de données bruts et traités"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("tables", help="Liste les tables disponibles")
+    saved = subparsers.add_parser("run", help="Lance une requête enregistrée")
+    saved.add_argument("name", help="Nom de la requête dans la config")
+    sql = subparsers.add_parser("sql", help="Lance une requête SQL libre")
+    sql.add_argument("statement", help="Requête SQL")
+    for sub in (saved, sql):
+        sub.add_argument(
+            "--param",
+            action="append",
+            help="Paramètre nom=valeur de la requête (option répétable)",
+        )
+        sub.add_argument("--output", help="Fichier de sortie .csv ou .parquet")
+    args = parser.parse_args()
+
+    try:
+        with build_engine(DICT_SCRIPT_CONFIG) as engine:
+            if args.command == "tables":
+                write_result(engine.tables(), None)
+            else:
+                if args.command == "run":
+                    queries = DICT_SCRIPT_CONFIG.get("queries", {})
+                    if args.name not in queries:
+                        raise KeyError(f"Requête inconnue : {args.name}")
+                    statement = queries[args.name]
+                else:
+                    statement = args.statement
+                result = engine.query(statement, parse_params(args.param))
+                write_result(result, args.output)
+    except Exception as err:
+        LOGGER.error(f"Erreur durant la requête : {err}")
+        sys.exit(1)
+
+    LOGGER.info("Fin du script.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import argparse
+import os
+import sys
+from datetime import datetime
+
+from packages.init_app import init_app
+from packages.models.train_model import (
+    FeatureConfig,
+    ModelTrainer,
+    make_estimator,
+)
+from packages.preprocessing.data_preprocessing import DataPreprocessor
+from packages.tools.file import PathUtils
+
+(
+    PROJECT_STRUCTURE,
+    DICT_APP,
+    DICT_SCRIPT_CONFIG,
+    LOGGER,
+    CONST,
+) = init_app(__file__)
+
+
+def run_training(config: dict, run_name: str | None = None) -> str:
+    """
+    Train the game-outcome model described by the configuration.
+
+    Args:
+        config (dict): Script configuration.
+        run_name (str | None): Name of the run, timestamp if None.
+
+    Returns:
+        str: Directory of the persisted run.
+    """
+    raw_path = PathUtils.get_node_path(PROJECT_STRUCTURE, "data", "raw")
+    processed_path = PathUtils.get_node_path(
+        PROJECT_STRUCTURE, "data", "processed"
+    )
+    view = DataPreprocessor(raw_path, processed_path).game_view()
+    LOGGER.info(f"Vue matchs chargée : {len(view)} matchs")
+
+    trainer = ModelTrainer(
+        cache_dir=os.path.join(
+            processed_path, config.get("cache_dirname", "feature_cache")
+        ),
+        artifacts_dir=os.path.join(
+            processed_path, config.get("models_dirname", "models")
+        ),
+        feature_config=FeatureConfig(**config.get("features", {})),
+        n_jobs=config.get("n_jobs", os.cpu_count() or 1),
+    )
+    estimator = make_estimator(
+        config.get("estimator", "logistic"), config.get("params")
+    )
+    run_name = run_name or datetime.now().strftime("%Y%m%d_%H%M%S")
+    run_dir = trainer.train(
+        view, estimator, run_name, n_folds=config.get("n_folds", 5)
+    )
+    LOGGER.info(f"Modèle et métriques enregistrés dans {run_dir}")
+    return str(run_dir)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Entraînement du modèle de prédiction des matchs"
+    )
+    parser.add_argument(
+        "--run-name",
+        default=None,
+        help="Nom du dossier de l'entraînement (horodatage par défaut)",
+    )
+    args = parser.parse_args()
+
+    try:
+        run_training(DICT_SCRIPT_CONFIG, run_name=args.run_name)
+    except Exception as err:
+        LOGGER.error(f"Erreur durant l'entraînement : {err}")
+        sys.exit(1)
+
+    LOGGER.info("Fin du script.")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,9 @@ from packages.tools.file import PathUtils
 from packages.tools.web.converter import HtmlConverter
 from packages.tools.web.crawler import Crawler
 from packages.tools.web.extractor import Extractor
+from packages.tools.web.fetcher import HybridFetcher
+from packages.tools.web.frontier import CrawlFrontier
+from packages.tools.web.route_filter import RouteFilter
 from playwright.sync_api import sync_playwright
 
 (
@@ -18,7 +21,14 @@ from playwright.sync_api import sync_playwright
 ) = init_app(__file__)
 
 
-def analyze_site(start_url, max_pages=50, max_depth=3):
+def analyze_site(
+    start_url,
+    max_pages=50,
+    max_depth=3,
+    hybrid_fetch=True,
+    wait_until="domcontentloaded",
+    block_resources=True,
+):
     report = {
         "start_url": start_url,
         "robots_txt_present": False,
@@ -28,6 +38,8 @@ def analyze_site(start_url, max_pages=50, max_depth=3):
         "max_depth": 0,
         "domain": urlparse(start_url).netloc,
         "extracted_texts": [],
+        "rendered_pages": 0,
+        "blocked_requests": 0,
     }
 
     crawler = Crawler()
@@ -36,27 +48,37 @@ def analyze_site(start_url, max_pages=50, max_depth=3):
 
     extractor = Extractor()
     HtmlConverter()  # Instanciation si utile ailleurs
+    # Pages statiques en HTTP simple, rendu navigateur si nécessaire
+    fetcher = HybridFetcher() if hybrid_fetch else None
 
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True)
         page = browser.new_page()
+        # Images, polices et trackers inutiles pour découvrir les liens
+        route_filter = RouteFilter() if block_resources else None
+        if route_filter is not None:
+            route_filter.attach(page)
 
-        visited = set()
-        queue = [(start_url, 0)]
+        frontier = CrawlFrontier(max_depth=max_depth)
+        frontier.push(start_url)
 
-        while queue and report["found_pages"] < max_pages:
-            url, depth = queue.pop(0)
-
-            if url in visited or depth > max_depth:
-                continue
+        while frontier and report["found_pages"] < max_pages:
+            item = frontier.pop()
+            url, depth = item.url, item.depth
 
             if not crawler.can_fetch(rp, url):
                 LOGGER.info(f"Robots.txt bloque l'URL : {url}")
                 continue
 
             # Navigation et récupération du contenu HTML
-            page.goto(url)
-            html = page.content()
+            if fetcher is None:
+                page.goto(url, wait_until=wait_until)
+                html = page.content()
+                report["rendered_pages"] += 1
+            else:
+                result = fetcher.fetch(url, page, wait_until)
+                html = result.html
+                report["rendered_pages"] += result.rendered
 
             # Extraction JSON dynamique
             json_objs = extractor.extract_json_objects_from_scripts(html)
@@ -73,12 +95,13 @@ def analyze_site(start_url, max_pages=50, max_depth=3):
             if depth > report["max_depth"]:
                 report["max_depth"] = depth
 
-            visited.add(url)
-            for link in links:
-                if link not in visited:
-                    queue.append((link, depth + 1))
+            frontier.push_many(links, depth=depth + 1)
 
+        if route_filter is not None:
+            report["blocked_requests"] = route_filter.take(page).blocked
         browser.close()
+    if fetcher is not None:
+        fetcher.close()
 
     report["unique_links"] = list(report["unique_links"])
     return report
@@ -100,6 +123,7 @@ def main():
     print(f"Pages visitées (max 50): {report['found_pages']}")
     print(f"Profondeur max atteinte: {report['max_depth']}")
     print(f"Liens uniques trouvés: {len(report['unique_links'])}")
+    print(f"Pages rendues par le navigateur: {report['rendered_pages']}")
     print(
         f"Extraits de textes JSON dynamiques : "
         f"{len(report['extracted_texts'])} items"
@@ -1,13 +1,18 @@
 import argparse
+import os
 import sys
 
 from packages.init_app import init_app
 from packages.tools.file import FileTools, PathUtils
+from packages.tools.web.assets import AssetDownloader
 from packages.tools.web.crawler import Crawler
 from packages.tools.web.extractor import Extractor
-from packages.tools.web.resources import ResourceManager
-from packages.tools.web.utils import WebUtils
-from playwright.sync_api import sync_playwright
+from packages.tools.web.fetcher import HybridFetcher
+from packages.tools.web.frontier import CrawlFrontier, FrontierItem
+from packages.tools.web.page_pool import PagePool
+from packages.tools.web.route_filter import RouteFilter
+from packages.tools.web.utils import WaitUntil, WebUtils
+from playwright.sync_api import Page
 
 (
     PROJECT_STRUCTURE,
@@ -63,90 +68,152 @@ def scrape_site(
     parser: str = "lxml",
     from_encoding: str = "utf-8",
     preserve_whitespace_tags: list[str] | None = None,
+    frontier_file: str | None = None,
+    checkpoint_every: int = 50,
+    pool_size: int = 1,
+    max_per_host: int | None = None,
+    fetcher: HybridFetcher | None = None,
+    wait_until: WaitUntil = "load",
+    route_filter: RouteFilter | None = None,
+    asset_workers: int = 8,
 ) -> None:
     """
     Recursively scrape a site, respecting robots.txt,
     limiting volume and depth, pausing between requests,
     and saving pages/resources.
+
+    Pages are rendered by a pool of `pool_size` Playwright pages, at
+    most `max_per_host` at once on one host, each worker pausing between
+    its requests. With `frontier_file`, the crawl frontier is saved there
+    every `checkpoint_every` pages and when the crawl stops, and an
+    existing file resumes the crawl where it stopped. With a `fetcher`,
+    pages are first fetched over plain HTTP and only rendered when they
+    need JavaScript. Rendering waits for the `wait_until` load state,
+    with the requests of the pages filtered by `route_filter`. The
+    resources of all pages are downloaded once per crawl by
+    `asset_workers` concurrent downloads.
     """
     if preserve_whitespace_tags is None:
         preserve_whitespace_tags = ["pre", "textarea"]
 
     crawler = Crawler()
     extractor = Extractor()
-    resource_manager = ResourceManager()
+    assets = AssetDownloader(
+        output_dir,
+        max_workers=asset_workers,
+        user_agent=None if user_agent == "*" else user_agent,
+    )
 
     rp = crawler.get_robots_parser(start_url)
-    visited: set[str] = set()
-    queue: list[tuple[str, int]] = [(start_url, 0)]
-
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-
-        while queue and len(visited) < max_pages:
-            url, depth = queue.pop(0)
-            if url in visited or depth > max_depth:
-                continue
-
-            if not crawler.can_fetch(rp, url, user_agent):
-                LOGGER.info(f"Bloqué par robots.txt : {url}")
-                continue
-
-            filename_embedded = (
-                WebUtils.generate_filename_from_url(url) + "_embedded.html"
+    if frontier_file and os.path.isfile(frontier_file):
+        frontier = CrawlFrontier.load(frontier_file)
+        LOGGER.info(f"Reprise du crawl : {len(frontier)} URL en attente")
+    else:
+        frontier = CrawlFrontier(max_depth=max_depth)
+        frontier.push(start_url)
+
+    def scrape_page(page: Page, item: FrontierItem) -> set[str] | None:
+        url, depth = item.url, item.depth
+        if not crawler.can_fetch(rp, url, user_agent):
+            LOGGER.info(f"Bloqué par robots.txt : {url}")
+            return None
+
+        filename_embedded = (
+            WebUtils.generate_filename_from_url(url) + "_embedded.html"
+        )
+        filename_text = WebUtils.generate_filename_from_url(url) + "_text.txt"
+
+        if WebUtils.is_cached(
+            output_dir, filename_embedded
+        ) and WebUtils.is_cached(output_dir, filename_text):
+            LOGGER.info(f"Cache trouvé, saute {url}")
+            return set()
+
+        LOGGER.info(f"Aspiration {url} à profondeur {depth}")
+        if fetcher is None:
+            html_content = WebUtils.fetch_page_with_playwright(
+                page, url, wait_until
             )
-            filename_text = (
-                WebUtils.generate_filename_from_url(url) + "_text.txt"
+            rendered = True
+        else:
+            result = fetcher.fetch(url, page, wait_until)
+            html_content = result.html
+            rendered = result.rendered
+            if rendered:
+                LOGGER.debug(f"Rendu navigateur ({result.reason}) : {url}")
+        if rendered and route_filter is not None:
+            stats = route_filter.take(page)
+            LOGGER.debug(
+                f"{stats.blocked} requêtes bloquées, {stats.stubbed} "
+                f"neutralisées, ~{stats.bytes_saved} octets économisés"
             )
 
-            if WebUtils.is_cached(
-                output_dir, filename_embedded
-            ) and WebUtils.is_cached(output_dir, filename_text):
-                LOGGER.info(f"Cache trouvé, saute {url}")
-                visited.add(url)
-                continue
+        assets.submit_page(html_content, url)
+        WebUtils.save_content(output_dir, filename_embedded, html_content)
 
-            LOGGER.info(f"Aspiration {url} à profondeur {depth}")
-            html_content = WebUtils.fetch_page_with_playwright(page, url)
-
-            resource_manager.extract_and_download_resources(
-                page, url, output_dir
-            )
-            WebUtils.save_content(output_dir, filename_embedded, html_content)
-
-            json_objs = extractor.extract_json_objects_from_scripts(
-                html_content
-            )
-            extracted_texts = extractor.extract_texts_from_json_objects(
-                json_objs,
-                keys_to_extract=["title", "content", "text", "description"],
-            )
+        json_objs = extractor.extract_json_objects_from_scripts(html_content)
+        extracted_texts = extractor.extract_texts_from_json_objects(
+            json_objs,
+            keys_to_extract=["title", "content", "text", "description"],
+        )
 
-            json_text_concat = "\n\n".join(extracted_texts)
+        json_text_concat = "\n\n".join(extracted_texts)
 
-            text_content = WebUtils.html_to_text(
-                html_content,
-                parser=parser,
-                from_encoding=from_encoding,
-                preserve_whitespace_tags=preserve_whitespace_tags,
-            )
-            full_text_content = f"{text_content}\n\n{json_text_concat}".strip()
+        text_content = WebUtils.html_to_text(
+            html_content,
+            parser=parser,
+            from_encoding=from_encoding,
+            preserve_whitespace_tags=preserve_whitespace_tags,
+        )
+        full_text_content = f"{text_content}\n\n{json_text_concat}".strip()
 
-            WebUtils.save_content(output_dir, filename_text, full_text_content)
+        WebUtils.save_content(output_dir, filename_text, full_text_content)
 
-            visited.add(url)
+        new_links = extractor.extract_internal_links(html_content, start_url)
 
-            new_links = extractor.extract_internal_links(
-                html_content, start_url
-            )
-            new_to_add = new_links - visited
-            for link in new_to_add:
-                queue.append((link, depth + 1))
+        WebUtils.delay_between_requests(min_delay, max_delay)
+        return new_links
 
-            WebUtils.delay_between_requests(min_delay, max_delay)
+    def log_error(item: FrontierItem, err: Exception) -> None:
+        LOGGER.error(f"Erreur sur {item.url} : {err}")
 
-        browser.close()
+    pool = PagePool(
+        size=pool_size, max_per_host=max_per_host, route_filter=route_filter
+    )
+    try:
+        pages = pool.crawl(
+            frontier,
+            scrape_page,
+            max_pages=max_pages,
+            on_error=log_error,
+            frontier_file=frontier_file,
+            checkpoint_every=checkpoint_every,
+        )
+    finally:
+        if frontier_file:
+            frontier.save(frontier_file)
+        assets.close()
+    LOGGER.info(
+        f"{pages} pages aspirées, {pool.recycled} pages Playwright recyclées"
+    )
+    LOGGER.info(
+        f"Ressources : {assets.stats['fetched']} téléchargées "
+        f"({assets.stats['bytes']} octets), {assets.stats['duplicates']} "
+        f"doublons de contenu, {assets.stats['skipped']} déjà connues, "
+        f"{assets.stats['failed']} échecs"
+    )
+    if route_filter is not None:
+        totals = route_filter.totals
+        LOGGER.info(
+            f"Requêtes bloquées : {totals.blocked}, neutralisées : "
+            f"{totals.stubbed}, ~{totals.bytes_saved} octets économisés"
+        )
+    if fetcher is not None:
+        LOGGER.info(
+            f"Pages HTTP : {fetcher.stats['http']}, rendues : "
+            f"{fetcher.stats['rendered']}, hôtes appris : "
+            f"{fetcher.stats['learned']}"
+        )
 
 
 def main():
@@ -170,6 +237,21 @@ def main():
     parser_name = config.get("parser", "lxml")
     encoding = config.get("from_encoding", "utf-8")
     preserve_tags = config.get("preserve_whitespace_tags", ["pre", "textarea"])
+    frontier_file = config.get("frontier_file")
+    pool_size = config.get("pool_size", 1)
+    asset_workers = config.get("asset_workers", 8)
+    max_per_host = config.get("max_per_host")
+    wait_until = config.get("wait_until", "load")
+    route_config = config.get("route_filter")
+    route_filter = RouteFilter(**route_config) if route_config else None
+    fetcher = None
+    if config.get("hybrid_fetch", True):
+        fetcher = HybridFetcher(
+            expected_selectors=config.get("expected_selectors"),
+            timeout=config.get("http_timeout", 10),
+            user_agent=config.get("user_agent"),
+            pool_size=pool_size,
+        )
 
     try:
         scrape_site(
@@ -177,15 +259,26 @@ def main():
             output_dir,
             max_pages=max_pages,
             max_depth=max_depth,
+            user_agent=config.get("user_agent", "*"),
             min_delay=min_delay,
             max_delay=max_delay,
             parser=parser_name,
             from_encoding=encoding,
             preserve_whitespace_tags=preserve_tags,
+            frontier_file=frontier_file,
+            pool_size=pool_size,
+            max_per_host=max_per_host,
+            fetcher=fetcher,
+            wait_until=wait_until,
+            route_filter=route_filter,
+            asset_workers=asset_workers,
         )
     except Exception as err:
         LOGGER.error(f"Erreur durant le scraping : {err}")
         sys.exit(1)
+    finally:
+        if fetcher is not None:
+            fetcher.close()
 
     LOGGER.info("Fin du script.")
 
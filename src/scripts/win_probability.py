@@ -0,0 +1,110 @@
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from packages.features.win_probability import (
+    WinProbabilityConfig,
+    WinProbabilityTable,
+)
+from packages.init_app import init_app
+from packages.preprocessing.memory import load_csv
+from packages.tools.file import PathUtils
+
+(
+    PROJECT_STRUCTURE,
+    DICT_APP,
+    DICT_SCRIPT_CONFIG,
+    LOGGER,
+    CONST,
+) = init_app(__file__)
+
+
+def build_table(config: dict) -> WinProbabilityTable:
+    """
+    Fit the win-probability table on the pbp files of data/raw.
+
+    Args:
+        config (dict): Script configuration.
+
+    Returns:
+        WinProbabilityTable: Table saved in data/processed.
+    """
+    raw_path = PathUtils.get_node_path(PROJECT_STRUCTURE, "data", "raw")
+    processed_path = PathUtils.get_node_path(
+        PROJECT_STRUCTURE, "data", "processed"
+    )
+    files = sorted(Path(raw_path).glob(config["pbp_pattern"]))
+    if not files:
+        raise FileNotFoundError(f"Aucun fichier pbp dans {raw_path}")
+    pbp = pd.concat(
+        [load_csv(f, low_memory=False) for f in files], ignore_index=True
+    )
+    started = time.perf_counter()
+    table = WinProbabilityTable.fit(
+        pbp, config=WinProbabilityConfig(**config.get("table", {}))
+    )
+    table.save(os.path.join(processed_path, config["table_filename"]))
+    LOGGER.info(
+        f"Table de probabilité de victoire {table.table.shape} construite "
+        f"sur {len(pbp)} actions en {time.perf_counter() - started:.1f} s"
+    )
+    return table
+
+
+def render(config: dict, pbp_file: str) -> pd.DataFrame:
+    """
+    Win-probability curves of every game of a pbp file.
+
+    Args:
+        config (dict): Script configuration.
+        pbp_file (str): pbp CSV file.
+
+    Returns:
+        pd.DataFrame: Curves, also written next to the table as Parquet.
+    """
+    processed_path = PathUtils.get_node_path(
+        PROJECT_STRUCTURE, "data", "processed"
+    )
+    table = WinProbabilityTable.load(
+        os.path.join(processed_path, config["table_filename"])
+    )
+    started = time.perf_counter()
+    curves = table.game_series(load_csv(pbp_file, low_memory=False))
+    output = os.path.join(processed_path, f"{Path(pbp_file).stem}_wp.parquet")
+    curves.to_parquet(output, index=False)
+    LOGGER.info(
+        f"{curves['URL'].nunique()} courbes calculées en "
+        f"{time.perf_counter() - started:.1f} s ({output})"
+    )
+    return curves
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Table de probabilité de victoire en cours de match"
+    )
+    parser.add_argument(
+        "--render",
+        metavar="PBP_CSV",
+        help="Calcule les courbes d'un fichier pbp avec la table existante",
+    )
+    args = parser.parse_args()
+
+    try:
+        if args.render:
+            render(DICT_SCRIPT_CONFIG, args.render)
+        else:
+            build_table(DICT_SCRIPT_CONFIG)
+    except Exception as err:
+        LOGGER.error(f"Erreur sur la probabilité de victoire : {err}")
+        sys.exit(1)
+
+    LOGGER.info("Fin du script.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+import json
+import threading
+
+import requests
+
+from packages.tools.web.assets import INDEX_FILENAME, AssetDownloader
+
+BASE = "https://www.example.com"
+
+
+class _Response:
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start : start + chunk_size]
+
+
+class _Session:
+    """Session factice : contenu par URL, appels comptés."""
+
+    def __init__(self, files: dict[str, bytes]):
+        self.files = files
+        self.headers = {}
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def get(self, url, stream=False, timeout=None):
+        with self.lock:
+            self.calls.append(url)
+        if url not in self.files:
+            raise requests.RequestException(url)
+        return _Response(self.files[url])
+
+    def close(self):
+        pass
+
+
+def test_assets_are_downloaded_once(tmp_path):
+    css = b"body { color: red; }" * 1000
+    session = _Session(
+        {
+            f"{BASE}/static/site.css": css,
+            f"{BASE}/static/copy.css": css,
+            f"{BASE}/img/logo.png": b"\x89PNG" * 10,
+        }
+    )
+    with AssetDownloader(
+        str(tmp_path), max_workers=4, chunk_size=1024, session=session
+    ) as assets:
+        for _ in range(3):
+            assets.submit(
+                [
+                    f"{BASE}/static/site.css",
+                    f"{BASE}/static/copy.css#v2",
+                    f"{BASE}/img/logo.png",
+                    f"{BASE}/missing.js",
+                ]
+            )
+        assets.wait()
+        site_path = assets.path_of(f"{BASE}/static/site.css")
+        copy_path = assets.path_of(f"{BASE}/static/copy.css")
+
+    # Une requête par URL, un seul fichier pour les octets identiques
+    assert sorted(session.calls) == sorted(set(session.calls))
+    assert len(session.calls) == 4
+    assert site_path == copy_path
+    assert (tmp_path / site_path).read_bytes() == css
+    assert (tmp_path / "img" / "logo.png").is_file()
+    assert assets.stats["fetched"] == 2
+    assert assets.stats["duplicates"] == 1
+    assert assets.stats["failed"] == 1
+    assert assets.stats["skipped"] == 8
+    assert not list((tmp_path / ".tmp").iterdir())
+
+
+def test_index_skips_assets_of_previous_crawls(tmp_path):
+    session = _Session({f"{BASE}/a.js": b"a", f"{BASE}/b.js": b"b"})
+    with AssetDownloader(str(tmp_path), session=session) as assets:
+        assets.submit([f"{BASE}/a.js"])
+
+    lines = (tmp_path / INDEX_FILENAME).read_text().splitlines()
+    assert json.loads(lines[0])["path"] == "a.js"
+
+    with AssetDownloader(str(tmp_path), session=session) as assets:
+        assert assets.submit([f"{BASE}/a.js", f"{BASE}/b.js"]) == 1
+    assert session.calls == [f"{BASE}/a.js", f"{BASE}/b.js"]
+
+
+def test_paths_stay_inside_the_output_dir(tmp_path):
+    session = _Session(
+        {
+            f"{BASE}/../../etc/x.js": b"x",
+            f"{BASE}/lib/": b"index",
+            f"{BASE}/etc/x.js?v=2": b"other x",
+        }
+    )
+    with AssetDownloader(str(tmp_path), session=session) as assets:
+        assets.submit(list(session.files))
+        assets.wait()
+        paths = {url: assets.path_of(url) for url in session.files}
+
+    assert paths[f"{BASE}/lib/"] == "lib/index"
+    # Même chemin, contenu différent : le second reçoit un suffixe de hash
+    same_path = [
+        paths[f"{BASE}/../../etc/x.js"],
+        paths[f"{BASE}/etc/x.js?v=2"],
+    ]
+    assert "etc/x.js" in same_path
+    other = [path for path in same_path if path != "etc/x.js"]
+    assert len(other) == 1
+    assert other[0].startswith("etc/x.") and other[0].endswith(".js")
+
+
+def test_requests_send_the_configured_user_agent(tmp_path):
+    session = _Session({})
+    with AssetDownloader(
+        str(tmp_path), user_agent="NbaBot/1.0", session=session
+    ):
+        pass
+    assert session.headers["User-Agent"] == "NbaBot/1.0"
@@ -0,0 +1,90 @@
+import multiprocessing
+from pathlib import Path
+
+from packages.benchmarks import (
+    BenchmarkResult,
+    BenchmarkRunner,
+    compare,
+    load_results,
+    save_results,
+)
+from packages.benchmarks.runner import _receive
+
+
+def test_compare_flags_slower_and_bigger_cases():
+    baseline = [
+        BenchmarkResult("csv_load", 1.0, wall_s=1.0, peak_rss_mb=100.0),
+        BenchmarkResult("transform", 1.0, wall_s=2.0, peak_rss_mb=100.0),
+        BenchmarkResult("report", 1.0, status="skipped"),
+    ]
+    results = [
+        BenchmarkResult("csv_load", 1.0, wall_s=1.1, peak_rss_mb=150.0),
+        BenchmarkResult("transform", 1.0, wall_s=3.0, peak_rss_mb=90.0),
+        BenchmarkResult("report", 1.0, wall_s=5.0, peak_rss_mb=90.0),
+    ]
+    comparisons = {c.case: c for c in compare(results, baseline, 0.2)}
+
+    # Pas de référence exploitable pour "report"
+    assert set(comparisons) == {"csv_load", "transform"}
+    assert comparisons["csv_load"].regressions == ["rss"]
+    assert comparisons["transform"].regressions == ["wall"]
+    assert comparisons["transform"].wall_ratio == 1.5
+
+
+def test_runner_measures_cases_on_synthetic_data(tmp_path: Path):
+    runner = BenchmarkRunner(
+        str(tmp_path),
+        scales=[0.05],
+        cases=["csv_load", "pbp_load"],
+        repeat=2,
+        pbp_seasons=0,
+    )
+    results = {r.case: r for r in runner.run(isolate=False)}
+
+    loaded = results["csv_load"]
+    assert loaded.status == "ok"
+    assert loaded.rows > 1230
+    assert 0 < loaded.wall_s <= loaded.wall_median_s
+    # Jeu sans pbp : le cas échoue sans interrompre la série
+    assert results["pbp_load"].status == "error"
+
+    # Le jeu généré est réutilisé
+    data_dir = runner.data_dir(0.05)
+    assert (data_dir / "_rows.json").is_file()
+
+    save_results(list(results.values()), str(tmp_path / "results.json"))
+    assert load_results(str(tmp_path / "results.json"))[0] == loaded
+
+
+def test_isolated_run_reports_process_peak(tmp_path: Path):
+    runner = BenchmarkRunner(
+        str(tmp_path),
+        scales=[0.05],
+        cases=["csv_load"],
+        repeat=1,
+        pbp_seasons=0,
+    )
+    (result,) = runner.run()
+    assert result.status == "ok"
+    assert result.peak_rss_mb is None or result.peak_rss_mb > 0
+
+
+def _put_large_result(queue) -> None:
+    queue.put({"status": "ok", "payload": "x" * 1_000_000})
+
+
+def test_receive_reads_results_larger_than_the_pipe_buffer():
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=_put_large_result, args=(queue,))
+    process.start()
+    # L'enfant ne se termine qu'une fois son résultat lu
+    fields = _receive(process, queue)
+    process.join(timeout=30)
+    assert fields is not None and len(fields["payload"]) == 1_000_000
+    assert process.exitcode == 0
+
+    empty = context.Process(target=len, args=((),))
+    empty.start()
+    assert _receive(empty, context.Queue(), poll=0.1) is None
+    empty.join()
@@ -0,0 +1,110 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from packages.preprocessing.data_preprocessing import (
+    BOX_COLUMNS,
+    DataPreprocessor,
+)
+
+HOME, AWAY = 1610612737, 1610612738
+
+
+def _write_raw(raw_dir: Path) -> None:
+    pd.DataFrame(
+        {
+            "GAME_DATE_EST": ["2020-01-03", "2020-01-05", "2020-01-05"],
+            "GAME_ID": [2, 3, 3],
+            "HOME_TEAM_ID": [HOME, AWAY, AWAY],
+            "VISITOR_TEAM_ID": [AWAY, HOME, HOME],
+            "SEASON": [2019] * 3,
+            "PTS_home": [100, np.nan, 95],
+            "PTS_away": [90, np.nan, 99],
+            "HOME_TEAM_WINS": [1, 0, 0],
+        }
+    ).to_csv(raw_dir / "games.csv", index=False)
+    details = pd.DataFrame(
+        {
+            "GAME_ID": [2, 2, 2, 3, 3, 3],
+            "TEAM_ID": [HOME, HOME, AWAY, AWAY, HOME, HOME],
+            "PLAYER_ID": [10, 11, 20, 20, 10, 10],
+            "MIN": ["30:00", "20:00", "40:00", "35:00", "33:00", "33:00"],
+        }
+    )
+    for col in BOX_COLUMNS:
+        details[col] = [1, 2, 3, 4, 5, 5]
+    details.to_csv(raw_dir / "games_details.csv", index=False)
+    pd.DataFrame(
+        {"TEAM_ID": [HOME, AWAY], "ABBREVIATION": ["ATL", "BOS"]}
+    ).to_csv(raw_dir / "teams.csv", index=False)
+    pd.DataFrame(
+        {
+            "TEAM_ID": [HOME, HOME, AWAY],
+            "SEASON_ID": [22019] * 3,
+            "STANDINGSDATE": ["2020-01-02", "2020-01-03", "2020-01-02"],
+            "G": [1, 2, 1],
+            "W": [1, 2, 0],
+            "L": [0, 0, 1],
+            "W_PCT": [1.0, 1.0, 0.0],
+            "HOME_RECORD": ["1-0", "2-0", "0-0"],
+            "ROAD_RECORD": ["0-0", "0-0", "0-1"],
+        }
+    ).to_csv(raw_dir / "ranking.csv", index=False)
+
+
+def test_tables_are_deduplicated_with_compact_keys(tmp_path: Path):
+    _write_raw(tmp_path)
+    prep = DataPreprocessor(str(tmp_path))
+
+    games = prep.games()
+    assert games.index.tolist() == [2, 3]
+    assert games["HOME_TEAM_ID"].dtype == np.int32
+    # La ligne la plus complète du doublon est conservée
+    assert games.loc[3, "PTS_home"] == 95
+    assert len(prep.details()) == 5
+    assert prep.team_box().loc[(3, HOME), "PTS"] == 5
+
+
+def test_game_view_joins_box_and_pregame_standings(tmp_path: Path):
+    _write_raw(tmp_path)
+    processed = tmp_path / "processed"
+    view = DataPreprocessor(str(tmp_path), str(processed)).game_view()
+
+    first = view.set_index("GAME_ID").loc[2]
+    assert (first["HOME_ABBREVIATION"], first["AWAY_ABBREVIATION"]) == (
+        "ATL",
+        "BOS",
+    )
+    assert (first["HOME_PTS"], first["AWAY_PTS"]) == (3.0, 3.0)
+    # Le classement du jour même n'est pas encore connu avant le match
+    assert first["HOME_STD_G"] == 1
+    assert view.set_index("GAME_ID").loc[3, "AWAY_STD_G"] == 2
+    assert view.set_index("GAME_ID").loc[3, "AWAY_STD_HOME_W"] == 2
+    assert (processed / DataPreprocessor.GAME_VIEW_FILE).is_file()
+
+    cached = DataPreprocessor(str(tmp_path), str(processed)).game_view()
+    pd.testing.assert_frame_equal(cached, view, check_dtype=False)
+
+
+def test_encoded_tables_share_dimension_codes(tmp_path: Path):
+    _write_raw(tmp_path)
+    processed = tmp_path / "processed"
+    prep = DataPreprocessor(str(tmp_path), str(processed))
+
+    games = prep.encoded("games")
+    details = prep.encoded("details")
+    assert games["HOME_TEAM_ID"].dtype == np.int16
+    assert games["HOME_TEAM_ID"].tolist() == [0, 1]
+    assert sorted(details["PLAYER_ID"].unique().tolist()) == [0, 1, 2]
+    assert (processed / "dimensions" / "team.parquet").is_file()
+
+
+def test_loaded_tables_are_optimized(tmp_path: Path):
+    _write_raw(tmp_path)
+    details = DataPreprocessor(str(tmp_path)).details()
+    assert details["MIN"].tolist()[:2] == [1800, 1200]
+    assert details["PTS"].dtype == np.int8
+
+    raw = DataPreprocessor(str(tmp_path), optimize=False).details()
+    assert raw["MIN"].tolist()[:2] == ["30:00", "20:00"]
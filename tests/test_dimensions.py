@@ -0,0 +1,92 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from packages.preprocessing.dimensions import Dimension, DimensionTables
+
+HOME, AWAY, OTHER = 1610612737, 1610612738, 1610612739
+
+
+def _tables() -> DimensionTables:
+    tables = DimensionTables()
+    tables.update(
+        games=pd.DataFrame(
+            {
+                "GAME_ID": [1, 2],
+                "HOME_TEAM_ID": [HOME, AWAY],
+                "VISITOR_TEAM_ID": [AWAY, HOME],
+                "SEASON": [2019, 2020],
+            }
+        ),
+        details=pd.DataFrame(
+            {
+                "GAME_ID": [1, 1],
+                "TEAM_ID": [HOME, AWAY],
+                "TEAM_ABBREVIATION": ["NJN", "BOS"],
+                "PLAYER_ID": [201939, 2544],
+                "PLAYER_NAME": ["Stephen Curry", "LeBron James"],
+            }
+        ),
+        teams=pd.DataFrame(
+            {"TEAM_ID": [HOME, AWAY], "ABBREVIATION": ["BKN", "BOS"]}
+        ),
+    )
+    return tables
+
+
+def test_codes_are_dense_and_stable():
+    dim = Dimension("team")
+    assert dim.extend([HOME, AWAY, HOME, None]) == 2
+    assert dim.encode([AWAY, HOME, OTHER, None]).tolist() == [1, 0, -1, -1]
+    assert dim.dtype == np.int16
+
+    # Les nouvelles clés sont ajoutées sans renuméroter les anciennes
+    assert dim.extend([OTHER, AWAY]) == 1
+    assert dim.encode([HOME, AWAY, OTHER]).tolist() == [0, 1, 2]
+    assert dim.decode([2, -1]).tolist() == [OTHER, -1]
+
+    cat = dim.categorical([OTHER, HOME])
+    assert cat.codes.tolist() == [2, 0]
+    assert list(cat.categories) == [HOME, AWAY, OTHER]
+
+
+def test_encode_maps_ids_aliases_and_seasons():
+    tables = _tables()
+    lines = pd.DataFrame(
+        {
+            "TEAM_ID": [AWAY, HOME],
+            "TEAM_ABBREVIATION": ["BOS", "NJN"],
+            "PLAYER_ID": [2544, 201939],
+            "SEASON": [2020, 2019],
+        }
+    )
+    encoded = tables.encode(lines)
+
+    assert encoded["TEAM_ID"].tolist() == [1, 0]
+    # Ancienne abréviation et abréviation actuelle désignent la même équipe
+    assert encoded["TEAM_ABBREVIATION"].tolist() == [1, 0]
+    assert tables.team.encode_aliases(["BKN", "XXX"]).tolist() == [0, -1]
+    assert encoded["PLAYER_ID"].tolist() == [1, 0]
+    assert encoded["SEASON"].tolist() == [1, 0]
+    assert tables.player.labels[1] == "LeBron James"
+
+
+def test_save_and_load_keep_codes(tmp_path: Path):
+    tables = _tables()
+    tables.save(str(tmp_path))
+    loaded = DimensionTables.load(str(tmp_path))
+
+    for name in DimensionTables.NAMES:
+        assert list(getattr(loaded, name).keys) == list(
+            getattr(tables, name).keys
+        )
+    assert loaded.team.encode_aliases(["NJN"]).tolist() == [0]
+    assert loaded.player.labels.tolist() == ["Stephen Curry", "LeBron James"]
+    assert (
+        loaded.update(
+            teams=pd.DataFrame({"TEAM_ID": [OTHER], "ABBREVIATION": ["CHA"]})
+        )["team"]
+        == 1
+    )
+    assert loaded.team.encode([OTHER]).tolist() == [2]
@@ -0,0 +1,90 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from packages.features.elo import EloConfig, EloRatingEngine
+
+
+def _games() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "GAME_DATE_EST": [
+                "2019-10-22",
+                "2019-10-22",
+                "2019-10-23",
+                "2020-12-22",
+                # doublon de GAME_ID présent dans games.csv
+                "2019-10-23",
+            ],
+            "GAME_ID": [1, 2, 3, 4, 3],
+            "SEASON": [2019, 2019, 2019, 2020, 2019],
+            "HOME_TEAM_ID": [10, 30, 20, 10, 20],
+            "VISITOR_TEAM_ID": [20, 40, 10, 30, 10],
+            "PTS_home": [110, 95, 100, 120, 100],
+            "PTS_away": [100, 99, 90, 101, 90],
+        }
+    )
+
+
+def test_process_ratings_are_zero_sum_and_chained():
+    engine = EloRatingEngine(EloConfig(season_regression=0.0))
+    history = engine.process(_games())
+
+    assert list(history["GAME_ID"]) == [1, 2, 3, 4]
+    assert (history.loc[:1, "ELO_PRE_home"] == 1500.0).all()
+    # Le vainqueur à domicile gagne des points, l'adversaire les perd
+    first = history.iloc[0]
+    assert first["ELO_POST_home"] > 1500.0
+    assert np.isclose(first["ELO_POST_home"] + first["ELO_POST_away"], 3000.0)
+    # Le post-match du match 1 est le pré-match suivant de l'équipe 20
+    assert history.iloc[2]["ELO_PRE_home"] == first["ELO_POST_away"]
+    assert np.isclose(engine.ratings().sum(), 4 * 1500.0)
+
+
+def test_season_regression_pulls_toward_initial_rating():
+    no_reg = EloRatingEngine(EloConfig(season_regression=0.0))
+    full_reg = EloRatingEngine(EloConfig(season_regression=1.0))
+    no_reg.process(_games())
+    history = full_reg.process(_games())
+
+    new_season = history[history["SEASON"] == 2020].iloc[0]
+    assert new_season["ELO_PRE_home"] == 1500.0
+    assert new_season["ELO_PRE_away"] == 1500.0
+    assert not np.allclose(no_reg.ratings(), full_reg.ratings())
+
+
+def test_state_roundtrip_resumes_after_last_game(tmp_path: Path):
+    games = _games()
+    full = EloRatingEngine()
+    expected = full.process(games)
+
+    partial = EloRatingEngine()
+    partial.process(games[games["GAME_ID"] <= 2])
+    state_file = tmp_path / "elo_state.npz"
+    partial.save_state(str(state_file))
+
+    resumed = EloRatingEngine.load_state(str(state_file))
+    assert resumed.last_processed == (pd.Timestamp("2019-10-22"), 2)
+    update = resumed.process(games)
+
+    assert list(update["GAME_ID"]) == [3, 4]
+    pd.testing.assert_series_equal(full.ratings(), resumed.ratings())
+    assert np.allclose(
+        update["ELO_POST_home"], expected["ELO_POST_home"].iloc[2:]
+    )
+    assert resumed.process(games).empty
+
+
+def test_pregame_matches_processed_pre_ratings():
+    games = _games()
+    engine = EloRatingEngine()
+    engine.process(games[games["SEASON"] == 2019])
+    home, away, prob = engine.pregame([10, 99], [30, 10], [2020, 2019])
+
+    # Le match 4 traité ensuite doit partir des mêmes notes
+    processed = engine.process(games).iloc[0]
+    assert home[0] == processed["ELO_PRE_home"]
+    assert away[0] == processed["ELO_PRE_away"]
+    assert prob[0] == processed["ELO_PROB_home"]
+    assert home[1] == 1500.0
@@ -0,0 +1,127 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from packages.features.feature_store import (
+    FeatureGroup,
+    FeatureStore,
+    player_form_features,
+    team_form_features,
+)
+
+
+def _games() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "GAME_ID": [1, 2, 3, 4],
+            "GAME_DATE_EST": [
+                "2019-11-01",
+                "2019-11-03",
+                "2020-12-01",
+                "2020-12-02",
+            ],
+            "SEASON": [2019, 2019, 2020, 2020],
+            "HOME_TEAM_ID": [10, 20, 10, 20],
+            "VISITOR_TEAM_ID": [20, 10, 20, 10],
+            "PTS_home": [100.0, 90.0, 110.0, 95.0],
+            "PTS_away": [90.0, 100.0, 100.0, 99.0],
+            "HOME_TEAM_WINS": [1, 0, 1, 0],
+        }
+    )
+
+
+def _store(tmp_path: Path, window: int = 10) -> FeatureStore:
+    store = FeatureStore(str(tmp_path))
+    store.register(
+        FeatureGroup(
+            "team_form", "team", team_form_features, {"window": window}
+        )
+    )
+    return store
+
+
+def test_materialize_recomputes_changed_partitions_only(tmp_path: Path):
+    store = _store(tmp_path)
+    games = _games()
+    assert store.materialize("team_form", games) == [2019, 2020]
+    assert store.materialize("team_form", games) == []
+
+    games.loc[3, "PTS_away"] = 120.0
+    assert store.materialize("team_form", games) == [2020]
+
+    rows = store.read("team_form", seasons=[2019])
+    team_10 = rows[rows["TEAM_ID"] == 10].set_index("GAME_ID")
+    assert team_10["FORM_NET"].tolist() == [10.0, 10.0]
+    assert team_10["GAMES_PLAYED"].tolist() == [1, 2]
+
+    # Une nouvelle configuration produit une nouvelle version
+    other = _store(tmp_path, window=1)
+    assert other.materialize("team_form", games) == [2019, 2020]
+    assert len(other.versions("team_form")) == 2
+    assert len(other.prune("team_form")) == 1
+
+
+def test_version_covers_listed_helpers():
+    def helper_v1(values):
+        return values
+
+    def helper_v2(values):
+        return values * 2
+
+    def group(helper) -> FeatureGroup:
+        return FeatureGroup(
+            "team_form", "team", team_form_features, depends_on=[helper]
+        )
+
+    # Modifier un helper invalide la version, pas seulement compute
+    assert group(helper_v1).version != group(helper_v2).version
+    assert group(helper_v1).version == group(helper_v1).version
+
+
+def test_point_in_time_never_reads_the_future(tmp_path: Path):
+    store = _store(tmp_path)
+    store.materialize("team_form", _games())
+    spine = pd.DataFrame(
+        {
+            "TEAM_ID": [10, 10, 10, 30],
+            "DATE": ["2019-11-01", "2019-11-03", "2019-11-04", "2019-11-04"],
+        }
+    )
+    out = store.point_in_time("team_form", spine, "TEAM_ID", "DATE")
+
+    # Avant le premier match : rien ; le 3 : seul le match du 1er est connu
+    assert np.isnan(out.loc[0, "FORM_WIN"])
+    assert out.loc[1, "GAMES_PLAYED"] == 1
+    assert out.loc[2, "GAMES_PLAYED"] == 2
+    assert np.isnan(out.loc[3, "FORM_NET"])
+
+
+def test_group_output_is_validated(tmp_path: Path):
+    def broken(games: pd.DataFrame) -> pd.DataFrame:
+        return games[["GAME_ID"]]
+
+    store = FeatureStore(str(tmp_path))
+    store.register(FeatureGroup("broken", "team", broken))
+    with pytest.raises(KeyError):
+        store.materialize("broken", _games())
+
+
+def test_player_form_skips_dnp_lines():
+    lines = pd.DataFrame(
+        {
+            "GAME_ID": [1, 2, 3],
+            "PLAYER_ID": [7, 7, 7],
+            "TEAM_ID": [10, 10, 10],
+            "GAME_DATE_EST": ["2019-11-01", "2019-11-03", "2019-11-05"],
+            "MIN": ["30:00", None, "20:00"],
+            "PTS": [20, np.nan, 10],
+            "OREB": [1, np.nan, 1],
+            "DREB": [4, np.nan, 2],
+            "AST": [5, np.nan, 3],
+        }
+    )
+    form = player_form_features(lines, window=5).set_index("GAME_ID")
+    assert form["FORM_PTS"].tolist() == [20.0, 20.0, 15.0]
+    assert form.loc[3, "FORM_MIN"] == 25.0
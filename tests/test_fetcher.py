@@ -0,0 +1,120 @@
+import types
+
+import requests
+
+from packages.tools.web import fetcher as fetcher_module
+from packages.tools.web.fetcher import HybridFetcher
+
+STATIC = (
+    "<html><head><title>Match</title></head><body><table id='box'>"
+    + "<tr><td>LeBron James</td><td>31 pts</td></tr>" * 5
+    + "</table></body></html>"
+)
+SPA = (
+    "<html><body><div id='root'></div>"
+    "<script src='/app.js'></script></body></html>"
+)
+
+
+class _Session:
+    """Session factice : une réponse HTML par URL."""
+
+    def __init__(self, pages: dict[str, str]):
+        self.pages = pages
+        self.headers = {}
+        self.calls = []
+
+    def get(self, url, timeout=None):
+        self.calls.append(url)
+        return types.SimpleNamespace(
+            ok=url in self.pages,
+            text=self.pages.get(url, ""),
+            headers={"Content-Type": "text/html; charset=utf-8"},
+        )
+
+    def close(self):
+        pass
+
+
+def test_needs_rendering_heuristics():
+    fetcher = HybridFetcher(session=_Session({}))
+    assert fetcher.needs_rendering(STATIC) is None
+    assert fetcher.needs_rendering("  ") == "empty"
+    assert fetcher.needs_rendering(SPA) == "spa"
+    assert fetcher.needs_rendering("<p>Loading…</p>") == "text"
+
+
+def test_noscript_notice_of_a_static_page():
+    fetcher = HybridFetcher(session=_Session({}))
+    notice = "<noscript>Please enable JavaScript</noscript>"
+    # Page statique avec un avis <noscript> : pas de rendu
+    static = STATIC.replace("<body>", "<body>" + notice)
+    assert fetcher.needs_rendering(static) is None
+    spa = SPA.replace("<script", notice + "<script")
+    assert fetcher.needs_rendering(spa) == "spa"
+
+
+def test_html_without_charset_is_not_read_as_latin1():
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = "text/html"
+    response._content = STATIC.replace("31 pts", "été").encode("utf-8")
+    # Comme l'adaptateur HTTP : ISO-8859-1 par défaut pour text/*
+    response.encoding = requests.utils.get_encoding_from_headers(
+        response.headers
+    )
+    session = _Session({})
+    session.get = lambda url, timeout=None: response
+
+    result = HybridFetcher(session=session).fetch("https://a.org/")
+    assert "été" in result.html
+
+
+def test_static_pages_skip_the_browser(monkeypatch):
+    rendered = []
+    monkeypatch.setattr(
+        fetcher_module.WebUtils,
+        "fetch_page_with_playwright",
+        lambda page, url, wait_until: rendered.append(url) or STATIC,
+    )
+    session = _Session({"https://a.org/1": STATIC, "https://a.org/2": SPA})
+    fetcher = HybridFetcher(session=session)
+
+    result = fetcher.fetch("https://a.org/1", page=object())
+    assert not result.rendered
+    assert result.html == STATIC
+
+    result = fetcher.fetch("https://a.org/2", page=object())
+    assert result.rendered
+    assert result.reason == "spa"
+    # Erreur HTTP : rendu navigateur
+    assert fetcher.fetch("https://a.org/404", page=object()).rendered
+    assert rendered == ["https://a.org/2", "https://a.org/404"]
+    assert fetcher.stats == {"http": 1, "rendered": 2, "learned": 0}
+
+
+def test_hosts_needing_the_browser_are_learned(monkeypatch):
+    monkeypatch.setattr(
+        fetcher_module.WebUtils,
+        "fetch_page_with_playwright",
+        lambda page, url, wait_until: STATIC,
+    )
+    session = _Session({f"https://spa.org/{i}": SPA for i in range(5)})
+    fetcher = HybridFetcher(learn_after=2, session=session)
+    for i in range(5):
+        fetcher.fetch(f"https://spa.org/{i}", page=object())
+
+    # Après 2 pages rendues, plus de GET HTTP pour cet hôte
+    assert session.calls == ["https://spa.org/0", "https://spa.org/1"]
+    assert fetcher.renders_host("spa.org")
+    assert fetcher.stats["learned"] == 1
+
+
+def test_expected_selectors():
+    fetcher = HybridFetcher(
+        expected_selectors=["table#box"], session=_Session({})
+    )
+    assert fetcher.needs_rendering(STATIC) is None
+    assert (
+        fetcher.needs_rendering(STATIC.replace("id='box'", "")) == "selector"
+    )
@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+
+from packages.preprocessing.memory import MemoryOptimizer, parse_minutes
+
+
+def _frame() -> pd.DataFrame:
+    n = 1000
+    return pd.DataFrame(
+        {
+            "GAME_ID": np.arange(22000000, 22000000 + n, dtype=np.int64),
+            "Quarter": np.tile([1, 2, 3, 4], n // 4).astype(np.int64),
+            "PTS": np.tile([10.0, np.nan], n // 2),
+            "REB": np.tile([4.0, 7.0], n // 2),
+            "FG_PCT": np.tile([0.35, 0.512], n // 2),
+            "MIN": np.tile(["30:30", None], n // 2),
+            "TEAM_ABBREVIATION": np.tile(["ATL", "BOS"], n // 2),
+            "PLAYER_NAME": [f"Player {i}" for i in range(n)],
+            "HomePlay": np.tile(["A. B makes 2-pt layup", None], n // 2),
+        }
+    )
+
+
+def test_optimize_downcasts_without_changing_values():
+    frame = _frame()
+    out = MemoryOptimizer().optimize(frame)
+
+    assert out["GAME_ID"].dtype == np.int32
+    assert out["Quarter"].dtype == np.int8
+    # Entiers avec NaN : float32 exact ; sans NaN : entier
+    assert out["PTS"].dtype == np.float32
+    assert out["REB"].dtype == np.int8
+    # 0.35 n'est pas exact en float32
+    assert out["FG_PCT"].dtype == np.float64
+    assert out["TEAM_ABBREVIATION"].dtype == "category"
+    assert out["PLAYER_NAME"].dtype != "category"
+    assert out["HomePlay"].dtype == frame["HomePlay"].dtype
+
+    assert out["MIN"].iloc[0] == 1830
+    assert np.isnan(out["MIN"].iloc[1])
+    for col in ["GAME_ID", "Quarter", "PTS", "REB", "FG_PCT"]:
+        np.testing.assert_array_equal(
+            out[col].to_numpy(dtype=np.float64),
+            frame[col].to_numpy(dtype=np.float64),
+        )
+    assert (out["TEAM_ABBREVIATION"] == frame["TEAM_ABBREVIATION"]).all()
+    # Le frame d'origine n'est pas modifié
+    assert frame["GAME_ID"].dtype == np.int64
+
+
+def test_report_and_profile():
+    frame = _frame()
+    optimizer = MemoryOptimizer()
+    out = optimizer.optimize(frame)
+
+    report = optimizer.report(frame, out).set_index("column")
+    assert report.loc["GAME_ID", "factor"] == 2.0
+    total = report.loc["TOTAL"]
+    assert total["bytes_after"] < total["bytes_before"]
+    assert (
+        total["bytes_before"]
+        == frame.memory_usage(deep=True, index=False).sum()
+    )
+
+    profile = optimizer.profile(frame).set_index("column")
+    assert profile.loc["Quarter", "max"] == 4
+    assert profile.loc["Quarter", "target"] == "int8"
+    assert profile.loc["PTS", "nulls"] == 500
+
+
+def test_out_of_range_values_keep_their_type():
+    frame = pd.DataFrame(
+        {
+            "BIG": np.array([0, 2**40], dtype=np.int64),
+            "FRACTION": [0.1, 0.2],
+            "MIXED": ["a", 1],
+        }
+    )
+    out = MemoryOptimizer().optimize(frame)
+    assert out.dtypes.equals(frame.dtypes)
+
+
+def test_parse_minutes_handles_formats():
+    values = pd.Series(["30:30", "12", "34.000000:12", None])
+    seconds = parse_minutes(values)
+    assert seconds.iloc[:3].tolist() == [1830.0, 720.0, 2052.0]
+    assert np.isnan(seconds.iloc[3])
@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+
+from packages.preprocessing.dimensions import DimensionTables
+from packages.preprocessing.name_resolution import (
+    PlayerNameIndex,
+    normalize_name,
+)
+
+BKN, BOS = 1610612751, 1610612738
+
+
+def _index() -> PlayerNameIndex:
+    roster = pd.DataFrame(
+        {
+            "PLAYER_ID": [1, 2, 3, 4, 5, 6],
+            "PLAYER_NAME": [
+                "Kyrie Irving",
+                "Jaylen Brown",
+                "Bruce Brown",
+                "Nikola Vučević",
+                "Gary Trent Jr.",
+                "Bobby Brown",
+            ],
+            "TEAM_ID": [BKN, BOS, BKN, BOS, BOS, BOS],
+            "SEASON": [2019] * 6,
+        }
+    )
+    return PlayerNameIndex(roster)
+
+
+def test_normalize_name():
+    assert normalize_name("Nikola Vučević") == ("nikola vucevic", "n vucevic")
+    assert normalize_name("G. Trent - trentga02") == ("g trent", "g trent")
+    assert normalize_name("Gary Trent Jr.") == ("gary trent", "g trent")
+    assert normalize_name("J.J. Redick")[1] == "j redick"
+
+
+def test_resolve_by_team_then_season_then_fuzzy():
+    index = _index()
+    # Deux "B. Brown" la même saison : l'équipe lève l'ambiguïté
+    assert index.resolve("B. Brown", BKN, 2019) == (3, "team")
+    assert index.resolve("J. Brown", BOS, 2019) == (2, "team")
+    assert index.resolve("K. Irving", -1, 2019) == (1, "season")
+    assert index.resolve("N. Vucevic", BOS, 2019) == (4, "team")
+    assert index.resolve("N. Vucevich", BOS, 2019) == (4, "fuzzy")
+    assert index.resolve("Unknown Player", BOS, 2019) == (-1, None)
+    assert index.resolve("B. Brown", -1, 2019) == (-1, None)
+
+
+def test_resolve_many_without_any_name():
+    ids, methods = _index().resolve_many(
+        pd.Series([None, None], dtype=object), seasons=np.full(2, 2019)
+    )
+    assert ids.tolist() == [-1, -1]
+    assert methods.tolist() == [None, None]
+
+
+def test_link_adds_ids_and_reports_unresolved():
+    dimensions = DimensionTables()
+    dimensions.update(
+        teams=pd.DataFrame(
+            {"TEAM_ID": [BKN, BOS], "ABBREVIATION": ["BKN", "BOS"]}
+        )
+    )
+    pbp = pd.DataFrame(
+        {
+            "Date": ["October 22 2019"] * 3,
+            "HomeTeam": ["BRK"] * 3,
+            "AwayTeam": ["BOS"] * 3,
+            "HomePlay": ["play", None, "play"],
+            "AwayPlay": [None, "play", None],
+            "Shooter": ["B. Brown - brownbr01", "J. Brown", "X. Nobody"],
+            "Blocker": [None, "K. Irving", None],
+            "Rebounder": [None, None, "Team"],
+        }
+    )
+    linked, report = _index().link(pbp, dimensions)
+
+    # Le contreur de l'action visiteuse joue pour l'équipe à domicile
+    assert linked["Shooter_ID"].tolist() == [3, 2, -1]
+    assert linked["Blocker_ID"].tolist() == [-1, 1, -1]
+    assert linked["Rebounder_ID"].tolist() == [-1, -1, -1]
+    assert report["name"].tolist() == ["X. Nobody"]
+
+    # Match de la bulle d'Orlando : effectifs de la saison 2019
+    pbp["Date"] = "August 14 2020"
+    bubble, _ = _index().link(pbp, dimensions)
+    assert bubble["Shooter_ID"].tolist() == [3, 2, -1]
+    dated, _ = _index().link(pbp.assign(Date="2021-01-05"), dimensions, 2019)
+    assert dated["Shooter_ID"].tolist() == [3, 2, -1]
@@ -0,0 +1,165 @@
+import sys
+import threading
+import time
+import types
+
+import pytest
+
+from packages.tools.web.frontier import CrawlFrontier
+from packages.tools.web.page_pool import PagePool
+
+BASE = "https://www.example.com"
+
+
+class _FakePage:
+    def __init__(self):
+        self.closed = False
+
+    def on(self, event, callback):
+        pass
+
+    def is_closed(self):
+        return self.closed
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeContext:
+    def new_page(self):
+        return _FakePage()
+
+    def close(self):
+        pass
+
+
+class _FakeBrowser:
+    def __init__(self):
+        self.connected = True
+
+    def new_context(self, **options):
+        return _FakeContext()
+
+    def is_connected(self):
+        return self.connected
+
+    def close(self):
+        pass
+
+
+class _FakePlaywright:
+    def __init__(self):
+        self.chromium = types.SimpleNamespace(
+            launch=lambda **options: _FakeBrowser()
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+@pytest.fixture
+def fake_playwright(monkeypatch):
+    # Navigateur factice : seule la logique du pool est testée
+    module = types.ModuleType("playwright.sync_api")
+    module.sync_playwright = _FakePlaywright
+    monkeypatch.setitem(sys.modules, "playwright", types.ModuleType("p"))
+    monkeypatch.setitem(sys.modules, "playwright.sync_api", module)
+
+
+def test_crawl_renders_pages_concurrently(fake_playwright):
+    frontier = CrawlFrontier(max_depth=2)
+    frontier.push(f"{BASE}/")
+    lock = threading.Lock()
+    active = {"now": 0, "max": 0}
+    crawled = []
+
+    def handler(page, item):
+        with lock:
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+            crawled.append(item.url)
+        time.sleep(0.02)
+        with lock:
+            active["now"] -= 1
+        if item.depth == 2:
+            return set()
+        return {f"{item.url}{i}/" for i in range(3)}
+
+    pages = PagePool(size=4).crawl(frontier, handler)
+
+    # 1 + 3 + 9 pages, chacune une seule fois
+    assert pages == 13
+    assert len(set(crawled)) == 13
+    assert active["max"] > 1
+
+
+def test_crawl_limits_pages_per_host_and_recycles(fake_playwright):
+    frontier = CrawlFrontier()
+    frontier.push_many(f"{BASE}/{i}" for i in range(10))
+    frontier.push("https://other.example.org/")
+    lock = threading.Lock()
+    active = {}
+    peak = {}
+    errors = []
+
+    def handler(page, item):
+        with lock:
+            active[item.host] = active.get(item.host, 0) + 1
+            peak[item.host] = max(peak.get(item.host, 0), active[item.host])
+        time.sleep(0.01)
+        with lock:
+            active[item.host] -= 1
+        if item.url.endswith("/3"):
+            page.close()
+            raise RuntimeError("crash")
+        return set()
+
+    pool = PagePool(size=4, max_per_host=2)
+    pages = pool.crawl(
+        frontier,
+        handler,
+        max_pages=8,
+        on_error=lambda item, err: errors.append(item.url),
+    )
+
+    assert pages == 8
+    assert peak["www.example.com"] <= 2
+    assert errors == [f"{BASE}/3"]
+    assert pool.recycled == 1
+
+
+def test_recycled_pages_survive_a_browser_restart(
+    fake_playwright, monkeypatch
+):
+    frontier = CrawlFrontier()
+    frontier.push_many(f"{BASE}/{i}" for i in range(3))
+    browsers = []
+
+    def handler(page, item):
+        if item.url.endswith("/0"):
+            raise RuntimeError("crash")
+        if item.url.endswith("/1"):
+            # Le navigateur meurt après la page recyclée
+            browsers[-1].connected = False
+        return set()
+
+    def launch(**options):
+        browsers.append(_FakeBrowser())
+        return browsers[-1]
+
+    monkeypatch.setattr(
+        _FakePlaywright,
+        "__init__",
+        lambda self: setattr(
+            self, "chromium", types.SimpleNamespace(launch=launch)
+        ),
+    )
+    pool = PagePool(size=1)
+    pages = pool.crawl(frontier, handler, on_error=lambda item, err: None)
+
+    assert pages == 2
+    assert len(browsers) == 2
+    assert pool.recycled == 1
@@ -0,0 +1,121 @@
+from pathlib import Path
+
+import pandas as pd
+
+from packages.preprocessing.pbp_storage import PbpStore
+
+
+def _pbp() -> pd.DataFrame:
+    rows = []
+    games = [
+        ("/g1", "BOS", "NYK"),
+        ("/g2", "NYK", "LAL"),
+        ("/g3", "LAL", "BOS"),
+    ]
+    for url, home, away in games:
+        for quarter in (1, 2, 3, 4):
+            for sec_left in (600, 300, 10):
+                rows.append(
+                    {
+                        "URL": url,
+                        "Date": "January 5 2020",
+                        "Quarter": quarter,
+                        "SecLeft": sec_left,
+                        "HomeTeam": home,
+                        "AwayTeam": away,
+                        "HomePlay": "A. B makes 2-pt layup from 1 ft",
+                        "AwayPlay": None,
+                    }
+                )
+    return pd.DataFrame(rows)
+
+
+def test_read_filters_and_returns_each_event_once(tmp_path: Path):
+    store = PbpStore(str(tmp_path), row_group_size=6)
+    assert store.write(_pbp()) == [2019]
+    assert store.seasons() == [2019]
+
+    everything = store.read()
+    assert len(everything) == 36
+    assert everything["EventType"].eq("shot").all()
+
+    bos = store.read(teams=["BOS"], quarters=[4], sec_left=(0, 60))
+    assert sorted(bos["URL"]) == ["/g1", "/g3"]
+    # Le match BOS-NYK n'est lu qu'une fois avec deux équipes demandées
+    both = store.read(teams=["BOS", "NYK"])
+    assert len(both) == 36
+    assert store.read(seasons=[2018], columns=["URL"]).empty
+
+    game = store.read(games=["/g2"], columns=["URL", "Quarter", "SecLeft"])
+    assert len(game) == 12
+    assert game["SecLeft"].tolist()[:3] == [600, 300, 10]
+
+
+def test_scan_stats_skip_partitions_and_row_groups(tmp_path: Path):
+    store = PbpStore(str(tmp_path), row_group_size=6)
+    store.write(_pbp())
+
+    stats = store.scan_stats(teams=["BOS"], quarters=[4])
+    assert (stats["files"], stats["files_read"]) == (3, 1)
+    # Seuls les groupes de lignes du 4e quart-temps sont lus
+    assert stats["row_groups_read"] < stats["row_groups"] / 3
+
+
+def test_convert_csv_skips_unchanged_files(tmp_path: Path):
+    csv_file = tmp_path / "2019-20_pbp.csv"
+    _pbp().to_csv(csv_file, index=False)
+    store = PbpStore(str(tmp_path / "store"))
+
+    assert store.convert_csv(str(csv_file))
+    assert not store.convert_csv(str(csv_file))
+    assert store.convert_csv(str(csv_file), refresh=True)
+
+
+def test_sources_sharing_a_season_are_replaced_separately(tmp_path: Path):
+    pbp = _pbp()
+    g1, g2, g3 = (pbp[pbp["URL"] == url] for url in ("/g1", "/g2", "/g3"))
+    first = pd.concat(
+        [
+            g1.assign(Date="2020-03-01"),
+            g2.assign(URL="/bubble", Date="2020-10-11"),
+        ]
+    )
+    store = PbpStore(str(tmp_path))
+
+    assert store.write(first, source="a") == [2019]
+    assert store.write(g3.assign(Date="2020-12-22"), source="b") == [2020]
+    store.write(g3.assign(URL="/g4", Date="2020-02-01"), source="c")
+    assert store.write(first, source="a") == [2019]
+    # La réécriture de "a" garde les matchs des autres sources
+    assert sorted(store.read()["URL"].unique()) == [
+        "/bubble",
+        "/g1",
+        "/g3",
+        "/g4",
+    ]
+    assert store.read(seasons=[2019])["URL"].nunique() == 3
+
+
+def test_convert_csv_takes_the_season_of_the_file_name(tmp_path: Path):
+    pbp = _pbp()
+    for name, url, date in (
+        ("2019-20_pbp.csv", "/g1", "2020-03-01"),
+        ("2019-20_pbp.csv", "/g3", "2020-10-11"),
+        ("2020-21_pbp.csv", "/g2", "2020-12-22"),
+    ):
+        games = pbp[pbp["URL"] == url].assign(Date=date)
+        csv_file = tmp_path / name
+        games.to_csv(
+            csv_file, mode="a", header=not csv_file.exists(), index=False
+        )
+    store = PbpStore(str(tmp_path / "store"))
+
+    store.convert_csv(str(tmp_path / "2019-20_pbp.csv"))
+    store.convert_csv(str(tmp_path / "2020-21_pbp.csv"))
+    store.convert_csv(str(tmp_path / "2019-20_pbp.csv"), refresh=True)
+    urls = store.read(columns=["URL", "SEASON"]).drop_duplicates()
+    assert urls.sort_values("URL").values.tolist() == [
+        ["/g1", 2019],
+        ["/g2", 2020],
+        ["/g3", 2019],
+    ]
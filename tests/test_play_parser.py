@@ -0,0 +1,84 @@
+import pandas as pd
+
+from packages.preprocessing.play_parser import OUTPUT_COLUMNS, PlayTextParser
+
+PLAYS = [
+    "L. James makes 2-pt layup from 1 ft (assist by K. Irving)",
+    "S. Curry misses 3-pt jump shot from 26 ft (block by D. Green)",
+    "A. Davis makes 2-pt dunk at rim",
+    "J. Harden makes free throw 1 of 2",
+    "J. Harden misses technical free throw",
+    "Defensive rebound by Team",
+    "Turnover by L. James (bad pass; steal by S. Curry)",
+    "Turnover by Team (shot clock)",
+    "Shooting foul by D. Green (drawn by L. James)",
+    "Violation by Team (delay of game)",
+    "K. Love enters the game for T. Thompson",
+    "Jump ball: J. Embiid vs. A. Drummond (B. Simmons gains possession)",
+    "Cleveland full timeout",
+    "Start of 1st quarter",
+    None,
+]
+
+
+def test_parse_extracts_typed_fields():
+    parsed = PlayTextParser().parse(pd.Series(PLAYS))
+
+    assert list(parsed.columns[: len(OUTPUT_COLUMNS)]) == OUTPUT_COLUMNS
+    first = parsed.iloc[0]
+    assert (first["Shooter"], first["Assister"]) == ("L. James", "K. Irving")
+    assert (first["ShotType"], first["ShotOutcome"]) == ("2-pt layup", "make")
+    assert first["ShotDist"] == 1
+    assert parsed.loc[1, "Blocker"] == "D. Green"
+    assert parsed.loc[2, "ShotDist"] == 0
+    assert parsed.loc[3, "FreeThrowNum"] == "1 of 2"
+    assert parsed.loc[4, "FreeThrowOutcome"] == "miss"
+    assert pd.isna(parsed.loc[4, "FreeThrowNum"])
+    assert parsed.loc[5, "ReboundType"] == "defensive"
+    assert parsed.loc[6, "TurnoverCause"] == "steal"
+    assert parsed.loc[6, "TurnoverCauser"] == "S. Curry"
+    assert parsed.loc[7, "TurnoverType"] == "shot clock"
+    assert parsed.loc[8, "FoulType"] == "shooting"
+    assert parsed.loc[8, "Fouled"] == "L. James"
+    assert parsed.loc[9, "ViolationType"] == "delay of game"
+    assert (parsed.loc[10, "EnterGame"], parsed.loc[10, "LeaveGame"]) == (
+        "K. Love",
+        "T. Thompson",
+    )
+    assert parsed.loc[11, "JumpballPoss"] == "B. Simmons"
+    assert parsed.loc[12, "TimeoutTeam"] == "Cleveland"
+    assert parsed.iloc[13:].drop(columns="PlayCategory").isna().all().all()
+    assert parsed["ShotDist"].dtype.kind == "f"
+    assert isinstance(parsed["ShotType"].dtype, pd.CategoricalDtype)
+
+
+def test_parse_events_and_memoization():
+    parser = PlayTextParser(max_cache_size=100)
+    pbp = pd.DataFrame(
+        {
+            "HomePlay": [PLAYS[0], None, PLAYS[0]],
+            "AwayPlay": [None, PLAYS[5], None],
+        },
+        index=[10, 11, 12],
+    )
+    events = parser.parse_events(pbp)
+
+    assert parser.cache_size == 2
+    assert events.loc[12, "Shooter"] == "L. James"
+    assert events.loc[11, "Rebounder"] == "Team"
+
+    parser.parse(pd.Series(PLAYS))
+    assert parser.cache_size == len(PLAYS) - 1
+
+
+def test_parse_with_more_texts_than_the_cache_holds():
+    parser = PlayTextParser(max_cache_size=3)
+    shots = pd.Series(
+        [f"L. James makes 2-pt layup from {dist} ft" for dist in range(6)]
+    )
+    parsed = parser.parse(shots)
+
+    # Les textes évincés pendant l'appel restent analysés
+    assert parsed["Shooter"].eq("L. James").all()
+    assert parsed["ShotDist"].tolist() == list(range(6))
+    assert parser.cache_size == 3
@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+
+from packages.features.possessions import PossessionBuilder
+
+PBP_COLUMNS = [
+    "URL",
+    "Quarter",
+    "SecLeft",
+    "HomeTeam",
+    "AwayTeam",
+    "HomePlay",
+    "AwayPlay",
+    "HomeScore",
+    "AwayScore",
+    "Shooter",
+    "ShotOutcome",
+    "Rebounder",
+    "ReboundType",
+    "FreeThrowShooter",
+    "FreeThrowNum",
+    "TurnoverType",
+]
+
+
+def _event(quarter, sec_left, side, home, away, **fields):
+    row = dict.fromkeys(PBP_COLUMNS)
+    row.update(
+        URL="/g1",
+        Quarter=quarter,
+        SecLeft=sec_left,
+        HomeTeam="BOS",
+        AwayTeam="NYK",
+        HomeScore=home,
+        AwayScore=away,
+    )
+    row["HomePlay" if side == "home" else "AwayPlay"] = "play"
+    row.update(fields)
+    return row
+
+
+def _pbp() -> pd.DataFrame:
+    rows = [
+        # Panier + faute + lancer franc 1 of 1 : une seule possession
+        _event(1, 700, "home", 2, 0, Shooter="A", ShotOutcome="make"),
+        _event(1, 700, "away", 2, 0),
+        _event(1, 700, "home", 3, 0, FreeThrowShooter="A", FreeThrowNum="1"),
+        # Tir raté, rebond offensif puis panier : même possession
+        _event(1, 680, "away", 3, 0, Shooter="B", ShotOutcome="miss"),
+        _event(1, 678, "away", 3, 0, Rebounder="B", ReboundType="offensive"),
+        _event(1, 675, "away", 3, 2, Shooter="B", ShotOutcome="make"),
+        # Perte de balle domicile
+        _event(1, 660, "home", 3, 2, TurnoverType="bad pass"),
+        # Nouvelle période : nouvelle possession même si même attaque
+        _event(2, 710, "away", 3, 2, Shooter="B", ShotOutcome="miss"),
+        _event(2, 705, "home", 3, 2, Rebounder="A", ReboundType="defensive"),
+    ]
+    frame = pd.DataFrame(rows, columns=PBP_COLUMNS)
+    # Ordre d'origine mélangé : le builder doit retrier
+    return frame.iloc[[3, 0, 1, 2, 4, 5, 8, 6, 7]]
+
+
+def test_annotate_assigns_possessions():
+    events = PossessionBuilder().annotate(_pbp())
+
+    assert events["POSS_ID"].tolist() == [0, 0, 0, 1, 1, 1, 2, 3, 4]
+    assert events["OFF_TEAM"].tolist()[:3] == ["BOS"] * 3
+    assert events["DEF_TEAM"].iloc[3] == "BOS"
+
+
+def test_possessions_summary():
+    _, poss = PossessionBuilder().build(_pbp())
+
+    assert poss["PTS"].tolist() == [3.0, 2.0, 0.0, 0.0, 0.0]
+    assert poss["OFF_TEAM"].tolist() == ["BOS", "NYK", "BOS", "NYK", "BOS"]
+    # Enchaînement des bornes temporelles dans une même période
+    assert poss["START_SECLEFT"].tolist() == [720, 700, 675, 720, 710]
+    assert poss["END_SECLEFT"].tolist() == [700, 675, 0, 710, 0]
+    assert np.allclose(poss["DURATION"], [20, 25, 675, 10, 710])
+    assert poss["START_TIME"].iloc[3] == 720
@@ -0,0 +1,61 @@
+from pathlib import Path
+
+import pandas as pd
+
+from packages.preprocessing.query_engine import QueryEngine, table_name
+
+
+def _write_data(root: Path) -> tuple[Path, Path]:
+    raw, processed = root / "raw", root / "processed"
+    raw.mkdir()
+    processed.mkdir()
+    pd.DataFrame({"GAME_ID": [1, 2, 3], "PTS_home": [100, 90, 110]}).to_csv(
+        raw / "games.csv", index=False
+    )
+    for season, dist in (("2019-20", [1, 25]), ("2020-21", [3, 0])):
+        pd.DataFrame(
+            {"URL": ["/a", "/b"], "Shooter": ["x", "y"], "ShotDist": dist}
+        ).to_csv(raw / f"{season}_pbp.csv", index=False)
+    pd.DataFrame({"TEAM_ID": [1, 2]}).to_csv(raw / "teams.csv", index=False)
+    pd.DataFrame({"TEAM_ID": [1, 2, 3]}).to_parquet(raw / "teams.parquet")
+    group_dir = processed / "feature_store" / "team_form" / "v=abc"
+    group_dir.mkdir(parents=True)
+    pd.DataFrame({"TEAM_ID": [1], "FORM_WIN": [0.5]}).to_parquet(
+        group_dir / "season=2019.parquet"
+    )
+    return raw, processed
+
+
+def test_table_name():
+    assert table_name("games_details") == "games_details"
+    assert table_name("2019-20_pbp") == "t_2019_20_pbp"
+
+
+def test_datasets_are_registered_and_queried(tmp_path: Path):
+    raw, processed = _write_data(tmp_path)
+    with QueryEngine([str(raw), str(processed)], threads=2) as engine:
+        tables = engine.tables().set_index("table")
+        assert sorted(tables.index) == [
+            "feature_store",
+            "games",
+            "pbp",
+            "teams",
+        ]
+        # Le Parquet remplace le CSV du même nom
+        assert tables.loc["teams", "format"] == "parquet"
+        assert engine.query("SELECT count(*) AS n FROM teams").n[0] == 3
+
+        # Les saisons pbp forment une seule table
+        shots = engine.query(
+            "SELECT count(*) AS n, max(ShotDist) AS d FROM pbp"
+        )
+        assert (shots.n[0], shots.d[0]) == (4, 25)
+
+        games = engine.query(
+            "SELECT GAME_ID FROM games WHERE PTS_home > $pts", {"pts": 95}
+        )
+        assert games["GAME_ID"].tolist() == [1, 3]
+
+        features = engine.query("SELECT * FROM feature_store")
+        assert features.loc[0, "v"] == "abc"
+        assert "Projections" in engine.explain("SELECT Shooter FROM pbp")
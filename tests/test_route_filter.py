@@ -0,0 +1,96 @@
+import types
+
+from packages.tools.web.route_filter import TYPICAL_BYTES, RouteFilter
+
+
+class _Page:
+    """Page factice : garde le handler de route enregistré."""
+
+    def __init__(self):
+        self.main_frame = object()
+        self.handler = None
+
+    def route(self, pattern, handler):
+        self.handler = handler
+
+    def on(self, event, callback):
+        pass
+
+
+class _Route:
+    def __init__(self, page, url, resource_type, navigation=False):
+        self.request = types.SimpleNamespace(
+            url=url,
+            resource_type=resource_type,
+            frame=page.main_frame,
+            is_navigation_request=lambda: navigation,
+        )
+        self.outcome = None
+
+    def continue_(self):
+        self.outcome = "continue"
+
+    def fulfill(self, **kwargs):
+        self.outcome = "fulfill"
+
+    def abort(self, error_code=None):
+        self.outcome = "abort"
+
+
+def test_decide():
+    route_filter = RouteFilter(block_third_party=True, allowed_hosts=["cdn"])
+    page_host = "www.nba.com"
+    assert route_filter.decide("https://x.org/", "document", page_host) is None
+    assert route_filter.decide("https://www.nba.com/a.png", "image") == "block"
+    assert (
+        route_filter.decide("https://www.nba.com/s.css", "stylesheet")
+        == "stub"
+    )
+    assert (
+        route_filter.decide(
+            "https://www.google-analytics.com/analytics.js", "script"
+        )
+        == "block"
+    )
+    assert (
+        route_filter.decide("https://www.nba.com/app.js", "script", page_host)
+        is None
+    )
+    assert (
+        route_filter.decide("https://other.org/app.js", "script", page_host)
+        == "block"
+    )
+    assert (
+        route_filter.decide("https://cdn/app.js", "script", page_host) is None
+    )
+    # Sans hôte de page connu, pas de filtrage tiers
+    assert route_filter.decide("https://other.org/app.js", "script") is None
+
+
+def test_routes_are_counted_per_page():
+    route_filter = RouteFilter(block_third_party=True)
+    page = _Page()
+    route_filter.attach(page)
+    requests = [
+        ("https://www.nba.com/games", "document", True),
+        ("https://www.nba.com/app.js", "script", False),
+        ("https://www.nba.com/logo.png", "image", False),
+        ("https://www.nba.com/site.css", "stylesheet", False),
+        ("https://ads.other.com/ad.js", "script", False),
+    ]
+    outcomes = []
+    for url, resource_type, navigation in requests:
+        route = _Route(page, url, resource_type, navigation)
+        page.handler(route)
+        outcomes.append(route.outcome)
+
+    assert outcomes == ["continue", "continue", "abort", "fulfill", "abort"]
+    stats = route_filter.take(page)
+    assert (stats.allowed, stats.blocked, stats.stubbed) == (2, 2, 1)
+    assert stats.by_type == {"image": 1, "stylesheet": 1, "script": 1}
+    assert stats.bytes_saved == sum(
+        TYPICAL_BYTES[t] for t in ("image", "stylesheet", "script")
+    )
+    # Compteurs remis à zéro, totaux conservés
+    assert route_filter.take(page).blocked == 0
+    assert route_filter.totals.blocked == 2
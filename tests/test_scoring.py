@@ -0,0 +1,95 @@
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from packages.models.scoring import (
+    FeatureState,
+    ScoringService,
+    request_scores,
+)
+from packages.models.train_model import (
+    FeatureConfig,
+    ModelTrainer,
+    build_features,
+    make_estimator,
+)
+
+
+def _view() -> pd.DataFrame:
+    rng = np.random.default_rng(1)
+    n = 240
+    home = rng.integers(0, 4, n) + 100
+    away = (home - 100 + rng.integers(1, 4, n)) % 4 + 100
+    home_pts = rng.integers(90, 120, n).astype(float)
+    away_pts = rng.integers(90, 120, n).astype(float)
+    view = pd.DataFrame(
+        {
+            "GAME_ID": np.arange(1, n + 1),
+            "GAME_DATE_EST": pd.Timestamp("2016-11-01")
+            + pd.to_timedelta(
+                np.arange(n) // 2 + 365 * (np.arange(n) // 60), "D"
+            ),
+            "SEASON": 2016 + np.arange(n) // 60,
+            "HOME_TEAM_ID": home,
+            "VISITOR_TEAM_ID": away,
+            "PTS_home": home_pts,
+            "PTS_away": away_pts,
+            "HOME_TEAM_WINS": (home_pts > away_pts).astype(int),
+        }
+    )
+    for side in ("HOME", "AWAY"):
+        for col in ("G", "W", "L", "HOME_W", "HOME_L", "ROAD_W", "ROAD_L"):
+            view[f"{side}_STD_{col}"] = np.nan
+        view[f"{side}_STD_W_PCT"] = np.nan
+    return view
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        FeatureConfig(form_window=5),
+        FeatureConfig(form_window=5, min_season=2018),
+    ],
+)
+def test_state_features_match_training_features(config: FeatureConfig):
+    view = _view()
+    expected = build_features(view, config).iloc[-1]
+
+    # Le dernier match est traité comme un match à venir
+    state = FeatureState(view.iloc[:-1], config)
+    upcoming = view.iloc[[-1]].drop(columns=["PTS_home", "PTS_away"])
+    actual = state.features(upcoming).iloc[0]
+
+    for col in actual.index:
+        if np.isnan(expected[col]):
+            assert np.isnan(actual[col]), col
+        else:
+            assert np.isclose(actual[col], expected[col]), col
+
+
+def test_service_scores_batches_over_socket(tmp_path: Path):
+    view = _view()
+    trainer = ModelTrainer(str(tmp_path / "cache"), str(tmp_path / "runs"))
+    run_dir = trainer.train(view, make_estimator("logistic"), "run", n_folds=1)
+    service = ScoringService.from_run(str(run_dir), view)
+
+    games = view.iloc[-3:].copy()
+    games["GAME_ID"] += 1000
+    scored = service.score(games)
+    assert scored["PROB_HOME_WIN"].between(0, 1).all()
+    assert list(scored.columns[6:]) == service.columns
+
+    server = service.make_server(port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        response = request_scores(games, *server.server_address)
+    finally:
+        server.shutdown()
+        server.server_close()
+    probs = [p["PROB_HOME_WIN"] for p in response["predictions"]]
+    np.testing.assert_allclose(probs, scored["PROB_HOME_WIN"])
+    assert service.handle({"games": [{"GAME_ID": 1}]})["error"]
@@ -0,0 +1,125 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from packages.models import search
+from packages.models.search import HalvingSearch
+from packages.models.train_model import FeatureConfig, ModelTrainer
+
+SPACE = {"learning_rate": [0.05, 0.1, 0.3], "max_leaf_nodes": [7, 15, 31]}
+
+
+def _features(tmp_path: Path):
+    rng = np.random.default_rng(2)
+    n = 300
+    home_pts = rng.integers(90, 120, n).astype(float)
+    away_pts = rng.integers(90, 120, n).astype(float)
+    view = pd.DataFrame(
+        {
+            "GAME_ID": np.arange(n),
+            "GAME_DATE_EST": pd.Timestamp("2010-11-01")
+            + pd.to_timedelta(np.arange(n), "D"),
+            "SEASON": 2010 + np.arange(n) // 60,
+            "HOME_TEAM_ID": rng.integers(0, 4, n),
+            "VISITOR_TEAM_ID": rng.integers(4, 8, n),
+            "PTS_home": home_pts,
+            "PTS_away": away_pts,
+            "HOME_TEAM_WINS": (home_pts > away_pts).astype(int),
+        }
+    )
+    for side in ("HOME", "AWAY"):
+        for col in ("G", "W", "L", "HOME_W", "HOME_L", "ROAD_W", "ROAD_L"):
+            view[f"{side}_STD_{col}"] = rng.integers(0, 10, n)
+        view[f"{side}_STD_W_PCT"] = rng.random(n)
+    trainer = ModelTrainer(
+        str(tmp_path / "cache"),
+        str(tmp_path / "runs"),
+        FeatureConfig(include_elo=False),
+    )
+    return trainer.prepare(view)
+
+
+def test_successive_halving_promotes_best_and_resumes(
+    tmp_path: Path, monkeypatch
+):
+    features = _features(tmp_path)
+    journal = tmp_path / "search.jsonl"
+    kwargs = {
+        "resource": "max_iter",
+        "min_resource": 5,
+        "max_resource": 45,
+        "n_folds": 2,
+        "journal": str(journal),
+    }
+    halving = HalvingSearch(features, "gradient_boosting", SPACE, **kwargs)
+    results = halving.successive_halving(9)
+
+    assert results.groupby("budget").size().to_dict() == {5: 9, 15: 3, 45: 1}
+    best = halving.best()
+    assert best["max_iter"] == 45 and set(SPACE) < set(best)
+
+    # Une recherche relancée relit le journal sans réentraîner
+    def fail(*args, **kwargs):
+        raise AssertionError("trial re-run")
+
+    monkeypatch.setattr(search, "evaluate_fold", fail)
+    resumed = HalvingSearch(features, "gradient_boosting", SPACE, **kwargs)
+    pd.testing.assert_frame_equal(resumed.successive_halving(9), results)
+
+    with pytest.raises(ValueError):
+        HalvingSearch(
+            features, "gradient_boosting", SPACE, **{**kwargs, "eta": 2}
+        )
+
+
+def test_hyperband_over_season_budgets(tmp_path: Path):
+    features = _features(tmp_path)
+    hyperband = HalvingSearch(
+        features,
+        "logistic",
+        {"C": [0.1, 1.0, 10.0]},
+        resource="seasons",
+        min_resource=1,
+        max_resource=3,
+        n_folds=1,
+        n_jobs=2,
+    )
+    results = hyperband.hyperband()
+
+    assert sorted(results["bracket"].unique()) == [0, 1]
+    assert results["budget"].max() == 3
+    # Un budget d'une saison n'entraîne que sur la saison précédente
+    one_season = results[results["budget"] == 1]
+    assert (one_season["n_train"] == 60).all()
+
+
+def test_greater_is_better_metrics_are_ranked_descending(tmp_path: Path):
+    features = _features(tmp_path)
+    halving = HalvingSearch(
+        features,
+        "gradient_boosting",
+        SPACE,
+        min_resource=5,
+        max_resource=15,
+        n_folds=2,
+        metric="accuracy",
+    )
+    results = halving.successive_halving(9)
+
+    first_rung = results[results["budget"] == 5]
+    promoted = set(results.loc[results["budget"] == 15, "candidate"])
+    # Les candidats promus sont les plus précis du premier palier
+    kept = first_rung["candidate"].isin(promoted)
+    assert len(promoted) == 3
+    assert (
+        first_rung.loc[kept, "accuracy"].min()
+        >= first_rung.loc[~kept, "accuracy"].max()
+    )
+    assert halving.results()["accuracy"].iloc[0] == (
+        results.loc[results["budget"] == 15, "accuracy"].max()
+    )
+
+    with pytest.raises(ValueError):
+        HalvingSearch(features, "logistic", SPACE, metric="f1")
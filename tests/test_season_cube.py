@@ -0,0 +1,60 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from packages.features.season_cube import SeasonCube
+
+
+def _games() -> pd.DataFrame:
+    return pd.DataFrame({"GAME_ID": [1, 2, 3, 3], "SEASON": [2019] * 4})
+
+
+def _details() -> pd.DataFrame:
+    base = {col: [2, 4, 1] for col in ["FGM", "FTM", "OREB", "DREB"]}
+    base.update({col: [5, 8, 0] for col in ["FGA", "FTA"]})
+    base.update({col: [1, 1, 0] for col in ["FG3M", "AST", "STL", "BLK"]})
+    base.update({col: [2, 3, 0] for col in ["FG3A", "TO", "PF"]})
+    return pd.DataFrame(
+        {
+            "GAME_ID": [1, 2, 3],
+            "TEAM_ID": [100, 100, 100],
+            "PLAYER_ID": [7, 7, 8],
+            "MIN": ["30:30", "12", None],
+            "PTS": [7, 13, 2],
+            "PLUS_MINUS": [5, -3, np.nan],
+            **base,
+        }
+    )
+
+
+def test_update_is_incremental_and_rates_computed_on_read(tmp_path: Path):
+    details = _details()
+    cube = SeasonCube(str(tmp_path))
+    assert cube.update(details[details["GAME_ID"] <= 1], _games()) == 1
+    assert cube.update(details, _games()) == 2
+    assert cube.update(details, _games()) == 0
+
+    player = cube.player_season(7, 2019).iloc[0]
+    assert player["GP"] == 2
+    assert player["PTS"] == 20
+    assert player["MIN"] == (1830 + 720) / 60
+    assert player["FG_PCT"] == 6 / 13
+    assert player["PTS_PG"] == 10.0
+
+    # Joueur sans minutes : ligne conservée mais non comptée comme match
+    assert cube.player_season(8).iloc[0]["GP"] == 0
+    assert cube.team_season(100, 2019).iloc[0]["GP"] == 3
+    assert cube.player_season(999).empty
+
+
+def test_save_and_load_roundtrip(tmp_path: Path):
+    cube = SeasonCube(str(tmp_path))
+    cube.update(_details(), _games())
+    cube.save()
+
+    reloaded = SeasonCube(str(tmp_path)).load()
+    assert list(reloaded.game_ids) == [1, 2, 3]
+    pd.testing.assert_frame_equal(
+        reloaded.season_players(2019), cube.season_players(2019)
+    )
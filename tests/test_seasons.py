@@ -0,0 +1,24 @@
+import pandas as pd
+
+from packages.preprocessing.seasons import (
+    season_from_dates,
+    season_from_filename,
+)
+
+
+def test_season_from_dates():
+    dates = pd.Series(["2019-10-22", "2020-03-03", "2020-12-22"])
+    assert season_from_dates(dates).tolist() == [2019, 2019, 2020]
+    assert season_from_dates(["January 5 2020"]).tolist() == [2019]
+
+
+def test_bubble_games_stay_in_the_2019_season():
+    # Saison 2019-20 reprise en juillet 2020, finale le 11 octobre
+    dates = ["July 30 2020", "August 14 2020", "2020-10-11", "2021-07-20"]
+    assert season_from_dates(dates).tolist() == [2019, 2019, 2019, 2020]
+    assert season_from_dates(["2021-10-19"]).tolist() == [2021]
+
+
+def test_season_from_filename():
+    assert season_from_filename("data/raw/2019-20_pbp.csv") == 2019
+    assert season_from_filename("games.csv") is None
@@ -0,0 +1,63 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from packages.features.shot_index import ShotIndex
+
+
+def _pbp() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Date": ["March 3 2020"] * 5,
+            "HomeTeam": ["BOS"] * 5,
+            "AwayTeam": ["NYK"] * 5,
+            "HomePlay": ["x", "x", "x", None, None],
+            "Shooter": ["A", "A", "A", "B", None],
+            "ShotType": [
+                "2-pt layup",
+                "3-pt jump shot",
+                "3-pt jump shot",
+                "2-pt dunk",
+                None,
+            ],
+            "ShotOutcome": ["make", "make", "miss", "make", None],
+            "ShotDist": [1, 25, 26, np.nan, None],
+        }
+    )
+
+
+def test_profile_and_league_comparison():
+    index = ShotIndex()
+    assert index.add(_pbp()) == 4
+    assert index.seasons == [2019]
+
+    profile = index.profile("player", "A", by=("distance",))
+    assert profile.loc["0-3", "FGM"] == 1
+    assert profile.loc["24-30", "FGA"] == 2
+    assert profile.loc["24-30", "EFG_PCT"] == 0.75
+
+    total = index.profile("team", "BOS", seasons=(2018, 2020), by=())
+    assert total.iloc[0]["FGA"] == 3
+    assert total.iloc[0]["EFG_PCT"] == 2.5 / 3
+    # Distance manquante rangée dans le seau "n/a"
+    assert index.makes("team", "NYK", by=("distance",))["n/a"] == 1
+
+    compare = index.compare_to_league("player", "B", by=("value",))
+    assert compare.loc["2-pt", "LEAGUE_FGA"] == 2
+    assert compare.loc["2-pt", "FGA_SHARE"] == 1.0
+
+
+def test_reload_season_replaces_counts_and_roundtrip(tmp_path: Path):
+    index = ShotIndex()
+    index.add(_pbp(), season=2019)
+    index.add(_pbp(), season=2019)
+    assert index.attempts("player", by=()).iloc[0] == 4
+
+    filepath = tmp_path / "shots.npz"
+    index.save(str(filepath))
+    loaded = ShotIndex.load(str(filepath))
+    assert loaded.entities("team") == ["BOS", "NYK"]
+    pd.testing.assert_frame_equal(
+        loaded.profile("player", "A"), index.profile("player", "A")
+    )
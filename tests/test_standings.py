@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+
+from packages.features.standings import StandingsIndex, parse_record
+
+
+def _ranking() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "TEAM_ID": [1, 1, 1, 2, 2],
+            "STANDINGSDATE": [
+                "2020-01-01",
+                "2020-01-03",
+                "2020-01-02",
+                "2020-01-02",
+                "2020-01-02",
+            ],
+            "G": [1, 3, 2, 1, 2],
+            "W": [1, 2, 1, 0, 1],
+            "L": [0, 1, 1, 1, 1],
+            "W_PCT": [1.0, 0.667, 0.5, 0.0, 0.5],
+            "HOME_RECORD": ["1-0", "2-0", "1-0", "0-0", "1-0"],
+            "ROAD_RECORD": ["0-0", "0-1", "0-1", "0-1", None],
+        }
+    )
+
+
+def test_parse_record():
+    wins, losses = parse_record(pd.Series(["12-3", " 0-41", None, "x"]))
+    assert wins.tolist() == [12, 0, -1, -1]
+    assert losses.tolist() == [3, 41, -1, -1]
+
+
+def test_lookup_is_as_of_per_team():
+    index = StandingsIndex(_ranking())
+    assert len(index) == 4
+
+    result = index.lookup(
+        [1, 1, 1, 2, 3, 1],
+        [
+            "2020-01-03",
+            "2020-01-10",
+            "2020-01-01",
+            "2020-01-05",
+            "2020-01-05",
+            "2020-01-03",
+        ],
+    )
+    assert result["G"].iloc[:2].tolist() == [2, 3]
+    # Aucun classement avant le premier relevé, ni pour une équipe inconnue
+    assert np.isnan(result.loc[2, "G"]) and np.isnan(result.loc[4, "W"])
+    # Le dernier relevé d'un doublon (équipe, date) l'emporte
+    assert result.loc[3, "G"] == 2
+    assert np.isnan(result.loc[3, "ROAD_W"])
+    assert result.loc[1, "HOME_W"] == 2 and result.loc[1, "ROAD_L"] == 1
+    assert result.loc[0, "STANDINGSDATE"] == pd.Timestamp("2020-01-02")
+
+    on_day = index.lookup([1], ["2020-01-03"], strict=False)
+    assert on_day.loc[0, "G"] == 3
+
+
+def test_annotate_games():
+    games = pd.DataFrame(
+        {
+            "GAME_DATE_EST": ["2020-01-04"],
+            "HOME_TEAM_ID": [2],
+            "VISITOR_TEAM_ID": [1],
+        }
+    )
+    out = StandingsIndex(_ranking()).annotate_games(games)
+    assert out.loc[0, "HOME_STD_W_PCT"] == 0.5
+    assert out.loc[0, "AWAY_STD_G"] == 3
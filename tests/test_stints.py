@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+
+from packages.features.stints import StintEngine, popcount
+
+HOME_PLAYERS = ["H1", "H2", "H3", "H4", "H5"]
+AWAY_PLAYERS = ["A1", "A2", "A3", "A4", "A5"]
+PLAYER_COLUMNS = [
+    *StintEngine.SAME_SIDE_COLUMNS,
+    *StintEngine.OTHER_SIDE_COLUMNS,
+    "FreeThrowNum",
+    "TurnoverType",
+    "EnterGame",
+    "LeaveGame",
+]
+
+
+def _event(quarter, sec_left, side, home, away, **fields):
+    row = {
+        "URL": "/g1",
+        "Quarter": quarter,
+        "SecLeft": sec_left,
+        "HomeTeam": "BOS",
+        "AwayTeam": "NYK",
+        "HomeScore": home,
+        "AwayScore": away,
+        "HomePlay": "play" if side == "home" else None,
+        "AwayPlay": "play" if side == "away" else None,
+    }
+    row.update(fields)
+    return row
+
+
+def _pbp() -> pd.DataFrame:
+    rows = [
+        _event(1, 715, "home", 0, 0, Fouler=HOME_PLAYERS[0]),
+        _event(1, 710, "home", 2, 0, Shooter="H1", Assister="H2"),
+        _event(1, 700, "away", 2, 2, Shooter="A1", Assister="A2"),
+        _event(1, 690, "home", 2, 2, TurnoverPlayer="H3", TurnoverType="x"),
+        _event(1, 690, "away", 2, 2, Fouler="A3", Fouled="H4"),
+        _event(1, 685, "home", 2, 2, Rebounder="H5"),
+        _event(1, 685, "away", 2, 2, Shooter="A4", Blocker="H5"),
+        _event(1, 680, "away", 2, 2, Rebounder="A5"),
+        # Changement : H6 remplace H1
+        _event(1, 600, "home", 2, 2, EnterGame="H6", LeaveGame="H1"),
+        _event(1, 590, "home", 5, 2, Shooter="H6"),
+        # Deuxième période : H1 revient sans apparaître avant
+        _event(2, 700, "home", 5, 2, EnterGame="H1", LeaveGame="H2"),
+        _event(2, 690, "away", 5, 4, Shooter="A1"),
+    ]
+    frame = pd.DataFrame(rows)
+    missing = [col for col in PLAYER_COLUMNS if col not in frame.columns]
+    return frame.reindex(columns=[*frame.columns, *missing])
+
+
+def test_popcount():
+    masks = np.array([0, 1, 0b1011, 2**63], dtype=np.uint64)
+    assert popcount(masks).tolist() == [0, 1, 3, 1]
+
+
+def test_stints_lineups_points_and_durations():
+    stints = StintEngine().build(_pbp())
+
+    assert len(stints) == 3
+    first, second, third = stints.to_dict("records")
+    assert first["HOME_LINEUP"] == tuple(HOME_PLAYERS)
+    assert first["AWAY_LINEUP"] == tuple(AWAY_PLAYERS)
+    assert second["HOME_LINEUP"] == ("H2", "H3", "H4", "H5", "H6")
+    # Quatre titulaires détectés en période 2, le cinquième hérité
+    assert third["HOME_LINEUP"] == ("H1", "H3", "H4", "H5", "H6")
+
+    assert (first["START_TIME"], first["END_TIME"]) == (0.0, 120.0)
+    assert (second["START_TIME"], second["END_TIME"]) == (120.0, 720.0)
+    assert third["START_TIME"] == 720.0
+    assert (first["PTS_HOME"], first["PTS_AWAY"]) == (2.0, 2.0)
+    assert second["PTS_HOME"] == 3.0
+    assert first["POSS_HOME"] + first["POSS_AWAY"] >= 3
+
+
+def test_lineup_plus_minus():
+    engine = StintEngine()
+    totals = engine.lineup_plus_minus(engine.build(_pbp()))
+
+    bos = totals[totals["TEAM"] == "BOS"].set_index("LINEUP")
+    assert bos.loc[[("H2", "H3", "H4", "H5", "H6")], "PLUS_MINUS"].iloc[0] == 3
+    nyk = totals[totals["TEAM"] == "NYK"]
+    assert nyk["SECONDS"].sum() == bos["SECONDS"].sum()
@@ -0,0 +1,82 @@
+import json
+from pathlib import Path
+
+import pandas as pd
+
+from packages.preprocessing.play_parser import PlayTextParser
+from packages.preprocessing.synthetic import SyntheticConfig, SyntheticDataset
+
+DESCRIBE_DIR = Path(__file__).resolve().parents[1] / "data" / "describe"
+CONFIG = SyntheticConfig(scale=0.05, pbp_seasons=1, games_per_team=20)
+
+
+def _describe_columns(name: str) -> list[str]:
+    with open(DESCRIBE_DIR / f"{name}_describe.json", encoding="utf-8") as f:
+        return list(json.load(f)["column_descriptions"])
+
+
+def test_config_scales_seasons_then_leagues():
+    assert SyntheticConfig(scale=0.1).seasons == [2003, 2004]
+    assert SyntheticConfig(scale=0.1, pbp_seasons=1).seasons_with_pbp == [2004]
+    big = SyntheticConfig(scale=3)
+    assert big.n_leagues == 3
+    assert len(big.seasons) == 20
+
+
+def test_files_follow_describe_and_keys(tmp_path: Path):
+    # Une saison de 20 matchs par équipe, un fichier pbp
+    rows = SyntheticDataset(CONFIG).generate(str(tmp_path))
+    assert rows["games.csv"] == 300
+    assert rows["games_details.csv"] == 300 * 2 * 15
+    assert rows["teams.csv"] == 30
+    assert "2003-04_pbp.csv" in rows
+
+    files = {
+        "games": "games.csv",
+        "games_details": "games_details.csv",
+        "players": "players.csv",
+        "teams": "teams.csv",
+        "ranking": "ranking.csv",
+        "20XX-YY_pbp": "2003-04_pbp.csv",
+    }
+    frames = {}
+    for describe, name in files.items():
+        frames[describe] = pd.read_csv(tmp_path / name, low_memory=False)
+        assert list(frames[describe].columns) == _describe_columns(describe)
+        assert len(frames[describe]) == rows[name]
+
+    games, details = frames["games"], frames["games_details"]
+    assert games["GAME_ID"].is_unique
+    assert set(details["GAME_ID"]) == set(games["GAME_ID"])
+    assert set(details["TEAM_ID"]) <= set(frames["teams"]["TEAM_ID"])
+    assert set(details["PLAYER_ID"]) <= set(frames["players"]["PLAYER_ID"])
+
+    # Les lignes de box score font le score du match
+    points = details.groupby(["GAME_ID", "TEAM_ID"])["PTS"].sum()
+    keys = zip(games["GAME_ID"], games["HOME_TEAM_ID"], strict=True)
+    home = points.loc[list(keys)]
+    assert (home.to_numpy() == games["PTS_home"].to_numpy()).all()
+    assert (games["PTS_home"] != games["PTS_away"]).all()
+
+    # Classement du dernier jour = bilan des matchs
+    ranking = frames["ranking"]
+    last = ranking[ranking["STANDINGSDATE"] == ranking["STANDINGSDATE"].max()]
+    assert (last["G"] == 20).all()
+    assert last["W"].sum() == len(games)
+
+    pbp = frames["20XX-YY_pbp"]
+    assert pbp["URL"].nunique() == len(games)
+    plays = pbp["HomePlay"].fillna(pbp["AwayPlay"])
+    categories = PlayTextParser().parse(plays)["PlayCategory"]
+    assert categories.notna().all()
+    assert {"shot", "rebound", "freethrow", "jumpball"} <= set(categories)
+
+
+def test_generation_is_deterministic(tmp_path: Path):
+    config = SyntheticConfig(scale=0.05, pbp_seasons=0, games_per_team=20)
+    SyntheticDataset(config).generate(str(tmp_path / "a"))
+    SyntheticDataset(config).generate(str(tmp_path / "b"))
+    for name in ("games.csv", "games_details.csv", "ranking.csv"):
+        assert (tmp_path / "a" / name).read_bytes() == (
+            tmp_path / "b" / name
+        ).read_bytes()
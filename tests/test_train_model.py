@@ -0,0 +1,108 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from packages.models import train_model
+from packages.models.train_model import (
+    FeatureConfig,
+    ModelTrainer,
+    build_features,
+    make_estimator,
+    season_folds,
+)
+
+
+def _view(n_seasons: int = 4, games_per_season: int = 60) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    rows = []
+    game_id = 0
+    for season in range(2015, 2015 + n_seasons):
+        start = pd.Timestamp(f"{season}-11-01")
+        for i in range(games_per_season):
+            home, away = rng.choice(4, size=2, replace=False) + 100
+            home_pts = rng.integers(90, 120) + (home - 100) * 3
+            away_pts = rng.integers(90, 120) + (away - 100) * 3
+            game_id += 1
+            rows.append(
+                {
+                    "GAME_ID": game_id,
+                    "GAME_DATE_EST": start + pd.Timedelta(days=i // 2),
+                    "SEASON": season,
+                    "HOME_TEAM_ID": home,
+                    "VISITOR_TEAM_ID": away,
+                    "PTS_home": float(home_pts),
+                    "PTS_away": float(away_pts),
+                    "HOME_TEAM_WINS": int(home_pts > away_pts),
+                }
+            )
+    view = pd.DataFrame(rows)
+    for side in ("HOME", "AWAY"):
+        for col in ("G", "W", "L", "HOME_W", "HOME_L", "ROAD_W", "ROAD_L"):
+            view[f"{side}_STD_{col}"] = rng.integers(0, 20, len(view))
+        view[f"{side}_STD_W_PCT"] = rng.random(len(view))
+    return view
+
+
+def test_season_folds_are_expanding_windows():
+    seasons = np.repeat([2015, 2016, 2017, 2018], 3)
+    folds = season_folds(seasons, n_folds=2, min_train_seasons=2)
+    assert [seasons[v[0]] for _, v in folds] == [2017, 2018]
+    for train, valid in folds:
+        assert seasons[train].max() < seasons[valid].min()
+
+
+def test_min_season_keeps_elo_of_earlier_seasons():
+    view = _view()
+    full = build_features(view, FeatureConfig()).set_index("GAME_ID")
+    recent = build_features(view, FeatureConfig(min_season=2017))
+    assert recent["SEASON"].min() == 2017
+    # L'Elo de 2017 tient compte des saisons 2015-2016 écartées
+    pd.testing.assert_series_equal(
+        recent.set_index("GAME_ID")["ELO_DIFF"],
+        full.loc[recent["GAME_ID"], "ELO_DIFF"],
+    )
+    assert recent["ELO_DIFF"].iloc[0] != 0
+
+
+def test_features_are_cached_as_float32_memmap(tmp_path: Path, monkeypatch):
+    trainer = ModelTrainer(str(tmp_path / "cache"), str(tmp_path / "runs"))
+    first = trainer.prepare(_view())
+    assert isinstance(first.X, np.memmap) and first.X.dtype == np.float32
+    assert "ELO_DIFF" in first.columns and "HOME_FORM_NET" in first.columns
+
+    # Un second appel relit le cache sans reconstruire les features
+    def fail(*args, **kwargs):
+        raise AssertionError("features rebuilt")
+
+    monkeypatch.setattr(train_model, "build_features", fail)
+    again = trainer.prepare(_view())
+    assert again.path == first.path
+    np.testing.assert_array_equal(np.asarray(again.X), np.asarray(first.X))
+
+    other = ModelTrainer(
+        str(tmp_path / "cache"),
+        str(tmp_path / "runs"),
+        FeatureConfig(form_window=5),
+    )
+    monkeypatch.undo()
+    assert other.prepare(_view()).path != first.path
+
+
+def test_train_runs_parallel_folds_and_persists_run(tmp_path: Path):
+    trainer = ModelTrainer(
+        str(tmp_path / "cache"), str(tmp_path / "runs"), n_jobs=2
+    )
+    run_dir = trainer.train(
+        _view(), make_estimator("logistic"), "baseline", n_folds=2
+    )
+
+    folds = pd.read_csv(run_dir / "folds.csv", index_col="SEASON")
+    assert folds.index.tolist() == [2017, 2018]
+    assert folds["log_loss"].notna().all()
+    with open(run_dir / "metrics.json", encoding="utf-8") as f:
+        summary = json.load(f)
+    assert summary["n_games"] == 240
+    assert "accuracy" in summary["cv_mean"]
+    assert (run_dir / "model.pkl").is_file()
@@ -0,0 +1,67 @@
+from packages.tools.web.frontier import CrawlFrontier
+
+BASE = "https://www.example.com"
+
+
+def _drain(frontier: CrawlFrontier) -> list[str]:
+    urls = []
+    while frontier:
+        urls.append(frontier.pop().url)
+    return urls
+
+
+def test_push_deduplicates_at_enqueue():
+    frontier = CrawlFrontier(max_depth=1)
+    assert frontier.push(f"{BASE}/a")
+    # Même URL, fragment ignoré
+    assert not frontier.push(f"{BASE}/a#top", depth=1)
+    assert not frontier.push(f"{BASE}/deep", depth=2)
+    assert frontier.push_many([f"{BASE}/b", f"{BASE}/a", f"{BASE}/b"]) == 1
+
+    assert len(frontier) == 2
+    assert f"{BASE}/a#x" in frontier
+    assert _drain(frontier) == [f"{BASE}/a", f"{BASE}/b"]
+    # Une URL déjà servie n'est plus acceptée
+    assert not frontier.push(f"{BASE}/a")
+    assert frontier.pop() is None
+
+
+def test_priority_then_depth_order_and_host_rotation():
+    frontier = CrawlFrontier()
+    frontier.push(f"{BASE}/deep", depth=2)
+    frontier.push(f"{BASE}/shallow", depth=1)
+    frontier.push(f"{BASE}/urgent", depth=3, priority=-1)
+    frontier.push("https://other.example.org/x", depth=1)
+
+    assert _drain(frontier) == [
+        f"{BASE}/urgent",
+        "https://other.example.org/x",
+        f"{BASE}/shallow",
+        f"{BASE}/deep",
+    ]
+
+
+def test_host_delay_and_max_queued():
+    frontier = CrawlFrontier(max_queued=2, host_delay=60)
+    frontier.push_many([f"{BASE}/a", f"{BASE}/b", f"{BASE}/c"])
+    assert len(frontier) == 2
+    assert frontier.dropped == 1
+
+    assert frontier.pop().url == f"{BASE}/a"
+    # L'hôte est en attente de politesse
+    assert frontier.pop() is None
+    assert 0 < frontier.wait_time() <= 60
+
+
+def test_save_and_load_resume_the_crawl(tmp_path):
+    frontier = CrawlFrontier(max_depth=3)
+    frontier.push_many([f"{BASE}/a", f"{BASE}/b", "https://other.org/c"])
+    frontier.pop()
+    path = tmp_path / "state" / "frontier.json"
+    frontier.save(str(path))
+
+    resumed = CrawlFrontier.load(str(path))
+    assert resumed.max_depth == 3
+    assert len(resumed) == 2
+    assert not resumed.push(f"{BASE}/a")
+    assert sorted(_drain(resumed)) == sorted(_drain(frontier))
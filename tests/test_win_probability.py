@@ -0,0 +1,86 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from packages.features.win_probability import (
+    WinProbabilityConfig,
+    WinProbabilityTable,
+    seconds_remaining,
+)
+
+
+def _pbp(n_games: int = 200, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    rows = []
+    for game in range(n_games):
+        home = away = 0
+        events = []
+        for quarter in (1, 2, 3, 4):
+            for sec_left in range(700, -1, -50):
+                home_side = rng.random() < 0.5
+                points = int(rng.choice([0, 2, 3], p=[0.5, 0.38, 0.12]))
+                home += points if home_side else 0
+                away += 0 if home_side else points
+                events.append(
+                    {
+                        "URL": f"/g{game}",
+                        "Quarter": quarter,
+                        "SecLeft": sec_left,
+                        "HomeTeam": "BOS",
+                        "AwayTeam": "NYK",
+                        "HomePlay": "play" if home_side else None,
+                        "AwayPlay": None if home_side else "play",
+                        "Shooter": "A. B" if points else None,
+                        "HomeScore": home,
+                        "AwayScore": away,
+                    }
+                )
+        winner = "BOS" if home > away else "NYK"
+        rows.extend({**event, "WinningTeam": winner} for event in events)
+    frame = pd.DataFrame(rows)
+    for col in (
+        "FreeThrowShooter",
+        "FreeThrowNum",
+        "TurnoverType",
+        "Rebounder",
+    ):
+        frame[col] = None
+    return frame
+
+
+def test_seconds_remaining():
+    remaining = seconds_remaining([1, 4, 5], [720, 30, 200])
+    assert remaining.tolist() == [2880.0, 30.0, 200.0]
+
+
+def test_table_is_monotonic_in_margin_and_sharpens_late():
+    table = WinProbabilityTable.fit(_pbp())
+    assert table.table.shape == (1, 2, 289, 61)
+
+    early = table.lookup([-10, 0, 10], [2400] * 3, [True] * 3)
+    late = table.lookup([-10, 0, 10], [20] * 3, [True] * 3)
+    assert np.all(np.diff(early) > 0) and np.all(np.diff(late) > 0)
+    # Un écart de 10 points pèse plus à 20 s de la fin qu'en début de match
+    assert late[2] > early[2] and late[0] < early[0]
+    assert late[2] > 0.95
+
+
+def test_game_series_and_persistence(tmp_path: Path):
+    pbp = _pbp(50)
+    config = WinProbabilityConfig(strength_bins=4)
+    strength = np.where(pbp["URL"].str[2:].astype(int) % 2 == 0, 0.8, 0.3)
+    table = WinProbabilityTable.fit(pbp, strength=strength, config=config)
+    assert table.n_strength == 4
+
+    curves = table.game_series(pbp, strength=strength)
+    assert len(curves) == len(pbp)
+    assert curves["WP_HOME"].between(0, 1).all()
+    last = curves.groupby("URL").tail(1)
+    last = last[last["MARGIN"] != 0]
+    assert ((last["WP_HOME"] > 0.5) == (last["MARGIN"] > 0)).all()
+
+    table.save(str(tmp_path / "wp.npz"))
+    loaded = WinProbabilityTable.load(str(tmp_path / "wp.npz"))
+    np.testing.assert_array_equal(loaded.table, table.table)
+    assert loaded.config == config